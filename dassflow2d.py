@@ -36,19 +36,32 @@ def main():
         ("config_file", ("--config-file", "-c"), "Configuration file path", None, True),
         ("temporal_scheme", ("--temporal-scheme", "-ts"), "Temporal scheme for resolution method", ["euler", "ssp-rk2", "imex"], False),
         ("spatial_scheme", ("--spatial-scheme", "-ss"), "Spatial scheme for resolution method", ["hllc", "muscl", "low-froude"], False),
+        ("kernel_backend", ("--kernel-backend", "-kb"), "Backend of the flux and update kernels, numba when installed by default", ["auto", "numpy", "numba"], False),
+        ("thread_number", ("--thread-number", "-tn"), "Number of threads scattering edge fluxes with the numpy backend, number of CPUs by default", None, False),
+        ("partition_number", ("--partition-number", "-pn"), "Number of subdomains whose fluxes and updates run in their own process", None, False),
         ("mesh_file", ("--mesh-file", "-mf"), "Mesh file path", None, False),
+        ("mesh_format", ("--mesh-format", "-mfo"), "Mesh file format, guessed from the mesh file extension by default (.msh for gmsh)", ["auto", "dassflow", "gmsh"], False),
+        ("cell_ordering", ("--cell-ordering", "-co"), "Cell renumbering applied for memory locality, results keep cell IDs", ["file", "rcm", "morton"], False),
         ("boundary_condition_file", ("--boundary-condition-file", "-bcf"), "Boundary condition description file path", None, False),
-        ("initial_state_file", ("--initial-state-file", "-isf"), "Initial state file path", None, False),
-        ("bathymetry_file", ("--bathymetry-file", "-bf"), "Bathymetry file path UNUSED", None, False),
+        ("initial_state_file", ("--initial-state-file", "-isf"), "Initial state file path (dof_init text file, HDF5 results or checkpoint of a previous run)", None, False),
+        ("bathymetry_file", ("--bathymetry-file", "-bf"), "Bathymetry file path (vertex values or ESRI ASCII grid), overrides mesh bathymetry", None, False),
         ("hydrographs_file", ("--hydrographs-file", "-hf"), "Hydrographs file path", None, False),
         ("rating_curve_file", ("--rating-curve-file", "-rcf"), "Rating curves file path", None, False),
         ("manning_file", ("--manning-file", "-mnf"), "Manning file path UNUSED", None, False),
         ("result_path", ("--result-path", "-rp"), "Result folder path", None, False),
-        ("output_mode", ("--output-mode", "-om"), "Output mode", ["vtk", "tecplot", "gnuplot", "hdf5"], False),
+        ("output_mode", ("--output-mode", "-om"), "Output modes, comma separated (vtk, tecplot, gnuplot, hdf5 or registered formats)", None, False),
+        ("output_compression", ("--output-compression", "-oc"), "Compression of raw results and text output formats, input files are decompressed based on their extension", ["none", "gz", "bz2", "xz"], False),
         ("simulation_time", ("--simulation-time", "-st"), "Total simulation duration", None, False),
         ("delta_to_write", ("--delta-to-write", "-dtw"), "Time needed to write a snapshot of the state", None, False),
-        ("is_delta_adaptative", ("--is-delta-adaptative", "-da"), "Does delta time adapt to mesh", None, False),
-        ("default_delta", ("--default-delta", "-dd"), "Default value of delta (in case of non-adaptive)", None, False)
+        ("is_delta_adaptive", ("--is-delta-adaptive", "--is-delta-adaptative", "-da"), "Does delta time adapt to mesh (true or false)", None, False),
+        ("default_delta", ("--default-delta", "-dd"), "Default value of delta (in case of non-adaptive)", None, False),
+        ("local_time_stepping", ("--local-time-stepping", "-lts"), "Advance cells by power of two time step classes of their CFL limit", None, False),
+        ("time_step_levels", ("--time-step-levels", "-tsl"), "Number of time step classes of local time stepping", None, False),
+        ("checkpoint_delta", ("--checkpoint-delta", "-cd"), "Simulation time between two checkpoints", None, False),
+        ("restart_from", ("--restart-from", "-rf"), "Checkpoint file to resume the simulation from", None, False),
+        ("profile_file", ("--profile-file", "-pf"), "Enable profiling and write the per phase timing report (json) to this file", None, False),
+        ("gauges_file", ("--gauges-file", "-gf"), "Gauge description file (yaml), gauge time series are written to the result folder", None, False),
+        ("gauges_every_steps", ("--gauges-every-steps", "-ges"), "Number of loops between two gauge records", None, False)
     ]
     for arg_fields in args_fields:
         # unpack structure
@@ -68,7 +81,8 @@ def main():
         arg_namespace = arg_fields[0]
         arg_value = getattr(args, arg_namespace)
         if arg_value is not None:
-            configuration_values[arg_namespace] = arg_value
+            # configuration namespaces use dashes where argument namespaces use underscores
+            configuration_values[arg_namespace.replace('_', '-')] = arg_value
 
     configuration.updateValues(configuration_values, ConfigSource.COMMAND_ARGS)
 
@@ -90,6 +104,10 @@ def main():
     loop_listener = PrintLoopListener()
 
     shallow_water_model.subscribe(loop_listener)
+
+    # or every 100 loops / 60 simulated seconds, with a summary of deltas, on a background thread
+    # (override 'endOfWindow' to receive the LoopWindow summary)
+    shallow_water_model.subscribe(loop_listener, every_steps=100, every_time=60.0, batched=True, background=True)
     """
 
     shallow_water_model.run()
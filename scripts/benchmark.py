@@ -0,0 +1,484 @@
+"""
+Benchmark harness: generates synthetic cases of several sizes and times every stage of a simulation.
+
+Usage (from the repository root):
+    python scripts/benchmark.py --sizes 10000 100000 1000000 --output benchmark.json
+    python scripts/benchmark.py --sizes 10000 --baseline benchmark.json
+    python scripts/benchmark.py --sizes 100000 --kernels
+    python scripts/benchmark.py --sizes 100000 --active
+    python scripts/benchmark.py --startup
+
+Generated cases (mesh.geo, bc.txt, hydrographs, rating curves, dof_init and config.yml) are kept
+in the work directory and reused by later runs.
+"""
+import sys
+import os
+
+# Add src/main/py to sys.path, relative to the repository root
+src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'main', 'py', 'fr', 'dasshydro')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import time
+
+import numpy as np
+
+from dassflow2d_py.input.Configuration import Configuration           # type: ignore
+from dassflow2d_py.input.DassflowMeshReader import DassflowMeshReader # type: ignore
+from dassflow2d_py.mesh.MeshImpl import MeshImpl                      # type: ignore
+from dassflow2d_py.ShallowWaterModel import ShallowWaterModel         # type: ignore
+from dassflow2d_py.d2dtime.TimeStepState import TimeStepState         # type: ignore
+from dassflow2d_py.resolution.EulerHLLC import EulerHLLC              # type: ignore
+from dassflow2d_py.mesh.connectivity import edge_cell_indices        # type: ignore
+from dassflow2d_py.resolution.Workspace import Workspace              # type: ignore
+from dassflow2d_py.resolution.edge_parallel import EdgeChunkExecutor  # type: ignore
+from dassflow2d_py.resolution.kernels import (                        # type: ignore
+    get_kernels, numba_available, edge_geometry, NUMPY_BACKEND, NUMBA_BACKEND
+)
+
+
+MESH_KINDS = ("structured-triangle", "structured-quad", "unstructured-triangle")
+DEFAULT_SIZES = (10000, 100000, 1000000)
+DEFAULT_STEPS = 10
+# wet fractions of the domain timed with --active
+WET_FRACTIONS = (0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8)
+DELTA = 0.01
+SLOPE = 0.001
+# libraries only needed by some output modes, never imported at startup
+OPTIONAL_FORMAT_MODULES = ("vtk", "h5py")
+
+
+def generate_mesh(kind: str, cell_number: int, seed: int = 0):
+    """
+    Generate a mesh of the unit square with about 'cell_number' cells
+
+    Args:
+        kind (str): one of MESH_KINDS, unstructured meshes have jittered vertices and random diagonals
+        cell_number (int): approximate number of cells
+        seed (int): seed of unstructured meshes
+
+    Returns:
+        tuple: vertex coordinates (V, 2), cells (C, 4) of 0-based vertex indices (triangles repeat their first vertex),
+        local edge number (1-based) of the left boundary edge and of the right boundary edge of every cell (0 if none)
+    """
+    quads = kind == "structured-quad"
+    n = max(1, int(round(np.sqrt(cell_number if quads else cell_number / 2))))
+    rng = np.random.default_rng(seed)
+
+    x, y = np.meshgrid(np.linspace(0.0, 1.0, n + 1), np.linspace(0.0, 1.0, n + 1))
+    if kind == "unstructured-triangle":
+        # move interior vertices by up to a quarter of a square
+        interior = (x > 0.0) & (x < 1.0) & (y > 0.0) & (y < 1.0)
+        x = x + interior * rng.uniform(-0.25, 0.25, x.shape) / n
+        y = y + interior * rng.uniform(-0.25, 0.25, y.shape) / n
+    coordinates = np.column_stack((x.ravel(), y.ravel()))
+
+    # corners of every square, counterclockwise
+    i_grid, j_grid = np.meshgrid(np.arange(n), np.arange(n))
+    i, j = i_grid.ravel(), j_grid.ravel()
+    a = j * (n + 1) + i
+    b, c, d = a + 1, a + n + 2, a + n + 1
+    first_column = (i == 0).astype(np.int64)
+    last_column = (i == n - 1).astype(np.int64)
+
+    if quads:
+        cells = np.column_stack((a, b, c, d))
+        # edge k joins vertices k-1 and k: d-a is edge 1, b-c is edge 3
+        return coordinates, cells, first_column, 3 * last_column
+
+    if kind == "unstructured-triangle":
+        flipped = rng.random(n * n) < 0.5
+    else:
+        flipped = np.zeros(n * n, dtype=bool)
+    # diagonal a-c: (a, b, c) and (a, c, d), diagonal b-d: (a, b, d) and (b, c, d)
+    lower = np.where(flipped[:, None], np.column_stack((a, b, d, a)), np.column_stack((a, b, c, a)))
+    upper = np.where(flipped[:, None], np.column_stack((b, c, d, b)), np.column_stack((a, c, d, a)))
+    cells = np.empty((2 * n * n, 4), dtype=np.int64)
+    cells[0::2], cells[1::2] = lower, upper
+    # d-a is edge 1 of (a, c, d) or (a, b, d), b-c is edge 3 of (a, b, c) or edge 2 of (b, c, d)
+    left = np.empty(2 * n * n, dtype=np.int64)
+    right = np.empty(2 * n * n, dtype=np.int64)
+    left[0::2] = np.where(flipped, first_column, 0)
+    left[1::2] = np.where(flipped, 0, first_column)
+    right[0::2] = np.where(flipped, 0, 3 * last_column)
+    right[1::2] = np.where(flipped, 2 * last_column, 0)
+    return coordinates, cells, left, right
+
+
+def write_case(folder: str, kind: str, cell_number: int, steps: int) -> str:
+    """
+    Write a complete case (mesh and every input file) in a folder, with an inflow on the left side
+    and a rating curve outflow on the right side
+
+    Returns:
+        str: path to the configuration file of the case
+    """
+    os.makedirs(folder, exist_ok=True)
+    coordinates, cells, left, right = generate_mesh(kind, cell_number)
+    vertex_z = SLOPE * (1.0 - coordinates[:, 0])
+    cell_z = vertex_z[cells].mean(axis=1)
+    ids = np.arange(1, len(cells) + 1)
+
+    with open(os.path.join(folder, "mesh.geo"), "w") as file:
+        file.write(f"# synthetic {kind} mesh\n{len(coordinates)} {len(cells)} 1.0\n")
+        file.write("#Vertex||| id vertex, x coord, y coord, bathymetry\n")
+        np.savetxt(file, np.column_stack((np.arange(1, len(coordinates) + 1), coordinates, vertex_z)),
+                   fmt=("%d", "%.12g", "%.12g", "%.12g"))
+        file.write("#cells||| id cell, id_vertex1, id_vertex2, id_vertex3, id_vertex4, patch_manning, bathymetry\n")
+        np.savetxt(file, np.column_stack((ids, cells + 1, np.ones(len(cells)), cell_z)),
+                   fmt=("%d", "%d", "%d", "%d", "%d", "%d", "%.12g"))
+        file.write("# boundaries\n")
+        for name, local_edges, group in (("INLET", left, 1), ("OUTLET", right, 2)):
+            boundary_cells = np.flatnonzero(local_edges)
+            file.write(f"{name} {len(boundary_cells)} 1\n")
+            np.savetxt(file, np.column_stack((
+                ids[boundary_cells], local_edges[boundary_cells], np.ones(len(boundary_cells)),
+                cell_z[boundary_cells], np.full(len(boundary_cells), group)
+            )), fmt=("%d", "%d", "%d", "%.12g", "%d"))
+
+    with open(os.path.join(folder, "bc.txt"), "w") as file:
+        file.write("# Number of boundary conditions\n2\n# List of boundary conditions\n1 discharg1 1\n2 ratcurve 1\n")
+    with open(os.path.join(folder, "hydrographs.txt"), "w") as file:
+        file.write("# Number of hydrographs\n1\n# Number of entries\n2\n0.0 1.0\n1.0e6 1.0\n")
+    with open(os.path.join(folder, "ratcurve.txt"), "w") as file:
+        file.write("# Number of rating curves\n1\n# Number of entries\n2\n0.0 0.0\n10.0 100.0\n")
+    with open(os.path.join(folder, "dof_init.txt"), "w") as file:
+        file.write("# h u v\n")
+        np.savetxt(file, np.column_stack((np.ones(len(cells)), np.zeros((len(cells), 2)))), fmt="%.1f")
+
+    simulation_time = steps * DELTA
+    config_path = os.path.join(folder, "config.yml")
+    with open(config_path, "w") as file:
+        file.write(
+            "temporal-scheme: euler\n"
+            "spatial-scheme: hllc\n"
+            f"mesh-file: {os.path.join(folder, 'mesh.geo')}\n"
+            f"boundary-condition-file: {os.path.join(folder, 'bc.txt')}\n"
+            f"initial-state-file: {os.path.join(folder, 'dof_init.txt')}\n"
+            f"hydrographs-file: {os.path.join(folder, 'hydrographs.txt')}\n"
+            f"rating-curve-file: {os.path.join(folder, 'ratcurve.txt')}\n"
+            f"simulation-time: {simulation_time}\n"
+            f"delta-to-write: {simulation_time / 2}\n"
+            "is-delta-adaptive: false\n"
+            f"default-delta: {DELTA}\n"
+            f"result-path: {os.path.join(folder, 'outputs')}\n"
+            "output-mode: hdf5\n"
+            f"profile-file: {os.path.join(folder, 'profile.json')}\n"
+        )
+    return config_path
+
+
+def run_case(folder: str, kind: str, cell_number: int, steps: int) -> dict:
+    """
+    Time every stage of a case
+
+    Returns:
+        dict: stage times (seconds) and case description
+    """
+    config_path = os.path.join(folder, "config.yml")
+    start = time.perf_counter()
+    if not os.path.isfile(config_path):
+        write_case(folder, kind, cell_number, steps)
+    generation_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    raw_info = DassflowMeshReader().read(os.path.join(folder, "mesh.geo"))
+    read_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    raw_vertices, raw_cells, raw_inlets, raw_outlets = raw_info[:4]
+    mesh = MeshImpl.createFromPartialInformation(raw_vertices, raw_cells, raw_inlets, raw_outlets, {})
+    mesh_time = time.perf_counter() - start
+    edge_number = mesh.getEdgeNumber()
+    del mesh, raw_info, raw_vertices, raw_cells
+
+    configuration = Configuration(None)
+    configuration.update_from_file(config_path, None)
+    start = time.perf_counter()
+    model = ShallowWaterModel(configuration)
+    setup_time = time.perf_counter() - start
+
+    model.run()
+    profile = model.getProfiler().getSummary()
+    phases = profile["phases"]
+    step_number = max(1, profile["steps"])
+
+    return {
+        "kind": kind,
+        "cells": model.mesh.getCellNumber(),
+        "edges": edge_number,
+        "steps": profile["steps"],
+        "stages": {
+            "generate": generation_time,
+            "read": read_time,
+            "create_mesh": mesh_time,
+            "model_setup": setup_time,
+            "solve_per_step": phases["resolve"]["wall_time"] / step_number,
+            "boundary_update_per_step": phases["boundary_conditions"]["wall_time"] / step_number,
+            "output": phases["write"]["wall_time"] + phases["write_all"]["wall_time"],
+        },
+        "cell_updates_per_second": profile["cell_updates_per_second"]
+    }
+
+
+def run_kernels(folder: str, kind: str, cell_number: int, steps: int) -> dict:
+    """
+    Time the flux, scatter and update kernels of every available backend over the mesh of a case,
+    and check that backends give identical results. The first call of a compiled backend is a warm up.
+
+    Returns:
+        dict: kernel times (seconds per step) of every backend and case description
+    """
+    if not os.path.isfile(os.path.join(folder, "config.yml")):
+        write_case(folder, kind, cell_number, steps)
+    raw_vertices, raw_cells, raw_inlets, raw_outlets = DassflowMeshReader().read(os.path.join(folder, "mesh.geo"))[:4]
+    mesh = MeshImpl.createFromPartialInformation(raw_vertices, raw_cells, raw_inlets, raw_outlets, {})
+    left, right, total_cell_number = edge_cell_indices(mesh)
+    normals, lengths = edge_geometry(mesh)
+    surfaces = np.array([cell.getSurface() for cell in mesh.getCells()], dtype=np.float64)
+
+    rng = np.random.default_rng(0)
+    state = np.column_stack((
+        rng.uniform(0.0, 2.0, total_cell_number),
+        rng.uniform(-1.0, 1.0, total_cell_number),
+        rng.uniform(-1.0, 1.0, total_cell_number)
+    ))
+    backends = [NUMPY_BACKEND] + ([NUMBA_BACKEND] if numba_available() else [])
+    times: dict[str, dict[str, float]] = {}
+    outputs = {}
+    for backend in backends:
+        kernels = get_kernels(backend)
+        workspace = Workspace.fromMesh(mesh)
+        stage_times = {"flux": 0.0, "scatter": 0.0, "update": 0.0}
+        for step in range(steps + 1):
+            start = time.perf_counter()
+            flux = kernels.flux(state, left, right, normals, lengths, workspace.edgeBuffer("flux", 3), workspace)
+            flux_time = time.perf_counter() - start
+            residual = workspace.cellBuffer("residual", 3)
+            residual.fill(0.0)
+            start = time.perf_counter()
+            kernels.scatter(left, right, flux, residual)
+            scatter_time = time.perf_counter() - start
+            start = time.perf_counter()
+            new_state = kernels.update(state, residual, surfaces, DELTA, workspace.cellBuffer("updated", 3), workspace)
+            update_time = time.perf_counter() - start
+            if step > 0:
+                stage_times["flux"] += flux_time / steps
+                stage_times["scatter"] += scatter_time / steps
+                stage_times["update"] += update_time / steps
+        times[backend] = stage_times
+        outputs[backend] = (flux.copy(), residual.copy(), new_state[:len(surfaces)].copy())
+
+    identical = all(
+        all(np.array_equal(a, b) for a, b in zip(outputs[NUMPY_BACKEND], outputs[backend])) for backend in backends
+    )
+
+    # flux by chunks of edges and scatter by cell blocks of the numpy backend (see 'EulerHLLC'),
+    # compared to the sequential kernels
+    expected_flux, expected_residual = outputs[NUMPY_BACKEND][:2]
+    executor = EdgeChunkExecutor(left, right, total_cell_number)
+    flux = np.empty_like(expected_flux)
+    residual = np.zeros((total_cell_number, 3))
+    executor_times = {"flux": 0.0, "scatter": 0.0}
+    for step in range(steps + 1):
+        start = time.perf_counter()
+        executor.flux(get_kernels(NUMPY_BACKEND).flux, state, normals, lengths, flux)
+        flux_time = time.perf_counter() - start
+        residual.fill(0.0)
+        start = time.perf_counter()
+        executor.scatter(flux, residual)
+        scatter_time = time.perf_counter() - start
+        if step > 0:
+            executor_times["flux"] += flux_time / steps
+            executor_times["scatter"] += scatter_time / steps
+    executor.close()
+    identical = identical and np.array_equal(flux, expected_flux) and np.array_equal(residual, expected_residual)
+    times[f"numpy, {executor.thread_number} thread executor"] = executor_times
+
+    return {"kind": kind, "cells": mesh.getCellNumber(), "edges": mesh.getEdgeNumber(),
+            "kernels": times, "identical": identical}
+
+
+def run_active(folder: str, kind: str, cell_number: int, steps: int) -> dict:
+    """
+    Time the EulerHLLC step over the whole domain and over the active set only, for a wet band of several widths,
+    and check that both give identical results
+
+    Returns:
+        dict: fraction of active edges and step times (seconds) of every wet fraction, and case description
+    """
+    if not os.path.isfile(os.path.join(folder, "config.yml")):
+        write_case(folder, kind, cell_number, steps)
+    configuration = Configuration(None)
+    configuration.update_from_file(os.path.join(folder, "config.yml"), None)
+    raw_vertices, raw_cells, raw_inlets, raw_outlets = DassflowMeshReader().read(os.path.join(folder, "mesh.geo"))[:4]
+    mesh = MeshImpl.createFromPartialInformation(raw_vertices, raw_cells, raw_inlets, raw_outlets, {})
+    method = EulerHLLC(configuration)
+    method.allocate(mesh)
+    workspace = method.getWorkspace()
+    x = np.zeros(len(method.cells))
+    x[:mesh.getCellNumber()] = [cell.getGravityCenter()[0] for cell in mesh.getCells()]
+
+    fractions = []
+    for wet_fraction in WET_FRACTIONS:
+        initial = np.zeros((len(method.cells), 3))
+        initial[x < wet_fraction, 0] = 1.0
+        times, results = {}, {}
+        for path, edge_fraction in (("whole", 0.0), ("active", float("inf"))):
+            method.active_edge_fraction = edge_fraction
+            workspace.getCurrentState()[:] = initial
+            # the time loop runs on the state buffers of the workspace
+            state = TimeStepState.fromArray(workspace.getCurrentState(), method.cells)
+            spare = TimeStepState.fromArray(workspace.getNextState(), method.cells)
+            elapsed = 0.0
+            for step in range(steps + 1):
+                start = time.perf_counter()
+                state, spare = method.resolve(state, DELTA / 100, mesh, None, spare), state
+                if step > 0:
+                    elapsed += (time.perf_counter() - start) / steps
+            times[path] = elapsed
+            results[path] = state.getValues().copy()
+        if not np.array_equal(results["whole"], results["active"]):
+            raise AssertionError(f"active set step differs from the whole domain step at {wet_fraction} wet")
+        fractions.append({"wet": wet_fraction,
+                          "active_edges": len(method.active_set.getActiveEdges()) / mesh.getEdgeNumber(),
+                          "times": times})
+    method.close()
+    return {"kind": kind, "cells": mesh.getCellNumber(), "edges": mesh.getEdgeNumber(), "fractions": fractions}
+
+
+def run_startup(repeats: int) -> dict:
+    """
+    Time the startup of the command line interface ('dassflow2d.py --help', which imports the whole model),
+    and list the optional format libraries loaded by importing the model
+
+    Returns:
+        dict: wall times (seconds) of every run and loaded optional modules
+    """
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "dassflow2d.py", "--help"], cwd=root, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    loaded = subprocess.check_output([
+        sys.executable, "-c",
+        f"import sys; sys.path.insert(0, {src_path!r}); import dassflow2d_py.ShallowWaterModel; "
+        f"print(' '.join(m for m in {OPTIONAL_FORMAT_MODULES!r} if m in sys.modules))"
+    ], text=True).split()
+    return {"min": min(times), "median": float(np.median(times)), "times": times, "loaded_optional_modules": loaded}
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    List the stages slower than the baseline by more than the tolerance (relative)
+
+    Returns:
+        list[str]: one message per regression
+    """
+    baseline_cases = {(case["kind"], case["cells"]): case for case in baseline["cases"]}
+    regressions = []
+    for case in results["cases"]:
+        previous = baseline_cases.get((case["kind"], case["cells"]))
+        if previous is None:
+            continue
+        for stage, value in case["stages"].items():
+            previous_value = previous["stages"].get(stage)
+            # generation is skipped when a case is reused, never compare it
+            if stage == "generate" or not previous_value:
+                continue
+            if value > previous_value * (1.0 + tolerance):
+                regressions.append(f"{case['kind']} {case['cells']} cells, {stage}: "
+                                   f"{previous_value:.4g}s -> {value:.4g}s ({value / previous_value:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every stage of dassflow2d-py on synthetic meshes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Approximate cell numbers")
+    parser.add_argument("--kinds", nargs="+", default=list(MESH_KINDS), choices=MESH_KINDS, help="Mesh kinds")
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS, help="Number of simulation steps per case")
+    parser.add_argument("--work-dir", default=os.path.join("benchmarks", "cases"), help="Folder of generated cases")
+    parser.add_argument("--output", default=os.path.join("benchmarks", "benchmark.json"), help="Json result file")
+    parser.add_argument("--baseline", help="Json result file of a previous version to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Relative slowdown reported as a regression")
+    parser.add_argument("--kernels", action="store_true",
+                        help="Only compare the NumPy and numba kernels (numba is used when installed)")
+    parser.add_argument("--active", action="store_true",
+                        help="Only compare steps over the whole domain and over the active set, for several wet fractions")
+    parser.add_argument("--startup", action="store_true", help="Only time the startup of the command line interface")
+    parser.add_argument("--repeats", type=int, default=10, help="Number of startups timed with --startup")
+    args = parser.parse_args()
+
+    if args.startup:
+        startup = run_startup(args.repeats)
+        print(f"startup: min {startup['min']:.4g}s, median {startup['median']:.4g}s over {args.repeats} runs")
+        if startup["loaded_optional_modules"]:
+            print(f"Regression: {', '.join(startup['loaded_optional_modules'])} imported at startup")
+            sys.exit(1)
+        return
+
+    if args.kernels:
+        for kind in args.kinds:
+            for size in args.sizes:
+                case = run_kernels(os.path.join(args.work_dir, f"{kind}_{size}_{args.steps}"), kind, size, args.steps)
+                for backend, stage_times in case["kernels"].items():
+                    stages = ", ".join(f"{stage} {value:.4g}s" for stage, value in stage_times.items())
+                    print(f"{kind} {case['cells']} cells, {backend}: {stages}")
+                if not case["identical"]:
+                    print(f"{kind} {case['cells']} cells: backends give different results")
+                    sys.exit(1)
+        return
+
+    if args.active:
+        for kind in args.kinds:
+            for size in args.sizes:
+                case = run_active(os.path.join(args.work_dir, f"{kind}_{size}_{args.steps}"), kind, size, args.steps)
+                for fraction in case["fractions"]:
+                    print(f"{kind} {case['cells']} cells, {fraction['active_edges']:.0%} active edges: "
+                          f"whole domain {fraction['times']['whole']:.4g}s, active set {fraction['times']['active']:.4g}s")
+        return
+
+    results = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.platform(),
+        "cases": []
+    }
+    for kind in args.kinds:
+        for size in args.sizes:
+            folder = os.path.join(args.work_dir, f"{kind}_{size}_{args.steps}")
+            case = run_case(folder, kind, size, args.steps)
+            results["cases"].append(case)
+            stages = ", ".join(f"{stage} {value:.4g}s" for stage, value in case["stages"].items())
+            print(f"{kind} {case['cells']} cells: {stages}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=4)
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
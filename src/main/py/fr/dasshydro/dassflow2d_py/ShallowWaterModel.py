@@ -1,31 +1,63 @@
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
 
 # input
 from dassflow2d_py.input.Configuration import Configuration
-from dassflow2d_py.input.MeshReader import MeshReader
+from dassflow2d_py.input.MeshReader import MeshReader, MeshFormat, mesh_format_of
 from dassflow2d_py.input.InitialStateReader import InitialStateReader
+from dassflow2d_py.input.BathymetryReader import BathymetryReader
+from dassflow2d_py.input.GaugeReader import GaugeReader
 # output
+from dassflow2d_py.output.RunProfiler import RunProfiler, BOUNDARY_CONDITIONS, DELTA, RESOLVE, WRITE, CHECKPOINT, LISTENERS, WRITE_ALL
 from dassflow2d_py.output.ResultWriter import ResultWriter
+from dassflow2d_py.output.GaugeRecorder import GaugeRecorder
 
 # mesh and geometry context
 from dassflow2d_py.mesh.Mesh import Cell, Boundary, RawInlet, RawOutlet
 from dassflow2d_py.mesh.MeshImpl import MeshImpl
+from dassflow2d_py.mesh.Bathymetry import Bathymetry
 from dassflow2d_py.boundary.BoundaryCondition import createBoundaryConditions
 
 # time and state
 import dassflow2d_py.d2dtime.delta as dt
 from dassflow2d_py.d2dtime.TimeStepState import TimeStepState, Node
+from dassflow2d_py.d2dtime.LocalTimeStepping import LocalTimeStepScheduler
+from dassflow2d_py.d2dtime.checkpoint import Checkpoint, read_checkpoint, write_checkpoint
 
 # resolution (a lot is in dynamic imports)
 from dassflow2d_py.resolution.ResolutionMethod import ResolutionMethod, TemporalScheme, SpatialScheme
 
 
+# name of the checkpoint file, in the result folder
+CHECKPOINT_FILENAME = "checkpoint.npz"
+
+
+# maximum number of snapshots waiting for a background listener, the solver waits beyond that
+MAX_PENDING_SNAPSHOTS = 2
+
+
+class LoopWindow(NamedTuple):
+    """Summary of the loops ended since the previous call of a listener"""
+    step_number: int # number of loops in the window
+    start_time: float # simulation time at the beginning of the window
+    end_time: float # simulation time at the end of the window
+    min_delta: float
+    max_delta: float
+    mean_delta: float
+    last_delta: float
+
+
 class LoopListener(ABC):
 
     @abstractmethod
     def endOfLoop(self, current_delta: float, current_state: TimeStepState, current_simulation_time: float):
         """
-        Gets triggered when a loop has ended
+        Gets triggered when a loop has ended. The state is overwritten by later loops,
+        listeners keeping it should copy it (see 'TimeStepState#copy')
 
         Args:
             current_delta (float): delta used in for resolution
@@ -34,6 +66,151 @@ class LoopListener(ABC):
         """
         pass
 
+    def endOfWindow(self, window: LoopWindow, current_state: TimeStepState, current_simulation_time: float):
+        """
+        Gets triggered instead of 'endOfLoop' for listeners subscribed with 'batched=True',
+        by default forwards the last delta of the window to 'endOfLoop'
+
+        Args:
+            window (LoopWindow): summary of the loops ended since the previous call
+            current_state (TimeStepState): state result of the last loop
+            current_simulation_time (float): simulation time at the last loop end
+        """
+        self.endOfLoop(window.last_delta, current_state, current_simulation_time)
+
+    def endOfRun(self, profile_summary: dict | None):
+        """
+        Gets triggered when the run has ended, does nothing by default
+
+        Args:
+            profile_summary (dict | None): timing report of the run, see 'RunProfiler#getSummary', None if profiling is disabled
+        """
+        pass
+
+
+class LoopSubscription:
+    """
+    Decides when a subscribed listener is called and how: every N loops and/or every T of simulated time,
+    with the last loop or with a summary of the window, on the solver thread or on a background thread
+    """
+
+    def __init__(self, listener: LoopListener, every_steps: int | None = None, every_time: float | None = None,
+                 batched: bool = False, background: bool = False):
+        """
+        Args:
+            listener (LoopListener): listener to call
+            every_steps (int | None): number of loops between two calls
+            every_time (float | None): simulated time between two calls, if both are set the listener is called
+                as soon as one of the conditions is met, if none is set the listener is called after every loop
+            batched (bool): wether the listener receives a window summary through 'LoopListener#endOfWindow'
+            background (bool): wether the listener runs on its own thread with a snapshot of the state
+        """
+        if every_steps is None and every_time is None:
+            every_steps = 1
+        if every_steps is not None and every_steps < 1:
+            raise ValueError("every_steps should be at least 1")
+        if every_time is not None and every_time <= 0.0:
+            raise ValueError("every_time should always be positive and non-zero")
+
+        self.listener = listener
+        self.every_steps = every_steps
+        self.every_time = every_time
+        self.batched = batched
+        self.background = background
+        self.executor: ThreadPoolExecutor | None = None
+        self.pending: list[Future] = []
+        self.start(0.0)
+
+    def start(self, start_time: float):
+        """
+        Reset the window at the beginning of a run
+
+        Args:
+            start_time (float): simulation time at the beginning of the run
+        """
+        self.last_time_quotient = 0.0 if self.every_time is None else start_time // self.every_time
+        self._reset_window(start_time)
+        if self.background and self.executor is None:
+            self.executor = ThreadPoolExecutor(1)
+
+    def _reset_window(self, start_time: float):
+        self.window_start = start_time
+        self.window_steps = 0
+        self.window_min = float('inf')
+        self.window_max = float('-inf')
+        self.window_sum = 0.0
+
+    def endOfLoop(self, current_delta: float, current_state: TimeStepState, current_simulation_time: float):
+        """
+        Record a loop and call the listener if it is due
+        """
+        self.window_steps += 1
+        if self.batched:
+            self.window_min = min(self.window_min, current_delta)
+            self.window_max = max(self.window_max, current_delta)
+            self.window_sum += current_delta
+
+        is_due = self.every_steps is not None and self.window_steps >= self.every_steps
+        if self.every_time is not None:
+            time_quotient = current_simulation_time // self.every_time
+            if time_quotient > self.last_time_quotient:
+                self.last_time_quotient = time_quotient
+                is_due = True
+
+        if is_due:
+            self._fire(current_delta, current_state, current_simulation_time)
+
+    def _fire(self, current_delta: float, current_state: TimeStepState, current_simulation_time: float):
+        window = None
+        if self.batched:
+            window = LoopWindow(
+                self.window_steps, self.window_start, current_simulation_time,
+                self.window_min, self.window_max, self.window_sum / self.window_steps, current_delta
+            )
+        self._reset_window(current_simulation_time)
+
+        if self.executor is None:
+            self._call(window, current_delta, current_state, current_simulation_time)
+            return
+
+        # bound the memory used by snapshots
+        for future in [future for future in self.pending if future.done()]:
+            # propagates exceptions raised by the listener
+            future.result()
+        self.pending = [future for future in self.pending if not future.done()]
+        while len(self.pending) >= MAX_PENDING_SNAPSHOTS:
+            self.pending.pop(0).result()
+        self.pending.append(self.executor.submit(
+            self._call, window, current_delta, current_state.copy(), current_simulation_time
+        ))
+
+    def _call(self, window: LoopWindow | None, current_delta: float, current_state: TimeStepState, current_simulation_time: float):
+        if window is None:
+            self.listener.endOfLoop(current_delta, current_state, current_simulation_time)
+        else:
+            self.listener.endOfWindow(window, current_state, current_simulation_time)
+
+    def finish(self, last_delta: float, current_state: TimeStepState, current_simulation_time: float):
+        """
+        Call the listener with the loops not reported yet, and wait for background calls to end
+
+        Args:
+            last_delta (float): delta of the last loop
+            current_state (TimeStepState): final state
+            current_simulation_time (float): final simulation time
+        """
+        try:
+            if self.window_steps > 0:
+                self._fire(last_delta, current_state, current_simulation_time)
+            for future in self.pending:
+                # propagates exceptions raised by the listener
+                future.result()
+        finally:
+            self.pending = []
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+
 
 class ShallowWaterModel:
 
@@ -48,18 +225,19 @@ class ShallowWaterModel:
         :raises: NotImplementedError: This function is not implemented yet and will raise a NotImplementedError when called.
         """
 
-        self.loop_listeners: list[LoopListener] = []
+        self.loop_subscriptions: list[LoopSubscription] = []
 
         ####################### Reading #######################
 
         # Read mesh
-        mesh_reader = self._get_mesh_reader()
         mesh_file = configuration.getMeshFilePath()
+        mesh_reader = self._get_mesh_reader(configuration)
         raw_info = mesh_reader.read(mesh_file)
         raw_mesh_info = raw_info[:4]
 
         # Read bathymetry
         _, cell_bathymetry = raw_info[4:6]
+        bathymetry_file = configuration.getBathymetryFilePath()
 
         # Read first time step state
         initial_state_reader = InitialStateReader()
@@ -69,7 +247,7 @@ class ShallowWaterModel:
 
         ### Create the mesh
         boundary_origin: dict[Boundary, RawInlet|RawOutlet] = {}
-        mesh = MeshImpl.createFromPartialInformation(*(*raw_mesh_info, boundary_origin))
+        mesh = MeshImpl.createFromPartialInformation(*(*raw_mesh_info, boundary_origin), ordering=configuration.getCellOrdering())
         self.mesh = mesh
 
         ### Create boundary condition
@@ -88,60 +266,109 @@ class ShallowWaterModel:
             boundary_groups
         )
 
-        ### Create bathymetry dictionary
-        bathymetry = {}
-
-        # fill bathymetry dict with all cell's values
-        for cell in mesh.getCells():
-            bathymetry[cell] = cell_bathymetry[cell.getID()]
-
-        # adds ghost cell bathymetry
-        for boundary in mesh.getBoundaries():
-            boundary_edge = boundary.getEdge()
-            cell = boundary_edge.getCells()[0]
-            ghost_cell = boundary_edge.getGhostCell()
-            bathymetry[ghost_cell] = bathymetry[cell]
+        ### Create bathymetry array (real cells followed by ghost cells, same ordering as the state)
+        # a dedicated bathymetry file overrides the mesh's values, ghost cells take the value of their real cell
+        if bathymetry_file is not None:
+            bathymetry = Bathymetry.fromMesh(mesh, BathymetryReader().read(bathymetry_file, mesh))
+        else:
+            bathymetry = Bathymetry.fromMesh(mesh, (cell_bathymetry[cell.getID()] for cell in mesh.getCells()))
 
         # update ghost cell bathymetry for inflow and outflow
         for flow_boundary, raw_boundary in boundary_origin.items():
-            boundary_edge = flow_boundary.getEdge()
-            ghost_cell = boundary_edge.getGhostCell()
-            bathymetry[ghost_cell] = raw_boundary.ghost_cell_bathymetry
-
+            ghost_cell = flow_boundary.getEdge().getGhostCell()
+            bathymetry.setValue(ghost_cell, raw_boundary.ghost_cell_bathymetry)
 
         self.bathymetry = bathymetry
 
         ### Create initial state
-        raw_initial_state = initial_state_reader.read(initial_state_file, mesh.getCellNumber())
-        node_dictionary = {}
-        for i, cell in enumerate(mesh.getCells()):
-            node_dictionary[cell] = raw_initial_state[i]
+        # state cells are real cells followed by ghost cells, the same ordering as the bathymetry
+        self.state_cells = bathymetry.getCells()
+        self.restart_file = configuration.getRestartFilePath()
+        checkpoint = None
 
-        # fill state with empty node for ghost cells
-        for boundary in mesh.getBoundaries():
-            boundary_edge = boundary.getEdge()
-            ghost_cell = boundary_edge.getGhostCell()
-            node_dictionary[ghost_cell] = Node(0.0, 0.0, 0.0)
+        node_dictionary = {}
+        if self.restart_file is not None:
+            # resume from a checkpoint, ghost cells included
+            checkpoint = read_checkpoint(self.restart_file)
+            if len(checkpoint.h) != len(self.state_cells):
+                raise ValueError(f"Checkpoint {self.restart_file} has {len(checkpoint.h)} cells, "
+                                 f"expected {len(self.state_cells)}.")
+            if checkpoint.real_cell_number != len(mesh.getCells()):
+                raise ValueError(f"Checkpoint {self.restart_file} has {checkpoint.real_cell_number} real cells, "
+                                 f"expected {len(mesh.getCells())}.")
+            if not np.array_equal(checkpoint.ids, [cell.getID() for cell in mesh.getCells()]):
+                raise ValueError(f"Checkpoint {self.restart_file} has been written with another cell ordering.")
+            for cell, h, u, v in zip(self.state_cells, checkpoint.h.tolist(), checkpoint.u.tolist(), checkpoint.v.tolist()):
+                node_dictionary[cell] = Node(h, u, v)
+        else:
+            # initial states are sorted by cell ID, whatever the internal ordering of the mesh
+            h, u, v = initial_state_reader.read(initial_state_file, mesh.getCellNumber())
+            sorted_cells = sorted(mesh.getCells(), key=lambda cell: cell.getID())
+            for cell, values in zip(sorted_cells, zip(h.tolist(), u.tolist(), v.tolist())):
+                node_dictionary[cell] = Node(*values)
+
+            # fill state with empty node for ghost cells
+            for boundary in mesh.getBoundaries():
+                boundary_edge = boundary.getEdge()
+                ghost_cell = boundary_edge.getGhostCell()
+                node_dictionary[ghost_cell] = Node(0.0, 0.0, 0.0)
 
         self.initial_state = TimeStepState(node_dictionary)
 
         # Instantiate used resolution method based on parameters
         self.resolution_method = self._get_resolution_method(configuration)
+        self.resolution_method.allocate(mesh)
 
         # Initialize time variables
         self.use_cfl = configuration.isDeltaAdaptive()
-        self.default_delta = configuration.getDefaultDelta() # used only if not adaptative
+        self.default_delta = configuration.getDefaultDelta() # used only if not adaptative, or if every cell is dry
+        # local time stepping advances every cell by a class of its own CFL limit, it is always adaptative
+        self.scheduler = None
+        if configuration.isLocalTimeStepping():
+            self.scheduler = LocalTimeStepScheduler.fromMesh(mesh, configuration.getTimeStepLevels())
+        self.cell_lengths = dt.get_cell_lengths(mesh) if self.use_cfl or self.scheduler is not None else None
         delta_to_write = configuration.getDeltaToWrite()
 
         # Instantiate result writer
         result_folder_path = configuration.getResultFolderPath()
-        self.result_writer = ResultWriter(mesh, result_folder_path, delta_to_write)
+        self.result_writer = ResultWriter(mesh, result_folder_path, delta_to_write, configuration.getOutputCompression())
+
+        # Initialize virtual gauges, recorded without writing full snapshots
+        self.result_folder = result_folder_path
+        self.gauge_recorder = None
+        gauges_file = configuration.getGaugesFilePath()
+        if gauges_file is not None:
+            gauges = GaugeReader().read(gauges_file)
+            self.gauge_recorder = GaugeRecorder(mesh, bathymetry, gauges, configuration.getGaugesEverySteps())
 
         # Initialize runner variables
         self.simulation_time = configuration.getSimulationTime()
-        self.output_mode = configuration.getOutputMode()
-
-    def _get_mesh_reader(self) -> MeshReader:
+        self.output_modes = configuration.getOutputModes()
+        self.start_time = 0.0
+        self.start_delta = self.default_delta
+
+        # Initialize checkpoint variables
+        self.checkpoint_delta = configuration.getCheckpointDelta() # no checkpoint if None
+        self.checkpoint_file = os.path.join(result_folder_path, CHECKPOINT_FILENAME)
+
+        # Initialize profiling, disabled profilers do not measure anything
+        self.profile_file = configuration.getProfileFilePath()
+        self.profiler = RunProfiler(mesh.getCellNumber(), enabled=self.profile_file is not None)
+
+        # Restore everything that depends on simulation time
+        if checkpoint is not None:
+            self.start_time = checkpoint.simulation_time
+            self.start_delta = checkpoint.delta
+            self.result_writer.restoreCheckpointState(checkpoint.result_writer_state)
+            if len(checkpoint.boundary_condition_states) != len(self.boundary_conditions):
+                raise ValueError(f"Checkpoint {self.restart_file} does not match boundary conditions.")
+            for bc, bc_state in zip(self.boundary_conditions, checkpoint.boundary_condition_states):
+                bc.restoreCheckpointState(bc_state)
+            # series recorded before the restart are kept, later records are appended
+            if self.gauge_recorder is not None and checkpoint.gauge_recorder_state is not None:
+                self.gauge_recorder.restoreCheckpointState(checkpoint.gauge_recorder_state)
+
+    def _get_mesh_reader(self, configuration: Configuration) -> MeshReader:
         """
         Get the correct implementation of Mesh reader according to the needs
 
@@ -149,8 +376,19 @@ class ShallowWaterModel:
             MeshReader: correct implementation of a mesh reader
         """
 
-        from dassflow2d_py.input.DassflowMeshReader import DassflowMeshReader
-        return DassflowMeshReader()
+        mesh_format = configuration.getMeshFormat()
+        if mesh_format is MeshFormat.AUTO:
+            mesh_format = mesh_format_of(configuration.getMeshFilePath())
+
+        if mesh_format is MeshFormat.GMSH:
+
+            from dassflow2d_py.input.GmshMeshReader import GmshMeshReader
+            return GmshMeshReader()
+
+        else:
+
+            from dassflow2d_py.input.DassflowMeshReader import DassflowMeshReader
+            return DassflowMeshReader()
 
     def _get_resolution_method(self, configuration: Configuration) -> ResolutionMethod:
         """
@@ -172,42 +410,190 @@ class ShallowWaterModel:
 
             raise NotImplementedError(f"Combination of {temporal_scheme} temporal scheme and {spatial_scheme} spatial scheme is not supported yet.")
 
-    def subscribe(self, loop_listener: LoopListener):
-        self.loop_listeners.append(loop_listener)
+    def _create_loop_states(self) -> tuple[TimeStepState, TimeStepState]:
+        """
+        Create the two states the time loop swaps, starting from the initial state.
+        They are backed by the state buffers of the resolution workspace when it has one, so that steps
+        do not copy states.
 
-    def run(self):
+        Returns:
+            tuple[TimeStepState, TimeStepState]: current state (a copy of the initial state) and spare state
         """
-        Starts a run on the shallow water model
+        workspace = self.resolution_method.getWorkspace()
+        if workspace is None:
+            return self.initial_state, self.initial_state.copy()
+        current_values = workspace.getCurrentState()
+        h, u, v = self.initial_state.toArrays(self.state_cells)
+        current_values[:, 0], current_values[:, 1], current_values[:, 2] = h, u, v
+        return (TimeStepState.fromArray(current_values, self.state_cells),
+                TimeStepState.fromArray(workspace.getNextState(), self.state_cells))
+
+    def _write_checkpoint(self, current_state: TimeStepState, current_simulation_time: float, delta: float):
         """
+        Write a checkpoint allowing to resume the simulation from this point
 
-        delta = self.default_delta
-        current_simulation_time = 0.0
-        current_state = self.initial_state
+        Args:
+            current_state (TimeStepState): state at the end of the loop
+            current_simulation_time (float): simulation time at the end of the loop
+            delta (float): delta used for the loop
+        """
+        h, u, v = current_state.toArrays(self.state_cells)
+        write_checkpoint(self.checkpoint_file, Checkpoint(
+            simulation_time=current_simulation_time,
+            delta=delta,
+            h=h,
+            u=u,
+            v=v,
+            result_writer_state=self.result_writer.getCheckpointState(),
+            boundary_condition_states=[bc.getCheckpointState() for bc in self.boundary_conditions],
+            ids=np.array([cell.getID() for cell in self.mesh.getCells()], dtype=np.int64),
+            real_cell_number=len(self.mesh.getCells()),
+            gauge_recorder_state=self.gauge_recorder.getCheckpointState() if self.gauge_recorder is not None else None
+        ))
+
+    def subscribe(self, loop_listener: LoopListener, every_steps: int | None = None, every_time: float | None = None,
+                  batched: bool = False, background: bool = False):
+        """
+        Register a listener called at the end of loops, by default after every single loop
 
-        # Iterative call loop
-        while current_simulation_time < self.simulation_time:
+        Args:
+            loop_listener (LoopListener): listener to register
+            every_steps (int | None): number of loops between two calls
+            every_time (float | None): simulated time between two calls, if both are set the listener is called
+                as soon as one of the conditions is met
+            batched (bool): wether the listener receives a summary of the loops through 'LoopListener#endOfWindow'
+            background (bool): wether the listener runs on its own thread with a snapshot of the state,
+                so that it does not block the solver
+        """
+        self.loop_subscriptions.append(LoopSubscription(loop_listener, every_steps, every_time, batched, background))
 
-            # update all boundary conditions
-            for bc in self.boundary_conditions:
-                bc.update(self.bathymetry, current_state, current_simulation_time)
+    @property
+    def loop_listeners(self) -> list[LoopListener]:
+        """
+        Listeners registered with 'subscribe', in registration order. Former attribute holding the listeners,
+        now read-only: listeners are wrapped in the subscriptions of 'loop_subscriptions'
+        """
+        return [subscription.listener for subscription in self.loop_subscriptions]
 
-            # get time step
-            if self.use_cfl:
-                delta = dt.get_delta_using_cfl(current_state, self.mesh)
+    def getProfiler(self) -> RunProfiler:
+        """
+        Get the profiler of the run, listeners may read it during the run using 'RunProfiler#getSummary'
 
-            # resolve using resolution method
-            current_state = self.resolution_method.resolve(current_state, delta, self.mesh, self.bathymetry)
+        Returns:
+            RunProfiler: profiler of the run, only measuring times if a profile file is configured
+        """
+        return self.profiler
 
-            current_simulation_time += delta
+    def run(self):
+        """
+        Starts a run on the shallow water model
+        """
 
-            if self.result_writer.isTimeToWrite(current_simulation_time):
+        delta = self.start_delta
+        current_simulation_time = self.start_time
+        # the resolution writes into the spare state, then both states are swapped (ping-pong)
+        current_state, spare_state = self._create_loop_states()
+        last_checkpoint_quotient = 0 if self.checkpoint_delta is None else current_simulation_time // self.checkpoint_delta
+
+        profiler = self.profiler
+        for subscription in self.loop_subscriptions:
+            subscription.start(current_simulation_time)
+
+        # Iterative call loop, subscriptions are finished even if it fails
+        completed = False
+        try:
+            while current_simulation_time < self.simulation_time:
+
+                mark = profiler.tick()
+
+                # update all boundary conditions
+                for bc in self.boundary_conditions:
+                    bc.update(self.bathymetry, current_state, current_simulation_time)
+                mark = profiler.record(BOUNDARY_CONDITIONS, mark)
+
+                # get time step, a loop covers a whole cycle of time step classes with local time stepping
+                if self.scheduler is not None or self.use_cfl:
+                    values = current_state.getValues()
+                    if values is not None:
+                        real_values = values[:self.mesh.getCellNumber()]
+                        h, u, v = real_values[:, 0], real_values[:, 1], real_values[:, 2]
+                    else:
+                        h, u, v = current_state.toArrays(self.mesh.getCells())
+                    cell_deltas = dt.get_cell_deltas(h, u, v, self.cell_lengths)
+                    if self.scheduler is not None:
+                        self.scheduler.classify(cell_deltas, self.default_delta)
+                        delta = self.scheduler.getCycleDelta()
+                    else:
+                        cfl_delta = float(cell_deltas.min()) if len(cell_deltas) else np.inf
+                        delta = cfl_delta if np.isfinite(cfl_delta) else self.default_delta
+                mark = profiler.record(DELTA, mark)
+
+                # resolve using resolution method
+                if self.scheduler is not None:
+                    next_state = self.resolution_method.resolveLocal(current_state, self.scheduler, self.mesh, self.bathymetry, spare_state)
+                else:
+                    next_state = self.resolution_method.resolve(current_state, delta, self.mesh, self.bathymetry, spare_state)
+                if next_state is not current_state:
+                    spare_state = current_state
+                current_state = next_state
+                mark = profiler.record(RESOLVE, mark)
+
+                current_simulation_time += delta
+
+                if self.result_writer.isTimeToWrite(current_simulation_time):
+
+                    self.result_writer.save(current_state, current_simulation_time)
+
+                if self.gauge_recorder is not None and self.gauge_recorder.isTimeToRecord():
+
+                    self.gauge_recorder.record(current_state, current_simulation_time)
+                mark = profiler.record(WRITE, mark)
+
+                if self.checkpoint_delta is not None:
+
+                    checkpoint_quotient = current_simulation_time // self.checkpoint_delta
+                    if checkpoint_quotient > last_checkpoint_quotient:
+                        last_checkpoint_quotient = checkpoint_quotient
+                        self._write_checkpoint(current_state, current_simulation_time, delta)
+                mark = profiler.record(CHECKPOINT, mark)
+
+                profiler.endOfStep()
+
+                # call all end of loop listeners
+                for subscription in self.loop_subscriptions:
+                    subscription.endOfLoop(delta, current_state, current_simulation_time)
+                profiler.record(LISTENERS, mark)
+
+            completed = True
+
+        finally:
+
+            self.resolution_method.close()
+
+            # report loops not reported yet and wait for background listeners
+            mark = profiler.tick()
+            listener_error = None
+            for subscription in self.loop_subscriptions:
+                try:
+                    subscription.finish(delta, current_state, current_simulation_time)
+                except Exception as error:
+                    listener_error = listener_error or error
+            mark = profiler.record(LISTENERS, mark)
+            # an error of the loop takes precedence over errors of listeners
+            if completed and listener_error is not None:
+                raise listener_error
 
-                self.result_writer.save(current_state, current_simulation_time)
+        ############### Results post-treatment ################=
 
-            # call all end of loop listeners
-            for listener in self.loop_listeners:
-                listener.endOfLoop(delta, current_state, current_simulation_time)
+        self.result_writer.writeAll(self.output_modes)
+        if self.gauge_recorder is not None:
+            self.gauge_recorder.write(self.result_folder, self.output_modes)
+        profiler.record(WRITE_ALL, mark)
 
-        ############### Results post-treatment ################=
+        profile_summary = None
+        if profiler.isEnabled():
+            profile_summary = profiler.getSummary()
+            profiler.writeSummary(self.profile_file)
 
-        self.result_writer.writeAll(self.output_mode)
\ No newline at end of file
+        for subscription in self.loop_subscriptions:
+            subscription.listener.endOfRun(profile_summary)
@@ -2,8 +2,9 @@ from abc import ABC, abstractmethod
 from typing import Type, Iterable, Sequence
 
 from dassflow2d_py.input.Configuration import Configuration
-from dassflow2d_py.input.file_reading import extract, next_line
-from dassflow2d_py.mesh.Mesh import Cell, Boundary, BoundaryType
+from dassflow2d_py.input.file_reading import extract, open_text, read_lines
+from dassflow2d_py.mesh.Mesh import Boundary, BoundaryType
+from dassflow2d_py.mesh.Bathymetry import Bathymetry
 from dassflow2d_py.d2dtime.TimeStepState import TimeStepState
 
 
@@ -17,18 +18,36 @@ class BoundaryCondition(ABC):
         pass
 
     @abstractmethod
-    def update(self, bathymetry: dict[Cell, float], current_state: TimeStepState, current_simulation_time: float):
+    def update(self, bathymetry: Bathymetry, current_state: TimeStepState, current_simulation_time: float):
         """
         Do all necessary operations for a boundary condition to correctly force it's condition
 
         Args:
             mesh (Mesh): mesh geometry
-            bathymetry (dict[Cell, float]): bathymetry z for each cell
+            bathymetry (Bathymetry): bathymetry z for each cell (including ghost cells)
             current_state (TimeStepState): every node value in the simulation
             current_simulation_time (float): current simulation time at the call time of this function
         """
         pass
 
+    def getCheckpointState(self) -> dict:
+        """
+        Get the internal state needed to resume a simulation with this boundary condition
+
+        Returns:
+            dict: json serializable state, empty for stateless boundary conditions
+        """
+        return {}
+
+    def restoreCheckpointState(self, checkpoint_state: dict):
+        """
+        Restore an internal state previously returned by 'getCheckpointState'
+
+        Args:
+            checkpoint_state (dict): state to restore
+        """
+        pass
+
 
 # implementations imports here ...
 from dassflow2d_py.boundary.Discharge1 import Discharge1
@@ -81,14 +100,13 @@ def createBoundaryConditions(
     # Step 2: Read bc_file to map group numbers to boundary condition arguments
     boundary_condition_arguments: dict[int, tuple] = {}
 
-    with open(bc_filepath, 'r') as bc_file:
+    with open_text(bc_filepath) as bc_file:
 
         # first content line should be the number of boundary conditions
         boundary_conditions_number, = extract(bc_file, (int,))
 
-        for _ in range(boundary_conditions_number):
+        for current_bc_line in read_lines(bc_file, boundary_conditions_number):
 
-            current_bc_line = next_line(bc_file)
             current_bc_arguments = current_bc_line.strip().split()
             group_number = int(current_bc_arguments[0])
             # store the whole line as "args" for the boundary condition
@@ -1,4 +1,4 @@
-from dassflow2d_py.input.file_reading import extract, next_line
+from dassflow2d_py.input.file_reading import extract, open_text, read_lines, read_array
 from dassflow2d_py.boundary.BoundaryCondition import BoundaryCondition
 
 
@@ -23,7 +23,7 @@ class DynamicBoundaryCondition(BoundaryCondition):
             dict[float, float]: mapping of values for every time steps
         """
 
-        with open(filepath, 'r') as file:
+        with open_text(filepath) as file:
             number_of_dictionaries, = extract(file, (int,))
             if dictionary_number > number_of_dictionaries:
                 raise ValueError(f"Dictionary number {dictionary_number} is incorrect.")
@@ -31,15 +31,12 @@ class DynamicBoundaryCondition(BoundaryCondition):
             # Skip non-relevant hydrographs
             for _ in range(dictionary_number - 1):
                 number_of_entries, = extract(file, (int,))
-                for _ in range(number_of_entries):
-                    next_line(file)
+                read_lines(file, number_of_entries)
 
-            # Read the correct hydrograph
-            dictionary = {}
+            # Read the correct hydrograph, entries being 'time value' lines
             number_of_entries, = extract(file, (int,))
-            for _ in range(number_of_entries):
-                simulation_time, q = extract(file, (float, float))
-                dictionary[simulation_time] = q
+            entries = read_array(file, number_of_entries, 2)
+            dictionary = dict(zip(entries[:, 0].tolist(), entries[:, 1].tolist()))
 
         return dictionary
 
@@ -51,6 +48,10 @@ class DynamicBoundaryCondition(BoundaryCondition):
         self.data = self._read_dynamic_data(dynamic_data_filepath, dictionary_number)
         if len(self.data) == 0:
             raise ValueError(f"No entry has been read in file {dynamic_data_filepath} for dictionary number {dictionary_number}")
+        # sorted points of the function, and position of the last interval used for interpolation
+        self.times = sorted(self.data.keys())
+        self.values = [self.data[time] for time in self.times]
+        self.cursor = 0
 
     def interpolate_dynamic_value(self, current_simulation_time: float) -> float:
         """
@@ -64,30 +65,36 @@ class DynamicBoundaryCondition(BoundaryCondition):
         """
 
         # If there is only one entry in data dict, then don't interpolate and return this constant
-        if len(self.data) == 1:
+        if len(self.times) == 1:
             # return the only entry's value
-            return next(iter(self.data.values()))
+            return self.values[0]
 
-        # Get the time intervals from data dict keys
-        times = sorted(self.data.keys())
+        times = self.times
         number_of_times = len(times)
 
         # If current simulation time is outside the range, use the closest boundary
-        last_time = times[number_of_times-1]
         if current_simulation_time < times[0]:
-            t0, t1 = times[0], times[1]
-        elif current_simulation_time > last_time:
-            t0, t1 = times[number_of_times-2], last_time
-        # Find the two closest times
+            index = 0
+        elif current_simulation_time > times[number_of_times-1]:
+            index = number_of_times - 2
+        # Find the first interval containing current simulation time, starting from the cursor
+        # (simulation time mostly moves forward, so this is usually immediate)
         else:
-            t0, t1 = times[0], times[1]
-            for i in range(len(times) - 1):
-                if times[i] <= current_simulation_time <= times[i + 1]:
-                    t0, t1 = times[i], times[i + 1]
-                    break
+            index = self.cursor
+            while index > 0 and current_simulation_time <= times[index]:
+                index -= 1
+            while current_simulation_time > times[index + 1]:
+                index += 1
+            self.cursor = index
 
-        v0 = self.data[t0]
-        v1 = self.data[t1]
+        t0, t1 = times[index], times[index + 1]
+        v0, v1 = self.values[index], self.values[index + 1]
 
         # Linear interpolation
         return v0 + (v1 - v0) * (current_simulation_time - t0) / (t1 - t0)
+
+    def getCheckpointState(self) -> dict:
+        return {"cursor": self.cursor}
+
+    def restoreCheckpointState(self, checkpoint_state: dict):
+        self.cursor = int(checkpoint_state["cursor"])
@@ -1,42 +1,81 @@
+from typing import Sequence
+
+import numpy as np
+
 from dassflow2d_py.boundary.BoundaryCondition import BoundaryCondition
 
-from dassflow2d_py.mesh.Mesh import Cell, Boundary, BoundaryType
+from dassflow2d_py.mesh.Mesh import Boundary, BoundaryType, Cell
+from dassflow2d_py.mesh.Bathymetry import Bathymetry
 from dassflow2d_py.d2dtime.TimeStepState import TimeStepState
 
 
+# reflection of the left state: h and v are kept, u changes sign
+REFLECTION = np.array([1.0, -1.0, 1.0])
+
+
 class Wall(BoundaryCondition):
     def __init__(self, configuration, boundaries: list[Boundary], *args):
         super().__init__(configuration, boundaries, *args)
+        edges = [boundary.getEdge() for boundary in self.boundaries]
+        self.left_cells: list[Cell] = [edge.getCells()[0] for edge in edges]
+        self.ghost_cells: list[Cell] = [edge.getGhostCell() for edge in edges]
+        # bathymetry indices of left and ghost cells, resolved once per bathymetry object
+        self.indexed_bathymetry: Bathymetry | None = None
+        self.left_indices = np.empty(0, dtype=np.int64)
+        self.ghost_indices = np.empty(0, dtype=np.int64)
+        # state rows of left and ghost cells, resolved once per state cell sequence
+        self.indexed_cells: Sequence[Cell] | None = None
+        self.left_rows = np.empty(0, dtype=np.int64)
+        self.ghost_rows = np.empty(0, dtype=np.int64)
 
     def getBoundaryType(self) -> BoundaryType:
         return BoundaryType.WALL
 
-    def update(self, bathymetry: dict[Cell, float], current_state: TimeStepState, current_simulation_time: float):
+    def _index_bathymetry(self, bathymetry: Bathymetry):
+        """
+        Resolve the bathymetry array index of the left and ghost cell of every boundary
+        """
+        self.left_indices = bathymetry.getIndices(self.left_cells)
+        self.ghost_indices = bathymetry.getIndices(self.ghost_cells)
+        self.indexed_bathymetry = bathymetry
+
+    def _index_state(self, cells: Sequence[Cell]):
+        """
+        Resolve the state array row of the left and ghost cell of every boundary
+        """
+        rows = {cell: row for row, cell in enumerate(cells)}
+        self.left_rows = np.array([rows[cell] for cell in self.left_cells], dtype=np.int64)
+        self.ghost_rows = np.array([rows[cell] for cell in self.ghost_cells], dtype=np.int64)
+        self.indexed_cells = cells
+
+    def update(self, bathymetry: Bathymetry, current_state: TimeStepState, current_simulation_time: float):
         """
         Update the boundary condition for a wall.
         For a wall, the right state is a reflection of the left state:
         - hR = hL + zL - zR
         - uR = -uL
         - vR = vL
+        States backed by an array are updated with a single array operation over all the boundaries.
         """
-        for boundary in self.boundaries:
-            edge = boundary.getEdge()
-            ghost_cell = edge.getGhostCell()
-            left_cell = edge.getCells()[0]  # Assuming the left cell is the first cell
-
-            # Get left cell values
-            hL = current_state.getNode(left_cell).h
-            uL = current_state.getNode(left_cell).u
-            vL = current_state.getNode(left_cell).v
-            zL = bathymetry[left_cell]
-            zR = bathymetry[ghost_cell]
-
-            # Calculate right cell values for wall boundary
-            hR = hL + zL - zR
-            uR = -uL
-            vR = vL
-
-            # Update ghost cell values
-            current_state.getNode(ghost_cell).h = hR
-            current_state.getNode(ghost_cell).u = uR
-            current_state.getNode(ghost_cell).v = vR
\ No newline at end of file
+        if bathymetry is not self.indexed_bathymetry:
+            self._index_bathymetry(bathymetry)
+
+        z = bathymetry.getValues()
+        steps = z[self.left_indices] - z[self.ghost_indices]
+
+        values, cells = current_state.getValues(), current_state.getCells()
+        if values is None or cells is None:
+            # states made of independent nodes
+            for left_cell, ghost_cell, step in zip(self.left_cells, self.ghost_cells, steps.tolist()):
+                left_node = current_state.getNode(left_cell)
+                ghost_node = current_state.getNode(ghost_cell)
+                ghost_node.h = left_node.h + step
+                ghost_node.u = -left_node.u
+                ghost_node.v = left_node.v
+            return
+
+        if cells is not self.indexed_cells:
+            self._index_state(cells)
+        reflected = values[self.left_rows] * REFLECTION
+        reflected[:, 0] += steps
+        values[self.ghost_rows] = reflected
@@ -0,0 +1,7 @@
+# Physical and numerical constants shared by every layer (time stepping, resolution, output)
+
+# gravitational acceleration (m/s^2)
+GRAVITY = 9.81
+
+# water depth under which a cell is considered dry
+DRY_THRESHOLD = 1e-6
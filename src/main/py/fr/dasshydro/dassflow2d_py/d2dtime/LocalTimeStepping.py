@@ -0,0 +1,183 @@
+import math
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+from dassflow2d_py.mesh.Mesh import Mesh
+from dassflow2d_py.mesh.connectivity import edge_cell_indices
+
+
+# number of time step classes, cells of class l advance with 2^l times the base delta
+DEFAULT_LEVELS = 4
+
+
+class Substep(NamedTuple):
+    """Represents a substep of a local time stepping cycle, of one base delta"""
+    time_offset: float # time since the start of the cycle, at which fluxes are evaluated
+    edges: np.ndarray # edges whose flux is evaluated at this substep
+    edge_deltas: np.ndarray # time covered by the flux of every edge
+    cells: np.ndarray # real cells completing their own step at the end of the substep
+
+
+class LocalTimeStepScheduler:
+    """
+    Schedules local time stepping (multi-rate): cells are binned into power of two time step classes
+    from their CFL limit, and every class advances at its own rate during a cycle of 2^L base deltas.
+
+    Classes of neighbor cells differ by at most one, and the flux through an edge is evaluated at the rate
+    of its finest side. Every edge flux, times the time it covers, is accumulated into the register of both
+    sides and a cell applies its register when it completes its own step, so the scheme stays conservative
+    at class interfaces.
+    Cells are referred to by their index in the state (real cells followed by ghost cells).
+    """
+
+    def __init__(self, left_cells: np.ndarray, right_cells: np.ndarray, cell_number: int,
+                 real_cell_number: int | None = None, levels: int = DEFAULT_LEVELS):
+        """
+        Args:
+            left_cells (np.ndarray): index of the first cell of every edge
+            right_cells (np.ndarray): index of the second cell of every edge (ghost cells included)
+            cell_number (int): number of cells (real cells followed by ghost cells)
+            real_cell_number (int | None): number of real cells, defaults to all cells
+            levels (int): number of time step classes
+        """
+        if len(left_cells) != len(right_cells):
+            raise ValueError("left and right cell arrays should have the same length")
+        if levels < 1:
+            raise ValueError("there should be at least one time step class")
+
+        self.left_cells = np.asarray(left_cells, dtype=np.int64)
+        self.right_cells = np.asarray(right_cells, dtype=np.int64)
+        self.cell_number = cell_number
+        self.real_cell_number = real_cell_number if real_cell_number is not None else cell_number
+        self.levels = levels
+
+        self.base_delta = math.inf
+        self.cell_levels = np.zeros(cell_number, dtype=np.int64)
+        self.edge_levels = np.zeros(len(self.left_cells), dtype=np.int64)
+        self.substeps: list[Substep] = []
+
+    @staticmethod
+    def fromMesh(mesh: Mesh, levels: int = DEFAULT_LEVELS) -> 'LocalTimeStepScheduler':
+        """
+        Create the scheduler of a mesh, cells being ordered as the state
+
+        Args:
+            mesh (Mesh): mesh of the simulation
+            levels (int): number of time step classes
+
+        Returns:
+            LocalTimeStepScheduler: scheduler, to be classified before use
+        """
+        left_cells, right_cells, cell_number = edge_cell_indices(mesh)
+        return LocalTimeStepScheduler(left_cells, right_cells, cell_number, mesh.getCellNumber(), levels)
+
+    def classify(self, cell_deltas: np.ndarray, default_delta: float):
+        """
+        Bin cells into time step classes and build the substeps of the next cycle
+
+        Args:
+            cell_deltas (np.ndarray): time step limit of every real cell, infinite for dry cells
+            default_delta (float): base delta used if every cell is dry
+        """
+        cell_deltas = np.asarray(cell_deltas, dtype=np.float64)
+        finite = np.isfinite(cell_deltas)
+        self.base_delta = float(cell_deltas[finite].min()) if np.any(finite) else default_delta
+
+        # class of every cell, dry and ghost cells in the coarsest class
+        top = self.levels - 1
+        levels = np.full(self.cell_number, top, dtype=np.int64)
+        with np.errstate(divide='ignore'):
+            ratios = np.floor(np.log2(cell_deltas[finite] / self.base_delta)).astype(np.int64)
+        levels[np.flatnonzero(finite)] = np.clip(ratios, 0, top)
+
+        # neighbors differ by at most one class, refining never breaks stability
+        while True:
+            smoothed = levels.copy()
+            np.minimum.at(smoothed, self.left_cells, levels[self.right_cells] + 1)
+            np.minimum.at(smoothed, self.right_cells, levels[self.left_cells] + 1)
+            if np.array_equal(smoothed, levels):
+                break
+            levels = smoothed
+        self.cell_levels = levels
+        self.edge_levels = np.minimum(levels[self.left_cells], levels[self.right_cells])
+
+        # a cycle lasts one step of the coarsest class in use
+        cycle_level = int(levels[:self.real_cell_number].max()) if self.real_cell_number else 0
+        edges_by_level = [np.flatnonzero(self.edge_levels == level) for level in range(cycle_level + 1)]
+        cells_by_level = [np.flatnonzero(levels[:self.real_cell_number] == level) for level in range(cycle_level + 1)]
+        self.substeps = []
+        for k in range(2 ** cycle_level):
+            # classes starting a step at k, and classes completing a step at the end of k
+            starting = [level for level in range(cycle_level + 1) if k % 2 ** level == 0]
+            completing = [level for level in range(cycle_level + 1) if (k + 1) % 2 ** level == 0]
+            self.substeps.append(Substep(
+                time_offset=k * self.base_delta,
+                edges=np.concatenate([edges_by_level[level] for level in starting]),
+                edge_deltas=np.concatenate([
+                    np.full(len(edges_by_level[level]), 2 ** level * self.base_delta) for level in starting
+                ]),
+                cells=np.concatenate([cells_by_level[level] for level in completing])
+            ))
+
+    def getBaseDelta(self) -> float:
+        return self.base_delta
+
+    def getCycleDelta(self) -> float:
+        """
+        Get the simulated time covered by a cycle
+
+        Returns:
+            float: base delta times the number of substeps
+        """
+        return self.base_delta * len(self.substeps)
+
+    def getSubsteps(self) -> list[Substep]:
+        return self.substeps
+
+    def getCellLevels(self) -> np.ndarray:
+        """
+        Get the time step class of every cell, a cell of class l advancing with 2^l base deltas
+
+        Returns:
+            np.ndarray: class of every cell (real cells followed by ghost cells)
+        """
+        return self.cell_levels
+
+    def getWorkRatio(self) -> float:
+        """
+        Get the cost of a cycle relative to global time stepping with the base delta,
+        counted in cell updates
+
+        Returns:
+            float: work ratio, 1 when every cell is in the finest class
+        """
+        real_levels = self.cell_levels[:self.real_cell_number]
+        if not len(real_levels):
+            return 1.0
+        return float(np.sum(0.5 ** real_levels)) / len(real_levels)
+
+    def advance(self, kernel: Callable[[float, np.ndarray], np.ndarray | tuple[np.ndarray, np.ndarray]],
+                apply: Callable[[float, np.ndarray, np.ndarray], None], components: int):
+        """
+        Run a cycle: evaluate fluxes substep by substep and apply them to cells completing their step
+
+        Args:
+            kernel (Callable[[float, np.ndarray], np.ndarray | tuple[np.ndarray, np.ndarray]]): function returning,
+                from the time offset and the edges of a substep, the flux of every edge per unit of time, with shape
+                (edge number, components), or the flux leaving first cells and the flux entering second cells
+                when they differ
+            apply (Callable[[float, np.ndarray, np.ndarray], None]): function updating, from the time offset at
+                the end of the substep, the completing cells with their accumulated residual (flux times time)
+            components (int): number of flux components
+        """
+        register = np.zeros((self.cell_number, components), dtype=np.float64)
+        for substep in self.substeps:
+            if len(substep.edges):
+                flux = kernel(substep.time_offset, substep.edges)
+                left_flux, right_flux = flux if isinstance(flux, tuple) else (flux, flux)
+                np.subtract.at(register, self.left_cells[substep.edges], left_flux * substep.edge_deltas[:, None])
+                np.add.at(register, self.right_cells[substep.edges], right_flux * substep.edge_deltas[:, None])
+            if len(substep.cells):
+                apply(substep.time_offset + self.base_delta, substep.cells, register[substep.cells])
+                register[substep.cells] = 0.0
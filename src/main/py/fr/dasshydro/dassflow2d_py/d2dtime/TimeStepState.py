@@ -1,4 +1,6 @@
-from typing import Iterable
+from typing import Iterable, Sequence
+
+import numpy as np
 
 from dassflow2d_py.mesh.Mesh import Cell
 
@@ -10,10 +12,111 @@ class Node:
         self.v = v
 
 
+class NodeView(Node):
+    """
+    Node whose values are a row of a state array (columns h, u and v), see 'TimeStepState#fromArray'
+    """
+
+    def __init__(self, values: np.ndarray, row: int):
+        self.values = values
+        self.row = row
+
+    @property
+    def h(self) -> float:
+        return float(self.values[self.row, 0])
+
+    @h.setter
+    def h(self, value: float):
+        self.values[self.row, 0] = value
+
+    @property
+    def u(self) -> float:
+        return float(self.values[self.row, 1])
+
+    @u.setter
+    def u(self, value: float):
+        self.values[self.row, 1] = value
+
+    @property
+    def v(self) -> float:
+        return float(self.values[self.row, 2])
+
+    @v.setter
+    def v(self, value: float):
+        self.values[self.row, 2] = value
+
+
 class TimeStepState:
 
     def __init__(self, state: dict[Cell, Node]):
         self.state = state
+        # array holding the values of every node, when nodes are views of its rows
+        self.values: np.ndarray | None = None
+        self.cells: Sequence[Cell] | None = None
+
+    @staticmethod
+    def fromArray(values: np.ndarray, cells: Sequence[Cell]) -> 'TimeStepState':
+        """
+        Create a state whose nodes are views of the rows of an array, so that array operations and node updates
+        (e.g. boundary conditions) see each other's changes
+
+        Args:
+            values (np.ndarray): h, u and v of every cell, shape (cell number, 3), not copied
+            cells (Sequence[Cell]): cell of every row
+
+        Returns:
+            TimeStepState: state backed by the array
+        """
+        state = TimeStepState({cell: NodeView(values, row) for row, cell in enumerate(cells)})
+        state.values = values
+        state.cells = cells
+        return state
 
     def getNode(self, cell: Cell) -> Node:
         return self.state[cell]
+
+    def getValues(self) -> np.ndarray | None:
+        """
+        Get the array backing the state, see 'fromArray'
+
+        Returns:
+            np.ndarray | None: h, u and v of every cell, in the order of 'getCells', None if the state is not backed by an array
+        """
+        return self.values
+
+    def getCells(self) -> Sequence[Cell] | None:
+        """
+        Get the cell of every row of the array backing the state
+
+        Returns:
+            Sequence[Cell] | None: cells, None if the state is not backed by an array
+        """
+        return self.cells
+
+    def copy(self) -> 'TimeStepState':
+        """
+        Snapshot of the state, nodes are copied so that later updates of this state are not visible in the snapshot
+
+        Returns:
+            TimeStepState: independent copy of the state
+        """
+        if self.values is not None and self.cells is not None:
+            return TimeStepState.fromArray(self.values.copy(), self.cells)
+        return TimeStepState({cell: Node(node.h, node.u, node.v) for cell, node in self.state.items()})
+
+    def toArrays(self, cells: Iterable[Cell]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gather the state of several cells into arrays
+
+        Args:
+            cells (Iterable[Cell]): cells to read, in the order of the arrays
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: h, u and v of every cell
+        """
+        nodes = [self.state[cell] for cell in cells]
+        return (
+            np.array([node.h for node in nodes], dtype=np.float64),
+            np.array([node.u for node in nodes], dtype=np.float64),
+            np.array([node.v for node in nodes], dtype=np.float64)
+        )
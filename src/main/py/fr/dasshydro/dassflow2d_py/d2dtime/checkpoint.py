@@ -0,0 +1,103 @@
+import json
+import os
+from typing import NamedTuple
+
+import numpy as np
+
+
+# increased whenever the content of a checkpoint changes
+CHECKPOINT_VERSION = 1
+# prefix of the arrays of the gauge recorder state, other entries are stored as json
+GAUGE_ARRAY_PREFIX = "gauge_recorder_state."
+
+
+class Checkpoint(NamedTuple):
+    """Represents everything needed to resume a simulation"""
+    simulation_time: float # simulation time reached
+    delta: float # last delta used for resolution
+    h: np.ndarray # water depth of every cell (real cells followed by ghost cells)
+    u: np.ndarray # x velocity of every cell (real cells followed by ghost cells)
+    v: np.ndarray # y velocity of every cell (real cells followed by ghost cells)
+    result_writer_state: dict # writing schedule of the result writer
+    boundary_condition_states: list[dict] # internal state of every boundary condition, in creation order
+    ids: np.ndarray # ID of every real cell, in state order
+    real_cell_number: int # number of real cells at the start of the state arrays, followed by ghost cells
+    gauge_recorder_state: dict | None # series recorded by the gauge recorder, None if the run has no gauge
+
+
+def write_checkpoint(file_path: str, checkpoint: Checkpoint):
+    """
+    Write a binary checkpoint. The file is replaced atomically, so that a failure while writing
+    never corrupts the previous checkpoint.
+
+    Args:
+        file_path (str): path to the checkpoint file
+        checkpoint (Checkpoint): simulation state to write
+    """
+    # gauge series are stored as binary arrays next to the json entries
+    gauge_state = checkpoint.gauge_recorder_state
+    gauge_arrays = {}
+    gauge_fields = None
+    if gauge_state is not None:
+        gauge_arrays = {GAUGE_ARRAY_PREFIX + key: value for key, value in gauge_state.items() if isinstance(value, np.ndarray)}
+        gauge_fields = {key: value for key, value in gauge_state.items() if not isinstance(value, np.ndarray)}
+
+    temporary_path = file_path + ".tmp"
+    with open(temporary_path, "wb") as file:
+        np.savez(
+            file,
+            version=np.array(CHECKPOINT_VERSION),
+            simulation_time=np.array(checkpoint.simulation_time, dtype=np.float64),
+            delta=np.array(checkpoint.delta, dtype=np.float64),
+            h=np.asarray(checkpoint.h, dtype=np.float64),
+            u=np.asarray(checkpoint.u, dtype=np.float64),
+            v=np.asarray(checkpoint.v, dtype=np.float64),
+            result_writer_state=np.array(json.dumps(checkpoint.result_writer_state)),
+            boundary_condition_states=np.array(json.dumps(checkpoint.boundary_condition_states)),
+            ids=np.asarray(checkpoint.ids, dtype=np.int64),
+            real_cell_number=np.array(checkpoint.real_cell_number),
+            gauge_recorder_state=np.array(json.dumps(gauge_fields)),
+            **gauge_arrays
+        )
+    os.replace(temporary_path, file_path)
+
+
+def read_checkpoint(file_path: str) -> Checkpoint:
+    """
+    Read a binary checkpoint written by 'write_checkpoint'
+
+    Args:
+        file_path (str): path to the checkpoint file
+
+    Raises:
+        ValueError: if the checkpoint has been written by an incompatible version,
+            or its real cells do not match its IDs and state arrays
+
+    Returns:
+        Checkpoint: simulation state read
+    """
+    with np.load(file_path, allow_pickle=False) as data:
+        version = int(data["version"])
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(f"Checkpoint version {version} is not supported (expected {CHECKPOINT_VERSION}).")
+        real_cell_number = int(data["real_cell_number"])
+        if real_cell_number != len(data["ids"]) or real_cell_number > len(data["h"]):
+            raise ValueError(f"Checkpoint {file_path} has {real_cell_number} real cells, "
+                             f"{len(data['ids'])} IDs and {len(data['h'])} cells.")
+        gauge_state = json.loads(str(data["gauge_recorder_state"]))
+        if gauge_state is not None:
+            for name in data.files:
+                if name.startswith(GAUGE_ARRAY_PREFIX):
+                    gauge_state[name[len(GAUGE_ARRAY_PREFIX):]] = data[name]
+        return Checkpoint(
+            simulation_time=float(data["simulation_time"]),
+            delta=float(data["delta"]),
+            h=data["h"],
+            u=data["u"],
+            v=data["v"],
+            result_writer_state=json.loads(str(data["result_writer_state"])),
+            boundary_condition_states=json.loads(str(data["boundary_condition_states"])),
+            ids=data["ids"],
+            real_cell_number=real_cell_number,
+            gauge_recorder_state=gauge_state
+        )
@@ -1,5 +1,62 @@
+import math
+
+import numpy as np
+
 from dassflow2d_py.d2dtime.TimeStepState import TimeStepState
+from dassflow2d_py.constants import GRAVITY, DRY_THRESHOLD
 from dassflow2d_py.mesh.Mesh import Mesh
 
-def get_delta_using_cfl(current_state: TimeStepState, mesh: Mesh):
-    raise NotImplementedError("Not yet implemented.")
\ No newline at end of file
+
+# Courant number used for adaptive time steps
+CFL = 0.8
+
+
+def get_cell_lengths(mesh: Mesh) -> np.ndarray:
+    """
+    Get the characteristic length of every real cell (twice its surface over its perimeter),
+    meant to be computed once and reused
+
+    Args:
+        mesh (Mesh): mesh of the simulation
+
+    Returns:
+        np.ndarray: length of every cell, in the order of 'Mesh#getCells()'
+    """
+    return np.array([2.0 * cell.getSurface() / cell.getPerimeter() for cell in mesh.getCells()], dtype=np.float64)
+
+
+def get_cell_deltas(h: np.ndarray, u: np.ndarray, v: np.ndarray, cell_lengths: np.ndarray, cfl: float = CFL) -> np.ndarray:
+    """
+    Get the largest stable time step of every cell, from the speed of its fastest wave
+
+    Args:
+        h (np.ndarray): water depth of every cell
+        u (np.ndarray): x velocity of every cell
+        v (np.ndarray): y velocity of every cell
+        cell_lengths (np.ndarray): characteristic length of every cell, see 'get_cell_lengths'
+        cfl (float): Courant number
+
+    Returns:
+        np.ndarray: time step limit of every cell, infinite for dry cells
+    """
+    wet = h > DRY_THRESHOLD
+    speed = np.hypot(u, v) + np.sqrt(GRAVITY * np.where(wet, h, 0.0))
+    with np.errstate(divide='ignore'):
+        return np.where(wet, cfl * cell_lengths / speed, math.inf)
+
+
+def get_delta_using_cfl(current_state: TimeStepState, mesh: Mesh, cfl: float = CFL) -> float:
+    """
+    Get the global time step, limited by the most constraining cell
+
+    Args:
+        current_state (TimeStepState): state at the time of call
+        mesh (Mesh): mesh of the simulation
+        cfl (float): Courant number
+
+    Returns:
+        float: time step, infinite if every cell is dry
+    """
+    h, u, v = current_state.toArrays(mesh.getCells())
+    cell_deltas = get_cell_deltas(h, u, v, get_cell_lengths(mesh), cfl)
+    return float(cell_deltas.min()) if len(cell_deltas) else math.inf
@@ -1,17 +1,231 @@
-from typing import Callable
-from dassflow2d_py.mesh.Mesh import Vertex, Cell
+import numpy as np
+
+from dassflow2d_py.input.file_reading import *
+from dassflow2d_py.mesh.Mesh import Mesh
+
+
+# --- Geometry Helper Functions ---
+
+def _mesh_geometry(mesh: Mesh) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gather mesh geometry into arrays so that interpolation can be done in one vectorized pass.
+
+    Args:
+        mesh (Mesh): mesh to gather geometry from
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: vertex ids (V,), vertex coordinates (V, 2),
+        cell vertex table as row indices in vertex arrays (C, 4), and cell centroids (C, 2).
+        Triangular cells repeat their first vertex in the fourth column.
+    """
+    vertex_ids = np.array([vertex.getID() for vertex in mesh.getVertices()], dtype=np.int64)
+    vertex_coordinates = np.array([vertex.getCoordinates() for vertex in mesh.getVertices()], dtype=np.float64)
+    vertex_rows = {int(vertex_id): row for row, vertex_id in enumerate(vertex_ids)}
+
+    cells = list(mesh.getCells())
+    cell_table = np.empty((len(cells), 4), dtype=np.int64)
+    centroids = np.empty((len(cells), 2), dtype=np.float64)
+    for i, cell in enumerate(cells):
+        rows = [vertex_rows[vertex.getID()] for vertex in cell.getVertices()]
+        if len(rows) == 3:
+            rows.append(rows[0])
+        cell_table[i] = rows
+        centroids[i] = cell.getGravityCenter()
+
+    return vertex_ids, vertex_coordinates, cell_table, centroids
+
+
+def _barycentric_weights(p: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+    Compute barycentric coordinates of points p in triangles (a, b, c), row by row.
+
+    Args:
+        p, a, b, c (np.ndarray): arrays of shape (N, 2)
+
+    Raises:
+        ValueError: if a triangle is degenerate
+
+    Returns:
+        np.ndarray: weights of a, b and c, shape (N, 3)
+    """
+    v0 = b - a
+    v1 = c - a
+    v2 = p - a
+    d00 = np.einsum('ij,ij->i', v0, v0)
+    d01 = np.einsum('ij,ij->i', v0, v1)
+    d11 = np.einsum('ij,ij->i', v1, v1)
+    d20 = np.einsum('ij,ij->i', v2, v0)
+    d21 = np.einsum('ij,ij->i', v2, v1)
+    denominator = d00 * d11 - d01 * d01
+    if np.any(denominator == 0.0):
+        raise ValueError("Cannot interpolate bathymetry on a degenerate cell.")
+    weight_b = (d11 * d20 - d01 * d21) / denominator
+    weight_c = (d00 * d21 - d01 * d20) / denominator
+    weight_a = 1.0 - weight_b - weight_c
+    return np.stack((weight_a, weight_b, weight_c), axis=1)
+
 
 class BathymetryReader:
     """
-    UNUSED reader for dedicated file for bathymetry, the idea of a bathymetry outside of the mesh
-    has been thrown out.
+    This class implements the reading of a dedicated bathymetry file, so that bed elevation can be updated
+    without regenerating the mesh. Two formats are supported:
+    - vertex bathymetry: number of vertices, then one 'vertex_id z' line per vertex,
+      interpolated at cell centroids using barycentric coordinates
+    - ESRI ASCII grid (header starting with 'ncols'): sampled bilinearly at cell centroids
     """
 
     def __init__(self):
-        raise NotImplementedError("Not yet implemented.")
+        pass
+
+    def read(self, file_path: str, mesh: Mesh) -> np.ndarray:
+        """
+        Read a bathymetry file and interpolate it to every cell of the mesh
+
+        Args:
+            file_path (str): string path to the bathymetry file
+            mesh (Mesh): mesh on which bathymetry is interpolated
+
+        Returns:
+            np.ndarray: bathymetry of every cell, in the order of 'Mesh#getCells()'
+        """
+        with open_text(file_path) as file:
+            first_line = next_line(file)
+            file.seek(0)
+            if first_line.strip().lower().startswith('ncols'):
+                return self._read_grid_bathymetry(file, mesh)
+            return self._read_vertex_bathymetry(file, mesh)
+
+    def _read_vertex_bathymetry(self, file, mesh: Mesh) -> np.ndarray:
+        """
+        Reads a per-vertex bathymetry file and interpolates it to cell centroids
+        """
+        vertex_number, = extract(file, (int,))
+        lines = read_lines(file, vertex_number)
+        vertex_ids = parse_array(lines, (0,), np.int64)[:, 0].tolist()
+        vertex_bathymetry = dict(zip(vertex_ids, parse_array(lines, (1,))[:, 0].tolist()))
+        return self.interpolateVertexBathymetry(mesh, vertex_bathymetry)
+
+    def _read_grid_bathymetry(self, file, mesh: Mesh) -> np.ndarray:
+        """
+        Reads an ESRI ASCII grid and samples it at cell centroids
+        """
+        header: dict[str, float] = {}
+        line = next_line(file)
+        while line.split()[0].lower() in ('ncols', 'nrows', 'xllcorner', 'yllcorner',
+                                          'xllcenter', 'yllcenter', 'cellsize', 'nodata_value'):
+            key, value = line.split()[:2]
+            header[key.lower()] = float(value)
+            line = next_line(file)
+
+        ncols = int(header['ncols'])
+        nrows = int(header['nrows'])
+        cellsize = header['cellsize']
+        # pixel center of the lower left pixel
+        if 'xllcenter' in header:
+            x0, y0 = header['xllcenter'], header['yllcenter']
+        else:
+            x0, y0 = header['xllcorner'] + cellsize / 2, header['yllcorner'] + cellsize / 2
+
+        # the line read ahead is the first data line
+        values = np.array((line + file.read()).split(), dtype=np.float64)
+        if values.size != ncols * nrows:
+            raise ValueError(f"Expected {ncols * nrows} grid values in {file.name}, got {values.size}.")
+        # first data row is the northernmost one
+        grid = values.reshape(nrows, ncols)[::-1]
+
+        _, _, _, centroids = _mesh_geometry(mesh)
+        return self.sampleGrid(grid, x0, y0, cellsize, centroids, header.get('nodata_value'))
+
+    def interpolateVertexBathymetry(self, mesh: Mesh, vertex_bathymetry: dict[int, float]) -> np.ndarray:
+        """
+        Interpolate vertex bathymetry at every cell centroid using barycentric coordinates.
+        Quadrilateral cells are split along their (v1, v3) diagonal, the triangle containing the centroid is used.
+
+        Args:
+            mesh (Mesh): mesh on which bathymetry is interpolated
+            vertex_bathymetry (dict[int, float]): bathymetry value for every vertex id
+
+        Raises:
+            ValueError: if a vertex of the mesh has no bathymetry value
+
+        Returns:
+            np.ndarray: bathymetry of every cell, in the order of 'Mesh#getCells()'
+        """
+        vertex_ids, vertex_coordinates, cell_table, centroids = _mesh_geometry(mesh)
+
+        missing = [int(vertex_id) for vertex_id in vertex_ids if vertex_id not in vertex_bathymetry]
+        if missing:
+            raise ValueError(f"Missing bathymetry for {len(missing)} vertices (first: {missing[0]}).")
+        z = np.array([vertex_bathymetry[int(vertex_id)] for vertex_id in vertex_ids], dtype=np.float64)
+
+        # first triangle (v1, v2, v3) of every cell
+        triangles = cell_table[:, [0, 1, 2]]
+        weights = _barycentric_weights(
+            centroids,
+            vertex_coordinates[triangles[:, 0]],
+            vertex_coordinates[triangles[:, 1]],
+            vertex_coordinates[triangles[:, 2]]
+        )
+
+        # quadrilaterals whose centroid lies in the second triangle (v1, v3, v4)
+        is_quad = cell_table[:, 3] != cell_table[:, 0]
+        outside = is_quad & np.any(weights < 0.0, axis=1)
+        if np.any(outside):
+            triangles[outside] = cell_table[outside][:, [0, 2, 3]]
+            weights[outside] = _barycentric_weights(
+                centroids[outside],
+                vertex_coordinates[triangles[outside, 0]],
+                vertex_coordinates[triangles[outside, 1]],
+                vertex_coordinates[triangles[outside, 2]]
+            )
+
+        return np.einsum('ij,ij->i', weights, z[triangles])
+
+    def sampleGrid(self, grid: np.ndarray, x0: float, y0: float, cellsize: float,
+                   points: np.ndarray, nodata_value: float | None = None) -> np.ndarray:
+        """
+        Bilinearly sample a regular grid at given points.
+        Points within half a pixel of the grid border take the value of the nearest pixel row or column.
+
+        Args:
+            grid (np.ndarray): grid values of shape (nrows, ncols), row 0 being the southernmost
+            x0 (float): x coordinate of the center of pixel (0, 0)
+            y0 (float): y coordinate of the center of pixel (0, 0)
+            cellsize (float): size of a pixel
+            points (np.ndarray): coordinates to sample, shape (N, 2)
+            nodata_value (float | None): value marking missing pixels
+
+        Raises:
+            ValueError: if a point is outside the grid or relies on a missing pixel
+
+        Returns:
+            np.ndarray: sampled values, shape (N,)
+        """
+        nrows, ncols = grid.shape
+        fx = (points[:, 0] - x0) / cellsize
+        fy = (points[:, 1] - y0) / cellsize
+
+        outside = (fx < -0.5) | (fx > ncols - 0.5) | (fy < -0.5) | (fy > nrows - 0.5)
+        if np.any(outside):
+            raise ValueError(f"{np.count_nonzero(outside)} points are outside of the bathymetry grid.")
+
+        fx = np.clip(fx, 0.0, ncols - 1)
+        fy = np.clip(fy, 0.0, nrows - 1)
+        col0 = np.minimum(np.floor(fx).astype(np.int64), max(ncols - 2, 0))
+        row0 = np.minimum(np.floor(fy).astype(np.int64), max(nrows - 2, 0))
+        col1 = np.minimum(col0 + 1, ncols - 1)
+        row1 = np.minimum(row0 + 1, nrows - 1)
+        tx = fx - col0
+        ty = fy - row0
+
+        z00 = grid[row0, col0]
+        z01 = grid[row0, col1]
+        z10 = grid[row1, col0]
+        z11 = grid[row1, col1]
 
-    def readVertexBathymetry(self) -> Callable[[Vertex], float]:
-        raise NotImplementedError("Not yet implemented.")
+        if nodata_value is not None:
+            missing = (z00 == nodata_value) | (z01 == nodata_value) | (z10 == nodata_value) | (z11 == nodata_value)
+            if np.any(missing):
+                raise ValueError(f"{np.count_nonzero(missing)} points rely on missing bathymetry pixels.")
 
-    def readCellBathymetry(self) -> Callable[[Cell], float]:
-        raise NotImplementedError("Not yet implemented.")
+        return (z00 * (1 - tx) + z01 * tx) * (1 - ty) + (z10 * (1 - tx) + z11 * tx) * ty
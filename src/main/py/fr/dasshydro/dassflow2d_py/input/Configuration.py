@@ -1,13 +1,22 @@
 import yaml
 
 from dassflow2d_py.resolution.ResolutionMethod import TemporalScheme, SpatialScheme
-from dassflow2d_py.output.ResultWriter import OutputMode
+from dassflow2d_py.output.FormatWriter import getFormatWriterClass
+from dassflow2d_py.mesh.renumbering import CellOrdering
+from dassflow2d_py.resolution.kernels import KernelBackend
+from dassflow2d_py.input.file_reading import COMPRESSION_OPENERS
+from dassflow2d_py.input.MeshReader import MeshFormat
 
 
 # Define constants for configuration keys
 TEMPORAL_SCHEME = 'temporal-scheme'
 SPATIAL_SCHEME = 'spatial-scheme'
+KERNEL_BACKEND = 'kernel-backend'
+THREAD_NUMBER = 'thread-number'
+PARTITION_NUMBER = 'partition-number'
 MESH_FILE = 'mesh-file'
+MESH_FORMAT = 'mesh-format'
+CELL_ORDERING = 'cell-ordering'
 BOUNDARY_CONDITION_FILE = 'boundary-condition-file'
 INITIAL_STATE_FILE = 'initial-state-file'
 BATHYMETRY_FILE = 'bathymetry-file'
@@ -16,10 +25,18 @@ RATING_CURVE_FILE = 'rating-curve-file'
 MANNING_FILE = 'manning-file'
 RESULT_PATH = 'result-path'
 OUTPUT_MODE = 'output-mode'
+OUTPUT_COMPRESSION = 'output-compression'
 SIMULATION_TIME = 'simulation-time'
 DELTA_TO_WRITE = 'delta-to-write'
 IS_DELTA_ADAPTIVE = 'is-delta-adaptive'
 DEFAULT_DELTA = 'default-delta'
+LOCAL_TIME_STEPPING = 'local-time-stepping'
+TIME_STEP_LEVELS = 'time-step-levels'
+CHECKPOINT_DELTA = 'checkpoint-delta'
+RESTART_FROM = 'restart-from'
+PROFILE_FILE = 'profile-file'
+GAUGES_FILE = 'gauges-file'
+GAUGES_EVERY_STEPS = 'gauges-every-steps'
 CONFIG_FILE = 'config_file'
 
 class Configuration:
@@ -32,19 +49,32 @@ class Configuration:
     DEFAULT = {
         TEMPORAL_SCHEME: 'euler',
         SPATIAL_SCHEME: 'hllc',
+        KERNEL_BACKEND: 'auto', # numba when it is installed, numpy otherwise
+        THREAD_NUMBER: None, # optional, number of CPUs by default
+        PARTITION_NUMBER: '1',
         MESH_FILE: 'mesh.geo',
+        MESH_FORMAT: 'auto', # guessed from the mesh file extension by default
+        CELL_ORDERING: 'file',
         BOUNDARY_CONDITION_FILE: 'bc.txt',
         INITIAL_STATE_FILE: 'dof_init.txt',
-        BATHYMETRY_FILE: 'bathymetry.txt',
+        BATHYMETRY_FILE: None, # optional, bathymetry is read from the mesh by default
         HYDROGRAPHS_FILE: 'hydrograph.txt',
         RATING_CURVE_FILE: 'rating_curve.txt',
         MANNING_FILE: 'manning.txt',
         RESULT_PATH: 'output/',
         OUTPUT_MODE: 'gnuplot',
+        OUTPUT_COMPRESSION: 'none',
         SIMULATION_TIME: '10000.0',
         DELTA_TO_WRITE: '100.0',
         IS_DELTA_ADAPTIVE: 'False',
-        DEFAULT_DELTA: '0.01'
+        DEFAULT_DELTA: '0.01',
+        LOCAL_TIME_STEPPING: 'False',
+        TIME_STEP_LEVELS: '4',
+        CHECKPOINT_DELTA: None, # optional, no checkpoint by default
+        RESTART_FROM: None, # optional, starts from the initial state by default
+        PROFILE_FILE: None, # optional, no profiling by default
+        GAUGES_FILE: None, # optional, no gauge by default
+        GAUGES_EVERY_STEPS: '1'
     }
 
     def __init__(self, source):
@@ -81,10 +111,31 @@ class Configuration:
             self.values[SPATIAL_SCHEME] = SpatialScheme(values[SPATIAL_SCHEME])
             self.sources[SPATIAL_SCHEME] = source
 
+        if KERNEL_BACKEND in values:
+            self.values[KERNEL_BACKEND] = KernelBackend(values[KERNEL_BACKEND])
+            self.sources[KERNEL_BACKEND] = source
+
+        if THREAD_NUMBER in values:
+            thread_number = values[THREAD_NUMBER]
+            self.values[THREAD_NUMBER] = int(thread_number) if thread_number is not None else None
+            self.sources[THREAD_NUMBER] = source
+
+        if PARTITION_NUMBER in values:
+            self.values[PARTITION_NUMBER] = int(values[PARTITION_NUMBER])
+            self.sources[PARTITION_NUMBER] = source
+
         if MESH_FILE in values:
             self.values[MESH_FILE] = values[MESH_FILE]
             self.sources[MESH_FILE] = source
 
+        if MESH_FORMAT in values:
+            self.values[MESH_FORMAT] = MeshFormat(values[MESH_FORMAT])
+            self.sources[MESH_FORMAT] = source
+
+        if CELL_ORDERING in values:
+            self.values[CELL_ORDERING] = CellOrdering(values[CELL_ORDERING])
+            self.sources[CELL_ORDERING] = source
+
         if BOUNDARY_CONDITION_FILE in values:
             self.values[BOUNDARY_CONDITION_FILE] = values[BOUNDARY_CONDITION_FILE]
             self.sources[BOUNDARY_CONDITION_FILE] = source
@@ -114,9 +165,27 @@ class Configuration:
             self.sources[RESULT_PATH] = source
 
         if OUTPUT_MODE in values:
-            self.values[OUTPUT_MODE] = OutputMode(values[OUTPUT_MODE])
+            # a list, or comma separated names, every format being written in a single pass
+            names: str | list = values[OUTPUT_MODE]
+            if isinstance(names, str):
+                names = names.split(',')
+            output_modes = [str(mode).strip() for mode in names]
+            for mode in output_modes:
+                # raises ValueError for unregistered formats
+                getFormatWriterClass(mode)
+            self.values[OUTPUT_MODE] = output_modes
             self.sources[OUTPUT_MODE] = source
 
+        if OUTPUT_COMPRESSION in values:
+            # stored as the extension of compressed files, empty for plain text
+            compression = str(values[OUTPUT_COMPRESSION]).strip().lower()
+            extension = '' if compression == 'none' else f'.{compression}'
+            if extension and extension not in COMPRESSION_OPENERS:
+                raise ValueError(f"unknown output compression {compression}, possible values are none, "
+                                 f"{', '.join(extension[1:] for extension in COMPRESSION_OPENERS)}")
+            self.values[OUTPUT_COMPRESSION] = extension
+            self.sources[OUTPUT_COMPRESSION] = source
+
         if SIMULATION_TIME in values:
             self.values[SIMULATION_TIME] = float(values[SIMULATION_TIME])
             self.sources[SIMULATION_TIME] = source
@@ -126,13 +195,42 @@ class Configuration:
             self.sources[DELTA_TO_WRITE] = source
 
         if IS_DELTA_ADAPTIVE in values:
-            self.values[IS_DELTA_ADAPTIVE] = bool(values[IS_DELTA_ADAPTIVE])
+            self.values[IS_DELTA_ADAPTIVE] = str(values[IS_DELTA_ADAPTIVE]).lower() == 'true'
             self.sources[IS_DELTA_ADAPTIVE] = source
 
         if DEFAULT_DELTA in values:
             self.values[DEFAULT_DELTA] = float(values[DEFAULT_DELTA])
             self.sources[DEFAULT_DELTA] = source
 
+        if LOCAL_TIME_STEPPING in values:
+            self.values[LOCAL_TIME_STEPPING] = str(values[LOCAL_TIME_STEPPING]).lower() == 'true'
+            self.sources[LOCAL_TIME_STEPPING] = source
+
+        if TIME_STEP_LEVELS in values:
+            self.values[TIME_STEP_LEVELS] = int(values[TIME_STEP_LEVELS])
+            self.sources[TIME_STEP_LEVELS] = source
+
+        if CHECKPOINT_DELTA in values:
+            checkpoint_delta = values[CHECKPOINT_DELTA]
+            self.values[CHECKPOINT_DELTA] = float(checkpoint_delta) if checkpoint_delta is not None else None
+            self.sources[CHECKPOINT_DELTA] = source
+
+        if RESTART_FROM in values:
+            self.values[RESTART_FROM] = values[RESTART_FROM]
+            self.sources[RESTART_FROM] = source
+
+        if PROFILE_FILE in values:
+            self.values[PROFILE_FILE] = values[PROFILE_FILE]
+            self.sources[PROFILE_FILE] = source
+
+        if GAUGES_FILE in values:
+            self.values[GAUGES_FILE] = values[GAUGES_FILE]
+            self.sources[GAUGES_FILE] = source
+
+        if GAUGES_EVERY_STEPS in values:
+            self.values[GAUGES_EVERY_STEPS] = int(values[GAUGES_EVERY_STEPS])
+            self.sources[GAUGES_EVERY_STEPS] = source
+
     def getSources(self) -> dict:
         return self.sources
 
@@ -142,9 +240,25 @@ class Configuration:
     def getSpatialScheme(self):
         return self.values[SPATIAL_SCHEME]
 
+    def getKernelBackend(self) -> str | None:
+        backend = self.values[KERNEL_BACKEND]
+        return None if backend is KernelBackend.AUTO else backend.value
+
+    def getThreadNumber(self) -> int | None:
+        return self.values[THREAD_NUMBER]
+
+    def getPartitionNumber(self) -> int:
+        return int(self.values[PARTITION_NUMBER])
+
     def getMeshFilePath(self):
         return self.values[MESH_FILE]
 
+    def getMeshFormat(self) -> MeshFormat:
+        return self.values[MESH_FORMAT]
+
+    def getCellOrdering(self) -> CellOrdering:
+        return self.values[CELL_ORDERING]
+
     def getBoundaryConditionFilePath(self):
         return self.values[BOUNDARY_CONDITION_FILE]
 
@@ -166,9 +280,12 @@ class Configuration:
     def getResultFolderPath(self):
         return self.values[RESULT_PATH]
 
-    def getOutputMode(self):
+    def getOutputModes(self) -> list[str]:
         return self.values[OUTPUT_MODE]
 
+    def getOutputCompression(self) -> str:
+        return self.values[OUTPUT_COMPRESSION]
+
     def getSimulationTime(self) -> float:
         return float(self.values[SIMULATION_TIME])
 
@@ -180,3 +297,24 @@ class Configuration:
 
     def getDefaultDelta(self) -> float:
         return float(self.values[DEFAULT_DELTA])
+
+    def isLocalTimeStepping(self) -> bool:
+        return bool(self.values[LOCAL_TIME_STEPPING])
+
+    def getTimeStepLevels(self) -> int:
+        return int(self.values[TIME_STEP_LEVELS])
+
+    def getCheckpointDelta(self) -> float | None:
+        return self.values[CHECKPOINT_DELTA]
+
+    def getRestartFilePath(self):
+        return self.values[RESTART_FROM]
+
+    def getProfileFilePath(self):
+        return self.values[PROFILE_FILE]
+
+    def getGaugesFilePath(self):
+        return self.values[GAUGES_FILE]
+
+    def getGaugesEverySteps(self) -> int:
+        return int(self.values[GAUGES_EVERY_STEPS])
@@ -1,3 +1,5 @@
+import numpy as np
+
 from dassflow2d_py.input.file_reading import *
 from dassflow2d_py.input.MeshReader import MeshReader
 from dassflow2d_py.mesh.Mesh import RawVertex, RawCell, RawInlet, RawOutlet
@@ -19,20 +21,26 @@ class DassflowMeshReader(MeshReader):
         vertex_bathymetry = {}
         cell_bathymetry = {}
 
-        with open(file_path, 'r') as f:
+        with open_text(file_path) as f:
             # Reads mesh header
             vertex_number, cell_number, _ = extract(f, (int, int, float))
 
-            # Reads all vertices
-            for _ in range(vertex_number):
-                vertex_id, x_coord, y_coord, bathymetry = extract(f, (int, float, float, float))
+            # Reads all vertices, by block: id x y bathymetry
+            vertex_lines = read_lines(f, vertex_number)
+            vertex_ids = parse_array(vertex_lines, (0,), np.int64)[:, 0].tolist()
+            vertex_values = parse_array(vertex_lines, (1, 2, 3))
+            del vertex_lines
+            for vertex_id, (x_coord, y_coord, bathymetry) in zip(vertex_ids, vertex_values.tolist()):
                 raw_vertex = RawVertex(vertex_id, x_coord, y_coord)
                 raw_vertices.append(raw_vertex)
                 vertex_bathymetry[vertex_id] = bathymetry
 
-            # Reads all cells
-            for _ in range(cell_number):
-                cell_id, vertex1, vertex2, vertex3, vertex4, _, bathymetry = extract(f, (int, int, int, int, int, float, float))
+            # Reads all cells, by block: id vertex1 vertex2 vertex3 vertex4 _ bathymetry
+            cell_lines = read_lines(f, cell_number)
+            cell_vertices = parse_array(cell_lines, (0, 1, 2, 3, 4), np.int64)
+            cell_values = parse_array(cell_lines, (6,))[:, 0].tolist()
+            del cell_lines
+            for (cell_id, vertex1, vertex2, vertex3, vertex4), bathymetry in zip(cell_vertices.tolist(), cell_values):
                 if vertex4 == 0:
                     # Handle triangular case
                     vertex4 = vertex1
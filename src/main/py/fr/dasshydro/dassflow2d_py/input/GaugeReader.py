@@ -0,0 +1,68 @@
+from typing import NamedTuple
+
+import numpy as np
+import yaml
+
+from dassflow2d_py.input.file_reading import open_text
+
+
+class Gauge(NamedTuple):
+    """Represents a virtual gauge, either a point (water depth, level and velocity) or a polyline (discharge)"""
+    name: str
+    points: np.ndarray # coordinates (N, 2), a single row for point gauges
+    is_line: bool
+
+
+class GaugeReader:
+    """
+    This class implements the reading of a gauge description file (yaml), for example:
+
+        gauges:
+          - name: bridge
+            point: [125.0, 40.5]
+          - name: cross_section
+            line: [[100.0, 0.0], [100.0, 50.0], [110.0, 80.0]]
+
+    Discharge through a polyline is counted positive to the right of its direction.
+    """
+
+    def __init__(self):
+        pass
+
+    def read(self, file_path: str) -> list[Gauge]:
+        """
+        Reads all gauges described in a file
+
+        Args:
+            file_path (str): string path to the gauge file
+
+        Raises:
+            ValueError: if a gauge is not a point nor a polyline of at least two points, or if names are not unique
+
+        Returns:
+            list[Gauge]: every gauge read, in file order
+        """
+        with open_text(file_path) as file:
+            yaml_data = yaml.safe_load(file)
+
+        gauges = []
+        for entry in (yaml_data or {}).get('gauges', []):
+            name = str(entry['name'])
+            if 'point' in entry:
+                points = np.array([entry['point']], dtype=np.float64)
+                is_line = False
+            elif 'line' in entry:
+                points = np.array(entry['line'], dtype=np.float64)
+                is_line = True
+                if len(points) < 2:
+                    raise ValueError(f"Gauge {name} should have at least two points.")
+            else:
+                raise ValueError(f"Gauge {name} should define either a 'point' or a 'line'.")
+            if points.ndim != 2 or points.shape[1] != 2:
+                raise ValueError(f"Gauge {name} coordinates should be (x, y) pairs.")
+            gauges.append(Gauge(name, points, is_line))
+
+        names = [gauge.name for gauge in gauges]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Gauge names should be unique in {file_path}.")
+        return gauges
@@ -0,0 +1,290 @@
+from typing import IO
+
+import numpy as np
+
+from dassflow2d_py.input.file_reading import open_binary
+from dassflow2d_py.input.MeshReader import MeshReader
+from dassflow2d_py.mesh.Mesh import RawVertex, RawCell, RawInlet, RawOutlet
+
+
+# supported gmsh element types, with their number of nodes
+POINT = 15
+LINE = 1
+TRIANGLE = 2
+QUADRANGLE = 3
+ELEMENT_NODE_NUMBERS = {POINT: 1, LINE: 2, TRIANGLE: 3, QUADRANGLE: 4}
+
+# beginnings of physical group names (case insensitive) of inlets and outlets, other groups are walls
+INLET_PREFIXES = ('inlet', 'inflow')
+OUTLET_PREFIXES = ('outlet', 'outflow')
+
+
+class _GmshBinaryFile:
+    """
+    Reads the ascii lines and the binary blocks of a gmsh binary file, in the byte order of the file
+    """
+
+    def __init__(self, file: IO[bytes]):
+        self.file = file
+        self.byte_order = '<'
+        self.size_type = 'u8'
+
+    def readLine(self) -> str:
+        line = self.file.readline()
+        if not line:
+            raise EOFError("End of file reached before the end of the mesh.")
+        return line.decode('utf-8', errors='replace').strip()
+
+    def readArray(self, value_type: str, count: int) -> np.ndarray:
+        dtype = np.dtype(self.byte_order + value_type)
+        data = self.file.read(dtype.itemsize * count)
+        if len(data) != dtype.itemsize * count:
+            raise EOFError("End of file reached before the end of the mesh.")
+        return np.frombuffer(data, dtype, count)
+
+    def readInts(self, count: int) -> np.ndarray:
+        return self.readArray('i4', count).astype(np.int64)
+
+    def readSizes(self, count: int) -> np.ndarray:
+        return self.readArray(self.size_type, count).astype(np.int64)
+
+    def skipSection(self, name: str):
+        """Skip the lines of a section up to its end, the header line being already read"""
+        while self.readLine() != f"$End{name}":
+            pass
+
+
+class GmshMeshReader(MeshReader):
+    """
+    This class implements the reading of a mesh, on a gmsh mesh type (version 4.1, binary).
+    Linear triangles and quadrangles are the cells, the z coordinate of nodes their bathymetry.
+    Lines of a physical group whose name starts with 'inlet' or 'outlet' are inlets or outlets, the tag of
+    the physical group being their group number in the boundary condition file, other boundaries are walls.
+    """
+
+    def __init__(self):
+        pass
+
+    def read(self, file_path: str):
+        physical_names: dict[tuple[int, int], str] = {}
+        curve_groups: dict[int, int] = {}
+        nodes: tuple[np.ndarray, np.ndarray] | None = None
+        elements: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None = None
+
+        with open_binary(file_path) as f:
+            gmsh_file = _GmshBinaryFile(f)
+            # sections after the elements (node data, periodicity, ...) are not read
+            while elements is None:
+                line = f.readline()
+                if not line:
+                    raise ValueError(f"No element found in gmsh mesh file {file_path}.")
+                section = line.decode('utf-8', errors='replace').strip()
+                if not section.startswith('$'):
+                    continue
+                name = section[1:]
+                if name == 'MeshFormat':
+                    self._read_mesh_format(gmsh_file, file_path)
+                elif name == 'PhysicalNames':
+                    physical_names = self._read_physical_names(gmsh_file)
+                elif name == 'Entities':
+                    curve_groups = self._read_entities(gmsh_file)
+                elif name == 'PartitionedEntities':
+                    raise ValueError(f"Partitioned gmsh mesh file {file_path} is not supported.")
+                elif name == 'Nodes':
+                    nodes = self._read_nodes(gmsh_file)
+                elif name == 'Elements':
+                    elements = self._read_elements(gmsh_file, curve_groups)
+                gmsh_file.skipSection(name)
+
+        if nodes is None:
+            raise ValueError(f"No node found in gmsh mesh file {file_path}.")
+        return self._create_raw_information(nodes, elements, physical_names)
+
+    def _read_mesh_format(self, gmsh_file: _GmshBinaryFile, file_path: str):
+        """
+        Reads the version, type and byte order of the file
+
+        Raises:
+            ValueError: if the file is not a binary mesh file of version 4.1
+        """
+        version, file_type, data_size = gmsh_file.readLine().split()
+        if version != '4.1':
+            raise ValueError(f"Gmsh mesh file {file_path} has version {version}, only version 4.1 is supported.")
+        if file_type != '1':
+            raise ValueError(f"Gmsh mesh file {file_path} is not a binary file, only binary files are supported.")
+        gmsh_file.size_type = f'u{data_size}'
+        # the integer 1, written in the byte order of the file
+        one = gmsh_file.file.read(4)
+        gmsh_file.byte_order = '<' if int.from_bytes(one, 'little') == 1 else '>'
+
+    def _read_physical_names(self, gmsh_file: _GmshBinaryFile) -> dict[tuple[int, int], str]:
+        """
+        Reads the names of physical groups, always written as text
+
+        Returns:
+            dict[tuple[int, int], str]: name of every physical group, by dimension and tag
+        """
+        physical_names = {}
+        for _ in range(int(gmsh_file.readLine())):
+            dimension, tag, name = gmsh_file.readLine().split(maxsplit=2)
+            physical_names[(int(dimension), int(tag))] = name.strip('"')
+        return physical_names
+
+    def _read_entities(self, gmsh_file: _GmshBinaryFile) -> dict[int, int]:
+        """
+        Reads geometric entities, only the physical groups of curves are kept
+
+        Returns:
+            dict[int, int]: first physical group of every curve with a physical group, by curve tag
+        """
+        curve_groups = {}
+        point_number, curve_number, surface_number, volume_number = gmsh_file.readSizes(4).tolist()
+        for _ in range(point_number):
+            gmsh_file.readInts(1)
+            gmsh_file.readArray('f8', 3)
+            gmsh_file.readInts(*gmsh_file.readSizes(1).tolist())
+        for dimension, entity_number in ((1, curve_number), (2, surface_number), (3, volume_number)):
+            for _ in range(entity_number):
+                tag, = gmsh_file.readInts(1).tolist()
+                # bounding box
+                gmsh_file.readArray('f8', 6)
+                physical_tags = gmsh_file.readInts(*gmsh_file.readSizes(1).tolist())
+                # bounding entities
+                gmsh_file.readInts(*gmsh_file.readSizes(1).tolist())
+                if dimension == 1 and len(physical_tags) > 0:
+                    curve_groups[tag] = int(physical_tags[0])
+        return curve_groups
+
+    def _read_nodes(self, gmsh_file: _GmshBinaryFile) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Reads all nodes, by block of entity
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: tag (node number) and coordinates (node number, 3) of every node
+        """
+        block_number, node_number, _, _ = gmsh_file.readSizes(4).tolist()
+        tags, coordinates = [], []
+        for _ in range(block_number):
+            dimension, _, parametric = gmsh_file.readInts(3).tolist()
+            block_size, = gmsh_file.readSizes(1).tolist()
+            tags.append(gmsh_file.readSizes(block_size))
+            # parametric nodes are followed by their coordinates on the entity
+            column_number = 3 + (dimension if parametric else 0)
+            coordinates.append(gmsh_file.readArray('f8', block_size * column_number).reshape(block_size, column_number)[:, :3])
+        node_tags = np.concatenate(tags) if tags else np.empty(0, dtype=np.int64)
+        node_coordinates = np.concatenate(coordinates) if coordinates else np.empty((0, 3))
+        if len(node_tags) != node_number:
+            raise ValueError(f"Gmsh mesh file declares {node_number} nodes, {len(node_tags)} were read.")
+        return node_tags, node_coordinates
+
+    def _read_elements(self, gmsh_file: _GmshBinaryFile,
+                       curve_groups: dict[int, int]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Reads all elements, by block of entity: cells and lines of a physical group are kept, points are ignored
+
+        Raises:
+            ValueError: if an element is not a point, a linear line, triangle or quadrangle
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: tag and node tags (cell number, 4) of every cell,
+            triangles being closed by their first node, node tags (line number, 2) and physical group of every line
+        """
+        block_number = gmsh_file.readSizes(4).tolist()[0]
+        cell_blocks, line_blocks, line_groups = [], [], []
+        for _ in range(block_number):
+            _, entity_tag, element_type = gmsh_file.readInts(3).tolist()
+            block_size, = gmsh_file.readSizes(1).tolist()
+            node_number = ELEMENT_NODE_NUMBERS.get(element_type)
+            if node_number is None:
+                raise ValueError(f"Gmsh element type {element_type} is not supported, only linear triangles and quadrangles are.")
+            # every element is its tag followed by its nodes
+            block = gmsh_file.readSizes(block_size * (node_number + 1)).reshape(block_size, node_number + 1)
+            if element_type == TRIANGLE:
+                cell_blocks.append(np.column_stack((block, block[:, 1])))
+            elif element_type == QUADRANGLE:
+                cell_blocks.append(block)
+            elif element_type == LINE and entity_tag in curve_groups:
+                line_blocks.append(block[:, 1:])
+                line_groups.append(np.full(block_size, curve_groups[entity_tag], dtype=np.int64))
+        cells = np.concatenate(cell_blocks) if cell_blocks else np.empty((0, 5), dtype=np.int64)
+        lines = np.concatenate(line_blocks) if line_blocks else np.empty((0, 2), dtype=np.int64)
+        groups = np.concatenate(line_groups) if line_groups else np.empty(0, dtype=np.int64)
+        return cells[:, 0], cells[:, 1:], lines, groups
+
+    def _create_raw_information(self, nodes: tuple[np.ndarray, np.ndarray],
+                                elements: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+                                physical_names: dict[tuple[int, int], str]):
+        """
+        Converts nodes and elements into the raw information of a mesh, see 'MeshReader#read'.
+        Only nodes of cells are vertices, cell bathymetry is the mean of the bathymetry of its vertices.
+
+        Raises:
+            ValueError: if a cell node is not defined, or a boundary line is not the edge of a cell
+        """
+        node_tags, node_coordinates = nodes
+        cell_ids, cell_nodes, lines, line_groups = elements
+        if len(cell_ids) == 0:
+            raise ValueError("No triangle nor quadrangle found in gmsh mesh file.")
+
+        # row of every node, by tag
+        tag_number = int(max(node_tags.max(initial=0), cell_nodes.max(), lines.max(initial=0))) + 1
+        node_rows = np.full(tag_number, -1, dtype=np.int64)
+        node_rows[node_tags] = np.arange(len(node_tags))
+        cell_rows = node_rows[cell_nodes]
+        if np.any(cell_rows < 0):
+            raise ValueError("A node of a cell is not defined in gmsh mesh file.")
+
+        # Vertices, in file order
+        used = np.zeros(len(node_tags), dtype=bool)
+        used[cell_rows.ravel()] = True
+        vertex_ids = node_tags[used].tolist()
+        x_coords, y_coords, bathymetries = node_coordinates[used].T.tolist()
+        raw_vertices = list(map(RawVertex, vertex_ids, x_coords, y_coords))
+        vertex_bathymetry = dict(zip(vertex_ids, bathymetries))
+
+        # Cells, triangles are closed by their first vertex
+        is_triangle = cell_nodes[:, 3] == cell_nodes[:, 0]
+        vertex_numbers = np.where(is_triangle, 3, 4)
+        cell_z = node_coordinates[cell_rows, 2]
+        cell_values = (cell_z[:, :3].sum(axis=1) + np.where(is_triangle, 0.0, cell_z[:, 3])) / vertex_numbers
+        raw_cells = list(map(RawCell, cell_ids.tolist(), *cell_nodes.T.tolist()))
+        cell_bathymetry = dict(zip(cell_ids.tolist(), cell_values.tolist()))
+
+        inlet: list[RawInlet] = []
+        outlet: list[RawOutlet] = []
+        if len(lines) == 0:
+            return raw_vertices, raw_cells, inlet, outlet, vertex_bathymetry, cell_bathymetry
+
+        ### Boundaries
+        # local edge k (1-based) of a cell joins its vertices k - 1 and k, the first one joins the last and first vertices
+        rows = np.arange(len(cell_ids))
+        edge_keys, edge_cells, edge_numbers = [], [], []
+        for k in range(4):
+            present = k < vertex_numbers
+            first = cell_nodes[rows, vertex_numbers - 1] if k == 0 else cell_nodes[:, k - 1]
+            second = cell_nodes[:, k]
+            edge_keys.append((np.minimum(first, second) * tag_number + np.maximum(first, second))[present])
+            edge_cells.append(rows[present])
+            edge_numbers.append(np.full(np.count_nonzero(present), k + 1))
+        keys = np.concatenate(edge_keys)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+
+        line_keys = np.minimum(lines[:, 0], lines[:, 1]) * tag_number + np.maximum(lines[:, 0], lines[:, 1])
+        positions = np.minimum(np.searchsorted(sorted_keys, line_keys), len(sorted_keys) - 1)
+        if np.any(sorted_keys[positions] != line_keys):
+            raise ValueError("A boundary line is not the edge of a cell in gmsh mesh file.")
+        line_cells = np.concatenate(edge_cells)[order][positions]
+        line_edges = np.concatenate(edge_numbers)[order][positions]
+
+        for cell_row, edge_number, group_number in zip(line_cells.tolist(), line_edges.tolist(), line_groups.tolist()):
+            group_name = physical_names.get((1, group_number), '').lower()
+            cell_id = int(cell_ids[cell_row])
+            # ghost cells take the bathymetry of their cell
+            if group_name.startswith(INLET_PREFIXES):
+                inlet.append(RawInlet(cell_id, edge_number, cell_bathymetry[cell_id], group_number))
+            elif group_name.startswith(OUTLET_PREFIXES):
+                outlet.append(RawOutlet(cell_id, edge_number, cell_bathymetry[cell_id], group_number))
+
+        # Gather all lists and return as tuple
+        return raw_vertices, raw_cells, inlet, outlet, vertex_bathymetry, cell_bathymetry
@@ -1,26 +1,78 @@
+import numpy as np
+
 from dassflow2d_py.input.file_reading import *
-from dassflow2d_py.d2dtime.TimeStepState import Node
+from dassflow2d_py.d2dtime.checkpoint import read_checkpoint
+
+
+# first bytes identifying binary files
+HDF5_SIGNATURE = b'\x89HDF\r\n\x1a\n'
+NPZ_SIGNATURE = b'PK\x03\x04'
+
 
 class InitialStateReader:
 
     def __init__(self):
         pass
 
-    def read(self, file_path: str, number_of_cells: int) -> list[Node]:
+    def read(self, file_path: str, number_of_cells: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Reads an init file with all h, u, and v values for every node at the start of the simulation
+        Reads an init file with all h, u, and v values for every cell at the start of the simulation.
+        Text dof_init files are converted by blocks, binary outputs of a previous run are read directly:
+        the last snapshot of an HDF5 result file, or the real cells of a checkpoint.
 
         Args:
             file_path (str): string path to the init file
             number_of_cells (int): number of cells in the mesh
 
+        Raises:
+            ValueError: if the number of cells in the file does not match the mesh
+
         Returns:
-            list[Node]: every node read, the nodes are in order such as it maps to a cell list sorted by id
+            tuple[np.ndarray, np.ndarray, np.ndarray]: h, u and v of every cell, sorted by cell id
+        """
+        with open(file_path, 'rb') as file:
+            signature = file.read(len(HDF5_SIGNATURE))
+
+        if signature.startswith(HDF5_SIGNATURE):
+            h, u, v = self._read_hdf5(file_path)
+        elif signature.startswith(NPZ_SIGNATURE):
+            checkpoint = read_checkpoint(file_path)
+            # checkpoints also store ghost cells after the real ones, real cells being in the internal ordering of the mesh
+            # checked before slicing, the ghost cells must never be taken for real cells
+            if checkpoint.real_cell_number != number_of_cells:
+                raise ValueError(f"Initial state file {file_path} has {checkpoint.real_cell_number} cells, expected {number_of_cells}.")
+            order = np.argsort(checkpoint.ids, kind="stable")
+            h = checkpoint.h[order]
+            u = checkpoint.u[order]
+            v = checkpoint.v[order]
+        else:
+            return self._read_text(file_path, number_of_cells)
+
+        if len(h) != number_of_cells:
+            raise ValueError(f"Initial state file {file_path} has {len(h)} cells, expected {number_of_cells}.")
+        return h, u, v
+
+    def _read_text(self, file_path: str, number_of_cells: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        with open_text(file_path) as file:
+            values = read_array(file, number_of_cells, 3)
+        # one contiguous array per variable
+        h, u, v = values.T.copy()
+        return h, u, v
+
+    def _read_hdf5(self, file_path: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Read the last snapshot of an HDF5 result file written by 'ResultWriter'
         """
-        node_list = []
-        with open(file_path, 'r') as file:
-            for _ in range(number_of_cells):
-                h, u, v = extract(file, (float, float, float))
-                node = Node(h, u, v)
-                node_list.append(node)
-        return node_list
+        import h5py #type: ignore
+
+        with h5py.File(file_path, 'r') as hdf:
+            snapshots = [name for name in hdf.keys() if name.startswith("time_")]
+            if not snapshots:
+                raise ValueError(f"No snapshot found in result file {file_path}.")
+            last_snapshot = hdf[max(snapshots, key=lambda name: float(name[len("time_"):]))]
+            order = np.argsort(last_snapshot["ids"][()], kind="stable")
+            return (
+                np.asarray(last_snapshot["h"][()], dtype=np.float64)[order],
+                np.asarray(last_snapshot["u"][()], dtype=np.float64)[order],
+                np.asarray(last_snapshot["v"][()], dtype=np.float64)[order]
+            )
@@ -1,8 +1,35 @@
+import os
 from abc import ABC, abstractmethod
+from enum import Enum
 
+from dassflow2d_py.input.file_reading import strip_compression_extension
 from dassflow2d_py.mesh.Mesh import RawCell, RawVertex, RawInlet, RawOutlet
 
 
+class MeshFormat(Enum):
+    AUTO = "auto"
+    DASSFLOW = "dassflow"
+    GMSH = "gmsh"
+
+
+# extension of gmsh mesh files, every other extension is read as a dassflow mesh
+GMSH_EXTENSION = ".msh"
+
+
+def mesh_format_of(file_path: str) -> MeshFormat:
+    """
+    Guess the format of a mesh file from its extension, compression extensions being ignored
+
+    Args:
+        file_path (str): string path to the mesh file
+
+    Returns:
+        MeshFormat: format of the mesh file, never 'MeshFormat.AUTO'
+    """
+    extension = os.path.splitext(strip_compression_extension(file_path))[1].lower()
+    return MeshFormat.GMSH if extension == GMSH_EXTENSION else MeshFormat.DASSFLOW
+
+
 class MeshReader(ABC):
 
     @abstractmethod
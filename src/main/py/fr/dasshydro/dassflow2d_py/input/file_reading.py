@@ -1,11 +1,79 @@
-from typing import Callable
-from io import TextIOWrapper
+import os
+import bz2
+import gzip
+import lzma
+from typing import IO, Callable, Sequence
+from itertools import islice
 
-def _read_next(file: TextIOWrapper, ignore_predicate: Callable[[str], bool]) -> str:
+import numpy as np
+
+
+# first characters of comment lines, also starting inline comments in numeric blocks
+COMMENT_CHARACTERS = ('#', '!')
+
+# streaming openers of compressed files, by file extension
+COMPRESSION_OPENERS: dict[str, Callable[..., IO]] = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open
+}
+
+
+def open_text(file_path: str, mode: str = 'r') -> IO[str]:
+    """Opens a text file, compressed files (see 'COMPRESSION_OPENERS') being decompressed or compressed
+    on the fly based on their extension, without ever holding the whole file in memory
+
+    Args:
+        file_path (str): path to the file
+        mode (str): 'r' to read, 'w' to write or 'a' to append
+
+    Returns:
+        IO[str]: text stream of the file
+    """
+    opener = COMPRESSION_OPENERS.get(os.path.splitext(file_path)[1].lower())
+    if opener is None:
+        return open(file_path, mode)
+    return opener(file_path, mode + 't')
+
+
+def open_binary(file_path: str) -> IO[bytes]:
+    """Opens a binary file for reading, compressed files (see 'COMPRESSION_OPENERS') being decompressed on the fly
+
+    Args:
+        file_path (str): path to the file
+
+    Returns:
+        IO[bytes]: binary stream of the file
+    """
+    opener = COMPRESSION_OPENERS.get(os.path.splitext(file_path)[1].lower())
+    if opener is None:
+        return open(file_path, 'rb')
+    return opener(file_path, 'rb')
+
+
+def strip_compression_extension(file_path: str) -> str:
+    """Removes the compression extension of a file path, if any (see 'COMPRESSION_OPENERS')
+
+    Args:
+        file_path (str): path to the file
+
+    Returns:
+        str: path of the uncompressed file
+    """
+    root, extension = os.path.splitext(file_path)
+    return root if extension.lower() in COMPRESSION_OPENERS else file_path
+
+
+def _ignore_line(line: str) -> bool:
+    """Tells if a line is only whitespaces or a comment"""
+    stripped_line = line.strip()
+    return not stripped_line or stripped_line.startswith(COMMENT_CHARACTERS)
+
+def _read_next(file: IO[str], ignore_predicate: Callable[[str], bool]) -> str:
     """Reads the next line in the file that don't match the ignore predicate
 
     Args:
-        file (TextIOWrapper): file to read from
+        file (IO[str]): file to read from
         ignore_predicate (Callable[[str], bool]): predicate on strings that indicate if the line should be ignored
     Returns:
         str: next line that don't match predicate
@@ -17,31 +85,80 @@ def _read_next(file: TextIOWrapper, ignore_predicate: Callable[[str], bool]) ->
             raise EOFError("End of file reached without finding a valid line.")
     return line
 
-def next_line(file: TextIOWrapper) -> str:
+def next_line(file: IO[str]) -> str:
     """Gets the next line of text in file ignoring whitespaces and comments
 
     Args:
-        file (TextIOWrapper): file to read line from
+        file (IO[str]): file to read line from
 
     Returns:
         str: the next line in file that is not only whitespaces nor a comment
     """
-    def ignore_line(line: str):
-        # Strip whitespace from the string
-        stripped_line = line.strip()
-        # Check if the string is empty or a comment
-        return not stripped_line or stripped_line.startswith('#') or stripped_line.startswith('!')
-    return _read_next(file, ignore_line)
+    return _read_next(file, _ignore_line)
 
-def extract(file: TextIOWrapper, type_tuple: tuple) -> tuple:
+def extract(file: IO[str], type_tuple: tuple) -> tuple:
     """Extract a number of variables from the next relevant line of a file
 
     Args:
-        file (TextIOWrapper): file to extract relevant line from
+        file (IO[str]): file to extract relevant line from
         type_tuple (tuple): types of all extracted variables
 
     Returns:
         tuple: all extracted variables in a tuple
     """
     parts = next_line(file).strip().split()
-    return tuple(typ(part) for typ, part in zip(type_tuple, parts))
\ No newline at end of file
+    return tuple(typ(part) for typ, part in zip(type_tuple, parts))
+
+def read_lines(file: IO[str], line_number: int) -> list[str]:
+    """Gets the next lines of text in file ignoring whitespaces and comments, reading them by blocks
+
+    Args:
+        file (IO[str]): file to read lines from
+        line_number (int): number of relevant lines to read
+
+    Raises:
+        EOFError: if the file ends before enough relevant lines are read
+
+    Returns:
+        list[str]: the next relevant lines in file, comments excluded
+    """
+    lines: list[str] = []
+    while len(lines) < line_number:
+        # comment lines are only known once read, so a block may not be enough
+        block = list(islice(file, line_number - len(lines)))
+        if not block:
+            raise EOFError("End of file reached without finding a valid line.")
+        lines.extend([line for line in block if not _ignore_line(line)])
+    return lines
+
+def parse_array(lines: list[str], columns: Sequence[int], dtype: type = np.float64) -> np.ndarray:
+    """Converts columns of lines of numbers into an array in one call, other columns are ignored
+
+    Args:
+        lines (list[str]): lines to convert, see 'read_lines'
+        columns (Sequence[int]): positions (0-based) of the columns to convert in every line
+        dtype (type): type of the values
+
+    Raises:
+        ValueError: if a value cannot be converted, or a line has not enough columns
+
+    Returns:
+        np.ndarray: values, shape (number of lines, number of columns)
+    """
+    if not lines:
+        return np.empty((0, len(columns)), dtype=dtype)
+    return np.loadtxt(lines, dtype=dtype, comments=COMMENT_CHARACTERS, usecols=columns, ndmin=2)
+
+def read_array(file: IO[str], row_number: int, column_number: int, dtype: type = np.float64) -> np.ndarray:
+    """Extract a block of numbers from the next relevant lines of a file, see 'read_lines' and 'parse_array'
+
+    Args:
+        file (IO[str]): file to extract relevant lines from
+        row_number (int): number of relevant lines to read
+        column_number (int): number of leading columns to convert in every line
+        dtype (type): type of the values
+
+    Returns:
+        np.ndarray: values, shape (row_number, column_number)
+    """
+    return parse_array(read_lines(file, row_number), range(column_number), dtype)
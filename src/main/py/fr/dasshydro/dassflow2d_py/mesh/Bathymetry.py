@@ -0,0 +1,130 @@
+from typing import Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
+
+from dassflow2d_py.mesh.Mesh import Mesh, Cell
+
+
+class Bathymetry(Mapping[Cell, float]):
+    """
+    Bed elevation of every cell stored in a single array: real cells first (in 'Mesh#getCells()' order),
+    followed by one slot per ghost cell (in 'Mesh#getBoundaries()' order), which is the same ordering as the state.
+
+    Hot paths should resolve cell indices once using 'getIndices' and then read 'getValues()' directly.
+    Lookup by cell ('bathymetry[cell]') is kept for legacy callers, as well as 'fromMapping' and 'toDict'.
+    """
+
+    def __init__(self, cells: Sequence[Cell], values: Iterable[float]):
+        self.cells = list(cells)
+        self.array = np.array(values, dtype=np.float64)
+        if self.array.shape != (len(self.cells),):
+            raise ValueError(f"Expected {len(self.cells)} bathymetry values, got {self.array.size}.")
+        self.index = {cell: i for i, cell in enumerate(self.cells)}
+
+    @staticmethod
+    def fromMesh(mesh: Mesh, cell_values: Iterable[float]) -> 'Bathymetry':
+        """
+        Create a bathymetry from real cell values, every ghost cell takes the value of its real cell
+
+        Args:
+            mesh (Mesh): mesh defining the cell ordering
+            cell_values (Iterable[float]): bathymetry of every real cell, in the order of 'Mesh#getCells()'
+
+        Returns:
+            Bathymetry: bathymetry including ghost cells
+        """
+        cells = list(mesh.getCells())
+        cell_index = {cell: i for i, cell in enumerate(cells)}
+        ghost_cells = []
+        ghost_origins = []
+        for boundary in mesh.getBoundaries():
+            boundary_edge = boundary.getEdge()
+            ghost_cells.append(boundary_edge.getGhostCell())
+            ghost_origins.append(cell_index[boundary_edge.getCells()[0]])
+
+        values = np.asarray(list(cell_values), dtype=np.float64)
+        values = np.concatenate((values, values[np.asarray(ghost_origins, dtype=np.int64)]))
+        return Bathymetry(cells + ghost_cells, values)
+
+    @staticmethod
+    def fromMapping(mapping: Mapping[Cell, float]) -> 'Bathymetry':
+        """
+        Create a bathymetry from a legacy cell to bathymetry mapping, keeping the mapping iteration order
+
+        Args:
+            mapping (Mapping[Cell, float]): bathymetry z for each cell
+
+        Returns:
+            Bathymetry: array backed bathymetry
+        """
+        return Bathymetry(list(mapping.keys()), list(mapping.values()))
+
+    def getValues(self) -> np.ndarray:
+        """
+        Get the bathymetry array, real cells followed by ghost cells
+
+        Returns:
+            np.ndarray: bathymetry values
+        """
+        return self.array
+
+    def getCells(self) -> list[Cell]:
+        """
+        Get the cells in the order of the bathymetry array
+
+        Returns:
+            list[Cell]: real cells followed by ghost cells
+        """
+        return self.cells
+
+    def getIndex(self, cell: Cell) -> int:
+        """
+        Get the position of a cell in the bathymetry array
+
+        Args:
+            cell (Cell): real or ghost cell
+
+        Returns:
+            int: index of the cell
+        """
+        return self.index[cell]
+
+    def getIndices(self, cells: Iterable[Cell]) -> np.ndarray:
+        """
+        Get the positions of several cells in the bathymetry array, meant to be computed once and reused
+
+        Args:
+            cells (Iterable[Cell]): real or ghost cells
+
+        Returns:
+            np.ndarray: index of every cell
+        """
+        return np.array([self.index[cell] for cell in cells], dtype=np.int64)
+
+    def setValue(self, cell: Cell, value: float):
+        """
+        Set the bathymetry of a single cell
+
+        Args:
+            cell (Cell): real or ghost cell
+            value (float): new bathymetry value
+        """
+        self.array[self.index[cell]] = value
+
+    def toDict(self) -> dict[Cell, float]:
+        """
+        Convert to a legacy cell to bathymetry dictionary
+
+        Returns:
+            dict[Cell, float]: bathymetry z for each cell
+        """
+        return dict(zip(self.cells, self.array.tolist()))
+
+    def __getitem__(self, cell: Cell) -> float:
+        return float(self.array[self.index[cell]])
+
+    def __iter__(self) -> Iterator[Cell]:
+        return iter(self.cells)
+
+    def __len__(self) -> int:
+        return len(self.cells)
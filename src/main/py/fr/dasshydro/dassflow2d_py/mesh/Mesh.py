@@ -12,10 +12,15 @@ class MeshType(Enum):
 
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Iterable, TYPE_CHECKING
+
+import numpy as np
 
 class Vertex(ABC):
 
+    # no instance dictionary, so that implementations can be slotted
+    __slots__ = ()
+
     @abstractmethod
     def getID(self) -> int:
         """
@@ -49,6 +54,9 @@ class Vertex(ABC):
 
 class Cell(ABC):
 
+    # no instance dictionary, so that implementations can be slotted
+    __slots__ = ()
+
     @abstractmethod
     def getID(self) -> int:
         """
@@ -153,6 +161,9 @@ class Cell(ABC):
 
 class Edge(ABC):
 
+    # no instance dictionary, so that implementations can be slotted
+    __slots__ = ()
+
     @abstractmethod
     def getID(self) -> int:
         """
@@ -443,3 +454,86 @@ class Mesh(ABC):
             Iterable[Boundary]: all boundaries of the mesh
         """
         pass
+
+    @abstractmethod
+    def getLocalEdge(self, cell_id: int, local_edge_number: int) -> Edge:
+        """
+        Get an edge of a cell from its local number, following the vertex order of the cell:
+        edge k joins vertices k-1 and k (1-based), edge 1 joins the last and the first vertices.
+        This is the numbering used by inlets and outlets of mesh files.
+
+        Args:
+            cell_id (int): ID of the cell
+            local_edge_number (int): 1-based local number of the edge in the cell
+
+        Raises:
+            KeyError: if no cell has this ID
+            IndexError: if the cell has no edge with this number
+
+        Returns:
+            Edge: the corresponding edge
+        """
+        pass
+
+    @abstractmethod
+    def getEdgeBoundary(self, edge: Edge) -> Boundary | None:
+        """
+        Get the boundary associated with an edge
+
+        Args:
+            edge (Edge): edge of the mesh
+
+        Returns:
+            Boundary | None: boundary of the edge, None if the edge is not a boundary edge
+        """
+        pass
+
+    @abstractmethod
+    def getCellEdgeTable(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the edges of every cell in compressed sparse row format: edges of the cell at position i
+        in 'getCells()' are at positions offsets[i] to offsets[i+1] (excluded) of the edge indices.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: offsets (cell number + 1,) and edge indices (positions in 'getEdges()')
+        """
+        pass
+
+    @abstractmethod
+    def getEdgeCellTable(self) -> np.ndarray:
+        """
+        Get the cells of every edge, in 'getEdges()' order: the first cell, then the second cell of the edge.
+        Cells are indexed as in the simulation state, the second cell of a boundary edge being its ghost cell
+        ('getCellNumber()' + position of the boundary in 'getBoundaries()').
+
+        Returns:
+            np.ndarray: cell indices (edge number, 2)
+        """
+        pass
+
+    @abstractmethod
+    def getCellNeighborTable(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the neighbors of every cell in compressed sparse row format, with the offsets of 'getCellEdgeTable':
+        the neighbor at a position is the other cell of the edge at the same position.
+        Cells are indexed as in the simulation state, the ghost cell of the boundary at position b
+        in 'getBoundaries()' being 'getCellNumber()' + b.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: offsets (cell number + 1,) and neighbor indices
+        """
+        pass
+
+    @abstractmethod
+    def getSpatialIndex(self) -> 'SpatialIndex':
+        """
+        Get the spatial index of the mesh, built on first call, locating the cells containing points.
+
+        Returns:
+            SpatialIndex: spatial index over all cells of the mesh
+        """
+        pass
+
+
+if TYPE_CHECKING:
+    from dassflow2d_py.mesh.SpatialIndex import SpatialIndex
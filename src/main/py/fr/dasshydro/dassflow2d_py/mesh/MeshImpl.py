@@ -1,75 +1,64 @@
 from dassflow2d_py.mesh.Mesh import *
-import math
+from dassflow2d_py.mesh.SpatialIndex import SpatialIndex
+from dassflow2d_py.mesh.renumbering import CellOrdering, renumber
+from dassflow2d_py.mesh.geometry import MAX_CELL_VERTICES, polygon_geometry, segment_geometry
+import numpy as np
 from typing import cast, Iterable
 
 
-# --- Global Helper Functions ---
-
-def _gauss_area_formula(vertices: list[tuple[float, float]]):
+class MeshArrays:
     """
-    Also known as the shoelace formula, this function calculate
-    the area of a 2D polygon given its vertices.
-
-    Args:
-        vertices: List of tuples [(x1, y1), (x2, y2), ..., (xn, yn)]
+    Shared arrays of a mesh: vertex coordinates, cell and edge connectivity and geometry.
+    Vertices, cells and edges are lightweight views holding their row in these arrays,
+    coordinates, vertex lists and geometric values are materialized on demand.
 
-    Returns:
-        Area of the polygon as a float.
-    """
-    n = len(vertices)
-    area = 0.0
-    for i in range(n):
-        x_i, y_i = vertices[i]
-        x_j, y_j = vertices[(i + 1) % n]
-        area += (x_i * y_j) - (x_j * y_i)
-    return abs(area) / 2.0
-
-def _polygon_perimeter(vertices):
+    Once the mesh is built, cell and edge rows are their positions in 'Mesh#getCells()' and 'Mesh#getEdges()'.
+    Cells are referred to as in the simulation state: real cells, followed by ghost cells in 'Mesh#getBoundaries()'
+    order (ghost cell of boundary b is cell number of cells + b).
     """
-    Calculate the perimeter of a 2D polygon given its vertices.
 
-    Args:
-        vertices: List of tuples [(x1, y1), (x2, y2), ..., (xn, yn)]
-
-    Returns:
-        Perimeter of the polygon as a float.
-    """
-    n = len(vertices)
-    perimeter = 0.0
-    for i in range(n):
-        x_i, y_i = vertices[i]
-        x_j, y_j = vertices[(i + 1) % n]
-        perimeter += math.sqrt((x_j - x_i)**2 + (y_j - y_i)**2)
-    return perimeter
-
-def _polygon_center(vertices):
-    """
-    Calculate the center of a 2D polygon given its vertices.
-
-    Args:
-        vertices: List of tuples [(x1, y1), (x2, y2), ..., (xn, yn)]
-
-    Returns:
-        Center of the polygon as a tuple of floats.
-    """
-    return (
-        sum(x for x, _ in vertices) / len(vertices),
-        sum(y for _, y in vertices) / len(vertices)
-    )
+    def __init__(self):
+        self.vertex_coordinates = np.empty((0, 2), dtype=np.float64)
+        self.vertices: list[Vertex] = []
+        # real cells followed by ghost cells, and edges, by row
+        self.cells: list[Cell] = []
+        self.edges: list[Edge] = []
+        # vertex rows of every cell, only the first 'cell_vertex_numbers' columns are meaningful
+        self.cell_vertices = np.empty((0, MAX_CELL_VERTICES), dtype=np.int64)
+        self.cell_vertex_numbers = np.empty(0, dtype=np.int64)
+        self.cell_centers = np.empty((0, 2), dtype=np.float64)
+        self.cell_surfaces = np.empty(0, dtype=np.float64)
+        self.cell_perimeters = np.empty(0, dtype=np.float64)
+        # vertex rows of every edge
+        self.edge_vertices = np.empty((0, 2), dtype=np.int64)
+        self.edge_centers = np.empty((0, 2), dtype=np.float64)
+        self.edge_lengths = np.empty(0, dtype=np.float64)
+        self.edge_normals = np.empty((0, 2), dtype=np.float64)
+        # first and second cell of every edge, the second one being a ghost cell for boundary edges
+        self.edge_cells = np.empty((0, 2), dtype=np.int64)
+        # edges and neighbors of cell i are at positions cell_offsets[i] to cell_offsets[i+1] (excluded)
+        # of 'cell_edges' and 'cell_neighbors' (compressed sparse row format)
+        self.cell_offsets = np.zeros(1, dtype=np.int64)
+        self.cell_edges = np.empty(0, dtype=np.int64)
+        self.cell_neighbors = np.empty(0, dtype=np.int64)
 
 
 class VertexImpl(Vertex):
 
-    def __init__(self, id: int, coordinates: tuple[float, float], isBoundary: bool):
+    __slots__ = ('id', 'arrays', 'index', 'boundary')
+
+    def __init__(self, id: int, arrays: MeshArrays, index: int, isBoundary: bool):
         self.id = id
-        self.coordinates = coordinates
+        self.arrays = arrays
+        self.index = index
         self.boundary = isBoundary
 
     def getID(self) -> int:
         return self.id
 
     def getCoordinates(self) -> tuple[float, float]:
-        return self.coordinates
+        x, y = self.arrays.vertex_coordinates[self.index].tolist()
+        return (x, y)
 
     def isBoundary(self) -> bool:
         return self.boundary
@@ -80,46 +69,45 @@ class VertexImpl(Vertex):
 
 class CellImpl(Cell):
 
-    def __init__(self, id: int, vertices: list[Vertex], edges: list[Edge], neighbors: list[Cell],
-                 isBoundary: bool, isGhost: bool):
+    __slots__ = ('id', 'arrays', 'index', 'boundary', 'ghost')
+
+    def __init__(self, id: int, arrays: MeshArrays, index: int, isBoundary: bool, isGhost: bool):
         self.id = id
-        self.vertices = vertices
-        self.edges = edges
-        self.neighbors = neighbors
+        self.arrays = arrays
+        self.index = index
         self.boundary = isBoundary
         self.ghost = isGhost
 
-        self.verticesNumber = len(vertices)
-        
-        # map from a list of vertices to a list of there coordinates
-        list_of_coordinates = [vertex.getCoordinates() for vertex in vertices]
-        self.center = _polygon_center(list_of_coordinates)
-        self.surface = _gauss_area_formula(list_of_coordinates)
-        self.perimeter = _polygon_perimeter(list_of_coordinates)
-
     def getID(self) -> int:
         return self.id
 
     def getSurface(self) -> float:
-        return self.surface
+        return float(self.arrays.cell_surfaces[self.index])
 
     def getPerimeter(self) -> float:
-        return self.perimeter
+        return float(self.arrays.cell_perimeters[self.index])
 
     def getVertices(self) -> list[Vertex]:
-        return self.vertices
+        vertices = self.arrays.vertices
+        rows = self.arrays.cell_vertices[self.index, :self.arrays.cell_vertex_numbers[self.index]]
+        return [vertices[row] for row in rows.tolist()]
 
     def getVerticesNumber(self) -> int:
-        return self.verticesNumber
+        return int(self.arrays.cell_vertex_numbers[self.index])
 
     def getEdges(self) -> list[Edge]:
-        return self.edges
+        arrays, edges = self.arrays, self.arrays.edges
+        rows = arrays.cell_edges[arrays.cell_offsets[self.index]:arrays.cell_offsets[self.index + 1]]
+        return [edges[row] for row in rows.tolist()]
 
     def getNeighbors(self) -> list[Cell]:
-        return self.neighbors
+        arrays, cells = self.arrays, self.arrays.cells
+        rows = arrays.cell_neighbors[arrays.cell_offsets[self.index]:arrays.cell_offsets[self.index + 1]]
+        return [cells[row] for row in rows.tolist()]
 
     def getGravityCenter(self) -> tuple[float, float]:
-        return self.center
+        x, y = self.arrays.cell_centers[self.index].tolist()
+        return (x, y)
 
     def isBoundary(self) -> bool:
         return self.boundary
@@ -133,6 +121,8 @@ class CellImpl(Cell):
 
 class GhostCell(Cell):
 
+    __slots__ = ('cell',)
+
     def __init__(self, cell: CellImpl):
         self.cell = cell
 
@@ -169,94 +159,48 @@ class GhostCell(Cell):
 
 class EdgeImpl(Edge):
 
-    def __init__(self, id: int, vertices: tuple[Vertex, Vertex], cells: tuple[Cell, Cell], isBoundary: bool):
+    __slots__ = ('id', 'arrays', 'index', 'cells', 'boundary')
+
+    def __init__(self, id: int, arrays: MeshArrays, index: int, cells: tuple[Cell, Cell], isBoundary: bool):
         self.id = id
-        self.vertices = vertices
-        self.setCells(cells)
+        self.arrays = arrays
+        self.index = index
+        self.cells = cells
         self.boundary = isBoundary
 
-        tuple_of_coordinates = (vertices[0].getCoordinates(), vertices[1].getCoordinates())
-        self.center = _polygon_center(tuple_of_coordinates)
-        x_0, y_0 = tuple_of_coordinates[0]
-        x_1, y_1 = tuple_of_coordinates[1]
-        self.length = math.sqrt((x_1 - x_0)**2 + (y_1 - y_0)**2)
-        self.normalVector = self._create_normal_vector(vertices[0].getCoordinates(), vertices[1].getCoordinates(), cells[0].getGravityCenter())
-    
-    # --- Private Methods ---
-
-    def _create_normal_vector(
-        self,
-        a: tuple[float, float],
-        b: tuple[float, float],
-        p: tuple[float, float]
-    ) -> tuple[float, float]:
-        """
-        Creates a 2D vector representing the normal vector of the current edge.
-        The edge normal vector is defined as the normal vector that faces away from the first cell in 'Edge#getCells()'
-
-        Args:
-            a (tuple[float, float]): one vertex of the edge
-            b (tuple[float, float]): other vertex of the edge
-            p (tuple[float, float]): a point in the cell to avoid
-
-        Raises:
-            ValueError: if p is colinear with a and b
-
-        Returns:
-            tuple[float, float]: the normal vector of the edge
-        """
-        cross = (b[0] - a[0]) * (p[1] - a[1]) - (b[1] - a[1]) * (p[0] - a[0])
-        if cross == 0:
-            raise ValueError("p cannot be collinear with segment AB")
-        isLeft = cross > 0
-        normal_vector = (b[0] - a[0], b[1] - a[1])
-        if isLeft:
-            # turn AB vector to the right
-            normal_vector = (normal_vector[1], -normal_vector[0])
-        else:
-            # so it's right
-            # turn AB vector to the left
-            normal_vector = (-normal_vector[1], normal_vector[0])
-        # normalizing step
-        magnitude = math.sqrt(normal_vector[0]**2 + normal_vector[1]**2)
-        if magnitude == 0:
-            return (0, 0)  # Avoid division by zero
-        normal_vector = (normal_vector[0] / magnitude, normal_vector[1] / magnitude)
-        return normal_vector
-
-    # --- End of Private ---
-
     def getID(self) -> int:
         return self.id
 
     def getVertices(self) -> tuple[Vertex, Vertex]:
-        return self.vertices
+        vertices = self.arrays.vertices
+        row1, row2 = self.arrays.edge_vertices[self.index].tolist()
+        return (vertices[row1], vertices[row2])
 
     def getCenter(self) -> tuple[float, float]:
-        return self.center
+        x, y = self.arrays.edge_centers[self.index].tolist()
+        return (x, y)
 
     def getLength(self) -> float:
-        return self.length
+        return float(self.arrays.edge_lengths[self.index])
 
     def getCells(self) -> tuple[Cell, Cell]:
         return self.cells
 
     def setCells(self, cells: tuple[Cell, Cell]):
         self.cells = cells
-        self.fluxDirectionVector = (
-            cells[1].getGravityCenter()[0] - cells[0].getGravityCenter()[0],
-            cells[1].getGravityCenter()[1] - cells[0].getGravityCenter()[1]
-        )
 
     def getNormalVector(self) -> tuple[float, float]:
-        return self.normalVector
+        x, y = self.arrays.edge_normals[self.index].tolist()
+        return (x, y)
 
     def getFluxDirectionVector(self) -> tuple[float, float]:
         assert self.cells[0] != self.cells[1]
-        return self.fluxDirectionVector
+        center1, center2 = self.cells[0].getGravityCenter(), self.cells[1].getGravityCenter()
+        return (center2[0] - center1[0], center2[1] - center1[1])
 
     def getVectorToCellCenter(self, cell: Cell) -> tuple[float, float]:
-        return (cell.getGravityCenter()[0] - self.center[0], cell.getGravityCenter()[1] - self.center[1])
+        center = self.getCenter()
+        return (cell.getGravityCenter()[0] - center[0], cell.getGravityCenter()[1] - center[1])
 
     def isBoundary(self) -> bool:
         return self.boundary
@@ -287,119 +231,146 @@ class BoundaryImpl(Boundary):
 
 # --- Mesh Helper Functions ---
 
-def _create_partial_vertices_dict(rawVertices: Iterable[RawVertex]) -> dict[int, Vertex]:
+def _create_partial_vertices_dict(rawVertices: Iterable[RawVertex], arrays: MeshArrays) -> dict[int, Vertex]:
     """
     Creates a dictionary mapping vertex IDs to partial Vertex objects.
     Created Vertices are partial as they lack coherence on the 'isBoundary' method
 
     Args:
         rawVertices: List of raw vertex data.
+        arrays: Shared arrays of the mesh, receiving vertex coordinates.
 
     Returns:
-        A dictionary mapping vertex IDs to Vertex objects.
+        A dictionary mapping vertex IDs to Vertex objects, in the order of their row in the shared arrays.
     """
-    return {
-        v.id: VertexImpl(v.id, (v.x_coord, v.y_coord), False)
-        for v in rawVertices
+    coordinates = {v.id: (v.x_coord, v.y_coord) for v in rawVertices}
+    arrays.vertex_coordinates = np.array(list(coordinates.values()), dtype=np.float64).reshape(len(coordinates), 2)
+    vertices_dict: dict[int, Vertex] = {
+        vertex_id: VertexImpl(vertex_id, arrays, index, False)
+        for index, vertex_id in enumerate(coordinates)
     }
+    arrays.vertices = list(vertices_dict.values())
+    return vertices_dict
 
 
-def _create_partial_cells(rawCells: Iterable[RawCell], vertices_dict: dict[int, Vertex]) -> list[Cell]:
+def _create_partial_cells(rawCells: Iterable[RawCell], vertices_dict: dict[int, Vertex],
+                          arrays: MeshArrays) -> list[Cell]:
     """
     Creates a list of partial Cell objects from raw cell data.
-    Created Cells are partial as they lack coherence on 'getEdges', 'getNeighbors', and 'isBoundary' methods
+    Created Cells are partial as they lack coherence on 'getEdges', 'getNeighbors', and 'isBoundary' methods.
+    Connectivity, centers, surfaces and perimeters of all cells are stored in the shared arrays in a single batch.
 
     Args:
         rawCells: List of raw cell data.
         vertices_dict: Dictionary mapping vertex IDs to Vertex objects.
+        arrays: Shared arrays of the mesh, receiving cell connectivity and geometry.
 
     Returns:
         A list of Cell objects.
     """
-    cells: list[Cell] = []
+    cell_ids: list[int] = []
+    # vertex rows of every cell, triangles are padded with their first vertex (never read)
+    connectivity: list[list[int]] = []
+    vertex_numbers: list[int] = []
 
     for raw_cell in rawCells:
-        
-        # build cell's vertices list
-        cell_vertices: list[Vertex] = [
-            vertices_dict[raw_cell.vertex1],
-            vertices_dict[raw_cell.vertex2],
-            vertices_dict[raw_cell.vertex3],
-        ]
+
+        # build cell's vertex rows
+        vertex_ids = [raw_cell.vertex1, raw_cell.vertex2, raw_cell.vertex3]
         # _ don't add fourth element if it comply with at least one method of nullification
         # i.e. that means that the fourth vertex don't represent a vertex but the end of the vertices list
         # in the case of a triangular cell
         if raw_cell.vertex4 != 0 and (raw_cell.vertex1 != raw_cell.vertex4):
-            cell_vertices.append(vertices_dict[raw_cell.vertex4])
+            vertex_ids.append(raw_cell.vertex4)
 
-        cell = CellImpl(
-            id=raw_cell.id,
-            vertices=cell_vertices,
-            edges=[],                 # non-coherent (populated later)
-            neighbors=[],             # non-coherent (populated later)
+        cell_ids.append(raw_cell.id)
+        rows = [cast(VertexImpl, vertices_dict[vertex_id]).index for vertex_id in vertex_ids]
+        connectivity.append(rows + rows[:1] * (MAX_CELL_VERTICES - len(rows)))
+        vertex_numbers.append(len(rows))
+
+    arrays.cell_vertices = np.array(connectivity, dtype=np.int64).reshape(len(cell_ids), MAX_CELL_VERTICES)
+    arrays.cell_vertex_numbers = np.array(vertex_numbers, dtype=np.int64)
+    arrays.cell_centers, arrays.cell_surfaces, arrays.cell_perimeters = polygon_geometry(
+        arrays.vertex_coordinates, arrays.cell_vertices, arrays.cell_vertex_numbers
+    )
+
+    cells: list[Cell] = [
+        CellImpl(
+            id=cell_id,
+            arrays=arrays,
+            index=index,
             isBoundary=False,         # non-coherent (corrected later)
             isGhost=False,
         )
-        cells.append(cell)
-
+        for index, cell_id in enumerate(cell_ids)
+    ]
     return cells
 
 
-def _create_partial_edges(cells: list[Cell], vertices_dict: dict[int, Vertex]) -> list[Edge]:
+# local vertex pairs leading to the edges of a cell, in creation order (the last pair only exists for quadrilaterals)
+_LOCAL_EDGE_PAIRS = ((0, 1), (0, -1), (1, 2), (2, 3))
+
+
+def _create_partial_edges(cells: list[Cell], arrays: MeshArrays) -> list[Edge]:
     """
-    Creates a list of partial Edge objects from cell and vertex information.
-    Created Edges are partial as they lack coherence on the 'getCells' method
+    Creates a list of partial Edge objects from the connectivity of the cells.
+    Created Edges are partial as they lack coherence on the 'getCells' method.
+    Edges are found, and their centers, lengths and normal vectors computed, in a single batch over the cells.
+    Edge IDs follow the order in which cells first reach them.
 
     Args:
-        cells: List of Cell objects.
-        vertices_dict: Dictionary mapping vertex IDs to Vertex objects.
+        cells: List of Cell objects, in the order of their row in the shared arrays.
+        arrays: Shared arrays of the mesh, receiving edge connectivity and geometry.
 
     Returns:
         A list of Edge objects.
     """
-    edges: list[Edge] = []
-    # counter to assign different IDs to each edge
-    edge_id = 1
-    # keeps track of what tuple of int*int already exists as an partial Edge object (avoid edge duplication)
-    edge_map = {}
-
-    for cell in cells:
-
-        # build array of possible tuple of vertex IDs that can lead to an edge
-        possible_edges = []
-        for i in range(cell.getVerticesNumber()):
-            for j in range(i + 1, cell.getVerticesNumber()):
-                cell = cast(CellImpl, cell)
-                vertex1 = cell.getVertices()[i]
-                vertex2 = cell.getVertices()[j]
-                possible_edges.append((vertex1.getID(), vertex2.getID()))
-
-        for possible_edge in possible_edges:
-
-            edge_key = tuple(sorted(possible_edge))
-            
-            # verify if this tuple of vertex IDs already led to the creation of a partial Edge object
-            if edge_key not in edge_map:
-
-                # if not, create it
-                edge = EdgeImpl(
-                    id=edge_id,
-                    vertices=(vertices_dict[possible_edge[0]], vertices_dict[possible_edge[1]]),
-                    cells=(cell, cell),
-                    isBoundary=True,
-                )
-                edges.append(edge)
-                edge_id += 1
-                # and update the dictionary to not create it again
-                edge_map[edge_key] = edge
-
-            else:
-
-                # if not, that means that this edge is the connection between two cells
-                edge = edge_map[edge_key]
-                edge.setCells((edge.getCells()[0], cell))
-                edge.setBoundary(False)
+    connectivity, vertex_numbers = arrays.cell_vertices, arrays.cell_vertex_numbers
+    cell_number = len(cells)
+
+    # every (cell, local pair) occurrence, by cell then by local pair
+    cell_rows = np.arange(cell_number)
+    first_vertices = np.column_stack([connectivity[:, i] for i, _ in _LOCAL_EDGE_PAIRS])
+    second_vertices = np.column_stack([
+        connectivity[cell_rows, vertex_numbers - 1] if j < 0 else connectivity[:, j] for _, j in _LOCAL_EDGE_PAIRS
+    ])
+    present = np.ones((cell_number, len(_LOCAL_EDGE_PAIRS)), dtype=bool)
+    present[:, 3] = vertex_numbers == MAX_CELL_VERTICES
+    occurrence_cells = np.repeat(cell_rows, len(_LOCAL_EDGE_PAIRS)).reshape(present.shape)[present]
+    first_vertices, second_vertices = first_vertices[present], second_vertices[present]
+
+    # an edge is identified by its sorted pair of vertices, whatever the cell reaching it
+    vertex_number = len(arrays.vertex_coordinates)
+    keys = np.minimum(first_vertices, second_vertices) * vertex_number + np.maximum(first_vertices, second_vertices)
+    _, first_occurrences, inverse, counts = np.unique(keys, return_index=True, return_inverse=True, return_counts=True)
+    last_occurrences = np.empty_like(first_occurrences)
+    last_occurrences[inverse] = np.arange(len(keys))
+    # edges are numbered by first occurrence
+    creation_order = np.argsort(first_occurrences, kind="stable")
+    first_occurrences, last_occurrences = first_occurrences[creation_order], last_occurrences[creation_order]
+    # edges reached by a single cell are boundaries
+    boundary_flags = counts[creation_order] == 1
+
+    arrays.edge_vertices = np.column_stack((first_vertices[first_occurrences], second_vertices[first_occurrences]))
+    first_cells = occurrence_cells[first_occurrences]
+    # boundary edges get their ghost cell in '_create_cell_tables'
+    arrays.edge_cells = np.column_stack((first_cells, occurrence_cells[last_occurrences]))
+    arrays.edge_centers, arrays.edge_lengths, arrays.edge_normals = segment_geometry(
+        arrays.vertex_coordinates, arrays.edge_vertices, arrays.cell_centers[first_cells]
+    )
 
+    edges: list[Edge] = [
+        EdgeImpl(
+            id=index + 1,
+            arrays=arrays,
+            index=index,
+            cells=(cells[cell1], cells[cell2]),
+            isBoundary=is_boundary,
+        )
+        for index, (cell1, cell2, is_boundary) in enumerate(zip(
+            arrays.edge_cells[:, 0].tolist(), arrays.edge_cells[:, 1].tolist(), boundary_flags.tolist()
+        ))
+    ]
     return edges
 
 
@@ -441,86 +412,141 @@ def _create_boundaries(edges: list[Edge]) -> list[Boundary]:
     return boundaries
 
 
-def _add_cell_edges(edges: list[Edge]):
+def _reorder_mesh_arrays(arrays: MeshArrays, cells: list[Cell], edges: list[Edge]):
     """
-    Adds the edges of each cell.
+    Reorders the rows of the shared arrays to follow the order of the cell and edge lists,
+    after they have been renumbered. Ghost cells of the edges are set back by '_create_cell_tables'.
 
     Args:
-        edges: List of Edge objects.
+        arrays: Shared arrays of the mesh.
+        cells: List of Cell objects, in their new order.
+        edges: List of Edge objects, in their new order.
     """
+    cell_views, edge_views = cast(list[CellImpl], cells), cast(list[EdgeImpl], edges)
+    cell_rows = np.fromiter((cell.index for cell in cell_views), dtype=np.int64, count=len(cells))
+    edge_rows = np.fromiter((edge.index for edge in edge_views), dtype=np.int64, count=len(edges))
+    positions = np.empty_like(cell_rows)
+    positions[cell_rows] = np.arange(len(cells))
+
+    edge_cells = arrays.edge_cells[edge_rows]
+    ghosts = edge_cells[:, 1] >= len(cells)
+    edge_cells[ghosts, 1] = edge_cells[ghosts, 0]
+    arrays.edge_cells = positions[edge_cells]
+    arrays.cell_vertices = arrays.cell_vertices[cell_rows]
+    arrays.cell_vertex_numbers = arrays.cell_vertex_numbers[cell_rows]
+    arrays.cell_centers = arrays.cell_centers[cell_rows]
+    arrays.cell_surfaces = arrays.cell_surfaces[cell_rows]
+    arrays.cell_perimeters = arrays.cell_perimeters[cell_rows]
+    arrays.edge_vertices = arrays.edge_vertices[edge_rows]
+    arrays.edge_centers = arrays.edge_centers[edge_rows]
+    arrays.edge_lengths = arrays.edge_lengths[edge_rows]
+    arrays.edge_normals = arrays.edge_normals[edge_rows]
+
+    for index, cell in enumerate(cell_views):
+        cell.index = index
+    for index, edge in enumerate(edge_views):
+        edge.index = index
+
+
+def _create_cell_tables(arrays: MeshArrays, cells: list[Cell], edges: list[Edge], boundaries: list[Boundary]):
+    """
+    Creates the edges and the neighbors of every cell, as compressed sparse row tables of the shared arrays.
+    The edges of a cell are listed by increasing ID, neighbors being the other cell of every edge.
 
-    for edge in edges:
-
-        for cell in edge.getCells():
+    Args:
+        arrays: Shared arrays of the mesh, rows following the order of the lists.
+        cells: List of Cell objects.
+        edges: List of Edge objects.
+        boundaries: List of Boundary objects, giving the order of ghost cells.
+    """
+    cell_number = len(cells)
+    arrays.cells = cells + [boundary.getEdge().getGhostCell() for boundary in boundaries]
+    arrays.edges = edges
+    # ghost cell of boundary b
+    boundary_rows = np.fromiter(
+        (cast(EdgeImpl, boundary.getEdge()).index for boundary in boundaries), dtype=np.int64, count=len(boundaries)
+    )
+    arrays.edge_cells[boundary_rows, 1] = cell_number + np.arange(len(boundaries))
 
-            if not cell.isGhost():
+    # every (cell, edge, neighbor) relation, ghost cells have no edges
+    first_cells, second_cells = arrays.edge_cells[:, 0], arrays.edge_cells[:, 1]
+    real_second = np.flatnonzero(second_cells < cell_number)
+    relation_cells = np.concatenate((first_cells, second_cells[real_second]))
+    relation_edges = np.concatenate((np.arange(len(edges)), real_second))
+    relation_neighbors = np.concatenate((second_cells, first_cells[real_second]))
+    edge_ids = np.fromiter((edge.getID() for edge in edges), dtype=np.int64, count=len(edges))
+    order = np.lexsort((edge_ids[relation_edges], relation_cells))
 
-                cell = cast(CellImpl, cell)
-                cell.getEdges().append(edge)
+    arrays.cell_offsets = np.zeros(cell_number + 1, dtype=np.int64)
+    np.cumsum(np.bincount(relation_cells, minlength=cell_number), out=arrays.cell_offsets[1:])
+    arrays.cell_edges = relation_edges[order]
+    arrays.cell_neighbors = relation_neighbors[order]
 
 
-def _add_neighbors_to_cells(cells: list[Cell]):
+def _create_local_edge_index(cells: list[Cell], edges: list[Edge]) -> dict[int, list[Edge]]:
     """
-    Adds neighboring cells to each cell.
+    Creates the index of the edges of every cell by local number, following the vertex order of the cell:
+    local edge k joins vertices k-1 and k (1-based), local edge 1 joins the last and the first vertices.
 
     Args:
         cells: List of Cell objects.
+        edges: List of Edge objects.
+
+    Returns:
+        A dictionary mapping cell IDs to the list of their edges, at position k-1 for local edge k.
     """
+    # search for an Edge object using the sorted IDs of its vertices
+    vertex_pair_dict = {
+        tuple(sorted((edge.getVertices()[0].getID(), edge.getVertices()[1].getID()))): edge
+        for edge in edges
+    }
 
+    local_edges: dict[int, list[Edge]] = {}
     for cell in cells:
-        # for each cells, explore their neighbors using edges
-
-        cell = cast(CellImpl, cell)
-
-        for cell_edge in cell.getEdges():
-
-            edge_cell1, edge_cell2 = cell_edge.getCells()
-            assert edge_cell1 != edge_cell2 # assume that edges are coherent on 'getCells' method
-            other_cell = edge_cell1 if edge_cell2 == cell else edge_cell2
-            cell.getNeighbors().append(other_cell)
+        vertex_ids = [vertex.getID() for vertex in cell.getVertices()]
+        local_edges[cell.getID()] = [
+            vertex_pair_dict[tuple(sorted((vertex_ids[k - 1], vertex_ids[k])))]
+            for k in range(len(vertex_ids))
+        ]
+    return local_edges
 
 
 def _process_inlets_and_outlets(
-    cells: list[Cell],
-    boundaries: list[Boundary],
+    local_edges: dict[int, list[Edge]],
+    edge_boundaries: dict[Edge, Boundary],
     inlets: Iterable[RawInlet],
     outlets: Iterable[RawOutlet],
     out_boundary_origin: dict[Boundary, RawInlet|RawOutlet]
 ):
     """
     Processes inlets and outlets, setting correct boundary type to corresponding Boundary object.
-    This function uses a naive approach to resolve target edge from inlet/outlet raw information.
-    This approach don't guarantee landing on the good edge and make tests unreliable on this information.
-    This issue should be investigated, Issue N°: #10
+    The target edge is resolved in constant time from the local edge number of the target cell.
 
     Args:
-        cells: List of Cell objects.
-        boundaries: List of Boundary objects.
+        local_edges: Dictionary mapping cell IDs to their edges by local number, see '_create_local_edge_index'.
+        edge_boundaries: Dictionary mapping boundary edges to their Boundary object.
         inlets: List of RawInlet objects.
         outlets: List of RawOutlet objects.
     """
-    # allows to search for a Cell object using it's ID
-    cells_dict = {cell.getID(): cell for cell in cells}
-    # allow to search for a Boundary object using it's target edge
-    boundary_edge_dict: dict[Edge, Boundary] = {boundary.getEdge(): boundary for boundary in boundaries}
 
     # function to process generic raw inlet/outlet
     def process_boundary_update(boundary_list, type_to_set: BoundaryType):
 
         for raw_boundary in boundary_list:
 
-            target_cell = cells_dict[raw_boundary.cell]
-            # casting to use 'getEdges' method as returning a list (indexable) instead of an Iterable
-            target_cell = cast(CellImpl, target_cell) 
-            edge_index = raw_boundary.edge - 1 # because mesh.geo is 1-based, not 0-based
-            target_edge = target_cell.getEdges()[edge_index]
-            # this can fail as resolving target edge using index in Cell#getEdges() is a naive approach
-            target_boundary = boundary_edge_dict.get(target_edge)
+            cell_edges = local_edges.get(raw_boundary.cell)
+            # local edge numbers are 1-based in mesh files
+            if cell_edges is None or not 1 <= raw_boundary.edge <= len(cell_edges):
+                print(f"Warning: Target edge {raw_boundary.edge} of cell {raw_boundary.cell} does not exist.")
+                continue
+
+            target_edge = cell_edges[raw_boundary.edge - 1]
+            target_boundary = edge_boundaries.get(target_edge)
 
             if target_boundary is None:
 
                 # this print should be replaced with a proper logging method
-                print(f"Warning: Target edge of inlet {raw_boundary.cell} is not a boundary edge.")
+                print(f"Warning: Target edge {raw_boundary.edge} of cell {raw_boundary.cell} is not a boundary edge.")
 
             else:
 
@@ -542,7 +568,9 @@ class MeshImpl(Mesh):
     Represent a geometric mesh, defining the simulation space
     """
 
-    def __init__(self, vertices: list[Vertex], edges: list[Edge], cells: list[Cell], boundaries: list[Boundary]):
+    def __init__(self, vertices: list[Vertex], edges: list[Edge], cells: list[Cell], boundaries: list[Boundary],
+                 arrays: MeshArrays):
+        self.arrays = arrays
         self.verticesNumber = len(vertices)
         self.vertices = vertices
         self.edgesNumber = len(edges)
@@ -552,6 +580,10 @@ class MeshImpl(Mesh):
         self.boundariesNumber = len(boundaries)
         self.boundaries = boundaries
         self.surface = sum(map(lambda c: c.getSurface(), cells))
+        # persistent indexes, resolving local edge numbers and boundaries in constant time
+        self.localEdges = _create_local_edge_index(cells, edges)
+        self.edgeBoundaries: dict[Edge, Boundary] = {boundary.getEdge(): boundary for boundary in boundaries}
+        self.spatialIndex: SpatialIndex | None = None # built on first use
 
     @staticmethod
     def createFromPartialInformation(
@@ -559,7 +591,8 @@ class MeshImpl(Mesh):
         rawCells: Iterable[RawCell],
         inlets: Iterable[RawInlet],
         outlets: Iterable[RawOutlet],
-        out_boundary_origin: dict[Boundary, RawInlet|RawOutlet]
+        out_boundary_origin: dict[Boundary, RawInlet|RawOutlet],
+        ordering: CellOrdering = CellOrdering.FILE
     ) -> Mesh:
         """
         Creates a Mesh object from raw vertex, cell, inlet, and outlet data.
@@ -569,25 +602,35 @@ class MeshImpl(Mesh):
             rawCells: List of raw cell data.
             inlets: List of raw inlet data.
             outlets: List of raw outlet data.
+            ordering: Cell renumbering applied for memory locality, cells keep their IDs.
 
         Returns:
             A fully constructed Mesh object.
         """
         assert len(out_boundary_origin) == 0
-        vertices_dict = _create_partial_vertices_dict(rawVertices)
-        cells = _create_partial_cells(rawCells, vertices_dict)
-        edges = _create_partial_edges(cells, vertices_dict)
+        arrays = MeshArrays()
+        vertices_dict = _create_partial_vertices_dict(rawVertices, arrays)
+        cells = _create_partial_cells(rawCells, vertices_dict, arrays)
+        edges = _create_partial_edges(cells, arrays)
         boundaries = _create_boundaries(edges)
-        _add_cell_edges(edges)
-        _add_neighbors_to_cells(cells)
-        _process_inlets_and_outlets(cells, boundaries, inlets, outlets, out_boundary_origin)
-
-        return MeshImpl(
+        _create_cell_tables(arrays, cells, edges, boundaries)
+        if ordering is not CellOrdering.FILE:
+            cells, edges, boundaries = renumber(
+                cells, edges, boundaries, ordering,
+                (arrays.cell_offsets, arrays.cell_neighbors), arrays.edge_cells, arrays.cell_centers
+            )
+            _reorder_mesh_arrays(arrays, cells, edges)
+            _create_cell_tables(arrays, cells, edges, boundaries)
+
+        mesh = MeshImpl(
             vertices=list(vertices_dict.values()),
             edges=edges,
             cells=cells,
             boundaries=boundaries,
+            arrays=arrays,
         )
+        _process_inlets_and_outlets(mesh.localEdges, mesh.edgeBoundaries, inlets, outlets, out_boundary_origin)
+        return mesh
 
     def getSurface(self) -> float:
         return self.surface
@@ -615,3 +658,28 @@ class MeshImpl(Mesh):
 
     def getBoundaries(self) -> list[Boundary]:
         return self.boundaries
+
+    def getLocalEdge(self, cell_id: int, local_edge_number: int) -> Edge:
+        if local_edge_number < 1:
+            raise IndexError(f"Local edge numbers are 1-based, got {local_edge_number}.")
+        return self.localEdges[cell_id][local_edge_number - 1]
+
+    def getEdgeBoundary(self, edge: Edge) -> Boundary | None:
+        return self.edgeBoundaries.get(edge)
+
+    def getCellEdgeTable(self) -> tuple[np.ndarray, np.ndarray]:
+        return self.arrays.cell_offsets, self.arrays.cell_edges
+
+    def getEdgeCellTable(self) -> np.ndarray:
+        return self.arrays.edge_cells
+
+    def getCellNeighborTable(self) -> tuple[np.ndarray, np.ndarray]:
+        return self.arrays.cell_offsets, self.arrays.cell_neighbors
+
+    def getSpatialIndex(self) -> SpatialIndex:
+        if self.spatialIndex is None:
+            # triangles already repeat their first vertex in the vertex table of the cells
+            self.spatialIndex = SpatialIndex(
+                self.arrays.vertex_coordinates, self.arrays.cell_vertices[:self.cellsNumber], self.cells
+            )
+        return self.spatialIndex
@@ -0,0 +1,165 @@
+import numpy as np
+
+from dassflow2d_py.mesh.Mesh import Cell
+
+
+# maximum number of cells in a leaf of the tree
+LEAF_SIZE = 8
+
+
+def _contains(corners: np.ndarray, points: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Tell, pair by pair, if a point lies in a convex cell (points on edges are inside), whatever the cell orientation
+
+    Args:
+        corners (np.ndarray): cell corners (N, 4, 2), triangles repeat their first vertex
+        points (np.ndarray): points (N, 2)
+        tolerance (float): tolerance on cross products
+
+    Returns:
+        np.ndarray: wether every point is in its cell (N,)
+    """
+    edge_vectors = np.roll(corners, -1, axis=1) - corners
+    to_points = points[:, None, :] - corners
+    cross = edge_vectors[:, :, 0] * to_points[:, :, 1] - edge_vectors[:, :, 1] * to_points[:, :, 0]
+    return np.all(cross >= -tolerance, axis=1) | np.all(cross <= tolerance, axis=1)
+
+
+class SpatialIndex:
+    """
+    Locates the cells containing points, using a KD-tree over the cell centers.
+    The tree is balanced: every node splits its cells at the median center along its widest axis, down to leaves of at most
+    LEAF_SIZE cells, and stores the bounding box of the bounding boxes of its cells. A query descends into the nodes whose
+    box holds the point and tests the cells of the reached leaves with a point in polygon test, so that the cost
+    follows the local cell size on graded meshes. Building costs O(C log² C), a query costs O(log C),
+    and batches of points are processed level by level in vectorized passes.
+    """
+
+    def __init__(self, vertex_coordinates: np.ndarray, cell_table: np.ndarray, cells: list[Cell] | None = None):
+        """
+        Args:
+            vertex_coordinates (np.ndarray): vertex coordinates (V, 2)
+            cell_table (np.ndarray): cell vertices as rows of the vertex coordinates (C, 4), triangles repeat their first vertex
+            cells (list[Cell] | None): cell object of every row, needed by 'findCell' only
+        """
+        self.vertex_coordinates = np.asarray(vertex_coordinates, dtype=np.float64)
+        self.cell_table = np.asarray(cell_table, dtype=np.int64)
+        self.cells = cells
+        cell_number = len(self.cell_table)
+
+        corners = self.vertex_coordinates[self.cell_table]
+        cell_min = corners.min(axis=1)
+        cell_max = corners.max(axis=1)
+        extent = (cell_max.max(axis=0) - cell_min.min(axis=0)) if cell_number else np.ones(2)
+        scale = float(np.maximum(extent, np.finfo(np.float64).tiny).max())
+        self.tolerance = 1e-12 * scale * scale
+        # margin of the node boxes, covering points accepted by the cross product tolerance
+        self.margin = 1e-9 * scale
+
+        # smallest depth whose leaves hold at most LEAF_SIZE cells
+        self.depth = 0
+        while cell_number > LEAF_SIZE << self.depth:
+            self.depth += 1
+
+        # cells of node k of a level are order[offsets[k]:offsets[k+1]], children split their parent at its middle
+        centers = 0.5 * (cell_min + cell_max)
+        order = np.arange(cell_number, dtype=np.int64)
+        offsets = np.array([0, cell_number], dtype=np.int64)
+        for _ in range(self.depth):
+            sizes = np.diff(offsets)
+            nodes = np.repeat(np.arange(len(sizes), dtype=np.int64), sizes)
+            node_centers = centers[order]
+            spans = np.maximum.reduceat(node_centers, offsets[:-1]) - np.minimum.reduceat(node_centers, offsets[:-1])
+            axes = np.argmax(spans, axis=1)
+            keys = node_centers[np.arange(cell_number), axes[nodes]]
+            order = order[np.lexsort((keys, nodes))]
+            children = np.empty(2 * len(sizes) + 1, dtype=np.int64)
+            children[0::2] = offsets
+            children[1::2] = offsets[:-1] + sizes // 2
+            offsets = children
+        self.order = order
+        self.leaf_offsets = offsets
+
+        # node boxes in heap layout: children of node k are 2k+1 and 2k+2, leaves are the last 2^depth nodes
+        leaf_number = 1 << self.depth
+        self.node_min = np.full((2 * leaf_number - 1, 2), np.inf)
+        self.node_max = np.full((2 * leaf_number - 1, 2), -np.inf)
+        if cell_number:
+            self.node_min[leaf_number - 1:] = np.minimum.reduceat(cell_min[order], offsets[:-1])
+            self.node_max[leaf_number - 1:] = np.maximum.reduceat(cell_max[order], offsets[:-1])
+        for level in range(self.depth - 1, -1, -1):
+            parents = slice((1 << level) - 1, (2 << level) - 1)
+            children = slice((2 << level) - 1, (4 << level) - 1)
+            self.node_min[parents] = np.minimum(self.node_min[children][0::2], self.node_min[children][1::2])
+            self.node_max[parents] = np.maximum(self.node_max[children][0::2], self.node_max[children][1::2])
+
+    def getVertexCoordinates(self) -> np.ndarray:
+        return self.vertex_coordinates
+
+    def getCellTable(self) -> np.ndarray:
+        return self.cell_table
+
+    def _inNodes(self, points: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        return np.all(
+            (points >= self.node_min[nodes] - self.margin) & (points <= self.node_max[nodes] + self.margin), axis=1
+        )
+
+    def locate(self, points: np.ndarray) -> np.ndarray:
+        """
+        Find the cell containing every point. A point on an edge shared by several cells gets the first of them.
+
+        Args:
+            points (np.ndarray): points to locate (N, 2)
+
+        Returns:
+            np.ndarray: row of the containing cell for every point (position in 'Mesh#getCells()'),
+            -1 if the point is outside of the mesh
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        cell_number = len(self.cell_table)
+        rows = np.full(len(points), cell_number, dtype=np.int64)
+
+        # (point, node) pairs whose node box holds the point, from the root down to the leaves
+        candidates = np.arange(len(points), dtype=np.int64)
+        nodes = np.zeros(len(points), dtype=np.int64)
+        inside = self._inNodes(points[candidates], nodes)
+        candidates, nodes = candidates[inside], nodes[inside]
+        for _ in range(self.depth):
+            candidates = np.repeat(candidates, 2)
+            nodes = 2 * np.repeat(nodes, 2) + np.tile(np.array([1, 2], dtype=np.int64), len(nodes))
+            inside = self._inNodes(points[candidates], nodes)
+            candidates, nodes = candidates[inside], nodes[inside]
+
+        # test the k-th cell of every reached leaf, the smallest containing row wins
+        leaves = nodes - ((1 << self.depth) - 1)
+        starts = self.leaf_offsets[leaves]
+        counts = self.leaf_offsets[leaves + 1] - starts
+        k = 0
+        while len(candidates):
+            pending = counts > k
+            candidates, starts, counts = candidates[pending], starts[pending], counts[pending]
+            if not len(candidates):
+                break
+            cell_rows = self.order[starts + k]
+            inside = _contains(self.vertex_coordinates[self.cell_table[cell_rows]], points[candidates], self.tolerance)
+            np.minimum.at(rows, candidates[inside], cell_rows[inside])
+            k += 1
+
+        rows[rows == cell_number] = -1
+        return rows
+
+    def findCell(self, x: float, y: float) -> Cell | None:
+        """
+        Find the cell containing a single point
+
+        Args:
+            x (float): x coordinate of the point
+            y (float): y coordinate of the point
+
+        Returns:
+            Cell | None: containing cell, None if the point is outside of the mesh
+        """
+        if self.cells is None:
+            raise ValueError("This spatial index has not been built from a mesh.")
+        row = int(self.locate(np.array([[x, y]]))[0])
+        return self.cells[row] if row >= 0 else None
@@ -0,0 +1,124 @@
+from collections import deque
+
+import numpy as np
+
+from dassflow2d_py.mesh.Mesh import Mesh
+
+
+def edge_cell_indices(mesh: Mesh) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Get the cells of every edge as indices in the state: real cells in 'Mesh#getCells()' order,
+    followed by ghost cells in 'Mesh#getBoundaries()' order
+
+    Args:
+        mesh (Mesh): mesh of the simulation
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, int]: index of the first cell and of the second cell of every edge
+        (in 'Mesh#getEdges()' order), and number of cells, ghost cells included
+    """
+    edge_cells = mesh.getEdgeCellTable()
+    # contiguous copies, callers own them
+    left_cells = np.ascontiguousarray(edge_cells[:, 0], dtype=np.int64).copy()
+    right_cells = np.ascontiguousarray(edge_cells[:, 1], dtype=np.int64).copy()
+    return left_cells, right_cells, mesh.getCellNumber() + mesh.getBoundaryNumber()
+
+
+def incidence_table(left_cells: np.ndarray, right_cells: np.ndarray, cell_number: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get the edges of every cell, ghost cells included, in compressed sparse row format.
+    The edges of a cell are listed as its first cell edges in edge order, followed by its second cell edges
+    in edge order, which is the order of 'np.subtract.at' followed by 'np.add.at' over the edges:
+    summing contributions in this order gives the same floating point results.
+
+    Args:
+        left_cells (np.ndarray): index of the first cell of every edge
+        right_cells (np.ndarray): index of the second cell of every edge
+        cell_number (int): number of cells, ghost cells included
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: offsets (cell number + 1,), edge indices, and side of every entry
+        (True where the cell is the first cell of the edge), edges of cell i being at positions offsets[i] to offsets[i+1]
+    """
+    edge_number = len(left_cells)
+    sides = np.concatenate((left_cells, right_cells))
+    order = np.argsort(sides, kind="stable")
+    offsets = np.zeros(cell_number + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sides, minlength=cell_number), out=offsets[1:])
+    edges = np.concatenate((np.arange(edge_number, dtype=np.int64), np.arange(edge_number, dtype=np.int64)))[order]
+    return offsets, edges, order < edge_number
+
+
+def real_cell_adjacency(offsets: np.ndarray, neighbors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Restrict a cell neighbor table (see 'Mesh#getCellNeighborTable') to real cells: ghost neighbors,
+    numbered after real cells, are removed
+
+    Args:
+        offsets (np.ndarray): offsets of the neighbor table (C+1,)
+        neighbors (np.ndarray): neighbor indices, ghost cells included
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: offsets (C+1,) and real neighbor indices
+    """
+    cell_number = len(offsets) - 1
+    real = neighbors < cell_number
+    rows = np.repeat(np.arange(cell_number), np.diff(offsets))
+    real_offsets = np.zeros(cell_number + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows[real], minlength=cell_number), out=real_offsets[1:])
+    return real_offsets, neighbors[real]
+
+
+def cell_adjacency(mesh: Mesh) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build the adjacency graph between real cells, in compressed sparse row format.
+    Ghost neighbors are not part of the graph.
+
+    Args:
+        mesh (Mesh): mesh to build the graph of
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: offsets (C+1,) and neighbor indices, neighbors of cell i
+        being neighbors[offsets[i]:offsets[i+1]]
+    """
+    return real_cell_adjacency(*mesh.getCellNeighborTable())
+
+
+def breadth_first_order(offsets: np.ndarray, neighbors: np.ndarray, subset: np.ndarray) -> np.ndarray:
+    """
+    Order cells of a subset breadth first, starting each connected component from a pseudo-peripheral cell
+    so that consecutive slices of the order are compact subdomains.
+
+    Args:
+        offsets (np.ndarray): offsets of the adjacency graph (C+1,)
+        neighbors (np.ndarray): neighbor indices, in the order they are visited
+        subset (np.ndarray): cells to order, components are started from the first unvisited cell of the subset
+
+    Returns:
+        np.ndarray: cells of the subset, in breadth first order
+    """
+    in_subset = np.zeros(len(offsets) - 1, dtype=bool)
+    in_subset[subset] = True
+
+    def traverse(start: int, visited: np.ndarray) -> list[int]:
+        order = [start]
+        visited[start] = True
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            for neighbor in neighbors[offsets[current]:offsets[current + 1]].tolist():
+                if in_subset[neighbor] and not visited[neighbor]:
+                    visited[neighbor] = True
+                    order.append(neighbor)
+                    queue.append(neighbor)
+        return order
+
+    visited = np.zeros(len(offsets) - 1, dtype=bool)
+    order: list[int] = []
+    for seed in subset.tolist():
+        if visited[seed]:
+            continue
+        # the last cell reached from any cell is a good approximation of a peripheral cell
+        component = traverse(seed, visited.copy())
+        order.extend(traverse(component[-1], visited))
+    return np.array(order, dtype=np.int64)
@@ -0,0 +1,87 @@
+import numpy as np
+
+
+# maximal number of vertices of a cell (quadrilaterals)
+MAX_CELL_VERTICES = 4
+
+
+def polygon_geometry(coordinates: np.ndarray, cell_vertices: np.ndarray,
+                     vertex_numbers: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the center, area and perimeter of every cell in one pass over the connectivity table.
+    Vertices are visited in the same order as the per cell formulas of 'MeshImpl' (center as the mean of the vertices,
+    shoelace formula for the area), centers and areas are identical to them and perimeters only differ by rounding
+    (squares are computed as exact products, not with 'pow').
+
+    Args:
+        coordinates (np.ndarray): coordinates of every vertex, shape (vertex number, 2)
+        cell_vertices (np.ndarray): vertex indices of every cell, shape (cell number, 4), only the first
+            'vertex_numbers' columns of a row are read
+        vertex_numbers (np.ndarray): number of vertices of every cell (3 or 4)
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: centers (cell number, 2), areas and perimeters of the cells
+    """
+    cell_number = len(cell_vertices)
+    x = coordinates[:, 0][cell_vertices]
+    y = coordinates[:, 1][cell_vertices]
+    rows = np.arange(cell_number)
+    center_x = np.zeros(cell_number)
+    center_y = np.zeros(cell_number)
+    area = np.zeros(cell_number)
+    perimeter = np.zeros(cell_number)
+    for k in range(MAX_CELL_VERTICES):
+        present = k < vertex_numbers
+        # the vertex following the last one is the first one
+        following = np.where(k + 1 < vertex_numbers, k + 1, 0)
+        x_i, y_i = x[:, k], y[:, k]
+        x_j, y_j = x[rows, following], y[rows, following]
+        # adding 0.0 for absent vertices leaves the sums unchanged
+        center_x += np.where(present, x_i, 0.0)
+        center_y += np.where(present, y_i, 0.0)
+        area += np.where(present, (x_i * y_j) - (x_j * y_i), 0.0)
+        dx, dy = x_j - x_i, y_j - y_i
+        perimeter += np.where(present, np.sqrt(dx * dx + dy * dy), 0.0)
+    centers = np.column_stack((center_x / vertex_numbers, center_y / vertex_numbers))
+    return centers, np.abs(area) / 2.0, perimeter
+
+
+def segment_geometry(coordinates: np.ndarray, edge_vertices: np.ndarray,
+                     cell_centers: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the center, length and normal vector of every edge in one pass, with the same operations
+    as the per edge formulas of 'EdgeImpl' (lengths and normals only differ from them by rounding).
+    Normals face away from a point of the first cell of every edge.
+
+    Args:
+        coordinates (np.ndarray): coordinates of every vertex, shape (vertex number, 2)
+        edge_vertices (np.ndarray): vertex indices of every edge, shape (edge number, 2)
+        cell_centers (np.ndarray): point to avoid for every edge, the center of its first cell, shape (edge number, 2)
+
+    Raises:
+        ValueError: if the point to avoid of an edge is colinear with it
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: centers (edge number, 2), lengths and normals (edge number, 2)
+    """
+    x_0, y_0 = coordinates[edge_vertices[:, 0], 0], coordinates[edge_vertices[:, 0], 1]
+    x_1, y_1 = coordinates[edge_vertices[:, 1], 0], coordinates[edge_vertices[:, 1], 1]
+    centers = np.column_stack(((x_0 + x_1) / 2, (y_0 + y_1) / 2))
+    dx, dy = x_1 - x_0, y_1 - y_0
+    lengths = np.sqrt(dx * dx + dy * dy)
+
+    cross = dx * (cell_centers[:, 1] - y_0) - dy * (cell_centers[:, 0] - x_0)
+    if np.any(cross == 0):
+        raise ValueError("p cannot be collinear with segment AB")
+    # turn the edge vector to the right when the point is on its left, to the left otherwise
+    is_left = cross > 0
+    normal_x = np.where(is_left, dy, -dy)
+    normal_y = np.where(is_left, -dx, dx)
+    magnitude = np.sqrt(normal_x * normal_x + normal_y * normal_y)
+    # degenerated edges get a null normal vector
+    safe_magnitude = np.where(magnitude == 0, 1.0, magnitude)
+    normals = np.column_stack((
+        np.where(magnitude == 0, 0.0, normal_x / safe_magnitude),
+        np.where(magnitude == 0, 0.0, normal_y / safe_magnitude)
+    ))
+    return centers, lengths, normals
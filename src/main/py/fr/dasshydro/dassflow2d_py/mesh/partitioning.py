@@ -0,0 +1,77 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from dassflow2d_py.mesh.Mesh import Mesh
+from dassflow2d_py.mesh.connectivity import cell_adjacency, breadth_first_order
+
+
+class Partition(NamedTuple):
+    """Represents a subdomain of the mesh, cells are referred to by their index in 'Mesh#getCells()'"""
+    number: int # partition number, from 0 to K-1
+    owned: np.ndarray # cells updated by this partition (sorted)
+    halo: np.ndarray # one layer of cells owned by other partitions and read by this one (sorted)
+    halo_owners: np.ndarray # partition number owning each halo cell
+
+
+def partition_cells(mesh: Mesh, partition_number: int) -> np.ndarray:
+    """
+    Split the cells of the mesh into K subdomains of balanced size, using recursive bisection
+    of the cell adjacency graph. The result only depends on the mesh, so it is reproducible between runs.
+
+    Args:
+        mesh (Mesh): mesh to partition
+        partition_number (int): number K of subdomains
+
+    Raises:
+        ValueError: if K is not between 1 and the number of cells
+
+    Returns:
+        np.ndarray: partition number of every cell, in the order of 'Mesh#getCells()'
+    """
+    cell_number = mesh.getCellNumber()
+    if not 1 <= partition_number <= cell_number:
+        raise ValueError(f"Partition number should be between 1 and {cell_number}, got {partition_number}.")
+
+    offsets, neighbors = cell_adjacency(mesh)
+    parts = np.zeros(cell_number, dtype=np.int64)
+
+    # stack of (cells to split, first partition number, number of partitions)
+    stack = [(np.arange(cell_number, dtype=np.int64), 0, partition_number)]
+    while stack:
+        subset, first_part, part_count = stack.pop()
+        if part_count == 1:
+            parts[subset] = first_part
+            continue
+        order = breadth_first_order(offsets, neighbors, subset)
+        left_count = part_count // 2
+        split = len(order) * left_count // part_count
+        stack.append((np.sort(order[:split]), first_part, left_count))
+        stack.append((np.sort(order[split:]), first_part + left_count, part_count - left_count))
+
+    return parts
+
+
+def create_partitions(mesh: Mesh, partition_number: int) -> list[Partition]:
+    """
+    Partition the mesh and compute, for every subdomain, the layer of halo cells it needs from its neighbors.
+
+    Args:
+        mesh (Mesh): mesh to partition
+        partition_number (int): number K of subdomains
+
+    Returns:
+        list[Partition]: all partitions, indexed by partition number
+    """
+    parts = partition_cells(mesh, partition_number)
+    offsets, neighbors = cell_adjacency(mesh)
+    # owner of the neighbor for every (cell, neighbor) pair
+    cell_of_pair = np.repeat(np.arange(len(parts), dtype=np.int64), np.diff(offsets))
+    crossing = parts[cell_of_pair] != parts[neighbors]
+
+    partitions = []
+    for number in range(partition_number):
+        owned = np.flatnonzero(parts == number)
+        halo = np.unique(neighbors[crossing & (parts[cell_of_pair] == number)])
+        partitions.append(Partition(number, owned, halo, parts[halo]))
+    return partitions
@@ -0,0 +1,105 @@
+from enum import Enum
+
+import numpy as np
+
+from dassflow2d_py.mesh.Mesh import Cell, Edge, Boundary
+from dassflow2d_py.mesh.connectivity import breadth_first_order, real_cell_adjacency
+
+
+# bits per coordinate of the Morton code
+MORTON_BITS = 16
+
+
+class CellOrdering(Enum):
+    FILE = "file"
+    RCM = "rcm"
+    MORTON = "morton"
+
+
+def reverse_cuthill_mckee_order(offsets: np.ndarray, neighbors: np.ndarray) -> np.ndarray:
+    """
+    Order cells with the reverse Cuthill-McKee algorithm: breadth first from a pseudo-peripheral cell,
+    visiting neighbors by increasing degree, then reversed. Neighbor cells get close positions,
+    which narrows the bandwidth of the cell adjacency.
+
+    Args:
+        offsets (np.ndarray): offsets of the adjacency graph between real cells (C+1,), see 'connectivity.cell_adjacency'
+        neighbors (np.ndarray): neighbor indices
+
+    Returns:
+        np.ndarray: new order, as cell positions
+    """
+    degrees = np.diff(offsets)
+    # sort every neighbor list by increasing degree
+    rows = np.repeat(np.arange(len(degrees), dtype=np.int64), degrees)
+    neighbors = neighbors[np.lexsort((neighbors, degrees[neighbors], rows))]
+    # components are started from their lowest degree cell
+    seeds = np.argsort(degrees, kind="stable")
+    return breadth_first_order(offsets, neighbors, seeds)[::-1].copy()
+
+
+def morton_order(centers: np.ndarray) -> np.ndarray:
+    """
+    Order cells along a Morton (Z-order) space filling curve of their gravity centers
+
+    Args:
+        centers (np.ndarray): gravity center of every cell (C, 2)
+
+    Returns:
+        np.ndarray: new order, as cell positions
+    """
+    if not len(centers):
+        return np.empty(0, dtype=np.int64)
+    low = centers.min(axis=0)
+    extent = max(float((centers.max(axis=0) - low).max()), np.finfo(np.float64).tiny)
+    scale = (2 ** MORTON_BITS - 1) / extent
+    quantized = np.floor((centers - low) * scale).astype(np.uint64)
+
+    def spread(x: np.ndarray) -> np.ndarray:
+        # insert a zero bit between every bit of a 16 bits integer
+        x = (x | (x << np.uint64(8))) & np.uint64(0x00FF00FF)
+        x = (x | (x << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+        x = (x | (x << np.uint64(2))) & np.uint64(0x33333333)
+        x = (x | (x << np.uint64(1))) & np.uint64(0x55555555)
+        return x
+
+    codes = spread(quantized[:, 0]) | (spread(quantized[:, 1]) << np.uint64(1))
+    return np.argsort(codes, kind="stable")
+
+
+def renumber(cells: list[Cell], edges: list[Edge], boundaries: list[Boundary], ordering: CellOrdering,
+             neighbor_table: tuple[np.ndarray, np.ndarray], edge_cells: np.ndarray,
+             centers: np.ndarray) -> tuple[list[Cell], list[Edge], list[Boundary]]:
+    """
+    Reorder cells for memory locality, edges then follow their cells and boundaries follow their edges.
+    IDs are kept, so that results can always be mapped back to the original numbering.
+
+    Args:
+        cells (list[Cell]): real cells
+        edges (list[Edge]): edges
+        boundaries (list[Boundary]): boundaries
+        ordering (CellOrdering): ordering to apply, 'FILE' keeps the lists as they are
+        neighbor_table (tuple[np.ndarray, np.ndarray]): cell neighbor table of the lists, see 'Mesh#getCellNeighborTable'
+        edge_cells (np.ndarray): cells of every edge (E, 2), ghost cells numbered after real cells, see 'Mesh#getEdgeCellTable'
+        centers (np.ndarray): gravity center of every cell (C, 2)
+
+    Returns:
+        tuple[list[Cell], list[Edge], list[Boundary]]: reordered cells, edges and boundaries
+    """
+    if ordering is CellOrdering.FILE:
+        return cells, edges, boundaries
+    elif ordering is CellOrdering.RCM:
+        order = reverse_cuthill_mckee_order(*real_cell_adjacency(*neighbor_table))
+    else:
+        order = morton_order(centers)
+
+    cells = [cells[i] for i in order.tolist()]
+    # new position of every cell, ghost cells come after every real cell
+    position = np.full(len(cells) + 1, len(cells), dtype=np.int64)
+    position[order] = np.arange(len(cells))
+    sides = position[np.minimum(edge_cells, len(cells))].reshape(-1, 2)
+    edge_order = np.lexsort((sides.max(axis=1), sides.min(axis=1)))
+    edges = [edges[i] for i in edge_order.tolist()]
+    edge_boundaries = {boundary.getEdge(): boundary for boundary in boundaries}
+    boundaries = [edge_boundaries[edge] for edge in edges if edge in edge_boundaries]
+    return cells, edges, boundaries
@@ -0,0 +1,136 @@
+from abc import ABC, abstractmethod
+from typing import Type
+
+import os
+
+from dassflow2d_py.mesh.Mesh import Mesh, Cell
+
+
+class FormatWriter(ABC):
+    """
+    Converts the raw snapshots of a run into an output format. 'ResultWriter#writeAll' reads every snapshot once
+    and hands it to the writer of every selected format, writers only import their format library when writing.
+    """
+
+    # text formats honouring the output compression set this to True, see 'configure'
+    supports_compression: bool = False
+
+    def __init__(self, mesh: Mesh, output_cells: list[Cell], result_folder: str):
+        """
+        Args:
+            mesh (Mesh): mesh of the simulation
+            output_cells (list[Cell]): real cells, in the order of the values of every snapshot (sorted by ID)
+            result_folder (str): folder to write files to
+        """
+        self.mesh = mesh
+        self.output_cells = output_cells
+        self.result_folder = result_folder
+        self.compression = ""
+        self.point_rows: dict[int, int] | None = None
+
+    def configure(self, compression: str = ""):
+        """
+        Apply the output options, called by 'ResultWriter#writeAll' on every writer before the first snapshot.
+        Writers ignore the options they do not support: only writers that support compression compress their files.
+
+        Args:
+            compression (str): extension of compressed text files ('.gz', '.bz2' or '.xz'), empty for plain text
+        """
+        if self.supports_compression:
+            self.compression = compression
+
+    def getPointRows(self) -> dict[int, int]:
+        """
+        Get the 0-based position of every vertex in 'Mesh#getVertices()', the order in which formats write points.
+        Vertex IDs are not positions: mesh files may skip IDs, e.g. gmsh node tags.
+
+        Returns:
+            dict[int, int]: point row of every vertex, by vertex ID
+        """
+        if self.point_rows is None:
+            self.point_rows = {vertex.getID(): row for row, vertex in enumerate(self.mesh.getVertices())}
+        return self.point_rows
+
+    def getTextFilePath(self, file_name: str) -> str:
+        """
+        Get the path of a text output file, with the compression extension, to be opened with 'open_text'
+
+        Args:
+            file_name (str): name of the file in the result folder, without compression extension
+
+        Returns:
+            str: path of the file
+        """
+        return os.path.join(self.result_folder, file_name + self.compression)
+
+    @abstractmethod
+    def write(self, simulation_time: float, ids: list[int], hs: list[float], us: list[float], vs: list[float], base_name: str):
+        """
+        Convert a snapshot, snapshots are given by increasing simulation time
+
+        Args:
+            simulation_time (float): simulation time of the snapshot
+            ids (list[int]): ID of every cell
+            hs (list[float]): h value of every cell
+            us (list[float]): u value of every cell
+            vs (list[float]): v value of every cell
+            base_name (str): name of the raw file of the snapshot, without extension
+        """
+        pass
+
+    def close(self):
+        """
+        Gets triggered once every snapshot has been written, does nothing by default
+        """
+        pass
+
+
+# implementations imports here ...
+from dassflow2d_py.output.VtkWriter import VtkWriter
+from dassflow2d_py.output.TecplotWriter import TecplotWriter
+from dassflow2d_py.output.GnuplotWriter import GnuplotWriter
+from dassflow2d_py.output.Hdf5Writer import Hdf5Writer
+
+# association between output mode names and FormatWriter implementation, extended by 'registerFormatWriter'
+format_writer_class: dict[str, Type[FormatWriter]] = {
+    "vtk": VtkWriter,
+    "tecplot": TecplotWriter,
+    "gnuplot": GnuplotWriter,
+    "hdf5": Hdf5Writer
+}
+
+
+def registerFormatWriter(name: str, writer_class: Type[FormatWriter]):
+    """
+    Register an output format, which can then be selected by name in the 'output-mode' configuration
+
+    Args:
+        name (str): output mode name
+        writer_class (Type[FormatWriter]): implementation, created with the arguments of 'FormatWriter#__init__'
+
+    Raises:
+        ValueError: if the name is already registered to another implementation
+    """
+    registered = format_writer_class.get(name)
+    if registered is not None and registered is not writer_class:
+        raise ValueError(f"output mode {name} is already registered")
+    format_writer_class[name] = writer_class
+
+
+def getFormatWriterClass(name: str) -> Type[FormatWriter]:
+    """
+    Get the implementation of an output format
+
+    Args:
+        name (str): output mode name
+
+    Raises:
+        ValueError: if no implementation is registered with this name
+
+    Returns:
+        Type[FormatWriter]: implementation of the format
+    """
+    writer_class = format_writer_class.get(name)
+    if writer_class is None:
+        raise ValueError(f"unknown output mode {name}, registered modes are {', '.join(format_writer_class)}")
+    return writer_class
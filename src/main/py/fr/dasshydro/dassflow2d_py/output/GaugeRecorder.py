@@ -0,0 +1,239 @@
+import os
+
+import numpy as np
+
+from dassflow2d_py.input.GaugeReader import Gauge
+from dassflow2d_py.mesh.Mesh import Mesh
+from dassflow2d_py.mesh.Bathymetry import Bathymetry
+from dassflow2d_py.d2dtime.TimeStepState import TimeStepState
+from dassflow2d_py.output.OutputMode import OutputMode
+
+
+# recorded quantities
+POINT_COLUMNS = ("h", "zs", "u", "v")
+LINE_COLUMNS = ("q",)
+# initial number of records, doubled whenever full
+INITIAL_CAPACITY = 1024
+
+
+def _split_polyline(polyline: np.ndarray, edge_starts: np.ndarray, edge_ends: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split a polyline where it crosses mesh edges, so that every piece lies in a single cell
+
+    Args:
+        polyline (np.ndarray): polyline points (N, 2)
+        edge_starts (np.ndarray): first vertex of every mesh edge (E, 2)
+        edge_ends (np.ndarray): second vertex of every mesh edge (E, 2)
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: middle point (P, 2), length (P,) and unit normal (P, 2),
+        pointing to the right of the polyline, of every piece
+    """
+    middles, lengths, normals = [], [], []
+    edge_vectors = edge_ends - edge_starts
+    for start, end in zip(polyline[:-1], polyline[1:]):
+        direction = end - start
+        length = float(np.hypot(*direction))
+        if length == 0.0:
+            continue
+        # solve start + t * direction = edge_start + s * edge_vector for every edge
+        denominator = direction[0] * edge_vectors[:, 1] - direction[1] * edge_vectors[:, 0]
+        offset = edge_starts - start
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = (offset[:, 0] * edge_vectors[:, 1] - offset[:, 1] * edge_vectors[:, 0]) / denominator
+            s = (offset[:, 0] * direction[1] - offset[:, 1] * direction[0]) / denominator
+        crossing = (denominator != 0.0) & (t > 0.0) & (t < 1.0) & (s >= 0.0) & (s <= 1.0)
+        breaks = np.unique(np.concatenate(([0.0, 1.0], t[crossing])))
+        middle_t = (breaks[:-1] + breaks[1:]) / 2.0
+        middles.append(start + middle_t[:, None] * direction)
+        lengths.append(np.diff(breaks) * length)
+        normals.append(np.repeat([[direction[1] / length, -direction[0] / length]], len(middle_t), axis=0))
+    return np.concatenate(middles), np.concatenate(lengths), np.concatenate(normals)
+
+
+class GaugeRecorder:
+    """
+    Record time series at virtual gauges during the run, without writing full snapshots.
+    Point gauges record h, zs (h + z), u and v of the cell containing the point, line gauges record
+    the discharge through a polyline. Cells and polyline pieces are located once, at creation, using the mesh spatial index.
+    """
+
+    def __init__(self, mesh: Mesh, bathymetry: Bathymetry, gauges: list[Gauge], every_steps: int = 1):
+        """
+        Args:
+            mesh (Mesh): mesh the gauges are located in
+            bathymetry (Bathymetry): bathymetry used to compute water levels
+            gauges (list[Gauge]): gauges to record
+            every_steps (int): number of loops between two records
+
+        Raises:
+            ValueError: if a gauge lies outside of the mesh
+        """
+        if every_steps < 1:
+            raise ValueError("every_steps should be at least 1")
+
+        cells = list(mesh.getCells())
+        spatial_index = mesh.getSpatialIndex()
+        edge_starts = np.array([edge.getVertices()[0].getCoordinates() for edge in mesh.getEdges()], dtype=np.float64)
+        edge_ends = np.array([edge.getVertices()[1].getCoordinates() for edge in mesh.getEdges()], dtype=np.float64)
+
+        self.columns: list[str] = []
+        point_rows: list[int] = []
+        piece_rows: list[np.ndarray] = []
+        piece_lengths: list[np.ndarray] = []
+        piece_normals: list[np.ndarray] = []
+        piece_lines: list[np.ndarray] = []
+        for gauge in gauges:
+            if gauge.is_line:
+                middles, lengths, normals = _split_polyline(gauge.points, edge_starts, edge_ends)
+                rows = spatial_index.locate(middles)
+                inside = rows >= 0
+                if not np.any(inside):
+                    raise ValueError(f"Gauge {gauge.name} does not cross the mesh.")
+                # pieces outside of the mesh carry no discharge
+                piece_rows.append(rows[inside])
+                piece_lengths.append(lengths[inside])
+                piece_normals.append(normals[inside])
+                piece_lines.append(np.full(np.count_nonzero(inside), len(piece_lines)))
+                self.columns.extend(f"{gauge.name}_{column}" for column in LINE_COLUMNS)
+            else:
+                row = int(spatial_index.locate(gauge.points)[0])
+                if row < 0:
+                    raise ValueError(f"Gauge {gauge.name} is outside of the mesh.")
+                point_rows.append(row)
+
+        # point columns come first, then line columns, whatever the file order
+        self.columns = [f"{gauge.name}_{column}" for gauge in gauges if not gauge.is_line for column in POINT_COLUMNS] + self.columns
+
+        # gather every cell read into a single list, and refer to cells by their position in it
+        used_rows = np.unique(np.concatenate([np.array(point_rows, dtype=np.int64)] + piece_rows))
+        self.cells = [cells[row] for row in used_rows.tolist()]
+        position = {row: i for i, row in enumerate(used_rows.tolist())}
+        self.point_cells = np.array([position[row] for row in point_rows], dtype=np.int64)
+        self.point_bathymetry = bathymetry.getValues()[np.array(point_rows, dtype=np.int64)] if point_rows else np.empty(0)
+        self.line_number = len(piece_rows)
+        if piece_rows:
+            self.piece_cells = np.array([position[row] for row in np.concatenate(piece_rows).tolist()], dtype=np.int64)
+            self.piece_lengths = np.concatenate(piece_lengths)
+            self.piece_normals = np.concatenate(piece_normals)
+            self.piece_lines = np.concatenate(piece_lines)
+
+        self.every_steps = every_steps
+        self.step_number = 0
+        self.record_number = 0
+        self.times = np.empty(INITIAL_CAPACITY, dtype=np.float64)
+        self.values = np.empty((INITIAL_CAPACITY, len(self.columns)), dtype=np.float64)
+
+    def getColumns(self) -> list[str]:
+        """
+        Get the name of every recorded series: '<gauge>_h', '<gauge>_zs', '<gauge>_u', '<gauge>_v'
+        for point gauges, followed by '<gauge>_q' for line gauges
+
+        Returns:
+            list[str]: column names
+        """
+        return self.columns
+
+    def getTimes(self) -> np.ndarray:
+        return self.times[:self.record_number]
+
+    def getValues(self) -> np.ndarray:
+        return self.values[:self.record_number]
+
+    def getCheckpointState(self) -> dict:
+        """
+        Get the series recorded so far and the record schedule, needed to resume a simulation
+        without losing the series recorded before the restart
+
+        Returns:
+            dict: columns and step number (json serializable), times and values (arrays)
+        """
+        return {
+            "columns": list(self.columns),
+            "step_number": self.step_number,
+            "times": self.getTimes().copy(),
+            "values": self.getValues().copy()
+        }
+
+    def restoreCheckpointState(self, checkpoint_state: dict):
+        """
+        Restore series and schedule previously returned by 'getCheckpointState', later records are appended to them
+
+        Args:
+            checkpoint_state (dict): series and schedule to restore
+
+        Raises:
+            ValueError: if the checkpoint has been recorded with other gauges
+        """
+        if list(checkpoint_state["columns"]) != self.columns:
+            raise ValueError("Gauges do not match the gauges recorded in the checkpoint.")
+        times = np.asarray(checkpoint_state["times"], dtype=np.float64)
+        values = np.asarray(checkpoint_state["values"], dtype=np.float64).reshape(len(times), len(self.columns))
+        capacity = max(INITIAL_CAPACITY, len(times))
+        self.times = np.empty(capacity, dtype=np.float64)
+        self.values = np.empty((capacity, len(self.columns)), dtype=np.float64)
+        self.times[:len(times)] = times
+        self.values[:len(times)] = values
+        self.record_number = len(times)
+        self.step_number = int(checkpoint_state["step_number"])
+
+    def isTimeToRecord(self) -> bool:
+        """
+        Tells if the recorder is ready to record, to be called once per loop
+
+        Returns:
+            bool: wether or not a record call can be done
+        """
+        self.step_number += 1
+        return self.step_number % self.every_steps == 0
+
+    def record(self, time_step_state: TimeStepState, current_simulation_time: float):
+        """
+        Record the values of every gauge
+
+        Args:
+            time_step_state (TimeStepState): provided time step state with h, u, and v results
+            current_simulation_time (float): simulation time of the state
+        """
+        if self.record_number == len(self.times):
+            self.times = np.resize(self.times, 2 * len(self.times))
+            self.values = np.resize(self.values, (2 * len(self.values), len(self.columns)))
+
+        nodes = [time_step_state.getNode(cell) for cell in self.cells]
+        h = np.array([node.h for node in nodes], dtype=np.float64)
+        u = np.array([node.u for node in nodes], dtype=np.float64)
+        v = np.array([node.v for node in nodes], dtype=np.float64)
+
+        row = self.values[self.record_number]
+        point_number = len(self.point_cells)
+        point_h = h[self.point_cells]
+        row[0:4 * point_number:4] = point_h
+        row[1:4 * point_number:4] = point_h + self.point_bathymetry
+        row[2:4 * point_number:4] = u[self.point_cells]
+        row[3:4 * point_number:4] = v[self.point_cells]
+        if self.line_number:
+            piece_h = h[self.piece_cells]
+            piece_flux = piece_h * (u[self.piece_cells] * self.piece_normals[:, 0] + v[self.piece_cells] * self.piece_normals[:, 1])
+            row[4 * point_number:] = np.bincount(self.piece_lines, weights=piece_flux * self.piece_lengths, minlength=self.line_number)
+
+        self.times[self.record_number] = current_simulation_time
+        self.record_number += 1
+
+    def write(self, result_folder: str, output_modes: list[str]):
+        """
+        Write recorded series to 'gauges.csv', and to 'gauges.hdf5' if results are written in HDF5
+
+        Args:
+            result_folder (str): folder to write files to
+            output_modes (list[str]): output modes of the run
+        """
+        header = ",".join(["time"] + self.columns)
+        data = np.column_stack((self.getTimes(), self.getValues()))
+        np.savetxt(os.path.join(result_folder, "gauges.csv"), data, fmt="%.10g", delimiter=",", header=header, comments="")
+
+        if OutputMode.HDF5.value in output_modes:
+            import h5py #type: ignore
+            with h5py.File(os.path.join(result_folder, "gauges.hdf5"), "w") as hdf:
+                hdf.create_dataset("time", data=self.getTimes())
+                for i, column in enumerate(self.columns):
+                    hdf.create_dataset(column, data=self.getValues()[:, i])
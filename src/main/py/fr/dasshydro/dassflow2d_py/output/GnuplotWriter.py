@@ -0,0 +1,33 @@
+from dassflow2d_py.input.file_reading import open_text
+from dassflow2d_py.output.FormatWriter import FormatWriter
+
+
+class GnuplotWriter(FormatWriter):
+    """
+    Writes one .dat file per snapshot
+    """
+
+    supports_compression = True
+
+    def write(self, simulation_time: float, ids: list[int], hs: list[float], us: list[float], vs: list[float], base_name: str):
+        self._write_gnuplot(ids, hs, us, vs, self.getTextFilePath(f"{base_name}.dat"))
+
+    def _write_gnuplot(self, ids, hs, us, vs, filename: str):
+        """
+        Write a file in .dat format for gnuplot
+
+        Args:
+            ids (_type_): list of all ids in a result file
+            hs (_type_): list of all h value in a result file
+            us (_type_): list of all u value in a result file
+            vs (_type_): list of all v value in a result file
+            filename (str): result dat file
+        """
+        with open_text(filename, "w") as file:
+            file.write(" # Gnuplot DataFile Version\n")
+            file.write(" # i x y bathy h zs Manning u v\n")
+            for i, cell in enumerate(self.output_cells):
+                assert cell.getID() == ids[i]
+                x = cell.getGravityCenter()[0]
+                y = cell.getGravityCenter()[1]
+                file.write(f"   {id} {x} {y} 0.0 {hs[i]} {hs[i]} 0.0 {us[i]} {vs[i]}\n")
@@ -0,0 +1,36 @@
+import os
+from typing import Any
+
+from dassflow2d_py.output.FormatWriter import FormatWriter
+
+
+# name of the single HDF5 file, in the result folder
+HDF5_FILENAME = "results.hdf5"
+
+
+class Hdf5Writer(FormatWriter):
+    """
+    Writes every snapshot into a single HDF5 file, one group per simulation time.
+    Snapshots are written as they come, the file stays open until 'close'.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hdf: Any = None
+
+    def write(self, simulation_time: float, ids: list[int], hs: list[float], us: list[float], vs: list[float], base_name: str):
+        if self.hdf is None:
+            # imported on use, h5py is only needed for this format
+            import h5py #type: ignore
+            self.hdf = h5py.File(os.path.join(self.result_folder, HDF5_FILENAME), "w")
+        # Create a group for each time step
+        group = self.hdf.create_group(f"time_{simulation_time:.6e}")
+        group.create_dataset("ids", data=ids)
+        group.create_dataset("h", data=hs)
+        group.create_dataset("u", data=us)
+        group.create_dataset("v", data=vs)
+
+    def close(self):
+        if self.hdf is not None:
+            self.hdf.close()
+            self.hdf = None
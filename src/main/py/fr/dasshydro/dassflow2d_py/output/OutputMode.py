@@ -0,0 +1,8 @@
+from enum import Enum
+
+# kept apart from 'ResultWriter' so that selecting an output mode does not import any format library
+class OutputMode(Enum):
+    VTK = 'vtk'
+    TECPLOT = 'tecplot'
+    GNUPLOT = 'gnuplot'
+    HDF5 = 'hdf5'
@@ -0,0 +1,121 @@
+import json
+import time
+
+
+# phases of a simulation loop, in execution order
+BOUNDARY_CONDITIONS = "boundary_conditions"
+DELTA = "delta"
+RESOLVE = "resolve"
+WRITE = "write"
+CHECKPOINT = "checkpoint"
+LISTENERS = "listeners"
+WRITE_ALL = "write_all"
+PHASES = (BOUNDARY_CONDITIONS, DELTA, RESOLVE, WRITE, CHECKPOINT, LISTENERS, WRITE_ALL)
+
+
+class RunProfiler:
+    """
+    Accumulates wall and CPU time spent in every phase of a run.
+
+    Phases are measured by chaining marks, so that each phase boundary costs a single pair of clock reads:
+
+        mark = profiler.tick()
+        ... boundary conditions ...
+        mark = profiler.record(BOUNDARY_CONDITIONS, mark)
+        ... resolution ...
+        mark = profiler.record(RESOLVE, mark)
+
+    A disabled profiler does not read any clock.
+    """
+
+    def __init__(self, cell_number: int, enabled: bool = True):
+        """
+        Args:
+            cell_number (int): number of real cells updated at every step
+            enabled (bool): wether or not times are measured
+        """
+        self.cell_number = cell_number
+        self.enabled = enabled
+        self.wall_times = dict.fromkeys(PHASES, 0.0)
+        self.cpu_times = dict.fromkeys(PHASES, 0.0)
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.step_number = 0
+
+    def isEnabled(self) -> bool:
+        return self.enabled
+
+    def tick(self) -> tuple[float, float]:
+        """
+        Read the clocks, starting a phase
+
+        Returns:
+            tuple[float, float]: wall and CPU time mark
+        """
+        if not self.enabled:
+            return (0.0, 0.0)
+        return (time.perf_counter(), time.process_time())
+
+    def record(self, phase: str, mark: tuple[float, float]) -> tuple[float, float]:
+        """
+        Add the time elapsed since a mark to a phase
+
+        Args:
+            phase (str): phase ending, one of PHASES
+            mark (tuple[float, float]): mark returned when the phase started
+
+        Returns:
+            tuple[float, float]: new mark, starting the next phase
+        """
+        if not self.enabled:
+            return mark
+        now = (time.perf_counter(), time.process_time())
+        self.wall_times[phase] += now[0] - mark[0]
+        self.cpu_times[phase] += now[1] - mark[1]
+        self.calls[phase] += 1
+        return now
+
+    def endOfStep(self):
+        """
+        Count a completed simulation step
+        """
+        self.step_number += 1
+
+    def getSummary(self) -> dict:
+        """
+        Get the times measured so far and the derived throughputs
+
+        Returns:
+            dict: json serializable summary
+        """
+        total_wall_time = sum(self.wall_times.values())
+        total_cpu_time = sum(self.cpu_times.values())
+        phases = {}
+        for phase in PHASES:
+            phases[phase] = {
+                "wall_time": self.wall_times[phase],
+                "cpu_time": self.cpu_times[phase],
+                "calls": self.calls[phase],
+                "wall_fraction": self.wall_times[phase] / total_wall_time if total_wall_time > 0.0 else 0.0
+            }
+        # throughputs only account for the simulation loop, not the final post-treatment
+        loop_wall_time = total_wall_time - self.wall_times[WRITE_ALL]
+        steps_per_second = self.step_number / loop_wall_time if loop_wall_time > 0.0 else 0.0
+        return {
+            "steps": self.step_number,
+            "cells": self.cell_number,
+            "wall_time": total_wall_time,
+            "cpu_time": total_cpu_time,
+            "steps_per_second": steps_per_second,
+            "cell_updates_per_second": steps_per_second * self.cell_number,
+            "phases": phases
+        }
+
+    def writeSummary(self, file_path: str):
+        """
+        Dump the summary in a json file
+
+        Args:
+            file_path (str): path to the json file
+        """
+        with open(file_path, "w") as file:
+            json.dump(self.getSummary(), file, indent=4)
@@ -0,0 +1,53 @@
+from dassflow2d_py.input.file_reading import open_text
+from dassflow2d_py.output.FormatWriter import FormatWriter
+
+
+class TecplotWriter(FormatWriter):
+    """
+    Writes one .plt file per snapshot
+    """
+
+    supports_compression = True
+
+    def write(self, simulation_time: float, ids: list[int], hs: list[float], us: list[float], vs: list[float], base_name: str):
+        self._write_tecplot(ids, hs, us, vs, simulation_time, self.getTextFilePath(f"{base_name}.plt"))
+
+    def _write_tecplot(self, ids, hs, us, vs, simulation_time: float, filename: str):
+        """
+        Write a file in .plt format for tecplot
+
+        Args:
+            ids (_type_): list of all ids in a result file
+            hs (_type_): list of all h value in a result file
+            us (_type_): list of all u value in a result file
+            vs (_type_): list of all v value in a result file
+            filename (str): result plt file
+        """
+        with open_text(filename, "w") as file:
+            file.write('TITLE = "DassFlow Result File in Time"\n')
+            file.write('VARIABLES = "x","y","bathy","h","zs","Manning","u","v"\n')
+
+            file.write(
+                f'ZONE T = "{simulation_time:.6e}", '
+                f'N = {self.mesh.getVertexNumber()}, '
+                f'E = {self.mesh.getCellNumber()}, '
+                f'DATAPACKING = BLOCK, '
+                f'ZONETYPE = FEQUADRILATERAL\n'
+            )
+            file.write('VARLOCATION = ([3-8]=CELLCENTERED)\n')
+            # Write node coordinates
+            for vertex in self.mesh.getVertices():
+                vertex_x, vertex_y = vertex.getCoordinates()
+                file.write(f"{vertex_x} {vertex_y} 0.0\n")
+            # Write cell data (simplified for example)
+            for i, id in enumerate(ids):
+                file.write(f"{hs[i]} {us[i]} {vs[i]} 0.0 0.0 0.0\n")
+            # Write connectivity, tecplot numbers points from 1 in the order they are written
+            point_rows = self.getPointRows()
+            for cell in self.output_cells:
+                vertices = list(cell.getVertices())
+                vertex1_id = point_rows[vertices[0].getID()] + 1
+                vertex2_id = point_rows[vertices[1].getID()] + 1
+                vertex3_id = point_rows[vertices[2].getID()] + 1
+                vertex4_id = point_rows[vertices[3].getID()] + 1 if cell.getVerticesNumber() == 4 else 0
+                file.write(f"{vertex1_id} {vertex2_id} {vertex3_id} {vertex4_id}\n")
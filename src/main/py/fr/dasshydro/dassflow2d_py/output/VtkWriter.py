@@ -0,0 +1,65 @@
+import os
+
+from dassflow2d_py.output.FormatWriter import FormatWriter
+
+
+class VtkWriter(FormatWriter):
+    """
+    Writes one legacy ASCII .vtk file per snapshot
+    """
+
+    def write(self, simulation_time: float, ids: list[int], hs: list[float], us: list[float], vs: list[float], base_name: str):
+        self._write_vtk(ids, hs, us, vs, os.path.join(self.result_folder, f"{base_name}.vtk"))
+
+    def _write_vtk(self, ids, hs, us, vs, filename: str):
+        """
+        Write a file in .vtk format for gnuplot
+
+        Args:
+            ids (_type_): list of all ids in a result file
+            hs (_type_): list of all h value in a result file
+            us (_type_): list of all u value in a result file
+            vs (_type_): list of all v value in a result file
+            filename (str): result vtk file
+        """
+        # imported on use, loading vtk takes longer than most short runs
+        import vtk #type: ignore
+        points = vtk.vtkPoints()
+        cells = vtk.vtkCellArray()
+        h_data = vtk.vtkDoubleArray()
+        u_data = vtk.vtkDoubleArray()
+        v_data = vtk.vtkDoubleArray()
+        h_data.SetName("h")
+        u_data.SetName("u")
+        v_data.SetName("v")
+
+        for vertex in self.mesh.getVertices():
+            vertex_x, vertex_y = vertex.getCoordinates()
+            points.InsertNextPoint(vertex_x, vertex_y, 0)
+
+        point_rows = self.getPointRows()
+        for cell in self.output_cells:
+            cell_vtk = vtk.vtkQuad()
+            for i, vertex in enumerate(cell.getVertices()):
+                cell_vtk.GetPointIds().SetId(i, point_rows[vertex.getID()])  # VTK uses 0-based indexing
+            cells.InsertNextCell(cell_vtk)
+
+        for i, id in enumerate(ids):
+            h_data.InsertNextValue(hs[i])
+            u_data.InsertNextValue(us[i])
+            v_data.InsertNextValue(vs[i])
+
+        # Create grid
+        grid = vtk.vtkUnstructuredGrid()
+        grid.SetPoints(points)
+        grid.SetCells(vtk.VTK_QUAD, cells)
+        grid.GetCellData().AddArray(h_data)
+        grid.GetCellData().AddArray(u_data)
+        grid.GetCellData().AddArray(v_data)
+
+        # Write as VTK file (version 5.1)
+        writer = vtk.vtkUnstructuredGridWriter()
+        writer.SetFileTypeToASCII()  # Force ASCII (legacy) format
+        writer.SetFileName(filename)
+        writer.SetInputData(grid)
+        writer.Write()
@@ -0,0 +1,183 @@
+from typing import Callable
+
+import numpy as np
+
+from dassflow2d_py.constants import DRY_THRESHOLD
+from dassflow2d_py.mesh.Mesh import Mesh
+from dassflow2d_py.mesh.connectivity import edge_cell_indices, incidence_table
+
+
+def _expand(offsets: np.ndarray, values: np.ndarray, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gather the compressed sparse rows of several rows at once
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: concatenated values of the rows, and position in 'rows' of every value
+    """
+    starts = offsets[rows]
+    counts = offsets[rows + 1] - starts
+    row_of_entry = np.repeat(np.arange(len(rows), dtype=np.int64), counts)
+    local = np.arange(len(row_of_entry), dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+    return values[starts[row_of_entry] + local], row_of_entry
+
+
+class ActiveSet:
+    """
+    Tracks the active part of the domain: wet cells plus a one cell buffer around them, and edges touching a wet cell.
+    Fluxes through other edges are zero (both sides are dry), and other cells keep their state, so the solver
+    only needs to evaluate fluxes and update states over the compacted index arrays of the active set.
+
+    The set is updated incrementally: every step only the cells whose wet/dry status changed are visited,
+    and index arrays are compacted again only when the set changed.
+    Cells are referred to by their index in the state (real cells followed by ghost cells).
+    """
+
+    def __init__(self, left_cells: np.ndarray, right_cells: np.ndarray, cell_number: int,
+                 real_cell_number: int | None = None, dry_threshold: float = DRY_THRESHOLD):
+        """
+        Args:
+            left_cells (np.ndarray): index of the first cell of every edge
+            right_cells (np.ndarray): index of the second cell of every edge (ghost cells included)
+            cell_number (int): number of cells (real cells followed by ghost cells)
+            real_cell_number (int | None): number of real cells, defaults to all cells
+            dry_threshold (float): water depth under which a cell is dry
+        """
+        if len(left_cells) != len(right_cells):
+            raise ValueError("left and right cell arrays should have the same length")
+
+        self.left_cells = np.asarray(left_cells, dtype=np.int64)
+        self.right_cells = np.asarray(right_cells, dtype=np.int64)
+        self.cell_number = cell_number
+        self.real_cell_number = real_cell_number if real_cell_number is not None else cell_number
+        self.dry_threshold = dry_threshold
+
+        # edges of every cell, in compressed sparse rows: edges of cell c are cell_edges[cell_edge_offsets[c]:cell_edge_offsets[c+1]]
+        edge_number = len(self.left_cells)
+        self.cell_edge_offsets, self.cell_edges, _ = incidence_table(self.left_cells, self.right_cells, cell_number)
+
+        # every cell starts dry, the spare wet status and change buffers are reused at every update
+        self.wet = np.zeros(cell_number, dtype=bool)
+        self.next_wet = np.zeros(cell_number, dtype=bool)
+        self.changed = np.zeros(cell_number, dtype=bool)
+        # number of wet cells among a cell and its neighbors, a cell is active when positive
+        self.wet_around = np.zeros(cell_number, dtype=np.int64)
+        # number of wet sides of every edge, an edge is active when positive
+        self.wet_sides = np.zeros(edge_number, dtype=np.int64)
+        self.active_cells = np.empty(0, dtype=np.int64)
+        self.active_real_cells = np.empty(0, dtype=np.int64)
+        self.active_edges = np.empty(0, dtype=np.int64)
+        self.residual: np.ndarray | None = None
+        # cells whose residual row may be non zero, the active cells of the last accumulation
+        self.residual_cells = np.empty(0, dtype=np.int64)
+
+    @staticmethod
+    def fromMesh(mesh: Mesh, dry_threshold: float = DRY_THRESHOLD) -> 'ActiveSet':
+        """
+        Create the active set of a mesh, cells being ordered as the state:
+        real cells in 'Mesh#getCells()' order, followed by ghost cells in 'Mesh#getBoundaries()' order
+
+        Args:
+            mesh (Mesh): mesh to track
+            dry_threshold (float): water depth under which a cell is dry
+
+        Returns:
+            ActiveSet: active set of the mesh, with every cell dry
+        """
+        left_cells, right_cells, cell_number = edge_cell_indices(mesh)
+        return ActiveSet(left_cells, right_cells, cell_number, mesh.getCellNumber(), dry_threshold)
+
+    def update(self, h: np.ndarray) -> bool:
+        """
+        Update the active set from the water depth of every cell, to be called once per step
+
+        Args:
+            h (np.ndarray): water depth of every cell (real cells followed by ghost cells)
+
+        Returns:
+            bool: wether or not the active set changed
+        """
+        wet = np.greater(h, self.dry_threshold, out=self.next_wet)
+        if not np.not_equal(wet, self.wet, out=self.changed).any():
+            return False
+        changed = np.flatnonzero(self.changed)
+        self.wet, self.next_wet = wet, self.wet
+        delta = np.where(wet[changed], 1, -1)
+
+        # update counters of the changed cells, of their edges and of their neighbors only
+        edges, row_of_entry = _expand(self.cell_edge_offsets, self.cell_edges, changed)
+        edge_delta = delta[row_of_entry]
+        np.add.at(self.wet_sides, edges, edge_delta)
+        np.add.at(self.wet_around, changed, delta)
+        left = self.left_cells[edges]
+        neighbors = np.where(left == changed[row_of_entry], self.right_cells[edges], left)
+        np.add.at(self.wet_around, neighbors, edge_delta)
+
+        previous_cells, previous_edges = self.active_cells, self.active_edges
+        self.active_cells = np.flatnonzero(self.wet_around > 0)
+        self.active_real_cells = self.active_cells[:np.searchsorted(self.active_cells, self.real_cell_number)]
+        self.active_edges = np.flatnonzero(self.wet_sides > 0)
+        return not (np.array_equal(previous_cells, self.active_cells) and np.array_equal(previous_edges, self.active_edges))
+
+    def getActiveCells(self) -> np.ndarray:
+        """
+        Get the active cells, wet cells and their neighbors, real and ghost ones
+
+        Returns:
+            np.ndarray: sorted index of every active cell
+        """
+        return self.active_cells
+
+    def getActiveRealCells(self) -> np.ndarray:
+        """
+        Get the active real cells, whose state has to be updated by the solver
+
+        Returns:
+            np.ndarray: sorted index of every active real cell
+        """
+        return self.active_real_cells
+
+    def getActiveEdges(self) -> np.ndarray:
+        """
+        Get the active edges, edges with at least one wet side, whose flux has to be evaluated
+
+        Returns:
+            np.ndarray: sorted index of every active edge
+        """
+        return self.active_edges
+
+    def getWetFraction(self) -> float:
+        """
+        Get the fraction of real cells which are wet
+
+        Returns:
+            float: wet fraction, between 0 and 1
+        """
+        return float(np.count_nonzero(self.wet[:self.real_cell_number])) / max(self.real_cell_number, 1)
+
+    def accumulate(self, kernel: Callable[[np.ndarray], np.ndarray], components: int) -> np.ndarray:
+        """
+        Compute a flux on every active edge and scatter it into cell residuals:
+        the flux is subtracted from the first cell of the edge and added to the second one.
+        Only rows of the active cells and of the cells active at the previous call are reset,
+        so residuals of inactive cells are always zero, including cells which just left the set.
+
+        Args:
+            kernel (Callable[[np.ndarray], np.ndarray]): function returning the flux of the given edges,
+                with shape (edge number, components)
+            components (int): number of flux components
+
+        Returns:
+            np.ndarray: residual of every cell, shape (cell number, components)
+        """
+        if self.residual is None or self.residual.shape != (self.cell_number, components):
+            self.residual = np.zeros((self.cell_number, components), dtype=np.float64)
+        else:
+            self.residual[self.residual_cells] = 0.0
+            self.residual[self.active_cells] = 0.0
+        self.residual_cells = self.active_cells
+
+        if len(self.active_edges):
+            flux = kernel(self.active_edges)
+            np.subtract.at(self.residual, self.left_cells[self.active_edges], flux)
+            np.add.at(self.residual, self.right_cells[self.active_edges], flux)
+        return self.residual
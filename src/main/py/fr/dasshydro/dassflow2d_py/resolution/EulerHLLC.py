@@ -1,13 +1,252 @@
+import numpy as np
+
+from dassflow2d_py.d2dtime.TimeStepState import TimeStepState
+from dassflow2d_py.mesh.Mesh import Mesh
+from dassflow2d_py.mesh.Bathymetry import Bathymetry
+from dassflow2d_py.mesh.connectivity import edge_cell_indices
 from dassflow2d_py.resolution.ResolutionMethod import ResolutionMethod
+from dassflow2d_py.resolution.ActiveSet import ActiveSet
+from dassflow2d_py.resolution.edge_parallel import EdgeChunkExecutor
+from dassflow2d_py.resolution.partitioned import PartitionedSolver
+from dassflow2d_py.resolution.kernels import edge_geometry, get_kernels, NUMPY_BACKEND
 from dassflow2d_py.input.Configuration import Configuration
 
+
+# steps are only computed over the active set while its edges are fewer than this fraction of the edges,
+# beyond it the compacted gathers and the sequential scatter cost more than they save (see 'benchmark.py --active')
+ACTIVE_EDGE_FRACTION = 0.5
+
 class EulerHLLC(ResolutionMethod):
+    """
+    Explicit euler time scheme with the HLLC solver, computed by the flux, scatter and update kernels
+    of the configured backend (see 'kernels.get_kernels').
+    With the numpy backend, fluxes are computed by chunks of edges and scattered by a pool of threads
+    (see 'EdgeChunkExecutor'), with the same results as the sequential kernels.
+    While most of the domain is dry, steps are computed over the active set only (see 'ActiveSet'): fluxes through
+    edges with a wet side, updates of wet cells and of their neighbors, dry cells away from the water being copied
+    through. Fluxes through other edges are zero, results are the same as over the whole domain.
+    With several partitions, global steps are computed by worker processes, one per subdomain
+    (see 'PartitionedSolver'), with the same results. Local time stepping cycles stay in process.
+    Bed slope source terms are taken into account by hydrostatic reconstruction (see 'kernels.hllc_flux'),
+    so that a lake at rest stays at rest over any bathymetry.
+    """
 
     def __init__(self, configuration: Configuration):
-        pass
+        self.kernels = get_kernels(configuration.getKernelBackend())
+        self.thread_number = configuration.getThreadNumber()
+        self.executor: EdgeChunkExecutor | None = None
+        self.active_edge_fraction = ACTIVE_EDGE_FRACTION
+        self.partition_number = configuration.getPartitionNumber()
+        self.partitioned_solver: PartitionedSolver | None = None
+
+    def allocate(self, mesh: Mesh):
+        super().allocate(mesh)
+        self.left_cells, self.right_cells, cell_number = edge_cell_indices(mesh)
+        self.normals, self.lengths = edge_geometry(mesh)
+        self.surfaces = np.array([cell.getSurface() for cell in mesh.getCells()], dtype=np.float64)
+        # state ordering: real cells followed by ghost cells
+        self.cells = list(mesh.getCells()) + [boundary.getEdge().getGhostCell() for boundary in mesh.getBoundaries()]
+        self.active_set = ActiveSet(self.left_cells, self.right_cells, cell_number, len(self.surfaces))
+        # geometry of the active edges, their cells being indexed in the active cells, gathered again when they change
+        self.active_geometry = (self.left_cells[:0], self.right_cells[:0], self.normals[:0], self.lengths[:0])
+        self.active_surfaces = self.surfaces[:0]
+        self.close()
+        self.executor = None
+        if self.kernels.backend == NUMPY_BACKEND:
+            # compiled backends scatter fast enough sequentially
+            self.executor = EdgeChunkExecutor(self.left_cells, self.right_cells, cell_number, self.thread_number)
+        self.partitioned_solver = None
+        if self.partition_number > 1:
+            self.partitioned_solver = PartitionedSolver(mesh, self.partition_number, self.kernels.backend, self.left_cells,
+                                                        self.right_cells, self.normals, self.lengths, self.surfaces)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.close()
+        if self.partitioned_solver is not None:
+            self.partitioned_solver.close()
+
+    def resolve(self, previous_time_step, delta, mesh, bathymetry, out=None):
+        """
+        Implements a resolution method using euler time scheme and the hllc solver.
+        Ghost cells keep their values, they are set by boundary conditions.
+        States backed by the state buffers of the workspace (see 'Workspace#getCurrentState') are read and written
+        in place, other states are copied to and from the buffers.
+        """
+        current, next_values = self._load(previous_time_step, mesh)
+        self._step(current, next_values, delta, self._bed(bathymetry))
+        return self._store(next_values, out)
+
+    def resolveLocal(self, previous_time_step, scheduler, mesh, bathymetry, out=None):
+        """
+        Advances a local time stepping cycle with 'LocalTimeStepScheduler#advance': the flux of every substep is
+        evaluated from the current state of both sides, cells completing their step are updated with the euler
+        scheme from the fluxes accumulated since their previous update.
+        """
+        current, next_values = self._load(previous_time_step, mesh)
+        kernels = self.kernels
+        state = self._toConservative(current)
+        bed = self._bed(bathymetry)
+
+        def kernel(time_offset: float, edges: np.ndarray) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+            geometry = (self.left_cells[edges], self.right_cells[edges], self.normals[edges], self.lengths[edges])
+            if bed is None:
+                return kernels.flux(state, *geometry)
+            right_flux = np.empty((len(edges), 3), dtype=np.float64)
+            return kernels.flux(state, *geometry, None, None, bed, right_flux), right_flux
+
+        def apply(time_offset: float, cells: np.ndarray, residual: np.ndarray):
+            # residuals are already multiplied by the time covered by every flux
+            state[cells] = kernels.update(state[cells], residual, self.surfaces[cells], 1.0)
+
+        scheduler.advance(kernel, apply, 3)
+        self._toPrimitive(state, current, next_values)
+        return self._store(next_values, out)
+
+    def _bed(self, bathymetry: Bathymetry | None) -> np.ndarray | None:
+        """
+        Get the bed elevation of every cell, in the state ordering, None for a flat bed
+        """
+        if bathymetry is None:
+            return None
+        bed = bathymetry.getValues()
+        if len(bed) != len(self.cells):
+            raise ValueError(f"Expected the bathymetry of {len(self.cells)} cells, got {len(bed)}.")
+        return bed
+
+    def _load(self, previous_time_step: TimeStepState, mesh: Mesh) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the state buffers of the workspace, copying the previous state to the current one
+        if it is not backed by it
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: current and next state buffers
+        """
+        if self.workspace is None:
+            self.allocate(mesh)
+        workspace = self.workspace
+        current = workspace.getCurrentState()
+        if previous_time_step.getValues() is not current:
+            h, u, v = previous_time_step.toArrays(self.cells)
+            current[:, 0], current[:, 1], current[:, 2] = h, u, v
+        return current, workspace.getNextState()
 
-    def resolve(self, previous_time_step, delta, mesh, bathymetry):
+    def _store(self, next_values: np.ndarray, out: TimeStepState | None) -> TimeStepState:
         """
-        Implements a resolution method using euler time scheme and the hllc solver
+        Make the next state buffer the current one, and get the state holding its values:
+        'out' if it is backed by the buffer, else 'out' (or a new state) updated with a copy of the values
         """
-        return previous_time_step
\ No newline at end of file
+        self.workspace.swap()
+        if out is not None and out.getValues() is next_values:
+            return out
+        if out is None:
+            return TimeStepState.fromArray(next_values.copy(), self.cells)
+        for cell, values in zip(self.cells, next_values.tolist()):
+            node = out.getNode(cell)
+            node.h, node.u, node.v = values
+        return out
+
+    def _toConservative(self, current: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Convert a state buffer to conservative variables (h, hu and hv), in 'out' or in a work buffer
+        """
+        state = out if out is not None else self.workspace.cellBuffer("conservative", 3)
+        h = current[:, 0]
+        np.copyto(state[:, 0], h)
+        np.multiply(h, current[:, 1], out=state[:, 1])
+        np.multiply(h, current[:, 2], out=state[:, 2])
+        return state
+
+    def _toPrimitive(self, updated: np.ndarray, current: np.ndarray, next_values: np.ndarray):
+        """
+        Write the new state of the real cells to the next state buffer, dry cells being at rest,
+        ghost cells being copied from the current state buffer
+        """
+        real_cell_number = len(self.surfaces)
+        self._primitiveRows(updated[:real_cell_number], next_values[:real_cell_number])
+        np.copyto(next_values[real_cell_number:], current[real_cell_number:])
+
+    def _primitiveRows(self, updated: np.ndarray, out: np.ndarray):
+        """
+        Convert conservative rows to h, u and v, cells without water being at rest
+        """
+        new_h = updated[:, 0]
+        wet = np.greater(new_h, 0.0, out=self.workspace.getBuffer("wet", len(updated), None, np.bool_))
+        np.copyto(out[:, 0], new_h)
+        for column in (1, 2):
+            velocity = out[:, column]
+            velocity.fill(0.0)
+            np.divide(updated[:, column], new_h, out=velocity, where=wet)
+
+    def _step(self, current: np.ndarray, next_values: np.ndarray, delta: float, bed: np.ndarray | None):
+        """
+        Compute the next state buffer from the current one, without allocating once the workspace is warm
+
+        Args:
+            current (np.ndarray): h, u and v of every cell
+            next_values (np.ndarray): h, u and v of every cell after delta, ghost cells are copied
+            delta (float): time step
+            bed (np.ndarray | None): bed elevation of every cell, None for a flat bed
+        """
+        if self.partitioned_solver is not None:
+            self._toConservative(current, self.partitioned_solver.getState())
+            self._toPrimitive(self.partitioned_solver.step(delta, bed), current, next_values)
+            return
+
+        active_set = self.active_set
+        if active_set.update(current[:, 0]):
+            active_cells, active_edges = active_set.getActiveCells(), active_set.getActiveEdges()
+            # both cells of an active edge are active, active real cells come first
+            self.active_geometry = (np.searchsorted(active_cells, self.left_cells[active_edges]),
+                                    np.searchsorted(active_cells, self.right_cells[active_edges]),
+                                    self.normals[active_edges], self.lengths[active_edges])
+            self.active_surfaces = self.surfaces[active_set.getActiveRealCells()]
+        if len(active_set.getActiveEdges()) < self.active_edge_fraction * len(self.left_cells):
+            self._stepActive(current, next_values, delta, bed)
+            return
+
+        workspace = self.workspace
+        kernels = self.kernels
+        state = self._toConservative(current)
+        flux = workspace.edgeBuffer("flux", 3)
+        right_flux = None if bed is None else workspace.edgeBuffer("right_flux", 3)
+        residual = workspace.cellBuffer("residual", 3)
+        residual.fill(0.0)
+        if self.executor is not None:
+            self.executor.flux(kernels.flux, state, self.normals, self.lengths, flux, bed, right_flux)
+            self.executor.scatter(flux, residual, right_flux)
+        else:
+            kernels.flux(state, self.left_cells, self.right_cells, self.normals, self.lengths, flux, workspace, bed, right_flux)
+            kernels.scatter(self.left_cells, self.right_cells, flux, residual, right_flux)
+        updated = kernels.update(state, residual, self.surfaces, delta, workspace.cellBuffer("updated", 3), workspace)
+        self._toPrimitive(updated, current, next_values)
+
+    def _stepActive(self, current: np.ndarray, next_values: np.ndarray, delta: float, bed: np.ndarray | None):
+        """
+        Compute the next state buffer over the active set only: the state of the active cells is gathered
+        in compacted buffers, fluxes, residuals and updates are computed over them, and the new state of the active
+        real cells is written back, other cells being copied from the current state buffer
+        """
+        workspace = self.workspace
+        kernels = self.kernels
+        active_cells, active_real_cells = self.active_set.getActiveCells(), self.active_set.getActiveRealCells()
+        cell_number, edge_number = len(active_cells), len(self.active_geometry[0])
+
+        gathered = np.take(current, active_cells, axis=0, out=workspace.getBuffer("active_current", cell_number, 3), mode='clip')
+        state = self._toConservative(gathered, workspace.getBuffer("active_state", cell_number, 3))
+        right_flux = None
+        if bed is not None:
+            bed = np.take(bed, active_cells, out=workspace.getBuffer("active_bed", cell_number), mode='clip')
+            right_flux = workspace.getBuffer("active_right_flux", edge_number, 3)
+        flux = kernels.flux(state, *self.active_geometry, workspace.getBuffer("active_flux", edge_number, 3), workspace,
+                            bed, right_flux)
+        residual = workspace.getBuffer("active_residual", cell_number, 3)
+        residual.fill(0.0)
+        kernels.scatter(self.active_geometry[0], self.active_geometry[1], flux, residual, right_flux)
+        updated = kernels.update(state, residual, self.active_surfaces, delta,
+                                 workspace.getBuffer("active_updated", cell_number, 3), workspace)
+
+        np.copyto(next_values, current)
+        new_values = workspace.getBuffer("active_values", len(active_real_cells), 3)
+        self._primitiveRows(updated[:len(active_real_cells)], new_values)
+        next_values[active_real_cells] = new_values
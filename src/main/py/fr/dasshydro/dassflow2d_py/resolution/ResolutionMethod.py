@@ -12,11 +12,43 @@ class SpatialScheme(Enum):
 
 from abc import ABC, abstractmethod
 from dassflow2d_py.d2dtime.TimeStepState import TimeStepState
-from dassflow2d_py.mesh.Mesh import Mesh, Cell
+from dassflow2d_py.d2dtime.LocalTimeStepping import LocalTimeStepScheduler
+from dassflow2d_py.mesh.Mesh import Mesh
+from dassflow2d_py.mesh.Bathymetry import Bathymetry
+from dassflow2d_py.resolution.Workspace import Workspace
 
 class ResolutionMethod(ABC):
+
+    workspace: Workspace | None = None
+
+    def allocate(self, mesh: Mesh):
+        """
+        Preallocate the work buffers of the method once the mesh is known, called before the first resolution
+
+        Args:
+            mesh (Mesh): geometry of the problem
+        """
+        self.workspace = Workspace.fromMesh(mesh)
+
+    def close(self):
+        """
+        Release the resources of the method (threads...), called at the end of every run.
+        The method can still be used afterwards, resources being acquired again.
+        """
+        pass
+
+    def getWorkspace(self) -> Workspace | None:
+        """
+        Get the work buffers of the method, see 'Workspace'
+
+        Returns:
+            Workspace | None: work buffers, None if not allocated yet
+        """
+        return self.workspace
+
     @abstractmethod
-    def resolve(self, previous_time_step: TimeStepState, delta: float, mesh: Mesh, bathymetry: dict[Cell, float]) -> TimeStepState:
+    def resolve(self, previous_time_step: TimeStepState, delta: float, mesh: Mesh, bathymetry: Bathymetry,
+                out: TimeStepState | None = None) -> TimeStepState:
         """
         Resolution call that should return a new (or modified) TimeStepState with corrected value
 
@@ -24,9 +56,36 @@ class ResolutionMethod(ABC):
             previous_time_step (TimeStepState): state at the time of call
             delta (float): time to skip to
             mesh (Mesh): geometry of the problem
-            bathymetry (dict[Cell, float]): bathymetry of each cell (including ghost cells)
+            bathymetry (Bathymetry): bathymetry of each cell (including ghost cells)
+            out (TimeStepState | None): state to write the result to instead of building a new one,
+                the caller swaps both states at every step (ping-pong)
 
         Returns:
-            TimeStepState: state after delta
+            TimeStepState: state after delta, 'out' when given (or 'previous_time_step' if it was updated in place)
         """
         pass
+
+    def resolveLocal(self, previous_time_step: TimeStepState, scheduler: LocalTimeStepScheduler, mesh: Mesh, bathymetry: Bathymetry,
+                     out: TimeStepState | None = None) -> TimeStepState:
+        """
+        Resolution call advancing a whole local time stepping cycle, every time step class at its own rate
+        (see 'LocalTimeStepScheduler#advance'). Methods not supporting local time stepping advance the cycle
+        with global steps of the base delta, which gives the same result as global time stepping.
+
+        Args:
+            previous_time_step (TimeStepState): state at the time of call
+            scheduler (LocalTimeStepScheduler): classified scheduler, giving the substeps of the cycle
+            mesh (Mesh): geometry of the problem
+            bathymetry (Bathymetry): bathymetry of each cell (including ghost cells)
+            out (TimeStepState | None): spare state, substeps ping-pong between it and 'previous_time_step'
+
+        Returns:
+            TimeStepState: state after the cycle delta, one of the two states when 'out' is given
+        """
+        state, spare = previous_time_step, out
+        for _ in scheduler.getSubsteps():
+            next_state = self.resolve(state, scheduler.getBaseDelta(), mesh, bathymetry, spare)
+            if spare is not None and next_state is not state:
+                spare = state
+            state = next_state
+        return state
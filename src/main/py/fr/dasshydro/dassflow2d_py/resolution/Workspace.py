@@ -0,0 +1,117 @@
+import numpy as np
+
+from dassflow2d_py.mesh.Mesh import Mesh
+
+
+# variables of the state: h, u and v
+STATE_COMPONENTS = 3
+
+
+class Workspace:
+    """
+    Preallocated work buffers of a resolution method, so that time steps do not allocate temporary arrays.
+
+    Buffers are identified by name and allocated on first request, later requests of the same name return the
+    same memory (a view of its first rows when fewer rows are requested), so kernels write every intermediate
+    result with 'out=' arguments. Two state buffers are swapped at every step (ping-pong): the next state is
+    computed from the current one, then becomes the current one. They hold the values of the states of the time loop
+    (see 'TimeStepState#fromArray'), so that steps read and write them without copies.
+    Cells are referred to by their index in the state (real cells followed by ghost cells).
+    """
+
+    def __init__(self, edge_number: int, cell_number: int, real_cell_number: int | None = None):
+        """
+        Args:
+            edge_number (int): number of edges
+            cell_number (int): number of cells (real cells followed by ghost cells)
+            real_cell_number (int | None): number of real cells, defaults to all cells
+        """
+        self.edge_number = edge_number
+        self.cell_number = cell_number
+        self.real_cell_number = real_cell_number if real_cell_number is not None else cell_number
+        self.buffers: dict[str, np.ndarray] = {}
+        self.states = (
+            np.zeros((cell_number, STATE_COMPONENTS), dtype=np.float64),
+            np.zeros((cell_number, STATE_COMPONENTS), dtype=np.float64)
+        )
+        self.current = 0
+
+    @staticmethod
+    def fromMesh(mesh: Mesh) -> 'Workspace':
+        """
+        Create the workspace of a mesh, sized for every edge and every cell (ghost cells included)
+
+        Args:
+            mesh (Mesh): mesh of the simulation
+
+        Returns:
+            Workspace: workspace with its state buffers allocated
+        """
+        cell_number = mesh.getCellNumber()
+        return Workspace(mesh.getEdgeNumber(), cell_number + mesh.getBoundaryNumber(), cell_number)
+
+    def getBuffer(self, name: str, length: int, columns: int | None = None, dtype: type = np.float64) -> np.ndarray:
+        """
+        Get a work buffer, allocated on first request and reused afterwards.
+        Its content is left over from its previous use.
+
+        Args:
+            name (str): name of the buffer, unique among the kernels sharing the workspace
+            length (int): number of rows
+            columns (int | None): number of columns, None for a one dimensional buffer
+            dtype (type): type of the values
+
+        Returns:
+            np.ndarray: buffer of shape (length,) or (length, columns)
+        """
+        buffer = self.buffers.get(name)
+        if (buffer is None or len(buffer) < length or buffer.dtype != dtype
+                or buffer.shape[1:] != (() if columns is None else (columns,))):
+            buffer = np.empty((length,) if columns is None else (length, columns), dtype=dtype)
+            self.buffers[name] = buffer
+        return buffer[:length]
+
+    def edgeBuffer(self, name: str, columns: int | None = None, dtype: type = np.float64) -> np.ndarray:
+        """
+        Get a work buffer with one row per edge, see 'getBuffer'
+        """
+        return self.getBuffer(name, self.edge_number, columns, dtype)
+
+    def cellBuffer(self, name: str, columns: int | None = None, dtype: type = np.float64) -> np.ndarray:
+        """
+        Get a work buffer with one row per cell (ghost cells included), see 'getBuffer'
+        """
+        return self.getBuffer(name, self.cell_number, columns, dtype)
+
+    def getCurrentState(self) -> np.ndarray:
+        """
+        Get the state buffer of the current time
+
+        Returns:
+            np.ndarray: h, u and v of every cell, shape (cell number, 3)
+        """
+        return self.states[self.current]
+
+    def getNextState(self) -> np.ndarray:
+        """
+        Get the state buffer the next time step is written to
+
+        Returns:
+            np.ndarray: h, u and v of every cell, shape (cell number, 3)
+        """
+        return self.states[1 - self.current]
+
+    def swap(self):
+        """
+        Make the next state the current one, the previous current state is overwritten by the next step
+        """
+        self.current = 1 - self.current
+
+    def getAllocatedBytes(self) -> int:
+        """
+        Get the memory held by the workspace
+
+        Returns:
+            int: size of every buffer, state buffers included, in bytes
+        """
+        return sum(buffer.nbytes for buffer in self.buffers.values()) + sum(state.nbytes for state in self.states)
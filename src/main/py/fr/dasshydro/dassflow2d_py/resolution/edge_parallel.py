@@ -0,0 +1,207 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import numpy as np
+
+from dassflow2d_py.mesh.connectivity import incidence_table
+from dassflow2d_py.resolution.Workspace import Workspace
+
+
+# number of edges (or cells) processed at once, keeps per chunk temporaries small enough to stay in cache
+DEFAULT_CHUNK_SIZE = 4096
+
+
+def _thread_blocks(length: int, chunk_size: int, thread_number: int) -> list[list[slice]]:
+    """
+    Split a range into chunks, then into contiguous blocks of chunks, one per thread
+    """
+    chunks = [slice(start, min(start + chunk_size, length)) for start in range(0, length, chunk_size)]
+    bounds = np.linspace(0, len(chunks), thread_number + 1).astype(int)
+    return [chunks[bounds[t]:bounds[t + 1]] for t in range(thread_number)]
+
+
+class EdgeChunkExecutor:
+    """
+    Runs edge kernels over cache sized chunks of the edge arrays using a pool of threads.
+    NumPy releases the GIL inside its kernels, so chunks are processed concurrently.
+    Every thread has its own workspace, sized for a chunk, for the intermediate results of its kernels.
+
+    Edge fluxes are scattered into cell residuals by gathering, for every cell, the fluxes of its edges
+    (see 'connectivity.incidence_table'): threads own disjoint blocks of cells, so they never write the same rows
+    and no reduction is needed. Contributions are summed in the order of 'kernels.scatter_residual',
+    results are therefore identical to it whatever the number of threads and the chunk size.
+    """
+
+    def __init__(self, left_cells: np.ndarray, right_cells: np.ndarray, cell_number: int,
+                 thread_number: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            left_cells (np.ndarray): index of the first cell of every edge
+            right_cells (np.ndarray): index of the second cell of every edge (ghost cells included)
+            cell_number (int): number of cells receiving contributions (real cells followed by ghost cells)
+            thread_number (int | None): number of threads, defaults to the number of CPUs
+            chunk_size (int): number of edges, or of cells, per chunk
+        """
+        if len(left_cells) != len(right_cells):
+            raise ValueError("left and right cell arrays should have the same length")
+        if chunk_size <= 0:
+            raise ValueError("chunk size should always be positive and non-zero")
+
+        self.left_cells = np.asarray(left_cells, dtype=np.int64)
+        self.right_cells = np.asarray(right_cells, dtype=np.int64)
+        self.cell_number = cell_number
+        self.chunk_size = chunk_size
+        edge_number = len(self.left_cells)
+
+        # no more threads than chunks
+        requested = max(1, thread_number if thread_number is not None else (os.cpu_count() or 1))
+        chunk_number = max(-(-edge_number // chunk_size), -(-cell_number // chunk_size))
+        self.thread_number = max(1, min(requested, chunk_number))
+        self.thread_chunks = _thread_blocks(edge_number, chunk_size, self.thread_number)
+        self.thread_rows = _thread_blocks(cell_number, chunk_size, self.thread_number)
+
+        # edges of every cell, padded to the largest number of edges of a cell: column k holds the k-th
+        # contribution of every cell, as an index in the signed fluxes (negated fluxes of first cells,
+        # then fluxes of second cells, then a zero row for padding)
+        offsets, edges, is_left = incidence_table(self.left_cells, self.right_cells, cell_number)
+        degrees = np.diff(offsets)
+        width = int(degrees.max()) if cell_number > 0 else 0
+        rows = np.repeat(np.arange(cell_number), degrees)
+        self.contributions = np.full((width, cell_number), 2 * edge_number, dtype=np.int64)
+        self.contributions[np.arange(len(edges)) - offsets[rows], rows] = np.where(is_left, edges, edge_number + edges)
+
+        self.pool: ThreadPoolExecutor | None = None
+        self.buffers: dict[str, np.ndarray] = {}
+        self.workspaces = [Workspace(chunk_size, 0) for _ in range(self.thread_number)]
+
+    def _buffer(self, name: str, shape: tuple[int, ...]) -> np.ndarray:
+        """
+        Get a work buffer of the executor, reallocated only when its shape changes
+        """
+        buffer = self.buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.float64)
+            self.buffers[name] = buffer
+        return buffer
+
+    def map(self, kernel: Callable[[slice, Workspace], None]):
+        """
+        Call a kernel on every chunk of edges, the kernel is responsible for writing its own outputs
+
+        Args:
+            kernel (Callable[[slice, Workspace], None]): function processing the edges of a chunk,
+                with the workspace of the thread running it
+        """
+        def run(thread: int):
+            workspace = self.workspaces[thread]
+            for chunk in self.thread_chunks[thread]:
+                kernel(chunk, workspace)
+
+        self._run_all(run)
+
+    def flux(self, kernel: Callable[..., np.ndarray], state: np.ndarray, normals: np.ndarray, lengths: np.ndarray,
+             out: np.ndarray, bed: np.ndarray | None = None, right_out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Compute an edge flux kernel (see 'Kernels#flux') chunk by chunk. Fluxes are computed edge by edge,
+        results are therefore identical to a single call over every edge.
+
+        Args:
+            kernel (Callable[..., np.ndarray]): flux kernel
+            state (np.ndarray): conservative state of every cell, shape (cell number, 3)
+            normals (np.ndarray): unit normal of every edge, shape (edge number, 2)
+            lengths (np.ndarray): length of every edge
+            out (np.ndarray): array the flux of every edge is written to, shape (edge number, 3)
+            bed (np.ndarray | None): bed elevation of every cell, None for a flat bed
+            right_out (np.ndarray | None): array the flux entering the second cell of every edge is written to,
+                required with a bed
+
+        Returns:
+            np.ndarray: 'out'
+        """
+        def compute(chunk: slice, workspace: Workspace):
+            kernel(state, self.left_cells[chunk], self.right_cells[chunk], normals[chunk], lengths[chunk], out[chunk], workspace,
+                   bed, None if right_out is None else right_out[chunk])
+
+        self.map(compute)
+        return out
+
+    def scatter(self, flux: np.ndarray, residual: np.ndarray, right_flux: np.ndarray | None = None):
+        """
+        Accumulate edge fluxes into cell residuals, as 'kernels.scatter_residual' does:
+        subtracted from the first cell of every edge, added to the second one
+
+        Args:
+            flux (np.ndarray): flux of every edge, shape (edge number, components)
+            residual (np.ndarray): residual of every cell, shape (cell number, components), updated in place
+            right_flux (np.ndarray | None): flux entering the second cell of every edge when it differs from
+                the flux leaving the first one, None otherwise
+        """
+        entering = flux if right_flux is None else right_flux
+        edge_number, components = flux.shape
+        signed = self._buffer("signed", (2 * edge_number + 1, components))
+        signed[2 * edge_number] = 0.0
+
+        def sign(chunk: slice, workspace: Workspace):
+            # subtracting a value is adding its opposite, exactly
+            np.negative(flux[chunk], out=signed[chunk])
+            np.copyto(signed[edge_number + chunk.start:edge_number + chunk.stop], entering[chunk])
+
+        self.map(sign)
+
+        gathered_buffers = [self._buffer(f"gathered_{thread}", (self.chunk_size, components)) for thread in range(self.thread_number)]
+
+        def run(thread: int):
+            for rows in self.thread_rows[thread]:
+                target = residual[rows]
+                gathered = gathered_buffers[thread][:rows.stop - rows.start]
+                for column in self.contributions:
+                    np.take(signed, column[rows], axis=0, out=gathered, mode='clip')
+                    np.add(target, gathered, out=target)
+
+        self._run_all(run)
+
+    def accumulate(self, kernel: Callable[[slice, Workspace], np.ndarray], components: int) -> np.ndarray:
+        """
+        Compute a flux on every edge and scatter it into cell residuals, see 'scatter'
+
+        Args:
+            kernel (Callable[[slice, Workspace], np.ndarray]): function returning the flux of the edges of a chunk,
+                with shape (chunk length, components), given the workspace of the thread running it
+            components (int): number of flux components
+
+        Returns:
+            np.ndarray: residual of every cell, shape (cell number, components), overwritten by the next call
+        """
+        flux = self._buffer("flux", (len(self.left_cells), components))
+
+        def compute(chunk: slice, workspace: Workspace):
+            flux[chunk] = kernel(chunk, workspace)
+
+        self.map(compute)
+        residual = self._buffer("residual", (self.cell_number, components))
+        residual.fill(0.0)
+        self.scatter(flux, residual)
+        return residual
+
+    def _run_all(self, run: Callable[[int], None]):
+        """
+        Run a function for every thread, the pool being started on first use
+        """
+        if self.thread_number == 1:
+            run(0)
+            return
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(self.thread_number)
+        futures = [self.pool.submit(run, thread) for thread in range(self.thread_number)]
+        for future in futures:
+            # propagates exceptions raised in threads
+            future.result()
+
+    def close(self):
+        """
+        Release the threads of the executor, they are started again if it is used afterwards
+        """
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
@@ -0,0 +1,298 @@
+from enum import Enum
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+from dassflow2d_py.constants import GRAVITY, DRY_THRESHOLD
+from dassflow2d_py.mesh.Mesh import Mesh
+from dassflow2d_py.resolution.Workspace import Workspace
+
+
+NUMPY_BACKEND = "numpy"
+NUMBA_BACKEND = "numba"
+
+
+class KernelBackend(Enum):
+    AUTO = "auto"
+    NUMPY = NUMPY_BACKEND
+    NUMBA = NUMBA_BACKEND
+
+
+class Kernels(NamedTuple):
+    """
+    Represents a set of edge flux and cell update kernels.
+    States are conservative, with shape (cell number, 3) and columns h, hu and hv,
+    cells being ordered as the state (real cells followed by ghost cells, see 'connectivity.edge_cell_indices').
+    With a bed, the flux leaving the first cell of an edge and the flux entering its second cell differ
+    by the bed source terms (see 'hllc_flux').
+    """
+    backend: str
+    # (state, left cells, right cells, normals, lengths, out, workspace, bed, right_out) -> flux of every edge,
+    # integrated over its length, leaving its first cell (the flux entering its second cell being written to right_out)
+    flux: Callable[..., np.ndarray]
+    # (left cells, right cells, flux, residual, right flux) -> None, subtracts the flux from left cells
+    # and adds the right flux (the flux when None) to right cells
+    scatter: Callable[..., None]
+    # (state, residual, surfaces, delta, out, workspace) -> state of the real cells after an explicit euler step
+    update: Callable[..., np.ndarray]
+
+
+def edge_geometry(mesh: Mesh) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Get the geometry of every edge, in 'Mesh#getEdges()' order
+
+    Args:
+        mesh (Mesh): mesh of the simulation
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: unit normal of every edge (from its first cell to its second cell),
+        shape (edge number, 2), and length of every edge
+    """
+    edges = list(mesh.getEdges())
+    normals = np.array([edge.getNormalVector() for edge in edges], dtype=np.float64).reshape(-1, 2)
+    lengths = np.array([edge.getLength() for edge in edges], dtype=np.float64)
+    return normals, lengths
+
+
+def hllc_flux(state: np.ndarray, left_cells: np.ndarray, right_cells: np.ndarray,
+              normals: np.ndarray, lengths: np.ndarray,
+              out: np.ndarray | None = None, workspace: Workspace | None = None,
+              bed: np.ndarray | None = None, right_out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Compute the HLLC flux of the shallow water equations through every edge.
+    Dry sides (depth under 'DRY_THRESHOLD') have no velocity and use the dry bed wave speeds.
+    With a bed, bed slope source terms are taken into account by hydrostatic reconstruction (Audusse et al.):
+    depths are reconstructed at the highest bed of both sides, velocities being kept, and the hydrostatic pressure
+    lost by every side is added to its flux, so that a lake at rest stays at rest (well-balanced scheme).
+    Every intermediate result is written to a buffer of the workspace, nothing is allocated once it is warm.
+
+    Args:
+        state (np.ndarray): conservative state of every cell, shape (cell number, 3)
+        left_cells (np.ndarray): index of the first cell of every edge
+        right_cells (np.ndarray): index of the second cell of every edge
+        normals (np.ndarray): unit normal of every edge, shape (edge number, 2)
+        lengths (np.ndarray): length of every edge
+        out (np.ndarray | None): array the flux is written to, allocated if None
+        workspace (Workspace | None): work buffers, temporary ones are used if None
+        bed (np.ndarray | None): bed elevation of every cell, None for a flat bed
+        right_out (np.ndarray | None): array the flux entering the second cell of every edge is written to,
+            required with a bed
+
+    Returns:
+        np.ndarray: flux of every edge leaving its first cell towards its second cell, times its length,
+        shape (edge number, 3)
+    """
+    edge_number = len(left_cells)
+    if out is None:
+        out = np.empty((edge_number, 3), dtype=np.float64)
+    if workspace is None:
+        workspace = Workspace(edge_number, 0)
+    if bed is not None and right_out is None:
+        raise ValueError("the flux entering second cells is required with a bed")
+
+    def buffer(name: str, dtype: type = np.float64) -> np.ndarray:
+        return workspace.getBuffer(name, edge_number, None, dtype)
+
+    # whole rows are gathered, 'clip' avoids the temporary copy made by the default mode (indices are valid)
+    state_l = np.take(state, left_cells, axis=0, out=workspace.getBuffer("hllc_state_l", edge_number, 3), mode='clip')
+    state_r = np.take(state, right_cells, axis=0, out=workspace.getBuffer("hllc_state_r", edge_number, 3), mode='clip')
+    nx, ny = normals[:, 0], normals[:, 1]
+    hl, hr = state_l[:, 0], state_r[:, 0]
+    # nothing flows between two dry cells
+    dry_edges = np.logical_and(np.less_equal(hl, DRY_THRESHOLD, out=buffer("hllc_dry_l", np.bool_)),
+                               np.less_equal(hr, DRY_THRESHOLD, out=buffer("hllc_dry_r", np.bool_)), out=buffer("hllc_dry", np.bool_))
+    t1, t2, t3 = buffer("hllc_t1"), buffer("hllc_t2"), buffer("hllc_t3")
+
+    if bed is not None:
+        # depths above the highest bed of both sides, momentum keeping the velocity of the cell
+        original_hl, original_hr = buffer("hllc_hl"), buffer("hllc_hr")
+        np.copyto(original_hl, hl)
+        np.copyto(original_hr, hr)
+        zl = np.take(bed, left_cells, out=buffer("hllc_zl"), mode='clip')
+        zr = np.take(bed, right_cells, out=buffer("hllc_zr"), mode='clip')
+        wet = buffer("hllc_wet", np.bool_)
+        for h, original_h, step, side in ((hl, original_hl, np.subtract(zr, zl, out=t1), state_l),
+                                          (hr, original_hr, np.subtract(zl, zr, out=t2), state_r)):
+            np.maximum(step, 0.0, out=step)
+            np.maximum(np.subtract(original_h, step, out=h), 0.0, out=h)
+            # ratio of the reconstructed depth to the depth, exactly one without bed step
+            step.fill(0.0)
+            np.divide(h, original_h, out=step, where=np.greater(original_h, DRY_THRESHOLD, out=wet))
+            np.multiply(side[:, 1], step, out=side[:, 1])
+            np.multiply(side[:, 2], step, out=side[:, 2])
+
+    wet_l, wet_r = np.greater(hl, DRY_THRESHOLD, out=buffer("hllc_wet_l", np.bool_)), np.greater(hr, DRY_THRESHOLD, out=buffer("hllc_wet_r", np.bool_))
+    dry_l, dry_r = np.logical_not(wet_l, out=buffer("hllc_dry_l", np.bool_)), np.logical_not(wet_r, out=buffer("hllc_dry_r", np.bool_))
+
+    # velocities, zero on dry sides
+    ul, vl, ur, vr = buffer("hllc_ul"), buffer("hllc_vl"), buffer("hllc_ur"), buffer("hllc_vr")
+    for velocity, momentum, h, wet in ((ul, state_l[:, 1], hl, wet_l), (vl, state_l[:, 2], hl, wet_l),
+                                       (ur, state_r[:, 1], hr, wet_r), (vr, state_r[:, 2], hr, wet_r)):
+        velocity.fill(0.0)
+        np.divide(momentum, h, out=velocity, where=wet)
+
+    # normal and tangential velocities
+    unl, utl, unr, utr = buffer("hllc_unl"), buffer("hllc_utl"), buffer("hllc_unr"), buffer("hllc_utr")
+    for un, ut, u, v in ((unl, utl, ul, vl), (unr, utr, ur, vr)):
+        np.add(np.multiply(u, nx, out=un), np.multiply(v, ny, out=t1), out=un)
+        np.subtract(np.multiply(v, nx, out=ut), np.multiply(u, ny, out=t1), out=ut)
+    cl, cr = buffer("hllc_cl"), buffer("hllc_cr")
+    for c, h, dry in ((cl, hl, dry_l), (cr, hr, dry_r)):
+        np.multiply(h, GRAVITY, out=c)
+        np.copyto(c, 0.0, where=dry)
+        np.sqrt(c, out=c)
+
+    # wave speeds, dry bed speeds when a side is dry
+    sl, sr = buffer("hllc_sl"), buffer("hllc_sr")
+    np.minimum(np.subtract(unl, cl, out=t1), np.subtract(unr, cr, out=t2), out=sl)
+    np.copyto(sl, np.subtract(unr, np.multiply(cr, 2.0, out=t1), out=t1), where=dry_l)
+    np.maximum(np.add(unl, cl, out=t1), np.add(unr, cr, out=t2), out=sr)
+    np.copyto(sr, np.add(unl, np.multiply(cl, 2.0, out=t1), out=t1), where=dry_r)
+
+    fl_h, fr_h = np.multiply(hl, unl, out=buffer("hllc_fl_h")), np.multiply(hr, unr, out=buffer("hllc_fr_h"))
+    fl_m, fr_m = buffer("hllc_fl_m"), buffer("hllc_fr_m")
+    for f_m, f_h, un, h in ((fl_m, fl_h, unl, hl), (fr_m, fr_h, unr, hr)):
+        np.multiply(f_h, un, out=f_m)
+        np.add(f_m, np.multiply(np.multiply(h, 0.5 * GRAVITY, out=t1), h, out=t1), out=f_m)
+
+    left_going = np.greater_equal(sl, 0.0, out=buffer("hllc_left_going", np.bool_))
+    right_going = np.less_equal(sr, 0.0, out=buffer("hllc_right_going", np.bool_))
+    f_h, f_m = buffer("hllc_f_h"), buffer("hllc_f_m")
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.subtract(sr, sl, out=t3)
+        for f, fl, fr, jump in ((f_h, fl_h, fr_h, np.subtract(hr, hl, out=buffer("hllc_jump_h"))),
+                                (f_m, fl_m, fr_m, np.subtract(fr_h, fl_h, out=buffer("hllc_jump_m")))):
+            np.subtract(np.multiply(sr, fl, out=f), np.multiply(sl, fr, out=t1), out=f)
+            np.add(f, np.multiply(np.multiply(sl, sr, out=t1), jump, out=t1), out=f)
+            np.divide(f, t3, out=f)
+            np.copyto(f, fr, where=right_going)
+            np.copyto(f, fl, where=left_going)
+
+        # speed of the contact wave, which carries the tangential velocity
+        np.subtract(unr, sr, out=t2)
+        np.subtract(unl, sl, out=t3)
+        sm = buffer("hllc_sm")
+        np.multiply(np.multiply(sl, hr, out=sm), t2, out=sm)
+        np.subtract(sm, np.multiply(np.multiply(sr, hl, out=t1), t3, out=t1), out=sm)
+        np.multiply(hr, t2, out=t2)
+        np.subtract(t2, np.multiply(hl, t3, out=t3), out=t2)
+        np.divide(sm, t2, out=sm)
+    f_t = t1
+    np.copyto(f_t, utr)
+    np.copyto(f_t, utl, where=np.greater_equal(sm, 0.0, out=buffer("hllc_contact", np.bool_)))
+    np.multiply(f_h, f_t, out=f_t)
+
+    np.multiply(f_h, lengths, out=out[:, 0])
+    np.multiply(np.subtract(np.multiply(f_m, nx, out=t2), np.multiply(f_t, ny, out=t3), out=t2), lengths, out=out[:, 1])
+    np.multiply(np.add(np.multiply(f_m, ny, out=t2), np.multiply(f_t, nx, out=t3), out=t2), lengths, out=out[:, 2])
+    np.copyto(out, 0.0, where=np.logical_and(dry_l, dry_r, out=dry_l)[:, None])
+
+    if bed is not None:
+        # hydrostatic pressure of every side above the reconstructed depth, times the length
+        np.copyto(right_out, out)
+        for flux, original_h, h in ((right_out, original_hr, hr), (out, original_hl, hl)):
+            np.subtract(np.multiply(original_h, original_h, out=t1), np.multiply(h, h, out=t2), out=t1)
+            np.multiply(np.multiply(t1, 0.5 * GRAVITY, out=t1), lengths, out=t1)
+            np.add(flux[:, 1], np.multiply(t1, nx, out=t2), out=flux[:, 1])
+            np.add(flux[:, 2], np.multiply(t1, ny, out=t2), out=flux[:, 2])
+        np.copyto(right_out, 0.0, where=dry_edges[:, None])
+    np.copyto(out, 0.0, where=dry_edges[:, None])
+    return out
+
+
+def scatter_residual(left_cells: np.ndarray, right_cells: np.ndarray, flux: np.ndarray, residual: np.ndarray,
+                     right_flux: np.ndarray | None = None):
+    """
+    Accumulate edge fluxes into cell residuals: subtracted from the first cell of every edge,
+    added to the second one, in edge order
+
+    Args:
+        left_cells (np.ndarray): index of the first cell of every edge
+        right_cells (np.ndarray): index of the second cell of every edge
+        flux (np.ndarray): flux of every edge, shape (edge number, components)
+        residual (np.ndarray): residual of every cell, updated in place
+        right_flux (np.ndarray | None): flux entering the second cell of every edge when it differs from
+            the flux leaving the first one (see 'hllc_flux'), None otherwise
+    """
+    np.subtract.at(residual, left_cells, flux)
+    np.add.at(residual, right_cells, flux if right_flux is None else right_flux)
+
+
+def euler_update(state: np.ndarray, residual: np.ndarray, surfaces: np.ndarray, delta: float,
+                 out: np.ndarray | None = None, workspace: Workspace | None = None) -> np.ndarray:
+    """
+    Advance real cells with an explicit euler step, cells drying out are set to rest with a non negative depth
+
+    Args:
+        state (np.ndarray): conservative state of every cell, shape (cell number, 3)
+        residual (np.ndarray): residual of every cell, see 'scatter_residual'
+        surfaces (np.ndarray): surface of every real cell
+        delta (float): time step
+        out (np.ndarray | None): array whose first rows receive the new state of the real cells (typically
+            the next state buffer of a workspace, ghost cell rows being left untouched), allocated if None
+        workspace (Workspace | None): work buffers, temporary ones are used if None
+
+    Returns:
+        np.ndarray: 'out', or the new state of the real cells if it was None
+    """
+    real_cell_number = len(surfaces)
+    if out is None:
+        out = np.empty((real_cell_number, 3), dtype=np.float64)
+    if workspace is None:
+        workspace = Workspace(0, real_cell_number)
+    new_state = out[:real_cell_number]
+
+    factor = np.divide(delta, surfaces, out=workspace.getBuffer("update_factor", real_cell_number))
+    # column by column, broadcasting the factor would make NumPy buffer the whole operation
+    for column in range(3):
+        np.multiply(residual[:real_cell_number, column], factor, out=new_state[:, column])
+    np.add(state[:real_cell_number], new_state, out=new_state)
+    dry = np.less_equal(new_state[:, 0], DRY_THRESHOLD, out=workspace.getBuffer("update_dry", real_cell_number, None, np.bool_))
+    negative = np.less(new_state[:, 0], 0.0, out=workspace.getBuffer("update_negative", real_cell_number, None, np.bool_))
+    np.copyto(new_state[:, 0], 0.0, where=negative)
+    np.copyto(new_state[:, 1:], 0.0, where=dry[:, None])
+    return out
+
+
+NUMPY_KERNELS = Kernels(NUMPY_BACKEND, hllc_flux, scatter_residual, euler_update)
+
+
+def numba_available() -> bool:
+    """
+    Check whether the compiled kernels can be used
+
+    Returns:
+        bool: True if numba is importable
+    """
+    try:
+        import numba #type: ignore
+    except ImportError:
+        return False
+    return True
+
+
+def get_kernels(backend: str | None = None) -> Kernels:
+    """
+    Get the kernels of a backend. Without a backend, the numba kernels are used when numba is importable,
+    and the NumPy kernels otherwise. Both give identical results.
+
+    Args:
+        backend (str | None): 'numpy', 'numba' or None to select automatically
+
+    Raises:
+        ValueError: if the backend is unknown, or is 'numba' and numba is not importable
+
+    Returns:
+        Kernels: kernels of the backend
+    """
+    if backend is None:
+        backend = NUMBA_BACKEND if numba_available() else NUMPY_BACKEND
+    if backend == NUMPY_BACKEND:
+        return NUMPY_KERNELS
+    if backend == NUMBA_BACKEND:
+        if not numba_available():
+            raise ValueError("the numba backend requires numba to be installed")
+        # compiled lazily, numba is an optional dependency
+        from dassflow2d_py.resolution import numba_kernels
+        return Kernels(NUMBA_BACKEND, numba_kernels.hllc_flux, numba_kernels.scatter_residual, numba_kernels.euler_update)
+    raise ValueError(f"unknown kernel backend: {backend}")
@@ -0,0 +1,145 @@
+# Compiled versions of the kernels of 'kernels', only imported when numba is installed (see 'kernels.get_kernels').
+# Every kernel performs the same floating point operations in the same order as its NumPy counterpart,
+# without fast math, so both backends give identical results.
+import math
+
+import numpy as np
+from numba import njit, prange #type: ignore
+
+from dassflow2d_py.constants import GRAVITY, DRY_THRESHOLD
+from dassflow2d_py.resolution.Workspace import Workspace
+
+
+def hllc_flux(state: np.ndarray, left_cells: np.ndarray, right_cells: np.ndarray,
+              normals: np.ndarray, lengths: np.ndarray,
+              out: np.ndarray | None = None, workspace: Workspace | None = None,
+              bed: np.ndarray | None = None, right_out: np.ndarray | None = None) -> np.ndarray:
+    """
+    See 'kernels.hllc_flux', edges are processed in parallel without any work buffer
+    """
+    if out is None:
+        out = np.empty((len(left_cells), 3), dtype=np.float64)
+    if bed is None:
+        # the compiled loop takes arrays only, an empty bed disables the reconstruction
+        _hllc_flux(state, left_cells, right_cells, normals, lengths, np.empty(0), out, out)
+    elif right_out is None:
+        raise ValueError("the flux entering second cells is required with a bed")
+    else:
+        _hllc_flux(state, left_cells, right_cells, normals, lengths, bed, out, right_out)
+    return out
+
+
+@njit(parallel=True, error_model='numpy', cache=True)
+def _hllc_flux(state: np.ndarray, left_cells: np.ndarray, right_cells: np.ndarray,
+               normals: np.ndarray, lengths: np.ndarray, bed: np.ndarray, flux: np.ndarray, right_flux: np.ndarray):
+    reconstruct = len(bed) > 0
+    for e in prange(len(left_cells)):
+        left, right = left_cells[e], right_cells[e]
+        nx, ny = normals[e, 0], normals[e, 1]
+        original_hl, original_hr = state[left, 0], state[right, 0]
+        # nothing flows between two dry cells
+        if original_hl <= DRY_THRESHOLD and original_hr <= DRY_THRESHOLD:
+            for k in range(3):
+                flux[e, k] = 0.0
+                right_flux[e, k] = 0.0
+            continue
+
+        hl, hr = original_hl, original_hr
+        hul, hvl, hur, hvr = state[left, 1], state[left, 2], state[right, 1], state[right, 2]
+        if reconstruct:
+            # depths above the highest bed of both sides, momentum keeping the velocity of the cell
+            hl = max(original_hl - max(bed[right] - bed[left], 0.0), 0.0)
+            hr = max(original_hr - max(bed[left] - bed[right], 0.0), 0.0)
+            ratio_l = hl / original_hl if original_hl > DRY_THRESHOLD else 0.0
+            ratio_r = hr / original_hr if original_hr > DRY_THRESHOLD else 0.0
+            hul, hvl, hur, hvr = hul * ratio_l, hvl * ratio_l, hur * ratio_r, hvr * ratio_r
+
+        wet_l, wet_r = hl > DRY_THRESHOLD, hr > DRY_THRESHOLD
+        if not wet_l and not wet_r:
+            flux[e, 0] = 0.0
+            flux[e, 1] = 0.0
+            flux[e, 2] = 0.0
+        else:
+            ul = hul / hl if wet_l else 0.0
+            vl = hvl / hl if wet_l else 0.0
+            ur = hur / hr if wet_r else 0.0
+            vr = hvr / hr if wet_r else 0.0
+
+            unl, utl = ul * nx + vl * ny, vl * nx - ul * ny
+            unr, utr = ur * nx + vr * ny, vr * nx - ur * ny
+            cl = math.sqrt(GRAVITY * (hl if wet_l else 0.0))
+            cr = math.sqrt(GRAVITY * (hr if wet_r else 0.0))
+
+            sl = min(unl - cl, unr - cr) if wet_l else unr - 2.0 * cr
+            sr = max(unl + cl, unr + cr) if wet_r else unl + 2.0 * cl
+
+            fl_h, fr_h = hl * unl, hr * unr
+            fl_m, fr_m = hl * unl * unl + 0.5 * GRAVITY * hl * hl, hr * unr * unr + 0.5 * GRAVITY * hr * hr
+            if sl >= 0.0:
+                f_h, f_m = fl_h, fl_m
+            elif sr <= 0.0:
+                f_h, f_m = fr_h, fr_m
+            else:
+                f_h = (sr * fl_h - sl * fr_h + sl * sr * (hr - hl)) / (sr - sl)
+                f_m = (sr * fl_m - sl * fr_m + sl * sr * (hr * unr - hl * unl)) / (sr - sl)
+            sm = (sl * hr * (unr - sr) - sr * hl * (unl - sl)) / (hr * (unr - sr) - hl * (unl - sl))
+            f_t = f_h * (utl if sm >= 0.0 else utr)
+
+            flux[e, 0] = f_h * lengths[e]
+            flux[e, 1] = (f_m * nx - f_t * ny) * lengths[e]
+            flux[e, 2] = (f_m * ny + f_t * nx) * lengths[e]
+
+        if reconstruct:
+            # hydrostatic pressure of every side above the reconstructed depth, times the length
+            pressure_r = (original_hr * original_hr - hr * hr) * (0.5 * GRAVITY) * lengths[e]
+            pressure_l = (original_hl * original_hl - hl * hl) * (0.5 * GRAVITY) * lengths[e]
+            right_flux[e, 0] = flux[e, 0]
+            right_flux[e, 1] = flux[e, 1] + pressure_r * nx
+            right_flux[e, 2] = flux[e, 2] + pressure_r * ny
+            flux[e, 1] = flux[e, 1] + pressure_l * nx
+            flux[e, 2] = flux[e, 2] + pressure_l * ny
+
+
+def scatter_residual(left_cells: np.ndarray, right_cells: np.ndarray, flux: np.ndarray, residual: np.ndarray,
+                     right_flux: np.ndarray | None = None):
+    """
+    See 'kernels.scatter_residual'
+    """
+    _scatter_residual(left_cells, right_cells, flux, flux if right_flux is None else right_flux, residual)
+
+
+@njit(cache=True)
+def _scatter_residual(left_cells: np.ndarray, right_cells: np.ndarray, flux: np.ndarray, right_flux: np.ndarray,
+                      residual: np.ndarray):
+    # the loop stays sequential: several edges write to the same cell,
+    # and keeping the accumulation order of the NumPy path keeps results identical
+    for e in range(len(left_cells)):
+        for k in range(flux.shape[1]):
+            residual[left_cells[e], k] -= flux[e, k]
+    for e in range(len(right_cells)):
+        for k in range(right_flux.shape[1]):
+            residual[right_cells[e], k] += right_flux[e, k]
+
+
+def euler_update(state: np.ndarray, residual: np.ndarray, surfaces: np.ndarray, delta: float,
+                 out: np.ndarray | None = None, workspace: Workspace | None = None) -> np.ndarray:
+    """
+    See 'kernels.euler_update', cells are processed in parallel without any work buffer
+    """
+    if out is None:
+        out = np.empty((len(surfaces), 3), dtype=np.float64)
+    _euler_update(state, residual, surfaces, delta, out)
+    return out
+
+
+@njit(parallel=True, error_model='numpy', cache=True)
+def _euler_update(state: np.ndarray, residual: np.ndarray, surfaces: np.ndarray, delta: float, new_state: np.ndarray):
+    for i in prange(len(surfaces)):
+        factor = delta / surfaces[i]
+        for k in range(3):
+            new_state[i, k] = state[i, k] + residual[i, k] * factor
+        if new_state[i, 0] <= DRY_THRESHOLD:
+            if new_state[i, 0] < 0.0:
+                new_state[i, 0] = 0.0
+            new_state[i, 1] = 0.0
+            new_state[i, 2] = 0.0
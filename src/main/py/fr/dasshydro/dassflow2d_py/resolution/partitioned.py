@@ -0,0 +1,251 @@
+import multiprocessing
+import traceback
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from dassflow2d_py.mesh.Mesh import Mesh
+from dassflow2d_py.mesh.connectivity import incidence_table
+from dassflow2d_py.mesh.partitioning import create_partitions
+from dassflow2d_py.resolution.Workspace import Workspace
+from dassflow2d_py.resolution.kernels import get_kernels
+
+
+# worker processes are spawned, forking a process running threads is not safe
+START_METHOD = "spawn"
+
+
+class PartitionData:
+    """
+    Static data of a subdomain, sent once to its worker: its owned cells, the edges of its owned cells
+    (including edges shared with other subdomains, whose other side is a halo cell) and their geometry
+    """
+
+    def __init__(self, owned: np.ndarray, edges: np.ndarray, left_cells: np.ndarray, right_cells: np.ndarray,
+                 normals: np.ndarray, lengths: np.ndarray, surfaces: np.ndarray, contributions: np.ndarray):
+        self.owned = owned
+        self.edges = edges
+        self.left_cells = left_cells
+        self.right_cells = right_cells
+        self.normals = normals
+        self.lengths = lengths
+        self.surfaces = surfaces
+        # padded edges of every owned cell, as indices in the signed fluxes of the local edges (see 'EdgeChunkExecutor')
+        self.contributions = contributions
+
+    @staticmethod
+    def create(owned: np.ndarray, incidence: tuple[np.ndarray, np.ndarray, np.ndarray], left_cells: np.ndarray,
+               right_cells: np.ndarray, normals: np.ndarray, lengths: np.ndarray, surfaces: np.ndarray) -> 'PartitionData':
+        """
+        Gather the data of a subdomain from the data of the whole mesh
+
+        Args:
+            owned (np.ndarray): sorted index of the real cells owned by the subdomain
+            incidence (tuple[np.ndarray, np.ndarray, np.ndarray]): edges of every cell, see 'connectivity.incidence_table'
+            left_cells (np.ndarray): index of the first cell of every edge
+            right_cells (np.ndarray): index of the second cell of every edge (ghost cells included)
+            normals (np.ndarray): unit normal of every edge
+            lengths (np.ndarray): length of every edge
+            surfaces (np.ndarray): surface of every real cell
+
+        Returns:
+            PartitionData: data of the subdomain
+        """
+        offsets, cell_edges, is_left = incidence
+        degrees = offsets[owned + 1] - offsets[owned]
+        # incidence entries of the owned cells, and their position in the edges of their cell
+        rows = np.repeat(np.arange(len(owned)), degrees)
+        positions = np.arange(int(degrees.sum())) - np.repeat(np.cumsum(degrees) - degrees, degrees)
+        entries = offsets[owned][rows] + positions
+        edges = np.unique(cell_edges[entries])
+        edge_number = len(edges)
+
+        # contributions in the order of the whole mesh incidence table, so sums are the same as the serial scatter
+        local_edges = np.searchsorted(edges, cell_edges[entries])
+        width = int(degrees.max()) if len(owned) else 0
+        contributions = np.full((width, len(owned)), 2 * edge_number, dtype=np.int64)
+        contributions[positions, rows] = np.where(is_left[entries], local_edges, edge_number + local_edges)
+
+        return PartitionData(owned, edges, left_cells[edges], right_cells[edges], normals[edges], lengths[edges],
+                             surfaces[owned], contributions)
+
+
+def _attach(name: str, shape: tuple[int, ...]) -> tuple[SharedMemory, np.ndarray]:
+    """
+    Attach to a shared state array created by the driver
+    """
+    memory = SharedMemory(name=name)
+    return memory, np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+
+
+def _run_worker(connection: Connection, state_name: str, updated_name: str, bed_name: str, shape: tuple[int, int],
+                data: PartitionData, backend: str):
+    """
+    Worker process of a subdomain: at every step, computes the fluxes of its edges from the shared state
+    (halo cells being read from the rows written by the driver for their owners), and writes the updated state
+    of its owned cells to the shared updated state
+    """
+    state_memory, state = _attach(state_name, shape)
+    updated_memory, updated = _attach(updated_name, shape)
+    bed_memory, shared_bed = _attach(bed_name, shape[:1])
+    kernels = get_kernels(backend)
+    edge_number, owned_number = len(data.edges), len(data.owned)
+    workspace = Workspace(edge_number, owned_number)
+    signed = np.zeros((2 * edge_number + 1, 3), dtype=np.float64)
+    gathered = np.empty((owned_number, 3), dtype=np.float64)
+    try:
+        while True:
+            message = connection.recv()
+            if message is None:
+                break
+            delta, with_bed = message
+            try:
+                bed, right_flux = (shared_bed, workspace.edgeBuffer("right_flux", 3)) if with_bed else (None, None)
+                flux = kernels.flux(state, data.left_cells, data.right_cells, data.normals, data.lengths,
+                                    workspace.edgeBuffer("flux", 3), workspace, bed, right_flux)
+                np.negative(flux, out=signed[:edge_number])
+                np.copyto(signed[edge_number:2 * edge_number], flux if right_flux is None else right_flux)
+                residual = workspace.cellBuffer("residual", 3)
+                residual.fill(0.0)
+                for column in data.contributions:
+                    np.take(signed, column, axis=0, out=gathered, mode='clip')
+                    np.add(residual, gathered, out=residual)
+                owned_state = np.take(state, data.owned, axis=0, out=workspace.cellBuffer("owned_state", 3), mode='clip')
+                new_state = kernels.update(owned_state, residual, data.surfaces, delta, workspace.cellBuffer("updated", 3), workspace)
+                updated[data.owned] = new_state
+                connection.send(None)
+            except Exception:
+                connection.send(traceback.format_exc())
+    finally:
+        del state, updated, shared_bed
+        state_memory.close()
+        updated_memory.close()
+        bed_memory.close()
+
+
+class PartitionedSolver:
+    """
+    Runs the flux and update kernels of an explicit euler step in worker processes, one per subdomain
+    of the mesh (see 'partitioning.create_partitions').
+
+    The conservative state of every cell, ghost cells included, the updated state and the bed elevation
+    are shared memory arrays:
+    the driver writes the state, every worker reads the rows of its owned cells and of its layer of halo cells,
+    then writes the updated rows of its owned cells. Halo values are exchanged through the shared state
+    at every step, the driver waiting for every worker before the next one.
+    Fluxes are elementwise and residuals are summed in the order of the serial scatter, so results are identical
+    to the serial step. Workers are started on first use and stopped by 'close'.
+    """
+
+    def __init__(self, mesh: Mesh, partition_number: int, backend: str, left_cells: np.ndarray, right_cells: np.ndarray,
+                 normals: np.ndarray, lengths: np.ndarray, surfaces: np.ndarray):
+        """
+        Args:
+            mesh (Mesh): mesh of the simulation
+            partition_number (int): number of subdomains, and of worker processes
+            backend (str): backend of the kernels run by the workers
+            left_cells (np.ndarray): index of the first cell of every edge
+            right_cells (np.ndarray): index of the second cell of every edge (ghost cells included)
+            normals (np.ndarray): unit normal of every edge
+            lengths (np.ndarray): length of every edge
+            surfaces (np.ndarray): surface of every real cell
+        """
+        self.cell_number = mesh.getCellNumber() + mesh.getBoundaryNumber()
+        self.backend = backend
+        self.partitions = create_partitions(mesh, partition_number)
+        incidence = incidence_table(left_cells, right_cells, self.cell_number)
+        self.partition_data = [
+            PartitionData.create(partition.owned, incidence, left_cells, right_cells, normals, lengths, surfaces)
+            for partition in self.partitions
+        ]
+        self.memories: list[SharedMemory] = []
+        self.processes: list = []
+        self.connections: list[Connection] = []
+        self.state: np.ndarray | None = None
+        self.updated: np.ndarray | None = None
+        self.bed: np.ndarray | None = None
+
+    def start(self):
+        """
+        Create the shared arrays and start the workers, if not started yet
+        """
+        if self.processes:
+            return
+        shape = (self.cell_number, 3)
+        size = max(1, self.cell_number * 3 * np.dtype(np.float64).itemsize)
+        bed_size = max(1, self.cell_number * np.dtype(np.float64).itemsize)
+        self.memories = [SharedMemory(create=True, size=size) for _ in range(2)] + [SharedMemory(create=True, size=bed_size)]
+        self.state, self.updated = (np.ndarray(shape, dtype=np.float64, buffer=memory.buf) for memory in self.memories[:2])
+        self.bed = np.ndarray(shape[:1], dtype=np.float64, buffer=self.memories[2].buf)
+        self.state.fill(0.0)
+        self.updated.fill(0.0)
+        self.bed.fill(0.0)
+
+        context = multiprocessing.get_context(START_METHOD)
+        for data in self.partition_data:
+            connection, worker_connection = context.Pipe()
+            process = context.Process(
+                target=_run_worker,
+                args=(worker_connection, *(memory.name for memory in self.memories), shape, data, self.backend),
+                daemon=True
+            )
+            process.start()
+            worker_connection.close()
+            self.processes.append(process)
+            self.connections.append(connection)
+
+    def getState(self) -> np.ndarray:
+        """
+        Get the shared state array, to be written before every step
+
+        Returns:
+            np.ndarray: conservative state of every cell, shape (cell number, 3)
+        """
+        self.start()
+        return self.state
+
+    def step(self, delta: float, bed: np.ndarray | None = None) -> np.ndarray:
+        """
+        Run an explicit euler step of every subdomain from the shared state, see 'kernels.euler_update'
+
+        Args:
+            delta (float): time step
+            bed (np.ndarray | None): bed elevation of every cell, copied to the shared bed, None for a flat bed
+
+        Raises:
+            RuntimeError: if a worker failed, with its traceback
+
+        Returns:
+            np.ndarray: shared updated state, whose real cell rows hold the new conservative state
+        """
+        self.start()
+        if bed is not None:
+            np.copyto(self.bed, bed)
+        for connection in self.connections:
+            connection.send((delta, bed is not None))
+        errors = [connection.recv() for connection in self.connections]
+        for error in errors:
+            if error is not None:
+                raise RuntimeError(f"a partition worker failed:\n{error}")
+        return self.updated
+
+    def close(self):
+        """
+        Stop the workers and release the shared arrays, they are started again if the solver is used afterwards
+        """
+        for connection in self.connections:
+            try:
+                connection.send(None)
+            except OSError:
+                pass
+        for process in self.processes:
+            process.join()
+        for connection in self.connections:
+            connection.close()
+        self.processes, self.connections = [], []
+        self.state, self.updated, self.bed = None, None, None
+        for memory in self.memories:
+            memory.close()
+            memory.unlink()
+        self.memories = []
@@ -161,6 +161,34 @@ class TestDischarge1(unittest.TestCase):
         expected_q = 3.372389 - (3.372389 - 3.003062) * (50000.0 - 46800.0) / (50400.0 - 46800.0)
         self.assertAlmostEqual(q, expected_q, places=6)
 
+    def test_interpolation_cursor_matches_full_search(self):
+
+        def full_search(t: float) -> float:
+            # reference: first interval containing t, searched from the beginning of the series
+            times = self.discharge.times
+            t0, t1 = times[0], times[1]
+            if t > times[-1]:
+                t0, t1 = times[-2], times[-1]
+            elif t >= times[0]:
+                for i in range(len(times) - 1):
+                    if times[i] <= t <= times[i + 1]:
+                        t0, t1 = times[i], times[i + 1]
+                        break
+            v0, v1 = self.discharge.data[t0], self.discharge.data[t1]
+            return v0 + (v1 - v0) * (t - t0) / (t1 - t0)
+
+        # forward steps crossing breakpoints, then going backward in time
+        query_times = [0.0, 100.0, 3600.0, 3600.5, 18000.0, 50000.0, 75600.0, 80000.0, 36000.0, 0.0, -10.0, 46800.0]
+        for t in query_times:
+            self.assertEqual(full_search(t), self.discharge.interpolate_dynamic_value(t))
+
+        # cursor survives a checkpoint
+        state = self.discharge.getCheckpointState()
+        other = Discharge1(self.config, [self.small_boundary], 1, 'discharg1', 2)
+        other.restoreCheckpointState(state)
+        self.assertEqual(self.discharge.cursor, other.cursor)
+        self.assertEqual(self.discharge.interpolate_dynamic_value(50000.0), other.interpolate_dynamic_value(50000.0))
+
     def test_update_distributes_q_in(self):
 
         # Get actual water depths from nodes
@@ -1,8 +1,11 @@
 import unittest
 from unittest.mock import MagicMock
 
+import numpy as np
+
 from dassflow2d_py.boundary.Wall import Wall
 from dassflow2d_py.mesh.Mesh import Boundary, BoundaryType, Cell
+from dassflow2d_py.mesh.Bathymetry import Bathymetry
 from dassflow2d_py.d2dtime.TimeStepState import TimeStepState, Node
 
 class TestWall(unittest.TestCase):
@@ -27,7 +30,7 @@ class TestWall(unittest.TestCase):
         self.boundaries = [self.boundary]
 
         # Mock bathymetry
-        self.bathymetry = {self.left_cell: 1.0, self.ghost_cell: 2.0}
+        self.bathymetry = Bathymetry.fromMapping({self.left_cell: 1.0, self.ghost_cell: 2.0})
 
         # Mock nodes
         self.left_node = MagicMock(spec=Node)
@@ -40,6 +43,7 @@ class TestWall(unittest.TestCase):
         # Mock state
         self.state = MagicMock(spec=TimeStepState)
         self.state.getNode.side_effect = lambda cell: self.left_node if cell == self.left_cell else self.ghost_node
+        self.state.getValues.return_value = None
 
         # Create Wall instance
         self.wall = Wall(self.config, self.boundaries)
@@ -53,5 +57,29 @@ class TestWall(unittest.TestCase):
         self.assertAlmostEqual(self.ghost_node.u, -4.0)  # uR = -uL
         self.assertAlmostEqual(self.ghost_node.v, 5.0)  # vR = vL
 
+    def test_update_array_state(self):
+        # two walls, the state rows are not the bathymetry order
+        left_cell, ghost_cell = MagicMock(spec=Cell), MagicMock(spec=Cell)
+        edge = MagicMock()
+        edge.getCells.return_value = [left_cell, ghost_cell]
+        edge.getGhostCell.return_value = ghost_cell
+        boundary = MagicMock(spec=Boundary)
+        boundary.getEdge.return_value = edge
+        wall = Wall(self.config, [self.boundary, boundary])
+        bathymetry = Bathymetry.fromMapping({self.left_cell: 1.0, left_cell: 0.5, self.ghost_cell: 2.0, ghost_cell: 0.0})
+        cells = [left_cell, self.left_cell, ghost_cell, self.ghost_cell]
+        values = np.array([[1.0, 2.0, -1.0], [3.0, 4.0, 5.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
+        state = TimeStepState.fromArray(values, cells)
+
+        wall.update(bathymetry, state, 0.0)
+        np.testing.assert_allclose(values[3], [3.0 + 1.0 - 2.0, -4.0, 5.0])
+        np.testing.assert_allclose(values[2], [1.0 + 0.5 - 0.0, -2.0, -1.0])
+        np.testing.assert_allclose(values[:2], [[1.0, 2.0, -1.0], [3.0, 4.0, 5.0]])
+
+        # rows are resolved once, later updates follow the state values
+        values[1, 0] = 6.0
+        wall.update(bathymetry, state, 0.0)
+        self.assertAlmostEqual(values[3, 0], 6.0 + 1.0 - 2.0)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import os
+import tempfile
+
+import numpy as np
+
+from dassflow2d_py.d2dtime.checkpoint import Checkpoint, read_checkpoint, write_checkpoint, CHECKPOINT_VERSION
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temporary_directory.name, "checkpoint.npz")
+        self.checkpoint = Checkpoint(
+            simulation_time=3600.0,
+            delta=0.0125,
+            h=np.array([1.0, 2.5, 0.1 + 0.2]),
+            u=np.array([0.0, -1.5, 1e-12]),
+            v=np.array([3.0, 0.25, -7.0]),
+            result_writer_state={"last_quotient": 12},
+            boundary_condition_states=[{}, {"cursor": 4}],
+            ids=np.array([7, 3]),
+            real_cell_number=2,
+            gauge_recorder_state=None
+        )
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_round_trip(self):
+        write_checkpoint(self.file_path, self.checkpoint)
+        checkpoint = read_checkpoint(self.file_path)
+
+        self.assertEqual(self.checkpoint.simulation_time, checkpoint.simulation_time)
+        self.assertEqual(self.checkpoint.delta, checkpoint.delta)
+        # bit-exact arrays
+        np.testing.assert_array_equal(self.checkpoint.h, checkpoint.h)
+        np.testing.assert_array_equal(self.checkpoint.u, checkpoint.u)
+        np.testing.assert_array_equal(self.checkpoint.v, checkpoint.v)
+        self.assertEqual(self.checkpoint.result_writer_state, checkpoint.result_writer_state)
+        self.assertEqual(self.checkpoint.boundary_condition_states, checkpoint.boundary_condition_states)
+        np.testing.assert_array_equal(self.checkpoint.ids, checkpoint.ids)
+        self.assertEqual(self.checkpoint.real_cell_number, checkpoint.real_cell_number)
+
+    def test_gauge_recorder_state(self):
+        gauge_state = {"columns": ["g_h", "g_zs"], "step_number": 7, "times": np.array([0.5, 1.0]), "values": np.array([[1.0, 1.5], [0.1 + 0.2, 2.0]])}
+        write_checkpoint(self.file_path, self.checkpoint._replace(gauge_recorder_state=gauge_state))
+        checkpoint = read_checkpoint(self.file_path)
+
+        self.assertEqual(["columns", "step_number", "times", "values"], sorted(checkpoint.gauge_recorder_state))
+        self.assertEqual(gauge_state["columns"], checkpoint.gauge_recorder_state["columns"])
+        self.assertEqual(7, checkpoint.gauge_recorder_state["step_number"])
+        np.testing.assert_array_equal(gauge_state["times"], checkpoint.gauge_recorder_state["times"])
+        np.testing.assert_array_equal(gauge_state["values"], checkpoint.gauge_recorder_state["values"])
+        # no gauge recorder
+        write_checkpoint(self.file_path, self.checkpoint)
+        self.assertIsNone(read_checkpoint(self.file_path).gauge_recorder_state)
+
+    def test_unsupported_version(self):
+        write_checkpoint(self.file_path, self.checkpoint)
+        with np.load(self.file_path) as data:
+            entries = {name: data[name] for name in data.files}
+        np.savez(self.file_path, **{**entries, "version": np.array(CHECKPOINT_VERSION + 1)})
+        with self.assertRaises(ValueError):
+            read_checkpoint(self.file_path)
+
+    def test_real_cell_number(self):
+        # real cells come first, each with its ID
+        for checkpoint in (self.checkpoint._replace(real_cell_number=3), self.checkpoint._replace(real_cell_number=4, ids=np.arange(4))):
+            write_checkpoint(self.file_path, checkpoint)
+            with self.assertRaises(ValueError):
+                read_checkpoint(self.file_path)
+
+    def test_overwrite_leaves_no_temporary_file(self):
+        write_checkpoint(self.file_path, self.checkpoint)
+        write_checkpoint(self.file_path, self.checkpoint._replace(simulation_time=7200.0))
+
+        self.assertEqual(7200.0, read_checkpoint(self.file_path).simulation_time)
+        self.assertEqual(["checkpoint.npz"], os.listdir(self.temporary_directory.name))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import math
+import unittest
+
+import numpy as np
+
+from dassflow2d_py.d2dtime.LocalTimeStepping import LocalTimeStepScheduler
+from dassflow2d_py.d2dtime.delta import get_cell_deltas, GRAVITY
+
+
+class TestLocalTimeStepScheduler(unittest.TestCase):
+
+    def setUp(self):
+        # chain of 8 cells, edge i joins cells i and i+1
+        self.cell_number = 8
+        self.left = np.arange(self.cell_number - 1)
+        self.right = np.arange(1, self.cell_number)
+        self.scheduler = LocalTimeStepScheduler(self.left, self.right, self.cell_number, levels=4)
+
+    def testClassify(self):
+        deltas = np.array([1.0, 1.5, 2.0, 8.0, 8.0, 8.0, 30.0, math.inf])
+        self.scheduler.classify(deltas, 0.1)
+        self.assertEqual(self.scheduler.getBaseDelta(), 1.0)
+        # neighbor classes differ by at most one, the dry cell is in the coarsest class
+        np.testing.assert_array_equal(self.scheduler.getCellLevels(), [0, 0, 1, 2, 3, 3, 3, 3])
+        self.assertEqual(len(self.scheduler.getSubsteps()), 8)
+        self.assertEqual(self.scheduler.getCycleDelta(), 8.0)
+        self.assertAlmostEqual(self.scheduler.getWorkRatio(), (2 + 0.5 + 0.25 + 4 * 0.125) / 8)
+
+    def testAllDry(self):
+        self.scheduler.classify(np.full(self.cell_number, math.inf), 0.1)
+        self.assertEqual(self.scheduler.getBaseDelta(), 0.1)
+        self.assertEqual(self.scheduler.getCycleDelta(), 0.1 * 8)
+
+    def testUniform(self):
+        self.scheduler.classify(np.full(self.cell_number, 0.5), 0.1)
+        self.assertEqual(len(self.scheduler.getSubsteps()), 1)
+        self.assertEqual(self.scheduler.getCycleDelta(), 0.5)
+        self.assertEqual(self.scheduler.getWorkRatio(), 1.0)
+
+    def testConservativeCycle(self):
+        rng = np.random.default_rng(3)
+        self.scheduler.classify(rng.uniform(1.0, 10.0, self.cell_number), 0.1)
+        edge_flux = rng.random((len(self.left), 2))
+        applied = np.zeros((self.cell_number, 2))
+        updates = np.zeros(self.cell_number, dtype=np.int64)
+
+        def kernel(time_offset: float, edges: np.ndarray) -> np.ndarray:
+            return edge_flux[edges]
+
+        def apply(time_offset: float, cells: np.ndarray, residual: np.ndarray):
+            applied[cells] += residual
+            updates[cells] += 1
+            # cells complete their step at multiples of their own delta
+            levels = self.scheduler.getCellLevels()[cells]
+            np.testing.assert_allclose(np.mod(time_offset, 2.0 ** levels * self.scheduler.getBaseDelta()), 0.0, atol=1e-12)
+
+        self.scheduler.advance(kernel, apply, 2)
+
+        # constant fluxes integrated over the cycle, whatever the class of every cell
+        expected = np.zeros((self.cell_number, 2))
+        np.subtract.at(expected, self.left, edge_flux * self.scheduler.getCycleDelta())
+        np.add.at(expected, self.right, edge_flux * self.scheduler.getCycleDelta())
+        np.testing.assert_allclose(applied, expected, rtol=1e-12)
+        np.testing.assert_allclose(applied.sum(axis=0), 0.0, atol=1e-12)
+        cycle_level = int(np.log2(len(self.scheduler.getSubsteps())))
+        np.testing.assert_array_equal(updates, 2 ** (cycle_level - self.scheduler.getCellLevels()))
+
+
+class TestCellDeltas(unittest.TestCase):
+
+    def testCellDeltas(self):
+        h = np.array([1.0, 0.0, 4.0])
+        u = np.array([3.0, 1.0, 0.0])
+        v = np.array([4.0, 1.0, 0.0])
+        lengths = np.array([2.0, 2.0, 1.0])
+        deltas = get_cell_deltas(h, u, v, lengths, cfl=0.5)
+        self.assertAlmostEqual(deltas[0], 0.5 * 2.0 / (5.0 + math.sqrt(GRAVITY)))
+        self.assertEqual(deltas[1], math.inf)
+        self.assertAlmostEqual(deltas[2], 0.5 / math.sqrt(4.0 * GRAVITY))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+import numpy as np
+
+from dassflow2d_py.d2dtime.TimeStepState import TimeStepState
+from mesh_factories import create_grid_mesh
+
+
+class TestTimeStepState(unittest.TestCase):
+
+    def setUp(self):
+        self.cells = list(create_grid_mesh(3).getCells())
+        self.values = np.arange(len(self.cells) * 3, dtype=np.float64).reshape(-1, 3)
+        self.state = TimeStepState.fromArray(self.values, self.cells)
+
+    def testFromArray(self):
+        self.assertIs(self.state.getValues(), self.values)
+        node = self.state.getNode(self.cells[2])
+        self.assertEqual((node.h, node.u, node.v), (6.0, 7.0, 8.0))
+        # nodes and array see each other's changes
+        node.u = -1.0
+        self.assertEqual(self.values[2, 1], -1.0)
+        self.values[2, 0] = 10.0
+        self.assertEqual(node.h, 10.0)
+        h, u, v = self.state.toArrays(self.cells)
+        np.testing.assert_array_equal(np.column_stack((h, u, v)), self.values)
+
+    def testCopy(self):
+        snapshot = self.state.copy()
+        self.assertIsNot(snapshot.getValues(), self.values)
+        self.state.getNode(self.cells[0]).h = 5.0
+        self.assertEqual(snapshot.getNode(self.cells[0]).h, 0.0)
+        self.assertIsNone(TimeStepState({}).getValues())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import os
+import tempfile
+
+from dassflow2d_py.input.BathymetryReader import BathymetryReader
+from dassflow2d_py.input.DassflowMeshReader import DassflowMeshReader
+from dassflow2d_py.mesh.MeshImpl import MeshImpl, RawVertex, RawCell
+
+
+def plane(x: float, y: float) -> float:
+    return 2.0 + 0.5 * x - 0.25 * y
+
+
+class TestBathymetryReader(unittest.TestCase):
+
+    def setUp(self):
+        mesh_path = os.path.join('src', 'test', 'resources', 'mesh', 'mesh1.geo')
+        raw_info = DassflowMeshReader().read(mesh_path)
+        self.mesh = MeshImpl.createFromPartialInformation(*(*raw_info[:4], {}))
+        self.reader = BathymetryReader()
+        self.temp_files = []
+
+    def tearDown(self):
+        for temp_file in self.temp_files:
+            os.unlink(temp_file)
+
+    def write_temp_file(self, content: str) -> str:
+        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False)
+        temp_file.write(content)
+        temp_file.close()
+        self.temp_files.append(temp_file.name)
+        return temp_file.name
+
+    def test_read_vertex_bathymetry(self):
+        vertex_bathymetry = {
+            vertex.getID(): plane(*vertex.getCoordinates())
+            for vertex in self.mesh.getVertices()
+        }
+        content = "# vertex bathymetry\n"
+        content += f"{len(vertex_bathymetry)}\n"
+        for vertex_id, z in vertex_bathymetry.items():
+            content += f"{vertex_id} {z}\n"
+
+        cell_bathymetry = self.reader.read(self.write_temp_file(content), self.mesh)
+
+        self.assertEqual(len(cell_bathymetry), self.mesh.getCellNumber())
+        for cell, z in zip(self.mesh.getCells(), cell_bathymetry):
+            # barycentric interpolation is exact for a linear function
+            self.assertAlmostEqual(z, plane(*cell.getGravityCenter()))
+
+    def test_vertex_bathymetry_quadrilateral(self):
+        raw_vertices = [
+            RawVertex(1, 0.0, 0.0),
+            RawVertex(2, 2.0, 0.0),
+            RawVertex(3, 3.0, 1.0),
+            RawVertex(4, 0.0, 1.0)
+        ]
+        raw_cells = [RawCell(1, 1, 2, 3, 4)]
+        mesh = MeshImpl.createFromPartialInformation(raw_vertices, raw_cells, [], [], {})
+
+        # centroid (1.25, 0.5) lies in the (v1, v3, v4) half of the quadrilateral
+        cell_bathymetry = self.reader.interpolateVertexBathymetry(mesh, {1: 0.0, 2: 2.0, 3: 4.0, 4: 1.0})
+
+        self.assertAlmostEqual(cell_bathymetry[0], 1.75)
+
+    def test_missing_vertex_bathymetry(self):
+        with self.assertRaises(ValueError):
+            self.reader.interpolateVertexBathymetry(self.mesh, {1: 0.0})
+
+    def test_read_grid_bathymetry(self):
+        ncols, nrows, cellsize = 6, 4, 0.5
+        xllcorner, yllcorner = -0.5, -0.5
+        content = f"ncols {ncols}\nnrows {nrows}\nxllcorner {xllcorner}\nyllcorner {yllcorner}\n"
+        content += f"cellsize {cellsize}\nNODATA_value -9999\n"
+        for row in range(nrows):
+            # first row is the northernmost
+            y = yllcorner + (nrows - row - 0.5) * cellsize
+            xs = [xllcorner + (col + 0.5) * cellsize for col in range(ncols)]
+            content += " ".join(str(plane(x, y)) for x in xs) + "\n"
+
+        cell_bathymetry = self.reader.read(self.write_temp_file(content), self.mesh)
+
+        for cell, z in zip(self.mesh.getCells(), cell_bathymetry):
+            # bilinear sampling is exact for a linear function
+            self.assertAlmostEqual(z, plane(*cell.getGravityCenter()))
+
+    def test_grid_errors(self):
+        content = "ncols 2\nnrows 2\nxllcorner 10.0\nyllcorner 10.0\ncellsize 1.0\n1 2\n3 4\n"
+        with self.assertRaises(ValueError):
+            self.reader.read(self.write_temp_file(content), self.mesh)
+
+        content = "ncols 2\nnrows 2\nxllcorner 0.0\nyllcorner 0.0\ncellsize 1.0\nNODATA_value -9999\n1 -9999\n3 4\n"
+        with self.assertRaises(ValueError):
+            self.reader.read(self.write_temp_file(content), self.mesh)
+
+
+if __name__ == '__main__':
+    unittest.main()
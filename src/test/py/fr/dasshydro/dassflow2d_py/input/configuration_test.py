@@ -2,8 +2,9 @@ import unittest
 import os
 
 from dassflow2d_py.input.Configuration import Configuration
+from dassflow2d_py.input.MeshReader import MeshFormat
 from dassflow2d_py.resolution.ResolutionMethod import TemporalScheme, SpatialScheme
-from dassflow2d_py.output.ResultWriter import OutputMode
+from dassflow2d_py.output.OutputMode import OutputMode
 
 class TestConfiguration(unittest.TestCase):
 
@@ -59,6 +60,7 @@ class TestConfiguration(unittest.TestCase):
         self.assertEqual(self.config.getDeltaToWrite(), delta_to_write, "delta to write is not stored correctly")
         self.assertEqual(self.config.isDeltaAdaptive(), is_delta_adaptive, "whether or not the delta is adaptive is not stored correctly")
         self.assertEqual(self.config.getDefaultDelta(), default_delta, "default delta is not stored correctly")
+        self.assertEqual(self.config.getOutputModes(), [output_mode.value], "output mode is not stored correctly")
 
     def testUpdateValues(self):
         # Initial state
@@ -80,6 +82,54 @@ class TestConfiguration(unittest.TestCase):
         self.config.updateValues({'default-delta': current_value}, None)
         self.assertEqual(self.config.getDefaultDelta(), current_value)
 
+    def testDeltaAdaptive(self):
+        # command line values are strings, 'False' must not be truthy
+        self.assertFalse(self.config.isDeltaAdaptive())
+        self.config.updateValues({'is-delta-adaptive': 'False'}, None)
+        self.assertFalse(self.config.isDeltaAdaptive())
+        self.config.updateValues({'is-delta-adaptive': 'true'}, None)
+        self.assertTrue(self.config.isDeltaAdaptive())
+        self.config.updateValues({'is-delta-adaptive': False}, None)
+        self.assertFalse(self.config.isDeltaAdaptive())
+
+    def testOutputModes(self):
+        # comma separated names, or a yaml list
+        self.config.updateValues({'output-mode': 'hdf5, vtk'}, None)
+        self.assertEqual(self.config.getOutputModes(), ['hdf5', 'vtk'])
+        self.config.updateValues({'output-mode': ['gnuplot', 'tecplot']}, None)
+        self.assertEqual(self.config.getOutputModes(), ['gnuplot', 'tecplot'])
+        with self.assertRaises(ValueError):
+            self.config.updateValues({'output-mode': 'hdf5,unknown'}, None)
+
+    def testMeshFormat(self):
+        self.assertEqual(self.config.getMeshFormat(), MeshFormat.AUTO)
+        self.config.updateValues({'mesh-format': 'gmsh'}, None)
+        self.assertEqual(self.config.getMeshFormat(), MeshFormat.GMSH)
+        with self.assertRaises(ValueError):
+            self.config.updateValues({'mesh-format': 'stl'}, None)
+
+    def testKernelBackend(self):
+        self.assertIsNone(self.config.getKernelBackend())
+        self.config.updateValues({'kernel-backend': 'numpy'}, None)
+        self.assertEqual(self.config.getKernelBackend(), 'numpy')
+        with self.assertRaises(ValueError):
+            self.config.updateValues({'kernel-backend': 'fortran'}, None)
+        self.assertIsNone(self.config.getThreadNumber())
+        self.config.updateValues({'thread-number': '4'}, None)
+        self.assertEqual(self.config.getThreadNumber(), 4)
+        self.assertEqual(self.config.getPartitionNumber(), 1)
+        self.config.updateValues({'partition-number': '3'}, None)
+        self.assertEqual(self.config.getPartitionNumber(), 3)
+
+    def testOutputCompression(self):
+        self.assertEqual(self.config.getOutputCompression(), '')
+        self.config.updateValues({'output-compression': 'gz'}, None)
+        self.assertEqual(self.config.getOutputCompression(), '.gz')
+        self.config.updateValues({'output-compression': 'none'}, None)
+        self.assertEqual(self.config.getOutputCompression(), '')
+        with self.assertRaises(ValueError):
+            self.config.updateValues({'output-compression': 'zip'}, None)
+
     def testLoadFromFile(self):
         test_config_path = os.path.join('src', 'test', 'resources', 'input', 'test_config.yml')
         self.config.update_from_file(test_config_path, None)
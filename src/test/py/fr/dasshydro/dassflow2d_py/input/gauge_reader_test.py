@@ -0,0 +1,45 @@
+import unittest
+import os
+import tempfile
+
+import numpy as np
+
+from dassflow2d_py.input.GaugeReader import GaugeReader
+
+
+class TestGaugeReader(unittest.TestCase):
+
+    def setUp(self):
+        self.reader = GaugeReader()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temporary_directory.name, "gauges.yml")
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def write(self, content: str):
+        with open(self.file_path, "w") as file:
+            file.write(content)
+
+    def test_read_demo(self):
+        gauges = self.reader.read(os.path.join('docs', 'demo', 'gauges.yml'))
+        self.assertEqual(["center", "section"], [gauge.name for gauge in gauges])
+        self.assertFalse(gauges[0].is_line)
+        np.testing.assert_array_equal([[1.2, 0.4]], gauges[0].points)
+        self.assertTrue(gauges[1].is_line)
+        self.assertEqual((2, 2), gauges[1].points.shape)
+
+    def test_invalid_gauges(self):
+        for content in (
+            "gauges:\n  - name: a\n    line: [[0.0, 0.0]]\n",
+            "gauges:\n  - name: a\n",
+            "gauges:\n  - name: a\n    point: [0.0, 0.0, 1.0]\n",
+            "gauges:\n  - name: a\n    point: [0.0, 0.0]\n  - name: a\n    point: [1.0, 0.0]\n",
+        ):
+            self.write(content)
+            with self.assertRaises(ValueError):
+                self.reader.read(self.file_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+import os
+import gzip
+import tempfile
+
+import numpy as np
+
+from dassflow2d_py.input.GmshMeshReader import GmshMeshReader
+from dassflow2d_py.input.MeshReader import MeshFormat, mesh_format_of
+from dassflow2d_py.mesh.Mesh import RawVertex, RawCell, RawInlet, RawOutlet, BoundaryType
+from dassflow2d_py.mesh.MeshImpl import MeshImpl
+
+
+# node tag: x, y, z
+NODES = {1: (0.0, 0.0, 1.0), 2: (1.0, 0.0, 2.0), 3: (2.0, 0.0, 3.0), 4: (0.0, 1.0, 4.0), 5: (1.0, 1.0, 5.0), 6: (2.0, 1.0, 6.0)}
+# physical group tag: name, curve entities are tagged like their physical group
+PHYSICAL_NAMES = {1: "inlet", 2: "Outlet", 3: "wall"}
+
+
+def write_gmsh_mesh(file_path: str, byte_order: str = '<', parametric: bool = False, header: str = "4.1 1 8"):
+    """
+    Write a gmsh v4.1 binary mesh of the rectangle [0, 2]x[0, 1]: two triangles and a quadrangle,
+    an inlet line on the left side, an outlet line on the right side and a wall line on the bottom side
+    """
+    def sizes(*values):
+        return np.array(values, dtype=f'{byte_order}u8').tobytes()
+
+    def ints(*values):
+        return np.array(values, dtype=f'{byte_order}i4').tobytes()
+
+    def doubles(*values):
+        return np.array(values, dtype=f'{byte_order}f8').tobytes()
+
+    content = f"$MeshFormat\n{header}\n".encode() + ints(1) + b"\n$EndMeshFormat\n"
+    content += f"$PhysicalNames\n{len(PHYSICAL_NAMES) + 1}\n".encode()
+    content += "".join(f'1 {tag} "{name}"\n' for tag, name in PHYSICAL_NAMES.items()).encode()
+    content += b'2 4 "domain"\n$EndPhysicalNames\n'
+
+    # entities: curves 1 to 3 in their physical group, surface 1 in the domain
+    content += b"$Entities\n" + sizes(0, 3, 1, 0)
+    for tag in PHYSICAL_NAMES:
+        content += ints(tag) + doubles(0, 0, 0, 2, 1, 0) + sizes(1) + ints(tag) + sizes(0)
+    content += ints(1) + doubles(0, 0, 0, 2, 1, 0) + sizes(1) + ints(4) + sizes(3) + ints(1, 2, 3)
+    content += b"\n$EndEntities\n"
+
+    # nodes: a block on the surface and a block on a curve
+    content += b"$Nodes\n" + sizes(2, 6, 1, 6)
+    for dimension, tags in ((2, [1, 2, 3, 4]), (1, [5, 6])):
+        content += ints(dimension, 1, int(parametric)) + sizes(len(tags)) + sizes(*tags)
+        for tag in tags:
+            content += doubles(*NODES[tag], *([0.5] * dimension if parametric else []))
+    content += b"\n$EndNodes\n"
+
+    # elements: (entity dimension, entity tag, type, [tag and nodes of every element])
+    blocks: list[tuple[int, int, int, list[tuple[int, ...]]]] = [
+        (2, 1, 2, [(1, 1, 2, 5), (3, 1, 4, 5)]),
+        (2, 1, 3, [(2, 2, 3, 6, 5)]),
+        (1, 1, 1, [(4, 4, 1)]),
+        (1, 2, 1, [(5, 3, 6)]),
+        (1, 3, 1, [(6, 1, 2)]),
+        (0, 1, 15, [(7, 1)])
+    ]
+    content += b"$Elements\n" + sizes(len(blocks), 7, 1, 7)
+    for dimension, entity, element_type, elements in blocks:
+        content += ints(dimension, entity, element_type) + sizes(len(elements))
+        content += sizes(*(value for element in elements for value in element))
+    content += b"\n$EndElements\n"
+
+    opener = gzip.open if file_path.endswith('.gz') else open
+    with opener(file_path, 'wb') as file:
+        file.write(content)
+
+
+class TestGmshMeshReader(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "mesh.msh")
+        write_gmsh_mesh(self.file_path)
+        self.reader = GmshMeshReader()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def testReadMesh(self):
+        raw_vertices, raw_cells, inlet, outlet, vertex_bathymetry, cell_bathymetry = self.reader.read(self.file_path)
+        self.assertEqual(raw_vertices, [RawVertex(tag, x, y) for tag, (x, y, _) in NODES.items()])
+        # triangles are closed by their first vertex
+        self.assertEqual(raw_cells, [RawCell(1, 1, 2, 5, 1), RawCell(3, 1, 4, 5, 1), RawCell(2, 2, 3, 6, 5)])
+        self.assertEqual(vertex_bathymetry, {tag: z for tag, (_, _, z) in NODES.items()})
+        self.assertEqual(cell_bathymetry, {1: 8.0 / 3.0, 3: 10.0 / 3.0, 2: 4.0})
+        # physical groups are matched by name, their tag is the group number
+        self.assertEqual(inlet, [RawInlet(3, 2, 10.0 / 3.0, 1)])
+        self.assertEqual(outlet, [RawOutlet(2, 3, 4.0, 2)])
+
+    def testBoundaryTypes(self):
+        raw_info = self.reader.read(self.file_path)
+        mesh = MeshImpl.createFromPartialInformation(*(*raw_info[:4], {}))
+        boundary_types = {}
+        for boundary in mesh.getBoundaries():
+            vertex_ids = tuple(sorted(vertex.getID() for vertex in boundary.getEdge().getVertices()))
+            boundary_types[vertex_ids] = boundary.getType()
+        self.assertEqual(len(boundary_types), 6)
+        self.assertEqual(boundary_types[(1, 4)], BoundaryType.INFLOW)
+        self.assertEqual(boundary_types[(3, 6)], BoundaryType.OUTFLOW)
+        self.assertEqual(boundary_types[(1, 2)], BoundaryType.WALL)
+        self.assertEqual(boundary_types[(4, 5)], BoundaryType.WALL)
+
+    def testByteOrderAndParametricNodes(self):
+        expected = self.reader.read(self.file_path)
+        file_path = os.path.join(self.temp_dir.name, "big_endian.msh")
+        write_gmsh_mesh(file_path, byte_order='>', parametric=True)
+        self.assertEqual(self.reader.read(file_path), expected)
+
+    def testCompressedMesh(self):
+        expected = self.reader.read(self.file_path)
+        file_path = os.path.join(self.temp_dir.name, "mesh.msh.gz")
+        write_gmsh_mesh(file_path)
+        self.assertEqual(self.reader.read(file_path), expected)
+
+    def testUnsupportedFiles(self):
+        for header in ("4.1 0 8", "2.2 1 8"):
+            write_gmsh_mesh(self.file_path, header=header)
+            with self.assertRaises(ValueError, msg=header):
+                self.reader.read(self.file_path)
+
+    def testMeshFormat(self):
+        self.assertEqual(mesh_format_of("mesh.msh"), MeshFormat.GMSH)
+        self.assertEqual(mesh_format_of("mesh.MSH.xz"), MeshFormat.GMSH)
+        self.assertEqual(mesh_format_of("mesh.geo"), MeshFormat.DASSFLOW)
+        self.assertEqual(mesh_format_of("mesh.geo.gz"), MeshFormat.DASSFLOW)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+import os
+import glob
+import tempfile
+import yaml
+
+import h5py #type: ignore
+import numpy as np
+
+from dassflow2d_py.input.InitialStateReader import InitialStateReader
+from dassflow2d_py.input.file_reading import COMPRESSION_OPENERS
+from dassflow2d_py.d2dtime.checkpoint import Checkpoint, write_checkpoint
+
+class TestInitialStateReader(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_path = os.path.join('src', 'test', 'resources', 'input')
+        cls.test_files = glob.glob(os.path.join(cls.base_path, 'dof_init*.txt'))
+        cls.reader = InitialStateReader()
+        # Create a list of (test_file, oracle_file) tuples
+        cls.test_cases = []
+        for test_file in cls.test_files:
+            filename = os.path.basename(test_file).split('.')[0]
+            oracle_file = os.path.join(cls.base_path, f'{filename}.orcl')
+            cls.test_cases.append((test_file, oracle_file))
+
+    def testRead(self):
+        for test_file, oracle_file in self.test_cases:
+            with open(oracle_file, 'r') as f:
+                oracle_data = yaml.safe_load(f)
+                number_of_cells = oracle_data['header']['number_of_cells']
+
+            h, u, v = self.reader.read(test_file, number_of_cells)
+            self.assertEqual(len(h), number_of_cells)
+
+            for i in range(number_of_cells):
+                expected_h = oracle_data['nodes'][i]['h']
+                expected_u = oracle_data['nodes'][i]['u']
+                expected_v = oracle_data['nodes'][i]['v']
+
+                self.assertAlmostEqual(h[i], expected_h)
+                self.assertAlmostEqual(u[i], expected_u)
+                self.assertAlmostEqual(v[i], expected_v)
+
+    def testReadHdf5LastSnapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "results.hdf5")
+            with h5py.File(file_path, "w") as hdf:
+                for time, offset in ((10.0, 0.0), (100.0, 1.0), (20.0, 2.0)):
+                    group = hdf.create_group(f"time_{time:.6e}")
+                    group.create_dataset("ids", data=[2, 1, 3])
+                    group.create_dataset("h", data=[offset + 0.2, offset + 0.1, offset + 0.3])
+                    group.create_dataset("u", data=[2.0, 1.0, 3.0])
+                    group.create_dataset("v", data=[-2.0, -1.0, -3.0])
+
+            h, u, v = self.reader.read(file_path, 3)
+            np.testing.assert_array_equal(h, [1.1, 1.2, 1.3])
+            np.testing.assert_array_equal(u, [1.0, 2.0, 3.0])
+            np.testing.assert_array_equal(v, [-1.0, -2.0, -3.0])
+
+            with self.assertRaises(ValueError):
+                self.reader.read(file_path, 4)
+
+    def testReadCheckpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "checkpoint.npz")
+            # two real cells followed by one ghost cell
+            write_checkpoint(file_path, Checkpoint(
+                1.0, 0.1, np.array([1.0, 2.0, 9.0]), np.array([0.5, 0.25, 9.0]), np.array([0.0, 1.0, 9.0]), {}, [],
+                ids=np.array([1, 2]), real_cell_number=2, gauge_recorder_state=None
+            ))
+
+            h, u, v = self.reader.read(file_path, 2)
+            self.assertEqual([(1.0, 0.5, 0.0), (2.0, 0.25, 1.0)], list(zip(h.tolist(), u.tolist(), v.tolist())))
+
+            with self.assertRaises(ValueError):
+                self.reader.read(file_path, 5)
+
+    def testReadCheckpointCellNumberMismatch(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "checkpoint.npz")
+            # two real cells followed by one ghost cell
+            write_checkpoint(file_path, Checkpoint(
+                1.0, 0.1, np.array([1.0, 2.0, 9.0]), np.zeros(3), np.zeros(3), {}, [], ids=np.array([1, 2]), real_cell_number=2,
+                gauge_recorder_state=None
+            ))
+            # a mesh of three cells must not take the ghost cell for a real one
+            with self.assertRaises(ValueError):
+                self.reader.read(file_path, 3)
+            with self.assertRaises(ValueError):
+                self.reader.read(file_path, 1)
+
+
+    def testReadTextBlocks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "dof_init.txt")
+            with open(file_path, "w") as file:
+                file.write("# h u v\n1.0 0.5 0.25\n\n! comment\n2.0 0.0 -1.0 # inline comment\n   # indented comment\n3.0 1.0 1.0\n")
+
+            h, u, v = self.reader.read(file_path, 3)
+            np.testing.assert_array_equal(h, [1.0, 2.0, 3.0])
+            np.testing.assert_array_equal(u, [0.5, 0.0, 1.0])
+            np.testing.assert_array_equal(v, [0.25, -1.0, 1.0])
+            self.assertTrue(h.flags.c_contiguous)
+
+            with self.assertRaises(EOFError):
+                self.reader.read(file_path, 4)
+
+    def testReadCompressed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for extension, opener in COMPRESSION_OPENERS.items():
+                file_path = os.path.join(directory, f"dof_init.txt{extension}")
+                with opener(file_path, "wt") as file:
+                    file.write("# h u v\n1.0 0.5 0.25\n2.0 0.0 -1.0\n")
+
+                h, u, v = self.reader.read(file_path, 2)
+                np.testing.assert_array_equal(h, [1.0, 2.0])
+                np.testing.assert_array_equal(v, [0.25, -1.0])
+
+    def testReadRenumberedCheckpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "checkpoint.npz")
+            # real cells stored in the internal ordering of a renumbered mesh
+            write_checkpoint(file_path, Checkpoint(
+                1.0, 0.1, np.array([3.0, 1.0, 2.0, 9.0]), np.zeros(4), np.zeros(4), {}, [], ids=np.array([3, 1, 2]),
+                real_cell_number=3, gauge_recorder_state=None
+            ))
+
+            h, _, _ = self.reader.read(file_path, 3)
+            np.testing.assert_array_equal(h, [1.0, 2.0, 3.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 import os
 import tempfile
 from dassflow2d_py.input.DassflowMeshReader import DassflowMeshReader
+from dassflow2d_py.input.file_reading import COMPRESSION_OPENERS
 from dassflow2d_py.mesh.Mesh import RawVertex, RawCell, RawInlet, RawOutlet
 
 class TestDassflowMeshReader(unittest.TestCase):
@@ -84,6 +85,16 @@ class TestDassflowMeshReader(unittest.TestCase):
         }
         self.assertEqual(expected_cell_bathymetry, cell_bathymetry)
 
+    def test_read_compressed_mesh_file(self):
+        """Test that compressed mesh files are read like plain ones"""
+        expected = self.reader.read(self.temp_file.name)
+        with tempfile.TemporaryDirectory() as directory:
+            for extension, opener in COMPRESSION_OPENERS.items():
+                file_path = os.path.join(directory, f"mesh.geo{extension}")
+                with opener(file_path, 'wt') as file:
+                    file.write(self.test_mesh_content)
+                self.assertEqual(self.reader.read(file_path), expected, f"{extension} mesh file")
+
     def test_vertex_coordinates(self):
         """Test that vertex coordinates are correctly read"""
         raw_info = self.reader.read(self.temp_file.name)
@@ -0,0 +1,94 @@
+import unittest
+import threading
+from typing import cast
+
+from dassflow2d_py.ShallowWaterModel import LoopListener, LoopSubscription, LoopWindow
+from dassflow2d_py.d2dtime.TimeStepState import TimeStepState, Node
+from dassflow2d_py.mesh.Mesh import Cell
+
+
+# the subscription never looks at cells
+CELL = cast(Cell, object())
+
+
+class RecordingListener(LoopListener):
+
+    def __init__(self):
+        self.calls = []
+        self.windows: list[LoopWindow] = []
+        self.threads = set()
+
+    def endOfLoop(self, current_delta, current_state, current_simulation_time):
+        self.calls.append((current_delta, current_state.getNode(CELL).h, current_simulation_time))
+        self.threads.add(threading.get_ident())
+
+    def endOfWindow(self, window, current_state, current_simulation_time):
+        self.windows.append(window)
+        super().endOfWindow(window, current_state, current_simulation_time)
+
+
+class FailingListener(LoopListener):
+
+    def endOfLoop(self, current_delta, current_state, current_simulation_time):
+        raise RuntimeError("listener failure")
+
+
+class TestLoopSubscription(unittest.TestCase):
+
+    def run_loops(self, subscription: LoopSubscription, deltas: list[float]):
+        # the node is updated in place, like the solver does with boundary conditions
+        node = Node(0.0, 0.0, 0.0)
+        state = TimeStepState({CELL: node})
+        time = 0.0
+        subscription.start(time)
+        for step, delta in enumerate(deltas):
+            time += delta
+            node.h = float(step + 1)
+            subscription.endOfLoop(delta, state, time)
+        subscription.finish(deltas[-1], state, time)
+
+    def test_every_loop_by_default(self):
+        listener = RecordingListener()
+        self.run_loops(LoopSubscription(listener), [1.0] * 4)
+        self.assertEqual([1.0, 2.0, 3.0, 4.0], [h for _, h, _ in listener.calls])
+
+    def test_every_steps(self):
+        listener = RecordingListener()
+        self.run_loops(LoopSubscription(listener, every_steps=3), [1.0] * 10)
+        # last loops are reported at the end of the run
+        self.assertEqual([3.0, 6.0, 9.0, 10.0], [h for _, h, _ in listener.calls])
+
+    def test_every_time(self):
+        listener = RecordingListener()
+        self.run_loops(LoopSubscription(listener, every_time=1.0), [0.4] * 6)
+        self.assertEqual([3.0, 5.0, 6.0], [h for _, h, _ in listener.calls])
+
+    def test_batched_window(self):
+        listener = RecordingListener()
+        self.run_loops(LoopSubscription(listener, every_steps=3, batched=True), [1.0, 2.0, 3.0, 0.5])
+        first, last = listener.windows
+        self.assertEqual(LoopWindow(3, 0.0, 6.0, 1.0, 3.0, 2.0, 3.0), first)
+        self.assertEqual(LoopWindow(1, 6.0, 6.5, 0.5, 0.5, 0.5, 0.5), last)
+        # default 'endOfWindow' forwards the last delta
+        self.assertEqual([(3.0, 3.0, 6.0), (0.5, 4.0, 6.5)], listener.calls)
+
+    def test_background_uses_snapshots(self):
+        listener = RecordingListener()
+        self.run_loops(LoopSubscription(listener, every_steps=2, background=True), [1.0] * 20)
+        # every call sees the state of its own loop, in order, even though the node kept changing
+        self.assertEqual([float(step) for step in range(2, 21, 2)], [h for _, h, _ in listener.calls])
+        self.assertNotIn(threading.get_ident(), listener.threads)
+
+    def test_background_exception_is_propagated(self):
+        with self.assertRaises(RuntimeError):
+            self.run_loops(LoopSubscription(FailingListener(), background=True), [1.0] * 3)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            LoopSubscription(RecordingListener(), every_steps=0)
+        with self.assertRaises(ValueError):
+            LoopSubscription(RecordingListener(), every_time=-1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+import os
+
+from dassflow2d_py.input.DassflowMeshReader import DassflowMeshReader
+from dassflow2d_py.mesh.MeshImpl import MeshImpl
+from dassflow2d_py.mesh.Bathymetry import Bathymetry
+
+
+class TestBathymetry(unittest.TestCase):
+
+    def setUp(self):
+        mesh_path = os.path.join('src', 'test', 'resources', 'mesh', 'mesh1.geo')
+        raw_info = DassflowMeshReader().read(mesh_path)
+        self.mesh = MeshImpl.createFromPartialInformation(*(*raw_info[:4], {}))
+        self.cell_values = [float(i) for i in range(self.mesh.getCellNumber())]
+        self.bathymetry = Bathymetry.fromMesh(self.mesh, self.cell_values)
+
+    def testOrdering(self):
+        cell_number = self.mesh.getCellNumber()
+        self.assertEqual(len(self.bathymetry), cell_number + self.mesh.getBoundaryNumber())
+        # real cells first, in mesh order
+        for i, cell in enumerate(self.mesh.getCells()):
+            self.assertEqual(self.bathymetry.getIndex(cell), i)
+            self.assertEqual(self.bathymetry[cell], self.cell_values[i])
+        # then ghost cells, in boundary order, with the value of their real cell
+        for j, boundary in enumerate(self.mesh.getBoundaries()):
+            edge = boundary.getEdge()
+            ghost_cell = edge.getGhostCell()
+            self.assertEqual(self.bathymetry.getIndex(ghost_cell), cell_number + j)
+            self.assertEqual(self.bathymetry[ghost_cell], self.bathymetry[edge.getCells()[0]])
+
+    def testSetValue(self):
+        ghost_cell = self.mesh.getBoundaries()[0].getEdge().getGhostCell()
+        self.bathymetry.setValue(ghost_cell, 42.0)
+        self.assertEqual(self.bathymetry[ghost_cell], 42.0)
+        self.assertEqual(self.bathymetry.getValues()[self.bathymetry.getIndex(ghost_cell)], 42.0)
+
+    def testLegacyMapping(self):
+        legacy = self.bathymetry.toDict()
+        self.assertEqual(len(legacy), len(self.bathymetry))
+        for cell, z in legacy.items():
+            self.assertEqual(self.bathymetry[cell], z)
+        rebuilt = Bathymetry.fromMapping(legacy)
+        self.assertEqual(rebuilt.getValues().tolist(), self.bathymetry.getValues().tolist())
+
+    def testInvalidSize(self):
+        with self.assertRaises(ValueError):
+            Bathymetry(list(self.mesh.getCells()), [0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+import numpy as np
+
+from dassflow2d_py.mesh.connectivity import edge_cell_indices, incidence_table, cell_adjacency
+from dassflow2d_py.mesh.renumbering import CellOrdering
+from mesh_factories import create_shuffled_mesh
+
+
+class TestConnectivity(unittest.TestCase):
+
+    def setUp(self):
+        self.meshes = [create_shuffled_mesh(8, ordering) for ordering in CellOrdering]
+
+    def testEdgeCellIndices(self):
+        for mesh in self.meshes:
+            left, right, cell_number = edge_cell_indices(mesh)
+            # reference: positions of the cell objects in the state
+            state_cells = list(mesh.getCells()) + [boundary.getEdge().getGhostCell() for boundary in mesh.getBoundaries()]
+            position = {cell: i for i, cell in enumerate(state_cells)}
+            self.assertEqual(cell_number, len(state_cells))
+            self.assertEqual(left.tolist(), [position[edge.getCells()[0]] for edge in mesh.getEdges()])
+            self.assertEqual(right.tolist(), [position[edge.getCells()[1]] for edge in mesh.getEdges()])
+
+    def testIncidenceTable(self):
+        left, right, cell_number = edge_cell_indices(self.meshes[1])
+        offsets, edges, is_left = incidence_table(left, right, cell_number)
+        for cell in range(cell_number):
+            entries = slice(offsets[cell], offsets[cell + 1])
+            # first cell edges in edge order, then second cell edges in edge order
+            expected = np.flatnonzero(left == cell).tolist() + np.flatnonzero(right == cell).tolist()
+            self.assertEqual(edges[entries].tolist(), expected)
+            self.assertEqual(is_left[entries].tolist(), [left[edge] == cell for edge in expected])
+
+    def testCellAdjacency(self):
+        for mesh in self.meshes:
+            offsets, neighbors = cell_adjacency(mesh)
+            cells = list(mesh.getCells())
+            position = {cell: i for i, cell in enumerate(cells)}
+            for i, cell in enumerate(cells):
+                expected = sorted(position[neighbor] for neighbor in cell.getNeighbors() if not neighbor.isGhost())
+                self.assertEqual(sorted(neighbors[offsets[i]:offsets[i + 1]].tolist()), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import math
+import unittest
+
+import numpy as np
+
+from dassflow2d_py.mesh.geometry import polygon_geometry, segment_geometry
+from mesh_factories import create_mixed_mesh
+
+
+def polygon_reference(points: list[tuple[float, float]]) -> tuple[tuple[float, float], float, float]:
+    """
+    Center, area (shoelace formula) and perimeter of a polygon, one vertex at a time
+    """
+    n = len(points)
+    area, perimeter = 0.0, 0.0
+    for i in range(n):
+        (x_i, y_i), (x_j, y_j) = points[i], points[(i + 1) % n]
+        area += (x_i * y_j) - (x_j * y_i)
+        perimeter += math.sqrt((x_j - x_i)**2 + (y_j - y_i)**2)
+    center = (sum(x for x, _ in points) / n, sum(y for _, y in points) / n)
+    return center, abs(area) / 2.0, perimeter
+
+
+def normal_reference(a: tuple[float, float], b: tuple[float, float], p: tuple[float, float]) -> tuple[float, float]:
+    """
+    Unit normal of segment AB facing away from P
+    """
+    cross = (b[0] - a[0]) * (p[1] - a[1]) - (b[1] - a[1]) * (p[0] - a[0])
+    normal = (b[1] - a[1], a[0] - b[0]) if cross > 0 else (a[1] - b[1], b[0] - a[0])
+    magnitude = math.sqrt(normal[0]**2 + normal[1]**2)
+    return (normal[0] / magnitude, normal[1] / magnitude)
+
+
+class TestGeometry(unittest.TestCase):
+
+    def setUp(self):
+        self.mesh = create_mixed_mesh(12)
+
+    def testCellsMatchPerCellFormulas(self):
+        for cell in self.mesh.getCells():
+            center, area, perimeter = polygon_reference([vertex.getCoordinates() for vertex in cell.getVertices()])
+            self.assertEqual(cell.getGravityCenter(), center)
+            self.assertEqual(cell.getSurface(), area)
+            # squares computed with 'pow' may differ from the exact product by rounding
+            self.assertAlmostEqual(cell.getPerimeter(), perimeter, places=12)
+            self.assertIs(type(cell.getSurface()), float)
+
+    def testEdgesMatchPerEdgeFormulas(self):
+        for edge in self.mesh.getEdges():
+            a, b = (vertex.getCoordinates() for vertex in edge.getVertices())
+            self.assertEqual(edge.getCenter(), ((a[0] + b[0]) / 2, (a[1] + b[1]) / 2))
+            self.assertAlmostEqual(edge.getLength(), math.dist(a, b), places=12)
+            expected = normal_reference(a, b, edge.getCells()[0].getGravityCenter())
+            np.testing.assert_allclose(edge.getNormalVector(), expected, rtol=0.0, atol=1e-12)
+
+    def testPolygonGeometry(self):
+        coordinates = np.array([[0.0, 0.0], [2.0, 0.0], [2.0, 1.0], [0.0, 1.0]])
+        cell_vertices = np.array([[0, 1, 2, 3], [0, 1, 2, 0], [3, 2, 1, 0]])
+        centers, areas, perimeters = polygon_geometry(coordinates, cell_vertices, np.array([4, 3, 4]))
+        np.testing.assert_allclose(centers, [[1.0, 0.5], [4 / 3, 1 / 3], [1.0, 0.5]])
+        # areas do not depend on the orientation of the cell
+        np.testing.assert_allclose(areas, [2.0, 1.0, 2.0])
+        np.testing.assert_allclose(perimeters, [6.0, 3.0 + np.sqrt(5.0), 6.0])
+
+    def testSegmentGeometry(self):
+        coordinates = np.array([[0.0, 0.0], [2.0, 0.0], [0.0, 2.0]])
+        edge_vertices = np.array([[0, 1], [1, 0], [0, 2]])
+        cell_centers = np.array([[1.0, 1.0], [1.0, -1.0], [1.0, 1.0]])
+        centers, lengths, normals = segment_geometry(coordinates, edge_vertices, cell_centers)
+        np.testing.assert_allclose(centers, [[1.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+        np.testing.assert_allclose(lengths, [2.0, 2.0, 2.0])
+        # normals face away from the given point
+        np.testing.assert_allclose(normals, [[0.0, -1.0], [0.0, 1.0], [-1.0, 0.0]])
+        with self.assertRaises(ValueError):
+            segment_geometry(coordinates, edge_vertices[:1], np.array([[3.0, 0.0]]))
+
+
+if __name__ == '__main__':
+    unittest.main()
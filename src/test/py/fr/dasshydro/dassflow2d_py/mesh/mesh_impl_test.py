@@ -6,7 +6,7 @@ from statistics import mean
 from dassflow2d_py.input.DassflowMeshReader import DassflowMeshReader
 from dassflow2d_py.mesh.MeshImpl import MeshImpl, BoundaryType, Boundary
 # Unnecessary imports (here for type check)
-from dassflow2d_py.mesh.Mesh import RawVertex, RawCell
+from dassflow2d_py.mesh.Mesh import RawVertex, RawCell, RawInlet, RawOutlet
 
 class TestMeshImpl(unittest.TestCase):
     def setUp(self):
@@ -33,6 +33,89 @@ class TestMeshImpl(unittest.TestCase):
         self.assertEqual(self.mesh.getSurface(), self.oracle_data['header']['surface'])
         self.assertEqual(self.mesh.getEdgeNumber(), self.oracle_data['header']['edge_number'])
 
+    def testQuadrilateralEdges(self):
+        # 2x1 grid of squares, diagonals are not edges
+        raw_vertices = [RawVertex(i + 1, float(i % 3), float(i // 3)) for i in range(6)]
+        raw_cells = [RawCell(1, 1, 2, 5, 4), RawCell(2, 2, 3, 6, 5)]
+        mesh = MeshImpl.createFromPartialInformation(raw_vertices, raw_cells, [], [], {})
+        self.assertEqual(mesh.getEdgeNumber(), 7)
+        self.assertEqual(mesh.getBoundaryNumber(), 6)
+        for cell in mesh.getCells():
+            self.assertEqual(len(cell.getEdges()), 4)
+            self.assertEqual(cell.getSurface(), 1.0)
+
+    def testLocalEdges(self):
+        # local edge k joins vertices k-1 and k, edge 1 joins the last and the first vertices
+        for cell in self.mesh.getCells():
+            vertex_ids = [vertex.getID() for vertex in cell.getVertices()]
+            for k in range(1, cell.getVerticesNumber() + 1):
+                edge = self.mesh.getLocalEdge(cell.getID(), k)
+                edge_vertex_ids = sorted(vertex.getID() for vertex in edge.getVertices())
+                self.assertEqual(edge_vertex_ids, sorted((vertex_ids[k - 2], vertex_ids[k - 1])))
+                self.assertIn(edge, cell.getEdges())
+            with self.assertRaises(IndexError):
+                self.mesh.getLocalEdge(cell.getID(), cell.getVerticesNumber() + 1)
+            with self.assertRaises(IndexError):
+                self.mesh.getLocalEdge(cell.getID(), 0)
+        # boundaries are found from their edge
+        for boundary in self.mesh.getBoundaries():
+            self.assertIs(self.mesh.getEdgeBoundary(boundary.getEdge()), boundary)
+        for edge in self.mesh.getEdges():
+            if not edge.isBoundary():
+                self.assertIsNone(self.mesh.getEdgeBoundary(edge))
+
+    def testInletsOnQuadrilaterals(self):
+        # 2x1 grid of squares, inflow on the left side, outflow on the right side
+        raw_vertices = [RawVertex(i + 1, float(i % 3), float(i // 3)) for i in range(6)]
+        raw_cells = [RawCell(1, 1, 2, 5, 4), RawCell(2, 2, 3, 6, 5)]
+        raw_inlets = [RawInlet(1, 1, 0.0, 1)]
+        raw_outlets = [RawOutlet(2, 3, 0.0, 2)]
+        boundary_origin: dict[Boundary, RawInlet | RawOutlet] = {}
+        mesh = MeshImpl.createFromPartialInformation(raw_vertices, raw_cells, raw_inlets, raw_outlets, boundary_origin)
+        types = {
+            tuple(sorted(vertex.getID() for vertex in boundary.getEdge().getVertices())): boundary.getType()
+            for boundary in mesh.getBoundaries()
+        }
+        self.assertEqual(types[(1, 4)], BoundaryType.INFLOW)
+        self.assertEqual(types[(3, 6)], BoundaryType.OUTFLOW)
+        self.assertEqual(list(types.values()).count(BoundaryType.WALL), 4)
+        self.assertEqual(sorted(boundary_origin.values()), sorted(raw_inlets + raw_outlets))
+
+    def testLightweightViews(self):
+        # entities are slotted views on the shared arrays of the mesh
+        vertex = self.mesh.getVertices()[0]
+        cell = self.mesh.getCells()[0]
+        edge = self.mesh.getEdges()[0]
+        ghost = self.mesh.getBoundaries()[0].getEdge().getGhostCell()
+        for entity in (vertex, cell, edge, ghost):
+            self.assertFalse(hasattr(entity, '__dict__'))
+        self.assertIs(type(vertex.getCoordinates()[0]), float)
+        self.assertIs(type(cell.getGravityCenter()[0]), float)
+        self.assertIs(type(edge.getLength()), float)
+        # neighbors are the other cells of the edges of the cell
+        for cell in self.mesh.getCells():
+            self.assertEqual(cell.getNeighbors(), [
+                edge.getCells()[1] if edge.getCells()[0] is cell else edge.getCells()[0] for edge in cell.getEdges()
+            ])
+
+    def testCellTables(self):
+        cells, edges = list(self.mesh.getCells()), list(self.mesh.getEdges())
+        ghost_cells = [boundary.getEdge().getGhostCell() for boundary in self.mesh.getBoundaries()]
+        cell_index = {cell: i for i, cell in enumerate(cells + ghost_cells)}
+        edge_index = {edge: i for i, edge in enumerate(edges)}
+        offsets, cell_edges = self.mesh.getCellEdgeTable()
+        neighbor_offsets, cell_neighbors = self.mesh.getCellNeighborTable()
+        self.assertEqual(offsets.tolist(), neighbor_offsets.tolist())
+        self.assertEqual(len(offsets), len(cells) + 1)
+        for i, cell in enumerate(cells):
+            self.assertEqual(cell_edges[offsets[i]:offsets[i + 1]].tolist(), [edge_index[e] for e in cell.getEdges()])
+            self.assertEqual(
+                cell_neighbors[offsets[i]:offsets[i + 1]].tolist(), [cell_index[c] for c in cell.getNeighbors()]
+            )
+        # ghost neighbors are numbered after real cells, by boundary
+        ghosts = cell_neighbors[cell_neighbors >= len(cells)]
+        self.assertEqual(sorted(ghosts.tolist()), list(range(len(cells), len(cells) + len(ghost_cells))))
+
     def testVerticesCoordinates(self):
         raw_vertices_dict = {raw_vertex.id: raw_vertex for raw_vertex in self.raw_vertices}
         for vertex in self.mesh.getVertices():
@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from dassflow2d_py.mesh.connectivity import cell_adjacency
+from dassflow2d_py.mesh.partitioning import partition_cells, create_partitions
+from mesh_factories import create_grid_mesh
+
+
+class TestPartitioning(unittest.TestCase):
+
+    def setUp(self):
+        self.mesh = create_grid_mesh(12, 8, triangles=True)
+
+    def testBalancedPartition(self):
+        for partition_number in (1, 2, 3, 4, 7):
+            parts = partition_cells(self.mesh, partition_number)
+            sizes = np.bincount(parts, minlength=partition_number)
+            self.assertEqual(sizes.sum(), self.mesh.getCellNumber())
+            self.assertLessEqual(sizes.max() - sizes.min(), 2)
+
+    def testDeterministic(self):
+        self.assertTrue(np.array_equal(partition_cells(self.mesh, 5), partition_cells(self.mesh, 5)))
+
+    def testHalo(self):
+        offsets, neighbors = cell_adjacency(self.mesh)
+        parts = partition_cells(self.mesh, 4)
+        partitions = create_partitions(self.mesh, 4)
+
+        owned = np.concatenate([partition.owned for partition in partitions])
+        self.assertEqual(sorted(owned.tolist()), list(range(self.mesh.getCellNumber())))
+
+        for partition in partitions:
+            expected_halo = set()
+            for i in partition.owned.tolist():
+                for neighbor in neighbors[offsets[i]:offsets[i + 1]].tolist():
+                    if parts[neighbor] != partition.number:
+                        expected_halo.add(neighbor)
+            self.assertEqual(sorted(expected_halo), partition.halo.tolist())
+            self.assertTrue(np.all(partition.halo_owners != partition.number))
+            self.assertTrue(np.array_equal(partition.halo_owners, parts[partition.halo]))
+
+    def testInvalidPartitionNumber(self):
+        with self.assertRaises(ValueError):
+            partition_cells(self.mesh, 0)
+        with self.assertRaises(ValueError):
+            partition_cells(self.mesh, self.mesh.getCellNumber() + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+
+from dassflow2d_py.mesh.Mesh import Mesh, BoundaryType
+from dassflow2d_py.mesh.renumbering import CellOrdering, reverse_cuthill_mckee_order, morton_order
+from dassflow2d_py.mesh.connectivity import cell_adjacency
+from mesh_factories import create_shuffled_mesh
+
+
+def bandwidth(mesh: Mesh) -> int:
+    offsets, neighbors = cell_adjacency(mesh)
+    rows = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    return int(np.abs(rows - neighbors).max())
+
+
+class TestRenumbering(unittest.TestCase):
+
+    def setUp(self):
+        self.n = 16
+        self.meshes = {ordering: create_shuffled_mesh(self.n, ordering) for ordering in CellOrdering}
+
+    def testPermutations(self):
+        mesh = self.meshes[CellOrdering.FILE]
+        centers = np.array([cell.getGravityCenter() for cell in mesh.getCells()])
+        for order in (reverse_cuthill_mckee_order(*cell_adjacency(mesh)), morton_order(centers)):
+            np.testing.assert_array_equal(np.sort(order), np.arange(mesh.getCellNumber()))
+
+    def testBandwidth(self):
+        file_bandwidth = bandwidth(self.meshes[CellOrdering.FILE])
+        # a band of two rows of triangles is enough for a structured mesh
+        self.assertLessEqual(bandwidth(self.meshes[CellOrdering.RCM]), 4 * self.n + 2)
+        self.assertLess(bandwidth(self.meshes[CellOrdering.RCM]), file_bandwidth / 4)
+        self.assertLess(bandwidth(self.meshes[CellOrdering.MORTON]), file_bandwidth)
+
+    def testSameMesh(self):
+        reference = self.meshes[CellOrdering.FILE]
+        for ordering in (CellOrdering.RCM, CellOrdering.MORTON):
+            mesh = self.meshes[ordering]
+            # IDs are kept, only positions change
+            self.assertEqual(sorted(c.getID() for c in mesh.getCells()), sorted(c.getID() for c in reference.getCells()))
+            self.assertNotEqual([c.getID() for c in mesh.getCells()], [c.getID() for c in reference.getCells()])
+            self.assertEqual(sorted(e.getID() for e in mesh.getEdges()), sorted(e.getID() for e in reference.getEdges()))
+            self.assertEqual(mesh.getBoundaryNumber(), reference.getBoundaryNumber())
+            # boundaries follow the order of their edges
+            boundary_edges = [b.getEdge() for b in mesh.getBoundaries()]
+            self.assertEqual(boundary_edges, [e for e in mesh.getEdges() if e.isBoundary()])
+            # inlets and outlets are resolved the same way
+            types = sorted((b.getEdge().getID(), b.getType().value) for b in mesh.getBoundaries())
+            expected_types = sorted((b.getEdge().getID(), b.getType().value) for b in reference.getBoundaries())
+            self.assertEqual(types, expected_types)
+            self.assertEqual([t for _, t in types].count(BoundaryType.INFLOW.value), 1)
+            self.assertEqual([t for _, t in types].count(BoundaryType.OUTFLOW.value), 1)
+            # cell tables follow the new positions, geometry follows its cells
+            offsets, cell_edges = mesh.getCellEdgeTable()
+            edges = list(mesh.getEdges())
+            for i, cell in enumerate(mesh.getCells()):
+                self.assertEqual([edges[e] for e in cell_edges[offsets[i]:offsets[i + 1]].tolist()], cell.getEdges())
+            reference_cells = {c.getID(): c for c in reference.getCells()}
+            for cell in mesh.getCells():
+                self.assertEqual(cell.getGravityCenter(), reference_cells[cell.getID()].getGravityCenter())
+
+
+if __name__ == '__main__':
+    unittest.main()
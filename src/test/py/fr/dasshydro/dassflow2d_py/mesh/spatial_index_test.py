@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from dassflow2d_py.mesh.Mesh import Mesh
+from dassflow2d_py.mesh.SpatialIndex import SpatialIndex
+from mesh_factories import create_graded_mesh, create_jittered_mesh
+
+
+def brute_force_locate(mesh: Mesh, points: np.ndarray) -> np.ndarray:
+    # reference: signed areas of every cell split in triangles from its first vertex
+    rows = np.full(len(points), -1, dtype=np.int64)
+    for row, cell in enumerate(mesh.getCells()):
+        corners = np.array([vertex.getCoordinates() for vertex in cell.getVertices()])
+        for k in range(1, len(corners) - 1):
+            a, b, c = corners[0], corners[k], corners[k + 1]
+            area = (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+            w_a = ((b[0] - points[:, 0]) * (c[1] - points[:, 1]) - (b[1] - points[:, 1]) * (c[0] - points[:, 0])) / area
+            w_b = ((c[0] - points[:, 0]) * (a[1] - points[:, 1]) - (c[1] - points[:, 1]) * (a[0] - points[:, 0])) / area
+            inside = (w_a > 0) & (w_b > 0) & (1 - w_a - w_b > 0) & (rows < 0)
+            rows[inside] = row
+    return rows
+
+
+class TestSpatialIndex(unittest.TestCase):
+
+    def test_locate_matches_brute_force(self):
+        rng = np.random.default_rng(1)
+        for quads in (False, True):
+            mesh = create_jittered_mesh(12, quads)
+            points = rng.uniform(-1.0, 13.0, (3000, 2))
+            np.testing.assert_array_equal(brute_force_locate(mesh, points), mesh.getSpatialIndex().locate(points))
+
+    def test_graded_mesh(self):
+        # cell sizes span five orders of magnitude, half of the points fall in the refined corner
+        mesh = create_graded_mesh(24, 1.6)
+        rng = np.random.default_rng(3)
+        smallest = mesh.getCells()[0].getVertices()[1].getCoordinates()[0]
+        points = np.concatenate((rng.uniform(-0.5, 24.5, (1500, 2)), rng.uniform(0.0, 50 * smallest, (1500, 2))))
+        np.testing.assert_array_equal(brute_force_locate(mesh, points), mesh.getSpatialIndex().locate(points))
+
+    def test_points_on_edges_and_corners(self):
+        mesh = create_jittered_mesh(4, True)
+        index = mesh.getSpatialIndex()
+        rows = index.locate(np.array([[0.0, 0.0], [4.0, 4.0], [4.0, 0.0], [2.0, 0.0], [4.0 + 1e-9, 2.0]]))
+        self.assertTrue(np.all(rows[:4] >= 0))
+        self.assertEqual(-1, rows[4])
+
+    def test_find_cell(self):
+        mesh = create_jittered_mesh(6, False)
+        cells = list(mesh.getCells())
+        index = mesh.getSpatialIndex()
+        # the same index is returned every time
+        self.assertIs(index, mesh.getSpatialIndex())
+        for cell in cells[::7]:
+            self.assertIs(cell, index.findCell(*cell.getGravityCenter()))
+        self.assertIsNone(index.findCell(-5.0, 3.0))
+        with self.assertRaises(ValueError):
+            SpatialIndex(index.getVertexCoordinates(), index.getCellTable()).findCell(1.0, 1.0)
+
+    def test_many_points(self):
+        mesh = create_jittered_mesh(30, False)
+        rows = mesh.getSpatialIndex().locate(np.random.default_rng(2).uniform(0.0, 30.0, (200000, 2)))
+        self.assertTrue(np.all(rows >= 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
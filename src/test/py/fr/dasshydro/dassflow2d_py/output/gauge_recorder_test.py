@@ -0,0 +1,71 @@
+import unittest
+import os
+import tempfile
+
+import numpy as np
+
+from dassflow2d_py.input.GaugeReader import Gauge, GaugeReader
+from dassflow2d_py.output.GaugeRecorder import GaugeRecorder
+from dassflow2d_py.output.OutputMode import OutputMode
+from dassflow2d_py.mesh.MeshImpl import MeshImpl
+from dassflow2d_py.mesh.Mesh import RawVertex, RawCell
+from dassflow2d_py.mesh.Bathymetry import Bathymetry
+from dassflow2d_py.d2dtime.TimeStepState import TimeStepState, Node
+
+
+class TestGaugeRecorder(unittest.TestCase):
+
+    def setUp(self):
+        # 2x2 square quadrilaterals: lower left, lower right, upper left, upper right
+        raw_vertices = [RawVertex(i + 1, float(i % 3), float(i // 3)) for i in range(9)]
+        raw_cells = [RawCell(1, 1, 2, 5, 4), RawCell(2, 2, 3, 6, 5), RawCell(3, 4, 5, 8, 7), RawCell(4, 5, 6, 9, 8)]
+        self.mesh = MeshImpl.createFromPartialInformation(raw_vertices, raw_cells, [], [], {})
+        self.bathymetry = Bathymetry.fromMesh(self.mesh, [0.1, 0.2, 0.3, 0.4])
+        self.depths = [1.0, 2.0, 3.0, 4.0]
+        nodes = {cell: Node(h, 1.0, 0.5) for cell, h in zip(self.mesh.getCells(), self.depths)}
+        self.state = TimeStepState(nodes)
+
+    def test_point_gauge(self):
+        recorder = GaugeRecorder(self.mesh, self.bathymetry, [Gauge("g", np.array([[1.5, 0.25]]), False)])
+        recorder.record(self.state, 1.0)
+        self.assertEqual(["g_h", "g_zs", "g_u", "g_v"], recorder.getColumns())
+        np.testing.assert_array_equal([[2.0, 2.2, 1.0, 0.5]], recorder.getValues())
+
+    def test_line_gauge_is_split_by_cells(self):
+        # crosses lower left on t in [0, 0.5], lower right on [0.5, 4/7] and upper right on [4/7, 1]
+        line = Gauge("s", np.array([[0.1, 0.2], [1.9, 1.6]]), True)
+        recorder = GaugeRecorder(self.mesh, self.bathymetry, [line])
+        recorder.record(self.state, 1.0)
+        # h * (u, v).n * length, with n to the right of the line
+        expected = (1.0 * 1.4 - 0.5 * 1.8) * (1.0 * 0.5 + 2.0 * (4 / 7 - 0.5) + 4.0 * (1 - 4 / 7))
+        self.assertAlmostEqual(expected, recorder.getValues()[0, 0])
+
+    def test_line_gauge_outside_parts_are_ignored(self):
+        line = Gauge("s", np.array([[0.5, -1.0], [0.5, 3.0]]), True)
+        recorder = GaugeRecorder(self.mesh, self.bathymetry, [line])
+        recorder.record(self.state, 1.0)
+        # normal is (1, 0), one unit in the lower left and upper left cells
+        self.assertAlmostEqual(1.0 * 1.0 + 3.0 * 1.0, recorder.getValues()[0, 0])
+
+    def test_outside_gauge(self):
+        with self.assertRaises(ValueError):
+            GaugeRecorder(self.mesh, self.bathymetry, [Gauge("g", np.array([[5.0, 5.0]]), False)])
+
+    def test_every_steps_and_write(self):
+        gauges_path = os.path.join('docs', 'demo', 'gauges.yml')
+        gauges = GaugeReader().read(gauges_path)
+        recorder = GaugeRecorder(self.mesh, self.bathymetry, gauges, every_steps=2)
+        for step in range(1, 2001):
+            if recorder.isTimeToRecord():
+                recorder.record(self.state, float(step))
+
+        self.assertEqual(1000, len(recorder.getTimes()))
+        with tempfile.TemporaryDirectory() as directory:
+            recorder.write(directory, [OutputMode.GNUPLOT.value])
+            data = np.genfromtxt(os.path.join(directory, "gauges.csv"), delimiter=",", names=True)
+            np.testing.assert_array_equal(np.arange(2.0, 2001.0, 2.0), data["time"])
+            self.assertEqual(("time", "center_h", "center_zs", "center_u", "center_v", "section_q"), data.dtype.names)
+
+
+if __name__ == "__main__":
+    unittest.main()
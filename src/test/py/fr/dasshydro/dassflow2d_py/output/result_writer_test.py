@@ -1,13 +1,44 @@
 import unittest
 import os
+import gzip
+import lzma
+import subprocess
+import sys
 from tempfile import TemporaryDirectory
 import h5py #type: ignore
 import vtk #type: ignore
 
-from dassflow2d_py.output.ResultWriter import ResultWriter, OutputMode
+from dassflow2d_py.output.ResultWriter import ResultWriter
+from dassflow2d_py.output.OutputMode import OutputMode
+from dassflow2d_py.output.FormatWriter import FormatWriter, registerFormatWriter, format_writer_class
 from dassflow2d_py.d2dtime.TimeStepState import TimeStepState, Node
 from dassflow2d_py.input.DassflowMeshReader import DassflowMeshReader
 from dassflow2d_py.mesh.MeshImpl import MeshImpl
+from dassflow2d_py.mesh.renumbering import CellOrdering
+from dassflow2d_py.mesh.Mesh import RawVertex, RawCell
+
+class RecordingWriter(FormatWriter):
+    """Third party format, records the snapshots it receives"""
+    snapshots: list[tuple[float, str]] = []
+    closed = 0
+
+    def write(self, simulation_time, ids, hs, us, vs, base_name):
+        RecordingWriter.snapshots.append((simulation_time, base_name))
+
+    def close(self):
+        RecordingWriter.closed += 1
+
+
+class FolderWriter(FormatWriter):
+    """Third party format with its own constructor, written before writers could support compression"""
+
+    def __init__(self, mesh, output_cells, result_folder):
+        super().__init__(mesh, output_cells, result_folder)
+        self.file_names = []
+
+    def write(self, simulation_time, ids, hs, us, vs, base_name):
+        self.file_names.append(self.getTextFilePath(base_name + ".txt"))
+
 
 class TestResultWriter(unittest.TestCase):
 
@@ -40,6 +71,10 @@ class TestResultWriter(unittest.TestCase):
         with self.assertRaises(ValueError, msg="Constructor should raise ValueError is mesh is null"):
             ResultWriter(None, os.path.join('src', 'test', 'resources', 'output'), 1.0)
 
+        # Test for unsupported compression
+        with self.assertRaises(ValueError, msg="Constructor should raise ValueError for unknown compressions"):
+            ResultWriter(self.mesh, self.temp_dir.name, 1.0, ".zip")
+
     def testRightTiming(self):
         self.assertFalse(self.result_writer.isTimeToWrite(0.0))
         self.assertFalse(self.result_writer.isTimeToWrite(0.3))
@@ -134,6 +169,46 @@ class TestResultWriter(unittest.TestCase):
             self.assertAlmostEqual(u, expected_u, places=6, msg=f"u value mismatch for cell {id}")
             self.assertAlmostEqual(v, expected_v, places=6, msg=f"v value mismatch for cell {id}")
 
+    def testRenumberedMesh(self):
+        # results are written in cell ID order, whatever the internal ordering of the mesh
+        raw_info = DassflowMeshReader().read(os.path.join('src', 'test', 'resources', 'mesh', 'mesh1.geo'))
+        mesh = MeshImpl.createFromPartialInformation(*(*raw_info[:4], {}), ordering=CellOrdering.MORTON)
+        self.assertNotEqual([cell.getID() for cell in mesh.getCells()], [1, 2, 3, 4])
+        state = TimeStepState({cell: Node(float(cell.getID()), 0.0, 0.0) for cell in mesh.getCells()})
+        result_writer = ResultWriter(mesh, self.temp_dir.name, 1.0)
+        result_writer.save(state, 1.0)
+        with open(os.path.join(self.temp_dir.name, "result_1.000000e+00.raw")) as file:
+            lines = [line.split() for line in file]
+        self.assertEqual([int(line[0]) for line in lines], [1, 2, 3, 4])
+        self.assertEqual([float(line[1]) for line in lines], [1.0, 2.0, 3.0, 4.0])
+
+    def testGappedVertexIDs(self):
+        # vertex IDs are not point positions, e.g. gmsh node tags of a mesh with unused nodes dropped
+        raw_vertices = [RawVertex(3, 0.0, 0.0), RawVertex(8, 1.0, 0.0), RawVertex(9, 2.0, 0.0),
+                        RawVertex(20, 0.0, 1.0), RawVertex(41, 1.0, 1.0), RawVertex(42, 2.0, 1.0)]
+        raw_cells = [RawCell(1, 3, 8, 41, 20), RawCell(2, 8, 9, 42, 41)]
+        mesh = MeshImpl.createFromPartialInformation(raw_vertices, raw_cells, [], [], {})
+        result_writer = ResultWriter(mesh, self.temp_dir.name, 1.0)
+        result_writer.save(TimeStepState({cell: Node(1.0, 0.0, 0.0) for cell in mesh.getCells()}), 0.0)
+        result_writer.writeAll(["vtk", "tecplot"])
+        expected = [[vertex.getCoordinates() for vertex in cell.getVertices()] for cell in result_writer.output_cells]
+
+        reader = vtk.vtkUnstructuredGridReader()
+        reader.SetFileName(os.path.join(self.temp_dir.name, "result_0.000000e+00.vtk"))
+        reader.Update()
+        output = reader.GetOutput()
+        for i, corners in enumerate(expected):
+            point_ids = output.GetCell(i).GetPointIds()
+            points = [output.GetPoint(point_ids.GetId(k))[:2] for k in range(point_ids.GetNumberOfIds())]
+            self.assertEqual(points, corners)
+
+        with open(os.path.join(self.temp_dir.name, "result_0.000000e+00.plt")) as file:
+            lines = file.readlines()
+        points = [tuple(map(float, line.split()[:2])) for line in lines[4:4 + mesh.getVertexNumber()]]
+        connectivity = lines[4 + mesh.getVertexNumber() + mesh.getCellNumber():]
+        for line, corners in zip(connectivity, expected):
+            self.assertEqual([points[int(number) - 1] for number in line.split()], corners)
+
     def testVTKOutput(self):
         """Test that VTK output is generated correctly and contains expected data."""
         self.result_writer.last_quotient = -1
@@ -311,3 +386,95 @@ class TestResultWriter(unittest.TestCase):
                 self.assertAlmostEqual(hs[i], expected_h, places=6, msg=f"h value mismatch for cell {id}")
                 self.assertAlmostEqual(us[i], expected_u, places=6, msg=f"u value mismatch for cell {id}")
                 self.assertAlmostEqual(vs[i], expected_v, places=6, msg=f"v value mismatch for cell {id}")
+
+    def testLazyImports(self):
+        # format libraries are only imported when writing, the model and its configuration never load them
+        code = ("import sys; import dassflow2d_py.ShallowWaterModel; "
+                "print(' '.join(m for m in ('vtk', 'h5py') if m in sys.modules))")
+        env = dict(os.environ, PYTHONPATH=os.path.join('src', 'main', 'py', 'fr', 'dasshydro'))
+        loaded = subprocess.check_output([sys.executable, "-c", code], env=env, text=True).split()
+        self.assertEqual(loaded, [])
+        self.assertIs(OutputMode('vtk'), OutputMode.VTK)
+
+    def saveSnapshots(self, times: list[float]):
+        self.result_writer.last_quotient = -1
+        state = TimeStepState({cell: Node(1.0, 0.5, 0.25) for cell in self.mesh.getCells()})
+        for simulation_time in times:
+            self.result_writer.save(state, simulation_time)
+
+    def testMultipleFormats(self):
+        self.saveSnapshots([2.0, 1.0])
+        read_files = []
+        read_raw_file = self.result_writer._read_raw_file
+        def counting_read(raw_filepath):
+            read_files.append(os.path.basename(raw_filepath))
+            return read_raw_file(raw_filepath)
+        self.result_writer._read_raw_file = counting_read # type: ignore
+        self.result_writer.writeAll(["hdf5", OutputMode.GNUPLOT, "hdf5"])
+        # every snapshot is read once, by increasing time, for every format
+        self.assertEqual(read_files, ["result_1.000000e+00.raw", "result_2.000000e+00.raw"])
+        for name in ("results.hdf5", "result_1.000000e+00.dat", "result_2.000000e+00.dat"):
+            self.assertTrue(os.path.exists(os.path.join(self.temp_dir.name, name)))
+        with h5py.File(os.path.join(self.temp_dir.name, "results.hdf5"), "r") as hdf:
+            self.assertEqual(sorted(hdf.keys()), ["time_1.000000e+00", "time_2.000000e+00"])
+        with self.assertRaises(ValueError):
+            self.result_writer.writeAll(["unknown"])
+
+    def testCompressedOutput(self):
+        self.result_writer = ResultWriter(self.mesh, self.temp_dir.name, 1.0, ".gz")
+        self.saveSnapshots([1.0])
+        raw_path = os.path.join(self.temp_dir.name, "result_1.000000e+00.raw.gz")
+        with gzip.open(raw_path, "rt") as file:
+            lines = [line.split() for line in file]
+        self.assertEqual([int(line[0]) for line in lines], sorted(cell.getID() for cell in self.mesh.getCells()))
+
+        # text formats are compressed, binary ones are not
+        self.result_writer.writeAll(["gnuplot", "tecplot", "hdf5"])
+        self.assertEqual(sorted(os.listdir(self.temp_dir.name)), [
+            "result_1.000000e+00.dat.gz", "result_1.000000e+00.plt.gz", "result_1.000000e+00.raw.gz", "results.hdf5"
+        ])
+        with gzip.open(os.path.join(self.temp_dir.name, "result_1.000000e+00.dat.gz"), "rt") as file:
+            self.assertEqual(len(file.readlines()), 2 + self.mesh.getCellNumber())
+
+        # raw files are read whatever their compression
+        with lzma.open(os.path.join(self.temp_dir.name, "result_2.000000e+00.raw.xz"), "wt") as file:
+            file.writelines(" ".join(line) + "\n" for line in lines)
+        with h5py.File(os.path.join(self.temp_dir.name, "results.hdf5"), "r") as hdf:
+            self.assertEqual(len(hdf.keys()), 1)
+        self.result_writer.writeAll("hdf5")
+        with h5py.File(os.path.join(self.temp_dir.name, "results.hdf5"), "r") as hdf:
+            self.assertEqual(sorted(hdf.keys()), ["time_1.000000e+00", "time_2.000000e+00"])
+
+    def testRegisteredFormat(self):
+        registerFormatWriter("recording", RecordingWriter)
+        try:
+            with self.assertRaises(ValueError):
+                registerFormatWriter("recording", FormatWriter) # type: ignore
+            RecordingWriter.snapshots = []
+            RecordingWriter.closed = 0
+            self.saveSnapshots([1.0, 3.0])
+            self.result_writer.writeAll("recording")
+            self.assertEqual(RecordingWriter.snapshots, [(1.0, "result_1.000000e+00"), (3.0, "result_3.000000e+00")])
+            self.assertEqual(RecordingWriter.closed, 1)
+        finally:
+            del format_writer_class["recording"]
+
+    def testThirdPartyWriterConstructor(self):
+        compressed_writer = ResultWriter(self.mesh, self.temp_dir.name, 1.0, compression=".gz")
+        registerFormatWriter("folder", FolderWriter)
+        try:
+            compressed_writer.last_quotient = -1
+            compressed_writer.save(TimeStepState({cell: Node(1.0, 0.5, 0.25) for cell in self.mesh.getCells()}), 1.0)
+            compressed_writer.writeAll(["folder", "gnuplot"])
+        finally:
+            del format_writer_class["folder"]
+        # writers supporting compression still compress their files
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir.name, "result_1.000000e+00.dat.gz")))
+
+    def testConfigure(self):
+        # every writer is configured the same way, writers without compression support ignore it
+        for name, expected in (("gnuplot", "result.dat.gz"), ("vtk", "result.dat"), ("folder", "result.dat")):
+            writer_class = FolderWriter if name == "folder" else format_writer_class[name]
+            writer = writer_class(self.mesh, list(self.mesh.getCells()), self.temp_dir.name)
+            writer.configure(compression=".gz")
+            self.assertEqual(writer.getTextFilePath("result.dat"), os.path.join(self.temp_dir.name, expected), msg=name)
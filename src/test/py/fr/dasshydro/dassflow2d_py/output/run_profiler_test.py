@@ -0,0 +1,51 @@
+import unittest
+import json
+import os
+import tempfile
+import time
+
+from dassflow2d_py.output.RunProfiler import RunProfiler, PHASES, BOUNDARY_CONDITIONS, RESOLVE
+
+
+class TestRunProfiler(unittest.TestCase):
+
+    def test_record_chained_phases(self):
+        profiler = RunProfiler(100)
+        for _ in range(3):
+            mark = profiler.tick()
+            mark = profiler.record(BOUNDARY_CONDITIONS, mark)
+            time.sleep(0.01)
+            profiler.record(RESOLVE, mark)
+            profiler.endOfStep()
+
+        summary = profiler.getSummary()
+        self.assertEqual(3, summary["steps"])
+        self.assertEqual(100, summary["cells"])
+        self.assertEqual(set(PHASES), set(summary["phases"].keys()))
+        self.assertEqual(3, summary["phases"][RESOLVE]["calls"])
+        self.assertGreaterEqual(summary["phases"][RESOLVE]["wall_time"], 0.03)
+        self.assertGreater(summary["phases"][RESOLVE]["wall_fraction"], summary["phases"][BOUNDARY_CONDITIONS]["wall_fraction"])
+        self.assertAlmostEqual(summary["steps_per_second"] * 100, summary["cell_updates_per_second"])
+
+    def test_disabled_profiler_measures_nothing(self):
+        profiler = RunProfiler(100, enabled=False)
+        mark = profiler.tick()
+        time.sleep(0.01)
+        profiler.record(RESOLVE, mark)
+
+        summary = profiler.getSummary()
+        self.assertEqual(0.0, summary["wall_time"])
+        self.assertEqual(0, summary["phases"][RESOLVE]["calls"])
+
+    def test_write_summary(self):
+        profiler = RunProfiler(10)
+        profiler.record(RESOLVE, profiler.tick())
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "profile.json")
+            profiler.writeSummary(file_path)
+            with open(file_path) as file:
+                self.assertEqual(profiler.getSummary(), json.load(file))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+
+import numpy as np
+
+from dassflow2d_py.constants import DRY_THRESHOLD
+from dassflow2d_py.resolution.ActiveSet import ActiveSet
+from mesh_factories import create_grid_mesh
+
+
+class TestActiveSet(unittest.TestCase):
+
+    def setUp(self):
+        self.n = 12
+        self.mesh = create_grid_mesh(self.n)
+        self.active_set = ActiveSet.fromMesh(self.mesh)
+        self.cell_number = self.active_set.cell_number
+        self.rng = np.random.default_rng(7)
+
+    def expected(self, h: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # reference: recomputed from scratch
+        wet = h > DRY_THRESHOLD
+        left, right = self.active_set.left_cells, self.active_set.right_cells
+        active_edges = wet[left] | wet[right]
+        active_cells = np.zeros(self.cell_number, dtype=bool)
+        active_cells[left[active_edges]] = True
+        active_cells[right[active_edges]] = True
+        return np.flatnonzero(active_cells), np.flatnonzero(active_edges)
+
+    def testFromMesh(self):
+        self.assertEqual(self.active_set.real_cell_number, self.n * self.n)
+        self.assertEqual(self.cell_number, self.n * self.n + self.mesh.getBoundaryNumber())
+        self.assertEqual(len(self.active_set.getActiveCells()), 0)
+        self.assertEqual(len(self.active_set.getActiveEdges()), 0)
+
+    def testSingleWetCell(self):
+        h = np.zeros(self.cell_number)
+        center = (self.n // 2) * self.n + self.n // 2
+        h[center] = 1.0
+        self.assertTrue(self.active_set.update(h))
+        # the wet cell and its 4 neighbors, through its 4 edges
+        self.assertEqual(len(self.active_set.getActiveCells()), 5)
+        self.assertEqual(len(self.active_set.getActiveEdges()), 4)
+        self.assertIn(center, self.active_set.getActiveRealCells())
+        self.assertFalse(self.active_set.update(h))
+        self.assertAlmostEqual(self.active_set.getWetFraction(), 1 / (self.n * self.n))
+
+    def testIncrementalUpdates(self):
+        h = np.zeros(self.cell_number)
+        for _ in range(30):
+            # wet or dry a few cells, sometimes under the threshold
+            flipped = self.rng.choice(self.cell_number, 8, replace=False)
+            h[flipped] = np.where(h[flipped] > 0.0, 0.0, self.rng.choice([1.0, DRY_THRESHOLD / 2], 8))
+            self.active_set.update(h)
+            expected_cells, expected_edges = self.expected(h)
+            np.testing.assert_array_equal(self.active_set.getActiveCells(), expected_cells)
+            np.testing.assert_array_equal(self.active_set.getActiveEdges(), expected_edges)
+            np.testing.assert_array_equal(
+                self.active_set.getActiveRealCells(), expected_cells[expected_cells < self.active_set.real_cell_number]
+            )
+
+    def testAccumulate(self):
+        h = np.where(self.rng.random(self.cell_number) < 0.1, 1.0, 0.0)
+        edge_values = self.rng.random((len(self.active_set.left_cells), 3))
+        left, right = self.active_set.left_cells, self.active_set.right_cells
+        # fluxes vanish between dry cells
+        edge_values[(h[left] == 0.0) & (h[right] == 0.0)] = 0.0
+        expected = np.zeros((self.cell_number, 3))
+        np.subtract.at(expected, left, edge_values)
+        np.add.at(expected, right, edge_values)
+
+        for _ in range(2):
+            self.active_set.update(h)
+            residual = self.active_set.accumulate(lambda edges: edge_values[edges], 3)
+            active_cells = self.active_set.getActiveCells()
+            np.testing.assert_allclose(residual[active_cells], expected[active_cells], rtol=0, atol=1e-12)
+            # residuals of inactive cells are zero
+            np.testing.assert_array_equal(residual, expected)
+
+    def testAccumulateWetDryWet(self):
+        center = (self.n // 2) * self.n + self.n // 2
+        left, right = self.active_set.left_cells, self.active_set.right_cells
+        edge_values = self.rng.random((len(left), 3))
+
+        def accumulate(h: np.ndarray) -> np.ndarray:
+            self.active_set.update(h)
+            # fluxes vanish between dry cells
+            values = np.where(((h[left] > 0.0) | (h[right] > 0.0))[:, None], edge_values, 0.0)
+            expected = np.zeros((self.cell_number, 3))
+            np.subtract.at(expected, left, values)
+            np.add.at(expected, right, values)
+            residual = self.active_set.accumulate(lambda edges: values[edges], 3)
+            np.testing.assert_array_equal(residual, expected)
+            return residual
+
+        wet = np.zeros(self.cell_number)
+        wet[center] = 1.0
+        self.assertTrue(np.any(accumulate(wet)[center] != 0.0))
+        # the cell and its neighbors leave the set, their residuals must not keep the wet values
+        dry = np.zeros(self.cell_number)
+        dry[0] = 1.0
+        np.testing.assert_array_equal(accumulate(dry)[center], 0.0)
+        self.assertNotIn(center, self.active_set.getActiveCells())
+        self.assertTrue(np.any(accumulate(wet)[center] != 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+
+import numpy as np
+
+from dassflow2d_py.resolution.edge_parallel import EdgeChunkExecutor
+from dassflow2d_py.resolution.Workspace import Workspace
+from dassflow2d_py.resolution.kernels import hllc_flux, scatter_residual
+
+
+class TestEdgeChunkExecutor(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.cell_number = 500
+        self.edge_number = 3000
+        self.left = rng.integers(0, self.cell_number, self.edge_number)
+        self.right = rng.integers(0, self.cell_number, self.edge_number)
+        self.edge_values = rng.random((self.edge_number, 3))
+        self.executors = []
+
+    def tearDown(self):
+        for executor in self.executors:
+            executor.close()
+
+    def create_executor(self, thread_number: int, chunk_size: int) -> EdgeChunkExecutor:
+        executor = EdgeChunkExecutor(self.left, self.right, self.cell_number, thread_number, chunk_size)
+        self.executors.append(executor)
+        return executor
+
+    def kernel(self, chunk: slice, workspace: Workspace) -> np.ndarray:
+        return self.edge_values[chunk] * 2.0
+
+    def testAccumulate(self):
+        expected = np.zeros((self.cell_number, 3))
+        scatter_residual(self.left, self.right, self.edge_values * 2.0, expected)
+
+        for thread_number, chunk_size in ((1, 3000), (1, 128), (4, 128), (8, 100), (16, 5000)):
+            residual = self.create_executor(thread_number, chunk_size).accumulate(self.kernel, 3)
+            # same sums in the same order, whatever the threads
+            np.testing.assert_array_equal(residual, expected)
+
+    def testScatter(self):
+        initial = np.random.default_rng(1).random((self.cell_number, 3))
+        expected = initial.copy()
+        scatter_residual(self.left, self.right, self.edge_values, expected)
+        for thread_number, chunk_size in ((1, 64), (3, 64), (4, 1000)):
+            residual = initial.copy()
+            self.create_executor(thread_number, chunk_size).scatter(self.edge_values, residual)
+            np.testing.assert_array_equal(residual, expected)
+
+    def testDeterministic(self):
+        executor = self.create_executor(4, 64)
+        first = executor.accumulate(self.kernel, 3).copy()
+        for _ in range(5):
+            self.assertTrue(np.array_equal(executor.accumulate(self.kernel, 3), first))
+        # the residual buffer is reused
+        self.assertIs(executor.accumulate(self.kernel, 3), executor.accumulate(self.kernel, 3))
+
+    def testMap(self):
+        out = np.zeros(self.edge_number)
+
+        def kernel(chunk: slice, workspace: Workspace):
+            out[chunk] = self.edge_values[chunk, 0] + 1.0
+
+        self.create_executor(4, 100).map(kernel)
+        np.testing.assert_array_equal(out, self.edge_values[:, 0] + 1.0)
+
+    def testFlux(self):
+        rng = np.random.default_rng(5)
+        state = np.column_stack((rng.uniform(0.0, 2.0, self.cell_number), rng.uniform(-1.0, 1.0, (self.cell_number, 2))))
+        angles = rng.uniform(0.0, 2.0 * np.pi, self.edge_number)
+        normals = np.column_stack((np.cos(angles), np.sin(angles)))
+        lengths = rng.uniform(0.1, 1.0, self.edge_number)
+        expected = hllc_flux(state, self.left, self.right, normals, lengths)
+
+        executor = self.create_executor(4, 128)
+        out = np.empty((self.edge_number, 3))
+        self.assertIs(executor.flux(hllc_flux, state, normals, lengths, out), out)
+        # every thread works in its own workspace, sized for a chunk
+        np.testing.assert_array_equal(out, expected)
+        for workspace in executor.workspaces:
+            self.assertLessEqual(max(len(buffer) for buffer in workspace.buffers.values()), 128)
+
+    def testKernelError(self):
+        def kernel(chunk: slice, workspace: Workspace) -> np.ndarray:
+            raise ArithmeticError("kernel failure")
+
+        with self.assertRaises(ArithmeticError):
+            self.create_executor(4, 100).accumulate(kernel, 3)
+
+    def testInvalidParameters(self):
+        with self.assertRaises(ValueError):
+            EdgeChunkExecutor(self.left, self.right[:-1], self.cell_number)
+        with self.assertRaises(ValueError):
+            EdgeChunkExecutor(self.left, self.right, self.cell_number, 2, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+import math
+import unittest
+
+import numpy as np
+
+from dassflow2d_py.constants import GRAVITY, DRY_THRESHOLD
+from dassflow2d_py.d2dtime.LocalTimeStepping import LocalTimeStepScheduler
+from dassflow2d_py.d2dtime.TimeStepState import TimeStepState, Node
+from dassflow2d_py.input.Configuration import Configuration
+from dassflow2d_py.mesh.Bathymetry import Bathymetry
+from dassflow2d_py.mesh.connectivity import edge_cell_indices
+from dassflow2d_py.resolution.EulerHLLC import EulerHLLC, ACTIVE_EDGE_FRACTION
+from dassflow2d_py.resolution.edge_parallel import EdgeChunkExecutor
+from dassflow2d_py.resolution.kernels import NUMPY_KERNELS, numba_available
+from mesh_factories import create_grid_mesh
+
+
+def reference_flux(left: tuple[float, float, float], right: tuple[float, float, float], nx: float, ny: float, length: float) -> tuple[float, float, float]:
+    """
+    HLLC flux through one edge, written as a plain loop body
+    """
+    hl, hr = left[0], right[0]
+    wet_l, wet_r = hl > DRY_THRESHOLD, hr > DRY_THRESHOLD
+    if not wet_l and not wet_r:
+        return 0.0, 0.0, 0.0
+    ul, vl = (left[1] / hl, left[2] / hl) if wet_l else (0.0, 0.0)
+    ur, vr = (right[1] / hr, right[2] / hr) if wet_r else (0.0, 0.0)
+    unl, utl = ul * nx + vl * ny, vl * nx - ul * ny
+    unr, utr = ur * nx + vr * ny, vr * nx - ur * ny
+    cl, cr = math.sqrt(GRAVITY * hl) if wet_l else 0.0, math.sqrt(GRAVITY * hr) if wet_r else 0.0
+
+    sl = min(unl - cl, unr - cr) if wet_l else unr - 2.0 * cr
+    sr = max(unl + cl, unr + cr) if wet_r else unl + 2.0 * cl
+    fl_h, fr_h = hl * unl, hr * unr
+    fl_m, fr_m = fl_h * unl + 0.5 * GRAVITY * hl * hl, fr_h * unr + 0.5 * GRAVITY * hr * hr
+    if sl >= 0.0:
+        f_h, f_m = fl_h, fl_m
+    elif sr <= 0.0:
+        f_h, f_m = fr_h, fr_m
+    else:
+        f_h = (sr * fl_h - sl * fr_h + sl * sr * (hr - hl)) / (sr - sl)
+        f_m = (sr * fl_m - sl * fr_m + sl * sr * (fr_h - fl_h)) / (sr - sl)
+    sm = (sl * hr * (unr - sr) - sr * hl * (unl - sl)) / (hr * (unr - sr) - hl * (unl - sl))
+    f_t = f_h * (utl if sm >= 0.0 else utr)
+    return f_h * length, (f_m * nx - f_t * ny) * length, (f_m * ny + f_t * nx) * length
+
+
+class TestEulerHLLC(unittest.TestCase):
+
+    def setUp(self):
+        self.n = 6
+        self.mesh = create_grid_mesh(self.n)
+        self.cells = list(self.mesh.getCells()) + [boundary.getEdge().getGhostCell() for boundary in self.mesh.getBoundaries()]
+        rng = np.random.default_rng(3)
+        self.values = np.column_stack((
+            rng.uniform(0.5, 2.0, len(self.cells)), rng.uniform(-1.0, 1.0, (len(self.cells), 2))
+        ))
+        # a dry region, and dry ghost cells
+        self.values[:self.n] = 0.0
+        self.values[-self.n:] = 0.0
+        self.state = TimeStepState({cell: Node(*values) for cell, values in zip(self.cells, self.values.tolist())})
+        configuration = Configuration('default')
+        configuration.updateValues({'kernel-backend': 'numpy'}, None)
+        self.method_configuration = configuration
+        self.method = EulerHLLC(configuration)
+        self.method.allocate(self.mesh)
+
+    def reference_step(self, delta: float) -> list[tuple[float, float, float]]:
+        # conservative variables of every cell
+        state = [(h, h * u, h * v) for h, u, v in self.values.tolist()]
+        residual = [[0.0, 0.0, 0.0] for _ in self.cells]
+        left_cells, right_cells, _ = edge_cell_indices(self.mesh)
+        for edge, left, right in zip(self.mesh.getEdges(), left_cells.tolist(), right_cells.tolist()):
+            nx, ny = edge.getNormalVector()
+            flux = reference_flux(state[left], state[right], nx, ny, edge.getLength())
+            for component in range(3):
+                residual[left][component] -= flux[component]
+                residual[right][component] += flux[component]
+
+        result = []
+        for index, cell in enumerate(self.mesh.getCells()):
+            factor = delta / cell.getSurface()
+            h, hu, hv = (state[index][component] + residual[index][component] * factor for component in range(3))
+            if h <= DRY_THRESHOLD:
+                result.append((max(h, 0.0), 0.0, 0.0))
+            else:
+                result.append((h, hu / h, hv / h))
+        return result
+
+    def testKernelBackend(self):
+        self.assertIs(self.method.kernels, NUMPY_KERNELS)
+        if not numba_available():
+            configuration = Configuration('default')
+            configuration.updateValues({'kernel-backend': 'numba'}, None)
+            with self.assertRaises(ValueError):
+                EulerHLLC(configuration)
+
+    def testReference(self):
+        out = self.state.copy()
+        result = self.method.resolve(self.state, 0.01, self.mesh, None, out)
+        self.assertIs(result, out)
+        expected = self.reference_step(0.01)
+        computed = [(node.h, node.u, node.v) for node in (result.getNode(cell) for cell in self.mesh.getCells())]
+        np.testing.assert_allclose(computed, expected, rtol=1e-12, atol=1e-14)
+        # water flows into the dry region
+        self.assertTrue(any(h > 0.0 for h, _, _ in computed[:self.n]))
+        # ghost cells are left to boundary conditions
+        for cell, values in zip(self.cells[self.mesh.getCellNumber():], self.values[self.mesh.getCellNumber():].tolist()):
+            node = result.getNode(cell)
+            self.assertEqual((node.h, node.u, node.v), tuple(values))
+
+    def testWorkspaceStates(self):
+        expected = self.method.resolve(self.state, 0.01, self.mesh, None)
+        # states backed by the workspace buffers are updated in place, the result being the spare state
+        workspace = self.method.getWorkspace()
+        workspace.getCurrentState()[:] = self.values
+        current = TimeStepState.fromArray(workspace.getCurrentState(), self.cells)
+        spare = TimeStepState.fromArray(workspace.getNextState(), self.cells)
+        result = self.method.resolve(current, 0.01, self.mesh, None, spare)
+        self.assertIs(result, spare)
+        self.assertIs(workspace.getCurrentState(), spare.getValues())
+        np.testing.assert_array_equal(spare.getValues(), expected.getValues())
+
+    def testExecutorScatter(self):
+        expected = self.method.resolve(self.state, 0.01, self.mesh, None).getValues()
+        # small chunks, so that several threads share the cells
+        self.method.executor = EdgeChunkExecutor(self.method.left_cells, self.method.right_cells, len(self.cells), 3, 8)
+        self.assertEqual(self.method.executor.thread_number, 3)
+        np.testing.assert_array_equal(self.method.resolve(self.state, 0.01, self.mesh, None).getValues(), expected)
+        self.method.close()
+        # sequential scatter of the kernels
+        self.method.executor = None
+        np.testing.assert_array_equal(self.method.resolve(self.state, 0.01, self.mesh, None).getValues(), expected)
+
+    def testActiveEdges(self):
+        # a wet column spreading over a dry domain, the wet cells changing at every step
+        values = np.zeros_like(self.values)
+        values[self.n // 2 * self.n + self.n // 2] = [1.0, 0.5, -0.5]
+        states = [TimeStepState.fromArray(values.copy(), self.cells) for _ in range(2)]
+        methods = [self.method, EulerHLLC(self.method_configuration)]
+        methods[0].active_edge_fraction = 0.0
+        methods[1].allocate(self.mesh)
+        for _ in range(3):
+            states = [method.resolve(state, 0.05, self.mesh, None) for method, state in zip(methods, states)]
+            np.testing.assert_array_equal(states[1].getValues(), states[0].getValues())
+        active_set = methods[1].active_set
+        active_edges = active_set.getActiveEdges()
+        self.assertLess(len(active_edges), ACTIVE_EDGE_FRACTION * self.mesh.getEdgeNumber())
+        self.assertGreater(len(active_edges), 4)
+        # only the active real cells are updated, the others are copied through
+        self.assertEqual(len(methods[1].active_surfaces), len(active_set.getActiveRealCells()))
+        self.assertLess(len(active_set.getActiveRealCells()), self.mesh.getCellNumber())
+
+    def testLocalTimeStepping(self):
+        scheduler = LocalTimeStepScheduler.fromMesh(self.mesh, levels=3)
+        # a single class, the cycle being one global step
+        scheduler.classify(np.full(self.mesh.getCellNumber(), 0.01), 0.01)
+        expected = self.method.resolve(self.state, 0.01, self.mesh, None).getValues()
+        result = self.method.resolveLocal(self.state, scheduler, self.mesh, None)
+        np.testing.assert_allclose(result.getValues(), expected, rtol=1e-12, atol=1e-14)
+
+        # several classes keep a lake at rest
+        for node in self.state.state.values():
+            node.h, node.u, node.v = 1.5, 0.0, 0.0
+        scheduler.classify(np.random.default_rng(1).uniform(0.01, 0.08, self.mesh.getCellNumber()), 0.01)
+        self.assertGreater(len(scheduler.getSubsteps()), 1)
+        result = self.method.resolveLocal(self.state, scheduler, self.mesh, None)
+        np.testing.assert_allclose(result.getValues()[:, 0], 1.5, rtol=1e-12)
+        np.testing.assert_allclose(result.getValues()[:, 1:], 0.0, atol=1e-12)
+
+    def testLakeAtRest(self):
+        for node in self.state.state.values():
+            node.h, node.u, node.v = 1.5, 0.0, 0.0
+        result = self.method.resolve(self.state, 0.01, self.mesh, None)
+        for cell in self.mesh.getCells():
+            node = result.getNode(cell)
+            self.assertAlmostEqual(node.h, 1.5, places=12)
+            self.assertAlmostEqual(node.u, 0.0, places=12)
+            self.assertAlmostEqual(node.v, 0.0, places=12)
+
+    def testLakeAtRestOverBed(self):
+        # a free surface at 1.2 over a rough bed, some cells emerging, ghost cells mirroring their cell
+        bathymetry = Bathymetry.fromMesh(self.mesh, np.random.default_rng(6).uniform(0.0, 1.5, self.mesh.getCellNumber()))
+        values = np.zeros_like(self.values)
+        values[:, 0] = np.maximum(1.2 - bathymetry.getValues(), 0.0)
+        expected = values[:self.mesh.getCellNumber()]
+        for fraction in (0.0, 1.0):
+            # over every edge, then over the active edges only
+            self.method.active_edge_fraction = fraction
+            state = TimeStepState.fromArray(values.copy(), self.cells)
+            for _ in range(5):
+                state = self.method.resolve(state, 0.01, self.mesh, bathymetry)
+            np.testing.assert_allclose(state.getValues()[:self.mesh.getCellNumber()], expected, atol=1e-12)
+
+        # the flat bed solution is not at rest
+        state = self.method.resolve(TimeStepState.fromArray(values.copy(), self.cells), 0.01, self.mesh, None)
+        self.assertGreater(np.abs(state.getValues()[:self.mesh.getCellNumber(), 1:]).max(), 1e-3)
+
+    def testBedPaths(self):
+        # every path gives the same results over a bed: executor threads, sequential kernels, active set
+        bathymetry = Bathymetry.fromMesh(self.mesh, np.random.default_rng(7).uniform(0.0, 0.5, self.mesh.getCellNumber()))
+        state = TimeStepState.fromArray(self.values.copy(), self.cells)
+        expected = self.method.resolve(state, 0.01, self.mesh, bathymetry).getValues()
+        self.method.executor = EdgeChunkExecutor(self.method.left_cells, self.method.right_cells, len(self.cells), 3, 8)
+        np.testing.assert_array_equal(self.method.resolve(state, 0.01, self.mesh, bathymetry).getValues(), expected)
+        self.method.close()
+        self.method.executor = None
+        np.testing.assert_array_equal(self.method.resolve(state, 0.01, self.mesh, bathymetry).getValues(), expected)
+        self.method.active_edge_fraction = 1.01
+        np.testing.assert_array_equal(self.method.resolve(state, 0.01, self.mesh, bathymetry).getValues(), expected)
+
+        scheduler = LocalTimeStepScheduler.fromMesh(self.mesh, levels=3)
+        scheduler.classify(np.full(self.mesh.getCellNumber(), 0.01), 0.01)
+        result = self.method.resolveLocal(state, scheduler, self.mesh, bathymetry)
+        np.testing.assert_allclose(result.getValues(), expected, rtol=1e-12, atol=1e-14)
+
+        with self.assertRaises(ValueError):
+            self.method.resolve(state, 0.01, self.mesh, Bathymetry(self.cells[:-1], np.zeros(len(self.cells) - 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+
+import numpy as np
+
+from dassflow2d_py.mesh.connectivity import edge_cell_indices
+from dassflow2d_py.resolution.kernels import (
+    get_kernels, numba_available, edge_geometry, hllc_flux, scatter_residual, euler_update, NUMPY_KERNELS
+)
+from dassflow2d_py.constants import DRY_THRESHOLD
+from mesh_factories import create_grid_mesh
+
+
+class TestKernels(unittest.TestCase):
+
+    def setUp(self):
+        self.n = 8
+        self.mesh = create_grid_mesh(self.n)
+        self.left, self.right, self.cell_number = edge_cell_indices(self.mesh)
+        self.normals, self.lengths = edge_geometry(self.mesh)
+        self.surfaces = np.array([cell.getSurface() for cell in self.mesh.getCells()])
+        rng = np.random.default_rng(5)
+        self.state = np.column_stack((
+            rng.uniform(0.5, 2.0, self.cell_number),
+            rng.uniform(-1.0, 1.0, self.cell_number),
+            rng.uniform(-1.0, 1.0, self.cell_number)
+        ))
+        # a dry region, including some dry neighbors
+        self.state[: self.n * 2] = 0.0
+
+    def residual(self, state: np.ndarray, bed: np.ndarray | None = None) -> np.ndarray:
+        right_flux = None if bed is None else np.empty((len(self.left), 3))
+        flux = hllc_flux(state, self.left, self.right, self.normals, self.lengths, None, None, bed, right_flux)
+        residual = np.zeros((self.cell_number, 3))
+        scatter_residual(self.left, self.right, flux, residual, right_flux)
+        return residual
+
+    def testLakeAtRest(self):
+        state = np.zeros((self.cell_number, 3))
+        state[:, 0] = 1.5
+        residual = self.residual(state)
+        np.testing.assert_array_equal(residual[:, 0], 0.0)
+        np.testing.assert_allclose(residual[:self.mesh.getCellNumber(), 1:], 0.0, atol=1e-12)
+
+    def testLakeAtRestOverBed(self):
+        # a free surface at 1.2 over a rough bed, some cells emerging
+        bed = np.random.default_rng(2).uniform(0.0, 1.5, self.cell_number)
+        state = np.zeros((self.cell_number, 3))
+        state[:, 0] = np.maximum(1.2 - bed, 0.0)
+        self.assertTrue(np.any(state[:, 0] == 0.0))
+        residual = self.residual(state, bed)
+        # up to the rounding of the reconstructed depths
+        np.testing.assert_allclose(residual[:self.mesh.getCellNumber()], 0.0, atol=1e-12)
+        # without source terms, water flows down the bed
+        self.assertGreater(np.abs(self.residual(state)[:self.mesh.getCellNumber(), 1:]).max(), 1e-3)
+
+    def testBedSourceTerms(self):
+        bed = np.random.default_rng(4).uniform(0.0, 1.0, self.cell_number)
+        right_flux = np.empty((len(self.left), 3))
+        flux = hllc_flux(self.state, self.left, self.right, self.normals, self.lengths, None, None, bed, right_flux)
+        # both sides exchange the same mass, momentum differs by the bed step pressure
+        np.testing.assert_array_equal(flux[:, 0], right_flux[:, 0])
+        self.assertTrue(np.any(flux[:, 1:] != right_flux[:, 1:]))
+        # nothing flows between two dry cells
+        dry = (self.state[self.left, 0] <= DRY_THRESHOLD) & (self.state[self.right, 0] <= DRY_THRESHOLD)
+        np.testing.assert_array_equal(flux[dry], 0.0)
+        np.testing.assert_array_equal(right_flux[dry], 0.0)
+
+        # a flat bed gives the flux without bed
+        flat_right_flux = np.empty((len(self.left), 3))
+        flat_flux = hllc_flux(self.state, self.left, self.right, self.normals, self.lengths, None, None,
+                              np.full(self.cell_number, 3.7), flat_right_flux)
+        expected = hllc_flux(self.state, self.left, self.right, self.normals, self.lengths)
+        np.testing.assert_array_equal(flat_flux, expected)
+        np.testing.assert_array_equal(flat_right_flux, expected)
+
+        with self.assertRaises(ValueError):
+            hllc_flux(self.state, self.left, self.right, self.normals, self.lengths, None, None, bed)
+
+    def testConservation(self):
+        residual = self.residual(self.state)
+        np.testing.assert_allclose(residual.sum(axis=0), 0.0, atol=1e-12)
+
+    def testOrientation(self):
+        # flux from the other side, through the opposite normal
+        flux = hllc_flux(self.state, self.left, self.right, self.normals, self.lengths)
+        reversed_flux = hllc_flux(self.state, self.right, self.left, -self.normals, self.lengths)
+        np.testing.assert_allclose(reversed_flux, -flux, atol=1e-12)
+
+    def testDryCells(self):
+        state = np.zeros((2, 3))
+        state[0] = [1.0, 0.0, 0.0]
+        left, right = np.array([0, 1]), np.array([1, 1])
+        flux = hllc_flux(state, left, right, np.array([[1.0, 0.0], [1.0, 0.0]]), np.ones(2))
+        # water flows into the dry cell, never between two dry cells
+        self.assertGreater(flux[0, 0], 0.0)
+        np.testing.assert_array_equal(flux[1], 0.0)
+
+    def testEulerUpdate(self):
+        residual = np.zeros((self.cell_number, 3))
+        residual[0] = [-10.0, 1.0, 1.0]
+        residual[1] = [1.0, 2.0, 3.0]
+        state = self.state.copy()
+        state[:2] = [1.0, 0.5, 0.5]
+        new_state = euler_update(state, residual, self.surfaces, 0.5)
+        self.assertEqual(new_state.shape, (self.mesh.getCellNumber(), 3))
+        # the drying cell is set to rest
+        np.testing.assert_array_equal(new_state[0], [0.0, 0.0, 0.0])
+        np.testing.assert_allclose(new_state[1], [1.5, 1.5, 2.0])
+        np.testing.assert_array_equal(new_state[2:], state[2:self.mesh.getCellNumber()])
+        self.assertTrue(np.all(new_state[:, 0] >= 0.0))
+        self.assertTrue(np.all(new_state[new_state[:, 0] <= DRY_THRESHOLD, 1:] == 0.0))
+
+    def testGetKernels(self):
+        self.assertIs(get_kernels("numpy"), NUMPY_KERNELS)
+        self.assertEqual(get_kernels().backend, "numba" if numba_available() else "numpy")
+        with self.assertRaises(ValueError):
+            get_kernels("fortran")
+        if not numba_available():
+            with self.assertRaises(ValueError):
+                get_kernels("numba")
+
+    @unittest.skipUnless(numba_available(), "numba is not installed")
+    def testNumbaIdentical(self):
+        numba_kernels = get_kernels("numba")
+        kernel_list = (NUMPY_KERNELS, numba_kernels)
+        fluxes = [kernels.flux(self.state, self.left, self.right, self.normals, self.lengths) for kernels in kernel_list]
+        np.testing.assert_array_equal(fluxes[0], fluxes[1])
+        residuals = [np.zeros((self.cell_number, 3)) for _ in kernel_list]
+        for kernels, residual in zip(kernel_list, residuals):
+            kernels.scatter(self.left, self.right, fluxes[0], residual)
+        np.testing.assert_array_equal(residuals[0], residuals[1])
+        states = [kernels.update(self.state, residuals[0], self.surfaces, 0.01) for kernels in kernel_list]
+        np.testing.assert_array_equal(states[0], states[1])
+
+        bed = np.random.default_rng(4).uniform(0.0, 1.0, self.cell_number)
+        right_fluxes = [np.empty((len(self.left), 3)) for _ in kernel_list]
+        fluxes = [kernels.flux(self.state, self.left, self.right, self.normals, self.lengths, None, None, bed, right_flux)
+                  for kernels, right_flux in zip(kernel_list, right_fluxes)]
+        np.testing.assert_array_equal(fluxes[0], fluxes[1])
+        np.testing.assert_array_equal(right_fluxes[0], right_fluxes[1])
+        residuals = [np.zeros((self.cell_number, 3)) for _ in kernel_list]
+        for kernels, residual in zip(kernel_list, residuals):
+            kernels.scatter(self.left, self.right, fluxes[0], residual, right_fluxes[0])
+        np.testing.assert_array_equal(residuals[0], residuals[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
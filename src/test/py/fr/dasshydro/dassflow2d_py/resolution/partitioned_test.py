@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from dassflow2d_py.d2dtime.TimeStepState import TimeStepState
+from dassflow2d_py.input.Configuration import Configuration
+from dassflow2d_py.mesh.Bathymetry import Bathymetry
+from dassflow2d_py.resolution.EulerHLLC import EulerHLLC
+from dassflow2d_py.ShallowWaterModel import ShallowWaterModel, LoopListener
+from mesh_factories import create_jittered_mesh, write_grid_case
+
+
+DEMO_CONFIG_FILE = os.path.join('docs', 'demo', 'config.yml')
+
+
+class LastStateListener(LoopListener):
+
+    def __init__(self):
+        self.values = None
+
+    def endOfLoop(self, current_delta, current_state, current_simulation_time):
+        self.values = current_state.getValues().copy()
+
+
+class TestPartitionedSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.methods = []
+
+    def tearDown(self):
+        for method in self.methods:
+            method.close()
+
+    def create_method(self, partition_number: int) -> EulerHLLC:
+        configuration = Configuration('default')
+        configuration.updateValues({'kernel-backend': 'numpy', 'partition-number': str(partition_number)}, None)
+        method = EulerHLLC(configuration)
+        self.methods.append(method)
+        return method
+
+    def testIdenticalToSerial(self):
+        mesh = create_jittered_mesh(10, quads=False)
+        cells = list(mesh.getCells()) + [boundary.getEdge().getGhostCell() for boundary in mesh.getBoundaries()]
+        rng = np.random.default_rng(8)
+        values = np.column_stack((rng.uniform(0.5, 2.0, len(cells)), rng.uniform(-1.0, 1.0, (len(cells), 2))))
+        # a dry region
+        values[:30, 0] = 0.0
+
+        methods = [self.create_method(1), self.create_method(3)]
+        for method in methods:
+            method.allocate(mesh)
+        partitioned_solver = methods[1].partitioned_solver
+        assert partitioned_solver is not None
+        self.assertEqual(len(partitioned_solver.partitions), 3)
+        states = [TimeStepState.fromArray(values.copy(), cells) for _ in methods]
+        for _ in range(5):
+            states = [method.resolve(state, 0.01, mesh, None) for method, state in zip(methods, states)]
+            np.testing.assert_array_equal(states[1].getValues(), states[0].getValues())
+        # the bed is shared with the workers
+        bathymetry = Bathymetry.fromMesh(mesh, rng.uniform(0.0, 0.5, mesh.getCellNumber()))
+        for _ in range(3):
+            states = [method.resolve(state, 0.01, mesh, bathymetry) for method, state in zip(methods, states)]
+            np.testing.assert_array_equal(states[1].getValues(), states[0].getValues())
+
+        # workers are started again after being stopped
+        methods[1].close()
+        expected = methods[0].resolve(states[0], 0.01, mesh, None)
+        np.testing.assert_array_equal(methods[1].resolve(states[1], 0.01, mesh, None).getValues(), expected.getValues())
+
+    def testModelRun(self):
+        results = []
+        with tempfile.TemporaryDirectory() as folder:
+            case_values = write_grid_case(folder, 10)
+            for partition_number in (1, 2):
+                configuration = Configuration('default')
+                configuration.update_from_file(DEMO_CONFIG_FILE, 'file')
+                configuration.updateValues({
+                    **case_values,
+                    'result-path': os.path.join(folder, str(partition_number)),
+                    'simulation-time': '0.2',
+                    'default-delta': '0.01',
+                    'delta-to-write': '0.1',
+                    'partition-number': str(partition_number)
+                }, 'test')
+                model = ShallowWaterModel(configuration)
+                listener = LastStateListener()
+                model.subscribe(listener)
+                model.run()
+                results.append(listener.values)
+
+        # boundary conditions are applied by the driver, the inflow changed the state
+        self.assertFalse(np.all(results[0][:, 0] == 1.0))
+        np.testing.assert_array_equal(results[1], results[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+import numpy as np
+
+from dassflow2d_py.d2dtime.LocalTimeStepping import LocalTimeStepScheduler
+from dassflow2d_py.d2dtime.TimeStepState import TimeStepState
+from dassflow2d_py.input.Configuration import Configuration
+from dassflow2d_py.resolution.ResolutionMethod import ResolutionMethod
+from dassflow2d_py.ShallowWaterModel import ShallowWaterModel, LoopListener
+from dassflow2d_py.resolution.Workspace import Workspace
+from dassflow2d_py.mesh.connectivity import edge_cell_indices
+from dassflow2d_py.resolution.kernels import edge_geometry, hllc_flux
+from mesh_factories import create_grid_mesh, write_grid_case
+
+
+DEMO_CONFIG_FILE = os.path.join('docs', 'demo', 'config.yml')
+
+
+class CopyMethod(ResolutionMethod):
+    """Returns the output state without computing anything, recording every call"""
+
+    def __init__(self):
+        self.calls: list[tuple[TimeStepState, TimeStepState | None]] = []
+
+    def resolve(self, previous_time_step, delta, mesh, bathymetry, out=None):
+        self.calls.append((previous_time_step, out))
+        return out if out is not None else TimeStepState(dict(previous_time_step.state))
+
+
+class AllocationListener(LoopListener):
+    """Measures the peak of memory allocated by loops once the first ones have warmed the workspace up"""
+
+    def __init__(self, warm_up_steps: int):
+        self.warm_up_steps = warm_up_steps
+        self.step_number = 0
+        self.start = 0
+        self.peak = 0
+        self.workspace_states = True
+
+    def endOfLoop(self, current_delta, current_state, current_simulation_time):
+        self.step_number += 1
+        self.workspace_states = self.workspace_states and current_state.getValues() is not None
+        if self.step_number == self.warm_up_steps:
+            self.start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        elif self.step_number > self.warm_up_steps:
+            self.peak = tracemalloc.get_traced_memory()[1] - self.start
+
+
+class TestWorkspace(unittest.TestCase):
+
+    def setUp(self):
+        self.mesh = create_grid_mesh(100)
+        self.workspace = Workspace.fromMesh(self.mesh)
+        self.left, self.right, self.cell_number = edge_cell_indices(self.mesh)
+        self.normals, self.lengths = edge_geometry(self.mesh)
+        self.surfaces = np.array([cell.getSurface() for cell in self.mesh.getCells()])
+
+    def testBuffers(self):
+        buffer = self.workspace.edgeBuffer("flux", 3)
+        self.assertEqual(buffer.shape, (self.mesh.getEdgeNumber(), 3))
+        self.assertIs(self.workspace.edgeBuffer("flux", 3).base, buffer.base)
+        # fewer rows give a view of the same memory, more rows or another type reallocate
+        self.assertTrue(np.shares_memory(self.workspace.getBuffer("flux", 10, 3), buffer))
+        self.assertFalse(np.shares_memory(self.workspace.cellBuffer("flux", 3, np.int64), buffer))
+        self.assertEqual(self.workspace.cellBuffer("residual", 3).shape, (self.cell_number, 3))
+
+    def testSwap(self):
+        current, next_state = self.workspace.getCurrentState(), self.workspace.getNextState()
+        self.assertEqual(current.shape, (self.cell_number, 3))
+        self.workspace.swap()
+        self.assertIs(self.workspace.getCurrentState(), next_state)
+        self.assertIs(self.workspace.getNextState(), current)
+
+    def testStepWithoutAllocation(self):
+        with tempfile.TemporaryDirectory() as folder:
+            configuration = Configuration('default')
+            configuration.update_from_file(DEMO_CONFIG_FILE, 'file')
+            configuration.updateValues({
+                **write_grid_case(folder, 100),
+                'result-path': folder,
+                'simulation-time': '0.1',
+                'default-delta': '0.01',
+                'delta-to-write': '1'
+            }, 'test')
+            model = ShallowWaterModel(configuration)
+            listener = AllocationListener(warm_up_steps=2)
+            model.subscribe(listener)
+            tracemalloc.start()
+            try:
+                model.run()
+            finally:
+                tracemalloc.stop()
+
+        workspace = model.resolution_method.getWorkspace()
+        assert workspace is not None
+        self.assertTrue(listener.workspace_states)
+        self.assertGreaterEqual(listener.step_number, 10)
+        # only boundary conditions and NumPy internals allocate (small objects), whatever the size of the mesh
+        self.assertLess(listener.peak, workspace.getCurrentState().nbytes // 10)
+
+    def testWorkspaceResults(self):
+        rng = np.random.default_rng(4)
+        state = np.column_stack((rng.uniform(0.0, 2.0, self.cell_number), rng.uniform(-1.0, 1.0, (self.cell_number, 2))))
+        expected = hllc_flux(state, self.left, self.right, self.normals, self.lengths)
+        for _ in range(2):
+            flux = hllc_flux(state, self.left, self.right, self.normals, self.lengths, self.workspace.edgeBuffer("flux", 3), self.workspace)
+            np.testing.assert_array_equal(flux, expected)
+
+    def testPingPong(self):
+        scheduler = LocalTimeStepScheduler(np.arange(3), np.arange(1, 4), 4, levels=3)
+        scheduler.classify(np.array([1.0, 2.0, 4.0, 4.0]), 0.1)
+        method = CopyMethod()
+        first, second = TimeStepState({}), TimeStepState({})
+        result = method.resolveLocal(first, scheduler, self.mesh, None, second) # type: ignore
+        # every substep writes into the state that is not read
+        self.assertEqual(len(method.calls), 4)
+        self.assertEqual(method.calls, [(first, second), (second, first), (first, second), (second, first)])
+        self.assertIs(result, first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from dassflow2d_py.input.Configuration import Configuration
+from dassflow2d_py.ShallowWaterModel import ShallowWaterModel, LoopListener
+
+
+DEMO_CONFIG_FILE = os.path.join('docs', 'demo', 'config.yml')
+
+
+def create_demo_model(result_path: str, **values: str) -> ShallowWaterModel:
+    """Model of the demo case writing to 'result_path', configuration keys use underscores instead of dashes"""
+    configuration = Configuration('default')
+    configuration.update_from_file(DEMO_CONFIG_FILE, 'file')
+    configuration.updateValues({
+        'result-path': result_path,
+        'simulation-time': '1',
+        'default-delta': '0.01',
+        'delta-to-write': '0.5',
+        **{key.replace('_', '-'): value for key, value in values.items()}
+    }, 'test')
+    return ShallowWaterModel(configuration)
+
+
+class CountingListener(LoopListener):
+
+    def __init__(self):
+        self.times = []
+
+    def endOfLoop(self, current_delta, current_state, current_simulation_time):
+        self.times.append(current_simulation_time)
+
+
+class TestShallowWaterModel(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def testSubscriptionsFinishedOnFailure(self):
+        model = create_demo_model(self.temp_dir.name)
+        listener = CountingListener()
+        model.subscribe(listener, every_steps=4, background=True)
+        subscription = model.loop_subscriptions[0]
+
+        resolve = model.resolution_method.resolve
+        calls = []
+        def failing_resolve(*args):
+            calls.append(None)
+            if len(calls) == 10:
+                raise RuntimeError("resolution failure")
+            return resolve(*args)
+        model.resolution_method.resolve = failing_resolve # type: ignore
+
+        # the loop error is not masked, and the loops not reported yet are still reported
+        with self.assertRaisesRegex(RuntimeError, "resolution failure"):
+            model.run()
+        self.assertEqual(len(listener.times), 3)
+        self.assertAlmostEqual(listener.times[-1], 0.09)
+        # the background thread has been released
+        self.assertIsNone(subscription.executor)
+
+    def testRestartKeepsGaugeSeries(self):
+        gauges = {'gauges_file': os.path.join('docs', 'demo', 'gauges.yml'), 'gauges_every_steps': '5'}
+        first_path, restart_path, full_path = (os.path.join(self.temp_dir.name, name) for name in ("first", "restart", "full"))
+        for path in (first_path, restart_path, full_path):
+            os.mkdir(path)
+
+        create_demo_model(first_path, simulation_time='0.5', checkpoint_delta='0.25', **gauges).run()
+        checkpoint_file = os.path.join(self.temp_dir.name, "checkpoint.npz")
+        shutil.copy(os.path.join(first_path, "checkpoint.npz"), checkpoint_file)
+        create_demo_model(restart_path, restart_from=checkpoint_file, **gauges).run()
+        create_demo_model(full_path, **gauges).run()
+
+        # the restarted run has the series of the whole simulation, as if it had never stopped
+        restarted = np.loadtxt(os.path.join(restart_path, "gauges.csv"), delimiter=",", skiprows=1)
+        full = np.loadtxt(os.path.join(full_path, "gauges.csv"), delimiter=",", skiprows=1)
+        self.assertEqual(len(full), 20)
+        np.testing.assert_array_equal(restarted, full)
+
+    def testLoopListenersAlias(self):
+        model = create_demo_model(self.temp_dir.name)
+        listener = CountingListener()
+        model.subscribe(listener)
+        self.assertEqual(model.loop_listeners, [listener])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Synthetic meshes shared by the tests, built from the squares of [0, nx]x[0, ny]
+"""
+import os
+
+import numpy as np
+
+from dassflow2d_py.mesh.MeshImpl import MeshImpl
+from dassflow2d_py.mesh.Mesh import Mesh, RawVertex, RawCell, RawInlet, RawOutlet
+from dassflow2d_py.mesh.renumbering import CellOrdering
+
+
+def create_grid_mesh(nx: int, ny: int | None = None, triangles: bool = False) -> Mesh:
+    """
+    Square [0, nx]x[0, ny] (ny defaults to nx) split into nx*ny quadrilaterals,
+    or into twice as many triangles sharing the diagonal from the lower left corner
+    """
+    ny = nx if ny is None else ny
+    raw_vertices = [RawVertex(j * (nx + 1) + i + 1, float(i), float(j)) for j in range(ny + 1) for i in range(nx + 1)]
+    raw_cells: list[RawCell] = []
+    for j in range(ny):
+        for i in range(nx):
+            a = j * (nx + 1) + i + 1
+            b, c, d = a + 1, a + nx + 2, a + nx + 1
+            if triangles:
+                raw_cells.append(RawCell(len(raw_cells) + 1, a, b, c, a))
+                raw_cells.append(RawCell(len(raw_cells) + 1, a, c, d, a))
+            else:
+                raw_cells.append(RawCell(len(raw_cells) + 1, a, b, c, d))
+    return MeshImpl.createFromPartialInformation(raw_vertices, raw_cells, [], [], {})
+
+
+def create_shuffled_mesh(n: int, ordering: CellOrdering, seed: int = 0) -> Mesh:
+    """
+    Square [0, n]x[0, n] split into triangles, cells listed in random order,
+    with an inflow on the left side of the first row and an outflow on the right side of the last row
+    """
+    rng = np.random.default_rng(seed)
+    raw_vertices = [RawVertex(j * (n + 1) + i + 1, float(i), float(j)) for j in range(n + 1) for i in range(n + 1)]
+    triangles = []
+    for j in range(n):
+        for i in range(n):
+            a = j * (n + 1) + i + 1
+            b, c, d = a + 1, a + n + 2, a + n + 1
+            triangles.append((a, b, c))
+            triangles.append((a, c, d))
+    raw_cells = []
+    for k, t in enumerate(rng.permutation(len(triangles)).tolist()):
+        a, b, c = triangles[t]
+        raw_cells.append(RawCell(k + 1, a, b, c, a))
+    # (a, c, d) of the first square has d-a as edge 1, (a, b, c) of the last square has b-c as edge 3
+    ids = {(raw_cell.vertex1, raw_cell.vertex2, raw_cell.vertex3): raw_cell.id for raw_cell in raw_cells}
+    first, last = 1, (n - 1) * (n + 1) + n
+    raw_inlets = [RawInlet(ids[(first, first + n + 2, first + n + 1)], 1, 0.0, 1)]
+    raw_outlets = [RawOutlet(ids[(last, last + 1, last + n + 2)], 3, 0.0, 2)]
+    return MeshImpl.createFromPartialInformation(raw_vertices, raw_cells, raw_inlets, raw_outlets, {}, ordering)
+
+
+def create_jittered_mesh(n: int, quads: bool, seed: int = 0) -> Mesh:
+    """
+    Square [0, n]x[0, n] with jittered interior vertices, split into triangles with random diagonals or kept as quadrilaterals
+    """
+    rng = np.random.default_rng(seed)
+    raw_vertices = []
+    for j in range(n + 1):
+        for i in range(n + 1):
+            interior = 0 < i < n and 0 < j < n
+            dx, dy = rng.uniform(-0.2, 0.2, 2) if interior else (0.0, 0.0)
+            raw_vertices.append(RawVertex(j * (n + 1) + i + 1, i + dx, j + dy))
+    raw_cells: list[RawCell] = []
+    for j in range(n):
+        for i in range(n):
+            a = j * (n + 1) + i + 1
+            b, c, d = a + 1, a + n + 2, a + n + 1
+            if quads:
+                raw_cells.append(RawCell(len(raw_cells) + 1, a, b, c, d))
+            elif rng.random() < 0.5:
+                raw_cells.append(RawCell(len(raw_cells) + 1, a, b, c, a))
+                raw_cells.append(RawCell(len(raw_cells) + 1, a, c, d, a))
+            else:
+                raw_cells.append(RawCell(len(raw_cells) + 1, a, b, d, a))
+                raw_cells.append(RawCell(len(raw_cells) + 1, b, c, d, b))
+    return MeshImpl.createFromPartialInformation(raw_vertices, raw_cells, [], [], {})
+
+
+def create_mixed_mesh(n: int, seed: int = 0) -> Mesh:
+    """
+    Square [0, n]x[0, n] with jittered vertices, every other square split into two triangles
+    """
+    rng = np.random.default_rng(seed)
+    raw_vertices = []
+    for j in range(n + 1):
+        for i in range(n + 1):
+            inner = 0 < i < n and 0 < j < n
+            dx, dy = rng.uniform(-0.2, 0.2, 2) if inner else (0.0, 0.0)
+            raw_vertices.append(RawVertex(j * (n + 1) + i + 1, i + dx * 0.3 + 0.1, j + dy * 0.7))
+    raw_cells: list[RawCell] = []
+    for j in range(n):
+        for i in range(n):
+            a = j * (n + 1) + i + 1
+            b, c, d = a + 1, a + n + 2, a + n + 1
+            if (i + j) % 2 == 0:
+                raw_cells.append(RawCell(len(raw_cells) + 1, a, b, c, d))
+            else:
+                raw_cells.append(RawCell(len(raw_cells) + 1, a, b, c, a))
+                raw_cells.append(RawCell(len(raw_cells) + 1, a, c, d, 0))
+    return MeshImpl.createFromPartialInformation(raw_vertices, raw_cells, [], [], {})
+
+
+def create_graded_mesh(n: int, ratio: float) -> Mesh:
+    """
+    Square [0, n]x[0, n] split into triangles, rows and columns shrinking geometrically by 'ratio' towards the origin
+    """
+    steps = ratio ** np.arange(n, dtype=np.float64)
+    coordinates = np.concatenate(([0.0], np.cumsum(steps) * n / steps.sum())).tolist()
+    raw_vertices = [RawVertex(j * (n + 1) + i + 1, coordinates[i], coordinates[j]) for j in range(n + 1) for i in range(n + 1)]
+    raw_cells: list[RawCell] = []
+    for j in range(n):
+        for i in range(n):
+            a = j * (n + 1) + i + 1
+            b, c, d = a + 1, a + n + 2, a + n + 1
+            raw_cells.append(RawCell(len(raw_cells) + 1, a, b, c, a))
+            raw_cells.append(RawCell(len(raw_cells) + 1, a, c, d, a))
+    return MeshImpl.createFromPartialInformation(raw_vertices, raw_cells, [], [], {})
+
+
+def write_grid_case(folder: str, n: int) -> dict[str, str]:
+    """
+    Write the square [0, n]x[0, n] split into n*n quadrilaterals as a dassflow mesh file, with an inflow (group 1)
+    on the left side and an outflow (group 2) on the right side, and an initial state of still water
+
+    Returns:
+        dict[str, str]: configuration values of the mesh file and of the initial state file
+    """
+    mesh_file, initial_state_file = os.path.join(folder, "grid.geo"), os.path.join(folder, "grid_init.txt")
+    with open(mesh_file, "w") as file:
+        file.write(f"# {n}x{n} grid\n{(n + 1) * (n + 1)} {n * n} 1.0\n#Vertex||| id vertex, x coord, y coord, bathymetry\n")
+        for j in range(n + 1):
+            for i in range(n + 1):
+                file.write(f"{j * (n + 1) + i + 1} {float(i)} {float(j)} 0.0\n")
+        file.write("#cells||| id cell, id_vertex1, id_vertex2, id_vertex3, id_vertex4, patch_manning, bathymetry\n")
+        for j in range(n):
+            for i in range(n):
+                a = j * (n + 1) + i + 1
+                file.write(f"{j * n + i + 1} {a} {a + 1} {a + n + 2} {a + n + 1} 1 0.0\n")
+        # d-a is edge 1 of the first column, b-c is edge 3 of the last column
+        file.write("# boundaries\n")
+        file.write(f"INLET {n} 1\n")
+        file.writelines(f"{j * n + 1} 1 1 0.0 1\n" for j in range(n))
+        file.write(f"OUTLET {n} 1\n")
+        file.writelines(f"{j * n + n} 3 1 0.0 2\n" for j in range(n))
+    with open(initial_state_file, "w") as file:
+        file.writelines("1.0 0.0 0.0\n" for _ in range(n * n))
+    return {"mesh-file": mesh_file, "initial-state-file": initial_state_file}